@@ -141,6 +141,7 @@ CREATE TABLE eboa.event_texts (
 	"position" integer NOT NULL,
 	parent_level integer NOT NULL,
 	parent_position integer NOT NULL,
+	event_start timestamp,
 	event_uuid uuid NOT NULL
 );
 -- ddl-end --
@@ -155,6 +156,7 @@ CREATE TABLE eboa.event_doubles (
 	"position" integer NOT NULL,
 	parent_level integer NOT NULL,
 	parent_position integer NOT NULL,
+	event_start timestamp,
 	event_uuid uuid NOT NULL
 );
 -- ddl-end --
@@ -622,6 +624,15 @@ CREATE INDEX idx_events_ingestion_time ON eboa.events
 	);
 -- ddl-end --
 
+-- object: idx_events_period | type: INDEX --
+-- DROP INDEX IF EXISTS eboa.idx_events_period CASCADE;
+CREATE INDEX idx_events_period ON eboa.events
+	USING gist
+	(
+	  (tsrange(start, stop, '[]'))
+	);
+-- ddl-end --
+
 -- object: idx_events_explicit_ref_id | type: INDEX --
 -- DROP INDEX IF EXISTS eboa.idx_events_explicit_ref_id CASCADE;
 CREATE INDEX idx_events_explicit_ref_id ON eboa.events
@@ -1135,6 +1146,15 @@ CREATE INDEX idx_processing_validity_stop ON eboa.sources
 	);
 -- ddl-end --
 
+-- object: idx_sources_validity_period | type: INDEX --
+-- DROP INDEX IF EXISTS eboa.idx_sources_validity_period CASCADE;
+CREATE INDEX idx_sources_validity_period ON eboa.sources
+	USING gist
+	(
+	  (tsrange(validity_start, validity_stop, '[]'))
+	);
+-- ddl-end --
+
 -- object: idx_processing_generation_time | type: INDEX --
 -- DROP INDEX IF EXISTS eboa.idx_processing_generation_time CASCADE;
 CREATE INDEX idx_processing_generation_time ON eboa.sources
@@ -3133,3 +3153,54 @@ ON DELETE RESTRICT ON UPDATE CASCADE;
 -- ddl-end --
 
 
+-- object: eboa.event_summaries | type: TABLE --
+-- DROP TABLE IF EXISTS eboa.event_summaries CASCADE;
+CREATE TABLE eboa.event_summaries (
+	gauge_uuid uuid NOT NULL,
+	explicit_ref_uuid uuid,
+	day date NOT NULL,
+	event_count bigint NOT NULL,
+	total_duration double precision NOT NULL,
+	min_start timestamp NOT NULL,
+	max_start timestamp NOT NULL,
+	min_stop timestamp NOT NULL,
+	max_stop timestamp NOT NULL
+
+);
+-- ddl-end --
+ALTER TABLE eboa.event_summaries OWNER TO eboa;
+-- ddl-end --
+
+-- object: gauges_fk | type: CONSTRAINT --
+-- ALTER TABLE eboa.event_summaries DROP CONSTRAINT IF EXISTS gauges_fk CASCADE;
+ALTER TABLE eboa.event_summaries ADD CONSTRAINT gauges_fk FOREIGN KEY (gauge_uuid)
+REFERENCES eboa.gauges (gauge_uuid) MATCH FULL
+ON DELETE CASCADE ON UPDATE CASCADE;
+-- ddl-end --
+
+-- object: explicit_refs_fk | type: CONSTRAINT --
+-- ALTER TABLE eboa.event_summaries DROP CONSTRAINT IF EXISTS explicit_refs_fk CASCADE;
+ALTER TABLE eboa.event_summaries ADD CONSTRAINT explicit_refs_fk FOREIGN KEY (explicit_ref_uuid)
+REFERENCES eboa.explicit_refs (explicit_ref_uuid) MATCH FULL
+ON DELETE CASCADE ON UPDATE CASCADE;
+-- ddl-end --
+
+-- object: idx_event_summaries_gauge_uuid_day | type: INDEX --
+-- DROP INDEX IF EXISTS eboa.idx_event_summaries_gauge_uuid_day CASCADE;
+CREATE INDEX idx_event_summaries_gauge_uuid_day ON eboa.event_summaries
+	USING btree
+	(
+	  gauge_uuid,
+	  day
+	);
+-- ddl-end --
+
+-- object: idx_event_summaries_explicit_ref_uuid | type: INDEX --
+-- DROP INDEX IF EXISTS eboa.idx_event_summaries_explicit_ref_uuid CASCADE;
+CREATE INDEX idx_event_summaries_explicit_ref_uuid ON eboa.event_summaries
+	USING btree
+	(
+	  explicit_ref_uuid
+	);
+-- ddl-end --
+
@@ -0,0 +1,363 @@
+-- Partitioned layout of the events and of their double and text values
+-- Model Author: Daniel Brosnan Blázquez
+--
+-- This file is applied on a DDBB just initialized with eboa_data_model.sql
+-- (see the option -t of eboa_init_ddbb.sh and init_provided_ddbb.sh):
+-- - eboa.events is partitioned by range of start (monthly partitions
+--   managed by eboa.engine.partitions plus a default partition)
+-- - eboa.event_doubles and eboa.event_texts are partitioned by range of
+--   event_start (start of the event, written by the engine with the values)
+--   with the same monthly partitions as the events plus a default partition
+--
+-- A partitioned table can only be referenced by foreign keys including its
+-- partition key, so the foreign keys referencing the events are replaced by
+-- the trigger eboa.delete_event_references, which removes the associated
+-- information as the ON DELETE CASCADE of the foreign keys did.
+-- The trigger is executed once per statement over the deleted events
+-- (transition table), so the bulk deletions of the engine remove the
+-- associated information with one statement per table
+--
+-- Retention: the partitions of the events, doubles and texts of a month are
+-- dropped together. The rest of the information of the events (booleans,
+-- timestamps, objects, geometries, links, keys and alerts), which has no start
+-- to be partitioned by, is removed with one DELETE per table over the events of
+-- the dropped partitions (see eboa.engine.partitions.drop_events_partitions)
+
+SET search_path TO pg_catalog,public,eboa;
+-- ddl-end --
+
+-- object: events_fk | type: CONSTRAINT --
+ALTER TABLE eboa.event_booleans DROP CONSTRAINT IF EXISTS events_fk CASCADE;
+ALTER TABLE eboa.event_timestamps DROP CONSTRAINT IF EXISTS events_fk CASCADE;
+ALTER TABLE eboa.event_doubles DROP CONSTRAINT IF EXISTS events_fk CASCADE;
+ALTER TABLE eboa.event_texts DROP CONSTRAINT IF EXISTS events_fk CASCADE;
+ALTER TABLE eboa.event_objects DROP CONSTRAINT IF EXISTS events_fk CASCADE;
+ALTER TABLE eboa.event_geometries DROP CONSTRAINT IF EXISTS events_fk CASCADE;
+ALTER TABLE eboa.event_links DROP CONSTRAINT IF EXISTS events_fk CASCADE;
+ALTER TABLE eboa.event_keys DROP CONSTRAINT IF EXISTS events_fk CASCADE;
+ALTER TABLE eboa.event_alerts DROP CONSTRAINT IF EXISTS events_fk CASCADE;
+-- ddl-end --
+
+-- object: eboa.events | type: TABLE --
+DROP TABLE IF EXISTS eboa.events CASCADE;
+CREATE TABLE eboa.events (
+	event_uuid uuid NOT NULL,
+	start timestamp NOT NULL,
+	stop timestamp NOT NULL,
+	ingestion_time timestamp NOT NULL,
+	visible boolean NOT NULL,
+	gauge_uuid uuid NOT NULL,
+	source_uuid uuid NOT NULL,
+	explicit_ref_uuid uuid,
+	CONSTRAINT events_pk PRIMARY KEY (event_uuid,start)
+
+) PARTITION BY RANGE (start);
+-- ddl-end --
+ALTER TABLE eboa.events OWNER TO eboa;
+-- ddl-end --
+
+-- object: eboa.events_default | type: TABLE --
+-- Events not covered by the monthly partitions
+CREATE TABLE eboa.events_default PARTITION OF eboa.events DEFAULT;
+-- ddl-end --
+ALTER TABLE eboa.events_default OWNER TO eboa;
+-- ddl-end --
+
+-- object: gauges_fk | type: CONSTRAINT --
+ALTER TABLE eboa.events ADD CONSTRAINT gauges_fk FOREIGN KEY (gauge_uuid)
+REFERENCES eboa.gauges (gauge_uuid) MATCH FULL
+ON DELETE CASCADE ON UPDATE CASCADE;
+-- ddl-end --
+
+-- object: sources_fk | type: CONSTRAINT --
+ALTER TABLE eboa.events ADD CONSTRAINT sources_fk FOREIGN KEY (source_uuid)
+REFERENCES eboa.sources (source_uuid) MATCH FULL
+ON DELETE CASCADE ON UPDATE CASCADE;
+-- ddl-end --
+
+-- object: explicit_refs_fk | type: CONSTRAINT --
+ALTER TABLE eboa.events ADD CONSTRAINT explicit_refs_fk FOREIGN KEY (explicit_ref_uuid)
+REFERENCES eboa.explicit_refs (explicit_ref_uuid) MATCH FULL
+ON DELETE CASCADE ON UPDATE CASCADE;
+-- ddl-end --
+
+-- object: idx_events_visible | type: INDEX --
+CREATE INDEX idx_events_visible ON eboa.events
+	USING btree
+	(
+	  visible
+	);
+-- ddl-end --
+
+-- object: idx_events_start | type: INDEX --
+CREATE INDEX idx_events_start ON eboa.events
+	USING btree
+	(
+	  start ASC NULLS LAST
+	);
+-- ddl-end --
+
+-- object: idx_events_stop | type: INDEX --
+CREATE INDEX idx_events_stop ON eboa.events
+	USING btree
+	(
+	  stop
+	);
+-- ddl-end --
+
+-- object: idx_events_gauge_id | type: INDEX --
+CREATE INDEX idx_events_gauge_id ON eboa.events
+	USING btree
+	(
+	  gauge_uuid
+	);
+-- ddl-end --
+
+-- object: idx_events_ingestion_time | type: INDEX --
+CREATE INDEX idx_events_ingestion_time ON eboa.events
+	USING btree
+	(
+	  ingestion_time
+	);
+-- ddl-end --
+
+-- object: idx_events_period | type: INDEX --
+CREATE INDEX idx_events_period ON eboa.events
+	USING gist
+	(
+	  (tsrange(start, stop, '[]'))
+	);
+-- ddl-end --
+
+-- object: idx_events_explicit_ref_id | type: INDEX --
+CREATE INDEX idx_events_explicit_ref_id ON eboa.events
+	USING btree
+	(
+	  explicit_ref_uuid
+	);
+-- ddl-end --
+
+-- object: idx_events_processing_uuid | type: INDEX --
+CREATE INDEX idx_events_processing_uuid ON eboa.events
+	USING btree
+	(
+	  source_uuid
+	);
+-- ddl-end --
+
+-- object: idx_events_event_uuid | type: INDEX --
+-- The primary key includes the partition key, the lookups by identifier use this index
+CREATE INDEX idx_events_event_uuid ON eboa.events
+	USING btree
+	(
+	  event_uuid
+	);
+-- ddl-end --
+
+-- object: eboa.event_texts | type: TABLE --
+DROP TABLE IF EXISTS eboa.event_texts CASCADE;
+CREATE TABLE eboa.event_texts (
+	name text NOT NULL,
+	value text NOT NULL,
+	"position" integer NOT NULL,
+	parent_level integer NOT NULL,
+	parent_position integer NOT NULL,
+	event_start timestamp NOT NULL,
+	event_uuid uuid NOT NULL,
+	CONSTRAINT unique_value_event_texts UNIQUE (name,parent_level,parent_position,event_uuid,event_start),
+	CONSTRAINT unique_value_position_event_texts UNIQUE ("position",parent_level,parent_position,event_uuid,event_start)
+) PARTITION BY RANGE (event_start);
+-- ddl-end --
+ALTER TABLE eboa.event_texts OWNER TO eboa;
+-- ddl-end --
+
+-- object: eboa.event_texts_default | type: TABLE --
+-- Values of the events not covered by the monthly partitions
+CREATE TABLE eboa.event_texts_default PARTITION OF eboa.event_texts DEFAULT;
+-- ddl-end --
+ALTER TABLE eboa.event_texts_default OWNER TO eboa;
+-- ddl-end --
+
+-- object: eboa.event_doubles | type: TABLE --
+DROP TABLE IF EXISTS eboa.event_doubles CASCADE;
+CREATE TABLE eboa.event_doubles (
+	name text NOT NULL,
+	value double precision NOT NULL,
+	"position" integer NOT NULL,
+	parent_level integer NOT NULL,
+	parent_position integer NOT NULL,
+	event_start timestamp NOT NULL,
+	event_uuid uuid NOT NULL,
+	CONSTRAINT unique_value_event_doubles UNIQUE (name,parent_level,parent_position,event_uuid,event_start),
+	CONSTRAINT unique_value_position_event_doubles UNIQUE ("position",parent_level,parent_position,event_uuid,event_start)
+) PARTITION BY RANGE (event_start);
+-- ddl-end --
+ALTER TABLE eboa.event_doubles OWNER TO eboa;
+-- ddl-end --
+
+-- object: eboa.event_doubles_default | type: TABLE --
+-- Values of the events not covered by the monthly partitions
+CREATE TABLE eboa.event_doubles_default PARTITION OF eboa.event_doubles DEFAULT;
+-- ddl-end --
+ALTER TABLE eboa.event_doubles_default OWNER TO eboa;
+-- ddl-end --
+
+-- object: idx_event_text_event_uuid | type: INDEX --
+CREATE INDEX idx_event_text_event_uuid ON eboa.event_texts
+	USING btree
+	(
+	  event_uuid
+	);
+-- ddl-end --
+
+-- object: idx_event_text_value | type: INDEX --
+CREATE INDEX idx_event_text_value ON eboa.event_texts
+	USING btree
+	(
+	  value
+	);
+-- ddl-end --
+
+-- object: idx_event_text_name | type: INDEX --
+CREATE INDEX idx_event_text_name ON eboa.event_texts
+	USING btree
+	(
+	  name
+	);
+-- ddl-end --
+
+-- object: idx_event_text_value_gin | type: INDEX --
+CREATE INDEX idx_event_text_value_gin ON eboa.event_texts
+	USING gin
+	(
+	  value eboa.gin_trgm_ops
+	);
+-- ddl-end --
+
+-- object: idx_event_text_name_gin | type: INDEX --
+CREATE INDEX idx_event_text_name_gin ON eboa.event_texts
+	USING gin
+	(
+	  name eboa.gin_trgm_ops
+	);
+-- ddl-end --
+
+-- object: idx_event_double_event_uuid | type: INDEX --
+CREATE INDEX idx_event_double_event_uuid ON eboa.event_doubles
+	USING btree
+	(
+	  event_uuid
+	);
+-- ddl-end --
+
+-- object: idx_event_double_value | type: INDEX --
+CREATE INDEX idx_event_double_value ON eboa.event_doubles
+	USING btree
+	(
+	  value
+	);
+-- ddl-end --
+
+-- object: idx_event_double_name | type: INDEX --
+CREATE INDEX idx_event_double_name ON eboa.event_doubles
+	USING btree
+	(
+	  name
+	);
+-- ddl-end --
+
+-- object: idx_event_double_name_gin | type: INDEX --
+CREATE INDEX idx_event_double_name_gin ON eboa.event_doubles
+	USING gin
+	(
+	  name eboa.gin_trgm_ops
+	);
+-- ddl-end --
+
+-- object: eboa.delete_event_references | type: FUNCTION --
+-- Replacement of the ON DELETE CASCADE of the foreign keys referencing the events.
+-- Statement trigger over the root table so that the associated information of all
+-- the deleted events is removed with one statement per table. The deletions of the
+-- doubles and texts are bounded by the starts of the deleted events so that only
+-- their partitions are accessed
+CREATE FUNCTION eboa.delete_event_references ()
+	RETURNS trigger
+	LANGUAGE plpgsql
+	AS $$
+DECLARE
+	first_start timestamp;
+	last_start timestamp;
+BEGIN
+	SELECT min(start), max(start) INTO first_start, last_start FROM deleted_events;
+	DELETE FROM eboa.event_booleans WHERE event_uuid IN (SELECT event_uuid FROM deleted_events);
+	DELETE FROM eboa.event_timestamps WHERE event_uuid IN (SELECT event_uuid FROM deleted_events);
+	DELETE FROM eboa.event_doubles WHERE event_start >= first_start AND event_start <= last_start AND event_uuid IN (SELECT event_uuid FROM deleted_events);
+	DELETE FROM eboa.event_texts WHERE event_start >= first_start AND event_start <= last_start AND event_uuid IN (SELECT event_uuid FROM deleted_events);
+	DELETE FROM eboa.event_objects WHERE event_uuid IN (SELECT event_uuid FROM deleted_events);
+	DELETE FROM eboa.event_geometries WHERE event_uuid IN (SELECT event_uuid FROM deleted_events);
+	DELETE FROM eboa.event_links WHERE event_uuid IN (SELECT event_uuid FROM deleted_events);
+	DELETE FROM eboa.event_keys WHERE event_uuid IN (SELECT event_uuid FROM deleted_events);
+	DELETE FROM eboa.event_alerts WHERE event_uuid IN (SELECT event_uuid FROM deleted_events);
+	RETURN NULL;
+END
+$$;
+-- ddl-end --
+ALTER FUNCTION eboa.delete_event_references() OWNER TO eboa;
+-- ddl-end --
+
+-- object: delete_event_references | type: TRIGGER --
+CREATE TRIGGER delete_event_references
+	AFTER DELETE
+	ON eboa.events
+	REFERENCING OLD TABLE AS deleted_events
+	FOR EACH STATEMENT
+	EXECUTE PROCEDURE eboa.delete_event_references();
+-- ddl-end --
+
+-- object: eboa.delete_referencing_events | type: FUNCTION --
+-- The ON DELETE CASCADE of the foreign keys of the events deletes the events
+-- partition by partition, which does not execute the statement trigger of the
+-- root table. The events of the deleted gauges, sources and explicit references
+-- are deleted beforehand through the root table (one statement per deleted row)
+CREATE FUNCTION eboa.delete_referencing_events ()
+	RETURNS trigger
+	LANGUAGE plpgsql
+	AS $$
+BEGIN
+	IF TG_TABLE_NAME = 'gauges' THEN
+		DELETE FROM eboa.events WHERE gauge_uuid = OLD.gauge_uuid;
+	ELSIF TG_TABLE_NAME = 'sources' THEN
+		DELETE FROM eboa.events WHERE source_uuid = OLD.source_uuid;
+	ELSE
+		DELETE FROM eboa.events WHERE explicit_ref_uuid = OLD.explicit_ref_uuid;
+	END IF;
+	RETURN OLD;
+END
+$$;
+-- ddl-end --
+ALTER FUNCTION eboa.delete_referencing_events() OWNER TO eboa;
+-- ddl-end --
+
+-- object: delete_referencing_events | type: TRIGGER --
+CREATE TRIGGER delete_referencing_events
+	BEFORE DELETE
+	ON eboa.gauges
+	FOR EACH ROW
+	EXECUTE PROCEDURE eboa.delete_referencing_events();
+-- ddl-end --
+
+-- object: delete_referencing_events | type: TRIGGER --
+CREATE TRIGGER delete_referencing_events
+	BEFORE DELETE
+	ON eboa.sources
+	FOR EACH ROW
+	EXECUTE PROCEDURE eboa.delete_referencing_events();
+-- ddl-end --
+
+-- object: delete_referencing_events | type: TRIGGER --
+CREATE TRIGGER delete_referencing_events
+	BEFORE DELETE
+	ON eboa.explicit_refs
+	FOR EACH ROW
+	EXECUTE PROCEDURE eboa.delete_referencing_events();
+-- ddl-end --
@@ -0,0 +1,58 @@
+"""
+Event summaries data model definition
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+from sqlalchemy import Column, DateTime, Date, ForeignKey, Float, BigInteger
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import relationship
+
+from eboa.datamodel.base import Base
+
+class EventSummary(Base):
+    """
+    Summary of the visible events associated to a gauge and an explicit reference
+    which start in the same day
+    """
+    __tablename__ = 'event_summaries'
+
+    gauge_uuid = Column(postgresql.UUID(as_uuid=True), ForeignKey('gauges.gauge_uuid'))
+    explicit_ref_uuid = Column(postgresql.UUID(as_uuid=True), ForeignKey('explicit_refs.explicit_ref_uuid'))
+    day = Column(Date)
+    event_count = Column(BigInteger)
+    total_duration = Column(Float)
+    min_start = Column(DateTime)
+    max_start = Column(DateTime)
+    min_stop = Column(DateTime)
+    max_stop = Column(DateTime)
+    gauge = relationship("Gauge", backref="eventSummaries")
+    explicitRef = relationship("ExplicitRef", backref="eventSummaries")
+    __mapper_args__ = {
+        'primary_key':[gauge_uuid, explicit_ref_uuid, day]
+    }
+
+    def __init__(self, gauge, day, event_count, total_duration, min_start, max_start, min_stop, max_stop, explicit_ref = None):
+        self.gauge = gauge
+        self.day = day
+        self.event_count = event_count
+        self.total_duration = total_duration
+        self.min_start = min_start
+        self.max_start = max_start
+        self.min_stop = min_stop
+        self.max_stop = max_stop
+        self.explicitRef = explicit_ref
+
+    def jsonify(self):
+        return {
+            "gauge_uuid": str(self.gauge_uuid),
+            "explicit_ref_uuid": str(self.explicit_ref_uuid) if self.explicit_ref_uuid else None,
+            "day": self.day.isoformat(),
+            "event_count": self.event_count,
+            "total_duration": self.total_duration,
+            "min_start": self.min_start.isoformat(),
+            "max_start": self.max_start.isoformat(),
+            "min_stop": self.min_stop.isoformat(),
+            "max_stop": self.max_stop.isoformat()
+        }
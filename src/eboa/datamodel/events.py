@@ -244,6 +244,8 @@ class EventText(Base):
     parent_level = Column(Integer)
     parent_position = Column(Integer)
     event_uuid = Column(postgresql.UUID(as_uuid=True), ForeignKey('events.event_uuid'))
+    # Start of the event (partition key of the values, see datamodel/eboa_events_partitioning.sql)
+    event_start = Column(DateTime)
     event = relationship("Event", backref="eventTexts")
     __mapper_args__ = {
         'primary_key':[name, position, parent_level, parent_position, event_uuid]
@@ -256,6 +258,7 @@ class EventText(Base):
         self.parent_level = parent_level
         self.parent_position = parent_position
         self.event = event
+        self.event_start = event.start
 
     def jsonify(self):
         return {
@@ -276,6 +279,8 @@ class EventDouble(Base):
     parent_level = Column(Integer)
     parent_position = Column(Integer)
     event_uuid = Column(postgresql.UUID(as_uuid=True), ForeignKey('events.event_uuid'))
+    # Start of the event (partition key of the values, see datamodel/eboa_events_partitioning.sql)
+    event_start = Column(DateTime)
     event = relationship("Event", backref="eventDoubles")
     __mapper_args__ = {
         'primary_key':[name, position, parent_level, parent_position, event_uuid]
@@ -288,6 +293,7 @@ class EventDouble(Base):
         self.parent_level = parent_level
         self.parent_position = parent_position
         self.event = event
+        self.event_start = event.start
 
     def jsonify(self):
         return {
@@ -0,0 +1,214 @@
+"""
+Baked queries for the lookups repeated by the engine
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import SQLalchemy entities
+from sqlalchemy import bindparam
+from sqlalchemy.ext import baked
+
+# Import datamodel
+from eboa.datamodel.dim_signatures import DimSignature
+from eboa.datamodel.events import Event, EventDouble
+from eboa.datamodel.gauges import Gauge
+from eboa.datamodel.sources import Source
+from eboa.datamodel.explicit_refs import ExplicitRefGrp
+from eboa.datamodel.annotations import AnnotationCnf
+
+# Cache (per process) of the queries and of their compiled statements.
+# Every lookup below is compiled once and then only its parameters are bound
+bakery = baked.bakery(size = 200)
+
+def get_dim_signature(session, dim_signature):
+    """
+    Method to obtain the DIM signature with the received name
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param dim_signature: name of the DIM signature
+    :type dim_signature: str
+
+    :return: DIM signature or None if it is not available
+    :rtype: DimSignature
+    """
+    baked_query = bakery(lambda session: session.query(DimSignature))
+    baked_query += lambda query: query.filter(DimSignature.dim_signature == bindparam("dim_signature"))
+
+    return baked_query(session).params(dim_signature = dim_signature).first()
+
+def get_source(session, name, dim_signature_uuid, processor_version, processor):
+    """
+    Method to obtain the source identified by its name, DIM signature, version and processor
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param name: name of the source
+    :type name: str
+    :param dim_signature_uuid: identifier of the DIM signature
+    :type dim_signature_uuid: uuid
+    :param processor_version: version of the processor
+    :type processor_version: str
+    :param processor: name of the processor
+    :type processor: str
+
+    :return: source or None if it is not available
+    :rtype: Source
+    """
+    baked_query = bakery(lambda session: session.query(Source))
+    baked_query += lambda query: query.filter(Source.name == bindparam("name"),
+                                              Source.dim_signature_uuid == bindparam("dim_signature_uuid"))
+    # Comparisons with NULL values need their own statements (IS NULL)
+    if processor_version == None:
+        baked_query += lambda query: query.filter(Source.processor_version == None)
+    else:
+        baked_query += lambda query: query.filter(Source.processor_version == bindparam("processor_version"))
+    # end if
+    if processor == None:
+        baked_query += lambda query: query.filter(Source.processor == None)
+    else:
+        baked_query += lambda query: query.filter(Source.processor == bindparam("processor"))
+    # end if
+
+    return baked_query(session).params(name = name, dim_signature_uuid = dim_signature_uuid,
+                                       processor_version = processor_version, processor = processor).first()
+
+def get_source_by_uuid(session, source_uuid):
+    """
+    Method to obtain the source with the received identifier
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param source_uuid: identifier of the source
+    :type source_uuid: uuid
+
+    :return: source or None if it is not available
+    :rtype: Source
+    """
+    baked_query = bakery(lambda session: session.query(Source))
+    baked_query += lambda query: query.filter(Source.source_uuid == bindparam("source_uuid"))
+
+    return baked_query(session).params(source_uuid = source_uuid).first()
+
+def get_gauge(session, name, system, dim_signature_uuid):
+    """
+    Method to obtain the gauge identified by its name, system and DIM signature
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param name: name of the gauge
+    :type name: str
+    :param system: system of the gauge
+    :type system: str
+    :param dim_signature_uuid: identifier of the DIM signature
+    :type dim_signature_uuid: uuid
+
+    :return: gauge or None if it is not available
+    :rtype: Gauge
+    """
+    baked_query = bakery(lambda session: session.query(Gauge))
+    baked_query += lambda query: query.filter(Gauge.name == bindparam("name"),
+                                              Gauge.dim_signature_uuid == bindparam("dim_signature_uuid"))
+    if system == None:
+        baked_query += lambda query: query.filter(Gauge.system == None)
+    else:
+        baked_query += lambda query: query.filter(Gauge.system == bindparam("system"))
+    # end if
+
+    return baked_query(session).params(name = name, system = system, dim_signature_uuid = dim_signature_uuid).first()
+
+def get_annotation_cnf(session, name, system, dim_signature_uuid):
+    """
+    Method to obtain the annotation configuration identified by its name, system and DIM signature
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param name: name of the annotation configuration
+    :type name: str
+    :param system: system of the annotation configuration
+    :type system: str
+    :param dim_signature_uuid: identifier of the DIM signature
+    :type dim_signature_uuid: uuid
+
+    :return: annotation configuration or None if it is not available
+    :rtype: AnnotationCnf
+    """
+    baked_query = bakery(lambda session: session.query(AnnotationCnf))
+    baked_query += lambda query: query.filter(AnnotationCnf.name == bindparam("name"),
+                                              AnnotationCnf.dim_signature_uuid == bindparam("dim_signature_uuid"))
+    if system == None:
+        baked_query += lambda query: query.filter(AnnotationCnf.system == None)
+    else:
+        baked_query += lambda query: query.filter(AnnotationCnf.system == bindparam("system"))
+    # end if
+
+    return baked_query(session).params(name = name, system = system, dim_signature_uuid = dim_signature_uuid).first()
+
+def get_explicit_ref_group(session, name):
+    """
+    Method to obtain the group of explicit references with the received name
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param name: name of the group
+    :type name: str
+
+    :return: group of explicit references or None if it is not available
+    :rtype: ExplicitRefGrp
+    """
+    baked_query = bakery(lambda session: session.query(ExplicitRefGrp))
+    baked_query += lambda query: query.filter(ExplicitRefGrp.name == bindparam("name"))
+
+    return baked_query(session).params(name = name).first()
+
+def get_counter_event(session, gauge_name, gauge_system, dim_signature, start, stop):
+    """
+    Method to obtain the event storing a counter
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param gauge_name: name of the gauge of the counter
+    :type gauge_name: str
+    :param gauge_system: system of the gauge of the counter
+    :type gauge_system: str
+    :param dim_signature: name of the DIM signature of the counter
+    :type dim_signature: str
+    :param start: start of the counter
+    :type start: datetime
+    :param stop: stop of the counter
+    :type stop: datetime
+
+    :return: event or None if it is not available
+    :rtype: Event
+    """
+    baked_query = bakery(lambda session: session.query(Event).join(Gauge).join(DimSignature))
+    baked_query += lambda query: query.filter(Gauge.name == bindparam("gauge_name"),
+                                              DimSignature.dim_signature == bindparam("dim_signature"),
+                                              Event.start == bindparam("start"),
+                                              Event.stop == bindparam("stop"))
+    if gauge_system == None:
+        baked_query += lambda query: query.filter(Gauge.system == None)
+    else:
+        baked_query += lambda query: query.filter(Gauge.system == bindparam("gauge_system"))
+    # end if
+
+    return baked_query(session).params(gauge_name = gauge_name, gauge_system = gauge_system, dim_signature = dim_signature,
+                                       start = start, stop = stop).first()
+
+def get_event_double(session, event_uuid):
+    """
+    Method to obtain the double value associated to an event (used by the counters)
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param event_uuid: identifier of the event
+    :type event_uuid: uuid
+
+    :return: double value or None if it is not available
+    :rtype: EventDouble
+    """
+    baked_query = bakery(lambda session: session.query(EventDouble))
+    baked_query += lambda query: query.filter(EventDouble.event_uuid == bindparam("event_uuid"))
+
+    return baked_query(session).params(event_uuid = event_uuid).first()
@@ -0,0 +1,83 @@
+"""
+Bulk loader definition for the engine component
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import io
+import datetime
+
+# Import SQLalchemy entities
+from sqlalchemy.exc import DBAPIError
+
+# Import psycopg2 errors
+import psycopg2
+
+def _format_csv_value(value):
+    """
+    Method to format a value as a field of the CSV format of the COPY command.
+    NULL values are represented by an unquoted empty field and the rest of values are always quoted
+    so that empty strings are not confused with NULL values
+
+    :param value: value to format
+    :type value: any type supported by the datamodel (None, str, bool, int, float, uuid, datetime)
+
+    :return: formatted field
+    :rtype: str
+    """
+    if value is None:
+        return ""
+    elif type(value) in (datetime.datetime, datetime.date):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    # end if
+
+    return '"' + value.replace('"', '""') + '"'
+
+def copy_mappings(session, entity, mappings):
+    """
+    Method to insert a list of mappings (as the ones received by session.bulk_insert_mappings)
+    streaming them through the PostgreSQL command COPY FROM STDIN in CSV format.
+    The command is executed using the connection associated to the session so it is part of the
+    current transaction (and savepoint if any).
+    The errors raised by psycopg2 are wrapped into the corresponding SQLAlchemy exceptions
+    (IntegrityError, InternalError...) so that callers can manage them as with session.bulk_insert_mappings
+
+    :param session: open session
+    :type session: sqlalchemy.orm.Session
+    :param entity: class of the datamodel associated to the table
+    :type entity: sqlalchemy declarative class
+    :param mappings: list of dictionaries with the values of the columns of each row
+    :type mappings: list
+    """
+    if len(mappings) == 0:
+        return
+    # end if
+
+    # Only the columns present in the mappings are streamed
+    columns = [column.name for column in entity.__table__.columns if any(column.name in mapping for mapping in mappings)]
+
+    buffer = io.StringIO()
+    for mapping in mappings:
+        buffer.write(",".join([_format_csv_value(mapping.get(column)) for column in columns]))
+        buffer.write("\n")
+    # end for
+    buffer.seek(0)
+
+    statement = "COPY {} ({}) FROM STDIN WITH (FORMAT csv)".format(entity.__table__.name, ", ".join(columns))
+
+    # Flush pending objects so that the COPY sees the entities it may refer to
+    session.flush()
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(statement, buffer)
+    except psycopg2.Error as e:
+        raise DBAPIError.instance(statement, None, e, psycopg2.Error)
+    finally:
+        cursor.close()
+    # end try
+
+    return
@@ -0,0 +1,131 @@
+"""
+Cache of catalogue entities (DIM signatures, gauges, annotation configurations, alert groups and alert configurations)
+for the engine component
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import time
+import threading
+from collections import OrderedDict
+
+# Import SQLalchemy entities
+from sqlalchemy.orm import make_transient_to_detached
+
+# Import auxiliary functions
+from eboa.engine.functions import read_configuration
+
+config = read_configuration()
+
+class CatalogueCache():
+    """
+    LRU cache with time to live of catalogue entities shared by all the engines of the process.
+    The cache stores the values of the columns of the entities (not the entities themselves) as the entities
+    are bound to the sessions where they were loaded. The entities are rebuilt and merged into the requesting session
+    without querying the DDBB
+    """
+
+    def __init__(self, max_size = 10000, ttl = 300):
+        """
+        Class for caching catalogue entities
+
+        :param max_size: maximum number of entities to keep in the cache
+        :type max_size: int
+        :param ttl: number of seconds an entity is kept in the cache (0 disables the cache)
+        :type ttl: float
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+        return
+
+    def get(self, session, entity, key):
+        """
+        Method to obtain a cached entity merged into the received session
+
+        :param session: session where to merge the entity
+        :type session: sqlalchemy.orm.Session
+        :param entity: class of the datamodel of the entity
+        :type entity: sqlalchemy declarative class
+        :param key: natural key of the entity (e.g. (name, system, dim_signature_uuid) for gauges)
+        :type key: tuple
+
+        :return: entity associated to the session or None if the entity is not cached
+        :rtype: sqlalchemy object
+        """
+        if self.ttl <= 0:
+            return None
+        # end if
+
+        with self.lock:
+            entry = self.entries.get((entity, key))
+            if entry == None:
+                return None
+            # end if
+            if entry[0] < time.monotonic():
+                del self.entries[(entity, key)]
+                return None
+            # end if
+            self.entries.move_to_end((entity, key))
+        # end with
+
+        instance = entity.__mapper__.class_manager.new_instance()
+        for attribute in entry[1]:
+            setattr(instance, attribute, entry[1][attribute])
+        # end for
+        make_transient_to_detached(instance)
+
+        return session.merge(instance, load = False)
+
+    def put(self, entity, key, instance):
+        """
+        Method to cache an entity.
+        Only entities committed into the DDBB have to be cached
+
+        :param entity: class of the datamodel of the entity
+        :type entity: sqlalchemy declarative class
+        :param key: natural key of the entity
+        :type key: tuple
+        :param instance: entity to cache
+        :type instance: sqlalchemy object
+        """
+        if self.ttl <= 0:
+            return
+        # end if
+
+        values = {attribute.key: getattr(instance, attribute.key) for attribute in entity.__mapper__.column_attrs}
+        with self.lock:
+            self.entries[(entity, key)] = (time.monotonic() + self.ttl, values)
+            self.entries.move_to_end((entity, key))
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last = False)
+            # end while
+        # end with
+
+        return
+
+    def invalidate(self, keys = None):
+        """
+        Method to remove cached entities
+
+        :param keys: pairs of class of the datamodel and natural key of the entities to remove (default None, all the entities are removed)
+        :type keys: list of tuples
+        """
+        with self.lock:
+            if keys == None:
+                self.entries.clear()
+            else:
+                for entity, key in keys:
+                    self.entries.pop((entity, key), None)
+                # end for
+            # end if
+        # end with
+
+        return
+
+catalogue_cache_config = config.get("CATALOGUE_CACHE") or {}
+catalogue_cache = CatalogueCache(max_size = catalogue_cache_config.get("MAX_SIZE", 10000), ttl = catalogue_cache_config.get("TTL", 300))
@@ -29,14 +29,21 @@ from eboa.datamodel.alerts import Alert, AlertGroup
 # Import alert severity codes
 from eboa.engine.alerts import alert_severity_codes
 
+# Import catalogue cache
+from eboa.engine.catalogue_cache import catalogue_cache
+
+# Import timestamps parsing
+from eboa.engine.timestamps import parse_timestamp
+
 def insert_values(values, entity_uuid, list_values, position = 0, parent_level = -1, parent_position = 0, positions = None):
     """
     Method to insert the values associated to events or annotations
 
     :param values: list of values to be inserted
     :type values: list
-    :param entity_uuid: identifier of the event or annotation
-    :type entity_uuid: uuid
+    :param entity_uuid: identifier of the event or annotation ({"name": column of the identifier, "id": identifier}
+    and, for events, "start": start of the event, which is stored with the text and double values)
+    :type entity_uuid: dict
     :param list_values: list with the inserted values for later bulk ingestion
     :type list_values: list
     :param position: value position inside the structure of values
@@ -99,7 +106,7 @@ def insert_values(values, entity_uuid, list_values, position = 0, parent_level =
                 list_to_use = list_values["doubles"]
             elif item["type"] == "timestamp":
                 try:
-                    value = parser.parse(item.get("value"))
+                    value = parse_timestamp(item.get("value"))
                 except ValueError:
                     raise WrongValue("The value {} cannot be converted to the specified type {}".format(item.get("value"), item["type"]))
                 # end try
@@ -147,20 +154,44 @@ def insert_values(values, entity_uuid, list_values, position = 0, parent_level =
                                      ("parent_position",  parent_position),
                                      (entity_uuid["name"], entity_uuid["id"])]
                                 ))
+            if item["type"] in ["text", "double"] and "start" in entity_uuid:
+                # The text and double values of the events are partitioned by the start of the event
+                list_to_use[-1]["event_start"] = entity_uuid["start"]
+            # end if
         # end if
         positions[parent_level] += 1
     # end for
 
     return
 
-def insert_alert_groups(session, operation):
+def insert_alert_groups(session, operation, catalogue_entries = None, catalogue_hits = None):
     """
     Method to insert the groups of alerts
+
+    :param session: open session
+    :type session: sqlalchemy.orm.Session
+    :param operation: operation containing the alerts
+    :type operation: dict
+    :param catalogue_entries: list where to register the alert groups to be cached once the operation is committed (default None)
+    :type catalogue_entries: list
+    :param catalogue_hits: list where to register the alert groups obtained from the cache (default None)
+    :type catalogue_hits: list
+
+    :return: alert groups
+    :rtype: dict
     """
     returned_alert_groups = {}
     alert_groups = [alert.get("alert_cnf").get("group") for alert in operation.get("alerts") or []]
     unique_alert_groups = sorted(set(alert_groups))
     for alert_group in unique_alert_groups or []:
+        alert_group_ddbb = catalogue_cache.get(session, AlertGroup, (alert_group,))
+        if alert_group_ddbb:
+            returned_alert_groups[alert_group] = alert_group_ddbb
+            if catalogue_hits != None:
+                catalogue_hits.append((AlertGroup, (alert_group,)))
+            # end if
+            continue
+        # end if
         session.begin_nested()
         id = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
         alert_group_ddbb = AlertGroup(id, alert_group)
@@ -175,13 +206,30 @@ def insert_alert_groups(session, operation):
             pass
         # end try
         returned_alert_groups[alert_group] = alert_group_ddbb
+        if catalogue_entries != None:
+            catalogue_entries.append((AlertGroup, (alert_group,), alert_group_ddbb))
+        # end if
     # end for
 
     return returned_alert_groups
 
-def insert_alert_cnfs(session, operation, alert_groups):
+def insert_alert_cnfs(session, operation, alert_groups, catalogue_entries = None, catalogue_hits = None):
     """
     Method to insert the alert configurations
+
+    :param session: open session
+    :type session: sqlalchemy.orm.Session
+    :param operation: operation containing the alerts
+    :type operation: dict
+    :param alert_groups: alert groups associated to the alerts
+    :type alert_groups: dict
+    :param catalogue_entries: list where to register the alert configurations to be cached once the operation is committed (default None)
+    :type catalogue_entries: list
+    :param catalogue_hits: list where to register the alert configurations obtained from the cache (default None)
+    :type catalogue_hits: list
+
+    :return: alert configurations
+    :rtype: dict
     """
     returned_alert_cnfs = {}
     alert_cnfs = [(alert.get("alert_cnf").get("name"), alert.get("alert_cnf").get("description"), alert.get("alert_cnf").get("severity"), alert.get("alert_cnf").get("group")) for alert in operation.get("alerts") or []]
@@ -191,6 +239,13 @@ def insert_alert_cnfs(session, operation, alert_groups):
         description = alert_cnf[1]
         severity = alert_severity_codes[alert_cnf[2]]
         group = alert_groups[alert_cnf[3]]
+        returned_alert_cnfs[name] = catalogue_cache.get(session, Alert, (name,))
+        if returned_alert_cnfs[name]:
+            if catalogue_hits != None:
+                catalogue_hits.append((Alert, (name,)))
+            # end if
+            continue
+        # end if
         returned_alert_cnfs[name] = session.query(Alert).filter(Alert.name == name).first()
         if not returned_alert_cnfs[name]:
             session.begin_nested()
@@ -210,6 +265,9 @@ def insert_alert_cnfs(session, operation, alert_groups):
                 pass
             # end try
         # end if
+        if catalogue_entries != None:
+            catalogue_entries.append((Alert, (name,), returned_alert_cnfs[name]))
+        # end if
     # end for
 
     return returned_alert_cnfs
@@ -18,12 +18,17 @@ import jsonschema
 import re
 from importlib import import_module
 from distutils import util
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 
 # Import SQLalchemy entities
 from sqlalchemy import or_, and_
 from sqlalchemy.exc import IntegrityError, InternalError
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import scoped_session
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy import inspect
+from sqlalchemy.dialects.postgresql import insert
 
 # Import GEOalchemy entities
 from geoalchemy2 import functions
@@ -33,7 +38,7 @@ from geoalchemy2.shape import to_shape
 from eboa.engine.errors import LinksInconsistency, UndefinedEventLink, DuplicatedEventLinkRef, WrongPeriod, SourceAlreadyIngested, WrongValue, OddNumberOfCoordinates, EboaResourcesPathNotAvailable, WrongGeometry, ErrorParsingDictionary, DuplicatedValues, UndefinedEntityReference, PriorityNotDefined, WrongReportedValidityPeriod, MixedOperationsWithCounter, DuplicatedSetCounter
 
 # Import datamodel
-from eboa.datamodel.base import Session
+from eboa.datamodel.base import Session, engine as ddbb_engine
 from eboa.datamodel.dim_signatures import DimSignature
 from eboa.datamodel.alerts import Alert, AlertGroup, EventAlert, AnnotationAlert, SourceAlert, ExplicitRefAlert
 from eboa.datamodel.events import Event, EventLink, EventKey, EventText, EventDouble, EventObject, EventGeometry, EventBoolean, EventTimestamp
@@ -61,6 +66,33 @@ from eboa.debugging import debug, race_condition, race_condition2, race_conditio
 from eboa.engine.functions import get_resources_path, get_schemas_path, read_configuration
 from eboa.engine.common_functions import insert_values, insert_alert_groups, insert_alert_cnfs
 
+# Import interval index
+from eboa.engine.intervals import get_items_per_timestamp
+
+# Import bulk loader
+from eboa.engine.bulk_loader import copy_mappings
+
+# Import catalogue cache
+from eboa.engine.catalogue_cache import catalogue_cache
+
+# Import baked queries
+import eboa.engine.baked_queries as baked_queries
+
+# Import event summaries
+import eboa.engine.event_summaries as event_summaries
+
+# Import overlap conditions
+import eboa.engine.periods as periods
+
+# Import timestamps parsing
+from eboa.engine.timestamps import parse_timestamp
+
+# Import json stream
+from eboa.engine.json_stream import load_data, encode_streamed_array, StreamedArray
+
+# Import xml registry
+from eboa.engine.xml_registry import xml_registry
+
 config = read_configuration()
 
 logging = Log(name = __name__)
@@ -201,6 +233,264 @@ exit_codes = {
     }
 }
 
+# Statement resolving, per segment of the timeline defined by the
+# sources of the DIM signature intersecting the validity period
+# received, the source with the maximum generation time (tie-break on
+# the minimum ingestion time, nulls last) to obtain only the events
+# which are not visible or which intersect a segment not won uniquely
+# by their source
+events_to_review_by_insert_and_erase_at_dim_signature_level_statement = """
+WITH overlapping_sources AS (
+    SELECT source_uuid, validity_start, validity_stop, generation_time, ingestion_time
+    FROM sources
+    WHERE dim_signature_uuid = :dim_signature_uuid
+    AND validity_start < :validity_stop
+    AND validity_stop > :validity_start
+), timeline_points AS (
+    SELECT validity_start AS point FROM overlapping_sources
+    UNION
+    SELECT validity_stop AS point FROM overlapping_sources
+), segments AS (
+    SELECT point AS start, lead(point) OVER (ORDER BY point) AS stop
+    FROM timeline_points
+    WHERE point >= :validity_start AND point <= :validity_stop
+), ranked_sources AS (
+    SELECT segments.start, segments.stop, overlapping_sources.source_uuid,
+           rank() OVER (PARTITION BY segments.start
+                        ORDER BY overlapping_sources.generation_time DESC,
+                                 overlapping_sources.ingestion_time ASC NULLS LAST) AS position
+    FROM segments
+    JOIN overlapping_sources ON overlapping_sources.validity_start < segments.stop
+                             AND overlapping_sources.validity_stop > segments.start
+    WHERE segments.stop IS NOT NULL
+), winning_sources AS (
+    SELECT start, stop, (array_agg(source_uuid))[1] AS source_uuid, count(*) AS winners
+    FROM ranked_sources
+    WHERE position = 1
+    GROUP BY start, stop
+)
+SELECT events.*
+FROM events
+WHERE events.gauge_uuid = :gauge_uuid
+AND events.start < :validity_stop
+AND events.stop > :validity_start
+AND events.source_uuid IN (SELECT source_uuid FROM overlapping_sources)
+AND (events.visible = false OR EXISTS (
+    SELECT 1
+    FROM winning_sources
+    WHERE winning_sources.start < events.stop
+    AND winning_sources.stop > events.start
+    AND (winning_sources.winners > 1 OR winning_sources.source_uuid <> events.source_uuid)))
+ORDER BY events.start
+"""
+
+def summarize_items(key, items, summary):
+    """
+    Method to collect the information needed from the items of one of the arrays of an operation before inserting them:
+    the keys of the catalogue entities referenced (gauges, annotation configurations, explicit references...),
+    the event keys, the link references and the number of alerts
+
+    :param key: key of the array inside the operation (events, annotations or explicit_references)
+    :type key: str
+    :param items: items of the array
+    :type items: list
+    :param summary: structure where to add the collected information
+    :type summary: dict
+    """
+    summary.setdefault("n_alerts", 0)
+    if key == "events":
+        gauges = summary.setdefault("gauges", set())
+        explicit_refs = summary.setdefault("explicit_refs", set())
+        event_keys = summary.setdefault("event_keys", set())
+        link_refs = summary.setdefault("link_refs", set())
+        for event in items:
+            gauges.add((event.get("gauge").get("name"), event.get("gauge").get("system"), event.get("gauge").get("description")))
+            if event.get("explicit_reference"):
+                explicit_refs.add(event.get("explicit_reference"))
+            # end if
+            if event.get("key"):
+                event_keys.add(event.get("key"))
+            # end if
+            if "link_ref" in event:
+                link_refs.add(event["link_ref"])
+            # end if
+            summary["n_alerts"] += len(event.get("alerts") or [])
+        # end for
+    elif key == "annotations":
+        annotation_cnfs = summary.setdefault("annotation_cnfs", set())
+        explicit_refs = summary.setdefault("explicit_refs", set())
+        for annotation in items:
+            annotation_cnfs.add((annotation.get("annotation_cnf").get("name"), annotation.get("annotation_cnf").get("system"), annotation.get("annotation_cnf").get("description")))
+            if annotation.get("explicit_reference"):
+                explicit_refs.add(annotation.get("explicit_reference"))
+            # end if
+            summary["n_alerts"] += len(annotation.get("alerts") or [])
+        # end for
+    elif key == "explicit_references":
+        explicit_refs = summary.setdefault("explicit_refs", set())
+        linked_explicit_refs = summary.setdefault("linked_explicit_refs", set())
+        explicit_ref_groups = summary.setdefault("explicit_ref_groups", set())
+        # Groups of the declared explicit references (the first declaration prevails)
+        groups_by_explicit_ref = summary.setdefault("groups_by_explicit_ref", {})
+        for explicit_ref in items:
+            explicit_refs.add(explicit_ref.get("name"))
+            if explicit_ref.get("group"):
+                explicit_ref_groups.add(explicit_ref.get("group"))
+            # end if
+            if not explicit_ref.get("name") in groups_by_explicit_ref:
+                groups_by_explicit_ref[explicit_ref.get("name")] = explicit_ref.get("group")
+            # end if
+            for link in explicit_ref.get("links") or []:
+                linked_explicit_refs.add(link.get("link"))
+            # end for
+            summary["n_alerts"] += len(explicit_ref.get("alerts") or [])
+        # end for
+    # end if
+
+    return
+
+def get_items_summary(operation, key):
+    """
+    Method to obtain the summary of one of the arrays of an operation (see summarize_items).
+    The summaries of the streamed arrays are computed only once (while loading the json file, see Engine.parse_data_from_json,
+    or the first time they are requested) and kept with the arrays, so that the items are not read again from the file
+
+    :param operation: operation containing the array
+    :type operation: dict
+    :param key: key of the array inside the operation (events, annotations or explicit_references)
+    :type key: str
+
+    :return: summary of the items of the array
+    :rtype: dict
+    """
+    items = operation.get(key) or []
+    if type(items) == StreamedArray:
+        if not "items" in items.summary:
+            summary = {}
+            for chunk in items.iterate_chunks():
+                summarize_items(key, chunk, summary)
+            # end for
+            items.summary["items"] = summary
+        # end if
+        return items.summary["items"]
+    # end if
+    summary = {}
+    summarize_items(key, items, summary)
+
+    return summary
+
+def get_operation_partitions(operations):
+    """
+    Method to group the operations in independent partitions.
+    Operations sharing the source name, the DIM signature, the link references defined in their events
+    or the explicit references pointed by alerts by reference belong to the same partition.
+    The alerts pointing to events by reference are grouped with the operations defining the link references,
+    so that the references are resolved in the same process
+
+    :param operations: list of operations
+    :type operations: list
+
+    :return: partitions of operations (pairs of the position of the operation and the operation) keeping the order of the operations
+    :rtype: list of lists
+    """
+    parents = list(range(len(operations)))
+    def find(position):
+        while parents[position] != position:
+            parents[position] = parents[parents[position]]
+            position = parents[position]
+        # end while
+        return position
+    # end def
+
+    # Entities pointed by the alerts by reference
+    alerted_entities_per_operation = []
+    alerted_explicit_refs = set()
+    for operation in operations:
+        alerted_entities = []
+        for alert in operation.get("alerts") or []:
+            entity = alert.get("entity") or {}
+            if entity.get("reference_mode") == "by_ref" and entity.get("type") == "event":
+                alerted_entities.append(("link_ref", entity.get("reference")))
+            elif entity.get("reference_mode") == "by_ref" and entity.get("type") == "explicit_ref":
+                alerted_entities.append(("explicit_ref", entity.get("reference")))
+                alerted_explicit_refs.add(entity.get("reference"))
+            # end if
+        # end for
+        alerted_entities_per_operation.append(alerted_entities)
+    # end for
+
+    positions_per_key = {}
+    for position, operation in enumerate(operations):
+        keys = [("source", (operation.get("source") or {}).get("name")),
+                ("dim_signature", (operation.get("dim_signature") or {}).get("name"))]
+        events_summary = get_items_summary(operation, "events")
+        keys += [("link_ref", link_ref) for link_ref in events_summary.get("link_refs", set())]
+        keys += alerted_entities_per_operation[position]
+        if len(alerted_explicit_refs) > 0:
+            explicit_refs = set()
+            for array_key in ["explicit_references", "events", "annotations"]:
+                explicit_refs |= get_items_summary(operation, array_key).get("explicit_refs", set())
+            # end for
+            keys += [("explicit_ref", explicit_ref) for explicit_ref in explicit_refs if explicit_ref in alerted_explicit_refs]
+        # end if
+        for key in keys:
+            if key in positions_per_key:
+                parents[find(position)] = find(positions_per_key[key])
+            else:
+                positions_per_key[key] = position
+            # end if
+        # end for
+    # end for
+
+    partitions = {}
+    for position, operation in enumerate(operations):
+        partitions.setdefault(find(position), []).append((position, operation))
+    # end for
+
+    return sorted(partitions.values(), key=lambda partition: partition[0][0])
+
+def treat_operations_partition(partition, processing_duration):
+    """
+    Method to treat a partition of operations inside a child process.
+    The links between events are not inserted but returned for their later insertion
+
+    :param partition: pairs of the position of the operation and the operation
+    :type partition: list
+    :param processing_duration: duration of the processing which generated the data to be treated
+    :type processing_duration: datetime.timedelta
+
+    :return: exit codes (with the position of the operation) and information for inserting the links between events
+    :rtype: dict
+    """
+    engine_eboa = Engine()
+    engine_eboa._initialize_context_treat_data()
+
+    returned_values = []
+    last_operation = None
+    for position, engine_eboa.operation in partition:
+        returned_values_operation = []
+        engine_eboa._treat_operation_data(processing_duration, returned_values_operation)
+        returned_values.extend([(position, returned_information) for returned_information in returned_values_operation])
+        source_uuid = None
+        if getattr(engine_eboa, "source", None) != None:
+            source_uuid = engine_eboa.source.source_uuid
+        # end if
+        last_operation = (position, source_uuid)
+    # end for
+
+    result = {
+        "returned_values": returned_values,
+        "event_link_refs": engine_eboa.event_link_refs,
+        "list_event_links_by_ref": engine_eboa.list_event_links_by_ref,
+        "list_event_links_by_uuid": engine_eboa.list_event_links_by_uuid,
+        "list_event_links_to_check_by_event_uuid_link": engine_eboa.list_event_links_to_check_by_event_uuid_link,
+        "dict_event_uuids_aliases": engine_eboa.dict_event_uuids_aliases,
+        "last_operation": last_operation
+    }
+    engine_eboa.close_session()
+
+    return result
+
 class Engine():
     """Class for communicating with the engine of the eboa module
 
@@ -226,6 +516,8 @@ class Engine():
         self.session_progress = self.Scoped_session()
         self.query = Query(self.session)
         self.operation = None
+        self.catalogue_entries = []
+        self.event_summary_keys = set()
     
         return
 
@@ -233,7 +525,7 @@ class Engine():
     # PARSING METHODS #
     ###################
     @debug
-    def parse_data_from_json(self, json_path, check_schema = True):
+    def parse_data_from_json(self, json_path, check_schema = True, stream = None):
         """
         Method to parse a json file for later treatment of its content
         
@@ -241,21 +533,49 @@ class Engine():
         :type json_path: str
         :param check_schema: indicates whether to pass a schema over the json file or not
         :type check_schema: bool
+        :param stream: indicates whether to keep in memory only the headers of the operations (default None, the value of JSON_STREAM in the configuration is used).
+        The events, annotations and explicit references are read from the file in chunks every time they are iterated (see json_stream.load_data).
+        Their items are validated and summarized while loading the file, so that they are read again only for their insertion
+        :type stream: bool
         """
+        if stream == None:
+            stream = config.get("JSON_STREAM") or False
+        # end if
         json_name = os.path.basename(json_path)
+        schema_error = None
         # Parse data from the json file
         try:
-            with open(json_path) as input_file:
-                data = json.load(input_file)
-
-        except ValueError:
+            if stream:
+                def treat_items(key, items, summary):
+                    if check_schema:
+                        parsing.validate_items(key, items)
+                        summary["validated"] = True
+                    # end if
+                    summarize_items(key, items, summary.setdefault("items", {}))
+                # end def
+                try:
+                    data = load_data(json_path, buffer_size = config.get("JSON_STREAM_BUFFER_SIZE") or 1048576, treat_items = treat_items)
+                except ErrorParsingDictionary as e:
+                    schema_error = e
+                # end try
+            else:
+                with open(json_path) as input_file:
+                    data = json.load(input_file)
+                # end with
+            # end if
+        except (ValueError, OSError) as e:
             message = exit_codes["FILE_NOT_VALID"]["message"].format(json_name)
             self._insert_source_without_dim_signature(json_name)
             self._insert_source_status(exit_codes["FILE_NOT_VALID"]["status"], error = True, message = message)
-            self.source.parse_error = "The json file cannot be loaded as it has a wrong structure"
-            # Insert the content of the file into the DDBB
-            with open(json_path) as input_file:
-                self.source.content_text = input_file.read()
+            if isinstance(e, OSError):
+                self.source.parse_error = "The json file cannot be read. Returned error: {}".format(str(e))
+            else:
+                self.source.parse_error = "The json file cannot be loaded as it has a wrong structure"
+                # Insert the content of the file into the DDBB
+                with open(json_path) as input_file:
+                    self.source.content_text = input_file.read()
+                # end with
+            # end if
             self.session.commit()
             # Log the error
             logger.error(message)
@@ -264,6 +584,9 @@ class Engine():
 
         if check_schema:
             try:
+                if schema_error != None:
+                    raise schema_error
+                # end if
                 parsing.validate_data_dictionary(data)
             except ErrorParsingDictionary as e:
                 self._insert_source_without_dim_signature(json_name)
@@ -318,8 +641,7 @@ class Engine():
         # Pass schema
         if check_schema:
             schema_path = get_schemas_path() + "/eboa_schema.xsd"
-            parsed_schema = etree.parse(schema_path)
-            schema = etree.XMLSchema(parsed_schema)
+            schema = xml_registry.get_schema(schema_path)
             valid = schema.validate(parsed_xml)
             if not valid:
                 message = exit_codes["FILE_NOT_VALID"]["message"].format(xml_name)
@@ -528,7 +850,7 @@ class Engine():
         return True
 
     @debug
-    def treat_data(self, data = None, source = None, validate = True, processing_duration = None):
+    def treat_data(self, data = None, source = None, validate = True, processing_duration = None, processes = None):
         """
         Method to treat the data stored in self.data
 
@@ -540,6 +862,8 @@ class Engine():
         :type validate: bool
         :param processing_duration: duration of the processing which generated the data to be treated
         :type processing_duration: datetime.timedelta
+        :param processes: number of processes to treat the operations (default None, the value of TREAT_DATA_PROCESSES in the configuration is used)
+        :type processes: int
 
         :return: exit_codes for every operation with the associated information (DIM signature, processor and source)
         :rtype: list of dictionaries
@@ -572,37 +896,19 @@ class Engine():
             # end if
         # end if
 
-        returned_values = []
-        for self.operation in self.data.get("operations") or []:
-
-            lock = "treat_data_" + self.operation.get("source").get("name")
-            @self.synchronized(lock, external=True, lock_path="/dev/shm")
-            def treat_operation_data(self, processing_duration, returned_values):
-                returned_value = -1
-                self.all_gauges_for_insert_and_erase = False
-                self.all_gauges_for_insert_and_erase_with_priority = False
-                self.all_gauges_for_insert_and_erase_with_equal_or_lower_priority = False
-                if self.operation.get("mode") == "insert_and_erase":
-                    self.all_gauges_for_insert_and_erase = True
-                elif self.operation.get("mode") == "insert_and_erase_with_priority":
-                    self.all_gauges_for_insert_and_erase_with_priority = True
-                elif self.operation.get("mode") == "insert_and_erase_with_equal_or_lower_priority":
-                    self.all_gauges_for_insert_and_erase_with_equal_or_lower_priority = True
-                # end if
+        operations = self.data.get("operations") or []
+        if processes == None:
+            processes = config.get("TREAT_DATA_PROCESSES") or 1
+        # end if
 
-                if self.operation.get("mode") in ["insert", "insert_and_erase", "insert_and_erase_with_priority", "insert_and_erase_with_equal_or_lower_priority"]:
-                    returned_value = self._insert_data(processing_duration = processing_duration)
-                    returned_information = {
-                        "source": self.operation.get("source").get("name"),
-                        "dim_signature": self.operation.get("dim_signature").get("name"),
-                        "processor": self.operation.get("dim_signature").get("exec"),
-                        "status": returned_value
-                    }
-                    returned_values.append(returned_information)
-                # end if
-            # end def
-            treat_operation_data(self, processing_duration, returned_values)
-        # end for
+        returned_values = []
+        if processes > 1 and len(operations) > 1:
+            returned_values = self._treat_operations_data_in_parallel(operations, processing_duration, processes)
+        else:
+            for self.operation in operations:
+                self._treat_operation_data(processing_duration, returned_values)
+            # end for
+        # end if
 
         # Insert event links at the end of the process to allow having references to events in DIMs which are going to be inserted later
         # Associate any error to the source of the last operation
@@ -613,7 +919,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["LINKS_INCONSISTENCY"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             # Log the error
             logger.error(e)
             returned_information = {
@@ -627,7 +933,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["UNDEFINED_EVENT_LINK_REF"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             # Log the error
             logger.error(e)
             returned_information = {
@@ -645,6 +951,141 @@ class Engine():
         
         return returned_values
 
+    def _treat_operation_data(self, processing_duration, returned_values):
+        """
+        Method to treat the operation stored in self.operation
+
+        :param processing_duration: duration of the processing which generated the data to be treated
+        :type processing_duration: datetime.timedelta
+        :param returned_values: list where to add the exit code of the operation with the associated information (DIM signature, processor and source)
+        :type returned_values: list
+        """
+        lock = "treat_data_" + self.operation.get("source").get("name")
+        @self.synchronized(lock, external=True, lock_path="/dev/shm")
+        def treat_operation_data(self, processing_duration, returned_values):
+            returned_value = -1
+            self.all_gauges_for_insert_and_erase = False
+            self.all_gauges_for_insert_and_erase_with_priority = False
+            self.all_gauges_for_insert_and_erase_with_equal_or_lower_priority = False
+            if self.operation.get("mode") == "insert_and_erase":
+                self.all_gauges_for_insert_and_erase = True
+            elif self.operation.get("mode") == "insert_and_erase_with_priority":
+                self.all_gauges_for_insert_and_erase_with_priority = True
+            elif self.operation.get("mode") == "insert_and_erase_with_equal_or_lower_priority":
+                self.all_gauges_for_insert_and_erase_with_equal_or_lower_priority = True
+            # end if
+
+            if self.operation.get("mode") in ["insert", "insert_and_erase", "insert_and_erase_with_priority", "insert_and_erase_with_equal_or_lower_priority"]:
+                returned_value = self._insert_data_checking_catalogue_cache(processing_duration = processing_duration)
+                returned_information = {
+                    "source": self.operation.get("source").get("name"),
+                    "dim_signature": self.operation.get("dim_signature").get("name"),
+                    "processor": self.operation.get("dim_signature").get("exec"),
+                    "status": returned_value
+                }
+                returned_values.append(returned_information)
+            # end if
+        # end def
+        treat_operation_data(self, processing_duration, returned_values)
+
+        return
+
+    def _insert_data_checking_catalogue_cache(self, processing_duration = None):
+        """
+        Method to insert the data of the operation stored in self.operation (see _insert_data).
+        The catalogue entities obtained from the cache could have been removed from the DDBB by other processes.
+        If the insertion violates the integrity of the DDBB after using cached entities, these entities are removed
+        from the cache and the insertion is performed again looking them up in the DDBB
+
+        :param processing_duration: duration of the processing which generated the data to be treated
+        :type processing_duration: datetime.timedelta
+
+        :return: exit code of the insertion
+        :rtype: int
+        """
+        if catalogue_cache.ttl <= 0:
+            return self._insert_data(processing_duration = processing_duration)
+        # end if
+
+        # Keep the context of treat_data modified by the insertion to restore it before the new attempt
+        context_treat_data = (dict(self.event_link_refs),
+                              list(self.list_event_links_by_ref),
+                              list(self.list_event_links_by_uuid),
+                              list(self.list_event_links_to_check_by_event_uuid_link),
+                              {event_uuid: list(aliases) for event_uuid, aliases in self.dict_event_uuids_aliases.items()})
+        try:
+            return self._insert_data(processing_duration = processing_duration)
+        except IntegrityError as e:
+            catalogue_hits = getattr(self, "catalogue_hits", [])
+            if len(catalogue_hits) == 0:
+                raise
+            # end if
+            logger.warning("The insertion of the source {} has violated the integrity of the DDBB after using cached catalogue entities, which could have been removed by other processes. The insertion is going to be performed again without the cached entities. Returned error: {}".format(self.operation.get("source").get("name"), str(e)))
+            # Roll back the nested transactions and the transaction of the insertion
+            while self.session.transaction != None and self.session.transaction.nested:
+                self.session.rollback()
+            # end while
+            self.session.rollback()
+            catalogue_cache.invalidate(catalogue_hits)
+            (self.event_link_refs,
+             self.list_event_links_by_ref,
+             self.list_event_links_by_uuid,
+             self.list_event_links_to_check_by_event_uuid_link,
+             self.dict_event_uuids_aliases) = context_treat_data
+        # end try
+
+        return self._insert_data(processing_duration = processing_duration)
+
+    def _treat_operations_data_in_parallel(self, operations, processing_duration, processes):
+        """
+        Method to treat the operations in parallel. The operations are grouped in independent partitions
+        (see get_operation_partitions) which are treated concurrently by a pool of processes with their own sessions.
+        The links between events are not inserted by the processes but returned to be inserted later by this engine
+
+        :param operations: list of operations to treat
+        :type operations: list
+        :param processing_duration: duration of the processing which generated the data to be treated
+        :type processing_duration: datetime.timedelta
+        :param processes: maximum number of processes
+        :type processes: int
+
+        :return: exit_codes for every operation with the associated information (DIM signature, processor and source) in the order of the operations
+        :rtype: list of dictionaries
+        """
+        partitions = get_operation_partitions(operations)
+
+        # The connections of the pool cannot be shared with the child processes
+        ddbb_engine.dispose()
+
+        # The child processes are forked so that they inherit the configuration and the loaded modules
+        # (the default start method is not fork in every platform and python version)
+        with ProcessPoolExecutor(max_workers = min(processes, len(partitions)), mp_context = multiprocessing.get_context("fork")) as executor:
+            results = list(executor.map(treat_operations_partition, partitions, [processing_duration] * len(partitions)))
+        # end with
+
+        returned_values = []
+        last_operation = None
+        for result in results:
+            returned_values.extend(result["returned_values"])
+            self.event_link_refs.update(result["event_link_refs"])
+            self.list_event_links_by_ref.extend(result["list_event_links_by_ref"])
+            self.list_event_links_by_uuid.extend(result["list_event_links_by_uuid"])
+            self.list_event_links_to_check_by_event_uuid_link.extend(result["list_event_links_to_check_by_event_uuid_link"])
+            self.dict_event_uuids_aliases.update(result["dict_event_uuids_aliases"])
+            if last_operation == None or result["last_operation"][0] > last_operation[0]:
+                last_operation = result["last_operation"]
+            # end if
+        # end for
+
+        # Associate the context of the last operation for the insertion of the links
+        self.operation = operations[last_operation[0]]
+        if last_operation[1] != None:
+            self.source = baked_queries.get_source_by_uuid(self.session, last_operation[1])
+            self.dim_signature = self.source.dimSignature
+        # end if
+
+        return [returned_information for position, returned_information in sorted(returned_values, key=lambda returned_value: returned_value[0])]
+
     def _initialize_context_treat_data(self):
         # Initialize context
         self.event_link_refs = {}
@@ -678,6 +1119,10 @@ class Engine():
         self.set_counters = {}
         self.alert_cnfs = {}
         self.alert_groups = {}
+        # Catalogue entities to be cached once the operation is committed
+        self.catalogue_entries = []
+        # Catalogue entities obtained from the cache (they could have been removed from the DDBB by other processes)
+        self.catalogue_hits = []
 
         # This is not necessarily needed, just here to avoid a lot of modifications on tests
         if not hasattr(self, "event_link_refs"):
@@ -737,14 +1182,14 @@ class Engine():
             # Log that the source file has a wrong specified period as the stop is lower than the start
             logger.error(e)
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             return exit_codes["WRONG_SOURCE_PERIOD"]["status"]
         except PriorityNotDefined as e:
             self.session.rollback()
             self._insert_source_status(exit_codes["PRIORITY_NOT_DEFINED"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -825,7 +1270,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["DUPLICATED_EVENT_LINK_REF"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -834,7 +1279,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["WRONG_EVENT_PERIOD"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -843,7 +1288,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["WRONG_VALUE"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -852,7 +1297,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["ODD_NUMBER_OF_COORDINATES"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -861,7 +1306,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["WRONG_GEOMETRY"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -870,7 +1315,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["DUPLICATED_VALUES"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -879,7 +1324,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["PRIORITY_NOT_DEFINED"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -888,7 +1333,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["MIXED_OPERATIONS_WITH_COUNTER"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -897,7 +1342,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["DUPLICATED_SET_COUNTER"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -915,7 +1360,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["WRONG_VALUE"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -924,7 +1369,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["ODD_NUMBER_OF_COORDINATES"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -933,7 +1378,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["WRONG_GEOMETRY"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -942,7 +1387,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["DUPLICATED_VALUES"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -951,7 +1396,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["PRIORITY_NOT_DEFINED"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -969,7 +1414,7 @@ class Engine():
             self.session.rollback()
             self._insert_source_status(exit_codes["UNDEFINED_ENTITY_REF"]["status"], error = True, message = str(e))
             # Insert content in the DDBB
-            self.source.content_json = json.dumps(self.operation)
+            self.source.content_json = json.dumps(self.operation, default = encode_streamed_array)
             self.session.commit()
             # Log the error
             logger.error(e)
@@ -997,70 +1442,21 @@ class Engine():
         self._manage_set_counters()
         self._manage_update_counters()
 
+        # Update the summaries of the events
+        if config.get("EVENT_SUMMARIES"):
+            self._refresh_event_summaries()
+        # end if
+
         self._insert_ingestion_progress(95)
 
         logger.debug("Counters managed for the source file {} associated to the DIM signature {} and DIM processing {} with version {}".format(self.source.name, self.dim_signature.dim_signature, self.source.processor, self.source.processor_version))
         
-        n_events = 0
-        n_event_alerts = 0
-        if "events" in self.operation:
-            events = self.operation.get("events")
-            n_events = len(events)
-
-            # Get the alerts associated to the events
-            for event in events:
-                if "alerts" in event:
-                    event_alerts = [alert for alert in event.get("alerts")]
-                    n_event_alerts = n_event_alerts + len(event_alerts)
-                # end if
-            # end for
-        # end if
-
-        n_annotations = 0
-        n_annotation_alerts = 0
-        if "annotations" in self.operation:
-            annotations = self.operation.get("annotations")
-            n_annotations = len(annotations)
-
-            # Get the alerts associated to the annotations
-            for annotation in annotations:
-                if "alerts" in annotation:
-                    annotation_alerts = [alert for alert in annotation.get("alerts")]
-                    n_annotation_alerts = n_annotation_alerts + len(annotation_alerts)
-                # end if
-            # end for
-        # end if
-
-        n_explicit_references = 0
-        n_explicit_reference_alerts = 0
-        if "explicit_references" in self.operation:
-            explicit_references = self.operation.get("explicit_references")
-            n_explicit_references = len(explicit_references)
-
-            # Get the alerts associated to the explicit_references
-            for explicit_reference in explicit_references:
-                if "alerts" in explicit_reference:
-                    explicit_reference_alerts = [alert for alert in explicit_reference.get("alerts")]
-                    n_explicit_reference_alerts = n_explicit_reference_alerts + len(explicit_reference_alerts)
-                # end if
-            # end for
-        # end if
-
-        n_source_alerts = 0        
-        if "source" in self.operation:
-            source = self.operation.get("source")
-
-            # Get the alerts associated to the sources
-            if "alerts" in source:
-                source_alerts = [alert for alert in source.get("alerts")]
-                n_source_alerts = len(source_alerts)
-            # end if
-        # end if
-
-        n_alerts = n_event_alerts + n_annotation_alerts + n_explicit_reference_alerts + n_source_alerts
-        if "alerts" in self.operation:
-            n_alerts = n_alerts + len(self.operation.get("alerts"))
-        # end if
+        n_events = len(self.operation.get("events") or [])
+        n_annotations = len(self.operation.get("annotations") or [])
+        n_alerts = len(self.operation.get("alerts") or []) + len((self.operation.get("source") or {}).get("alerts") or [])
+        for key in ["events", "annotations", "explicit_references"]:
+            n_alerts += get_items_summary(self.operation, key).get("n_alerts", 0)
+        # end for
 
         self._insert_ingestion_progress(100)
 
@@ -1082,27 +1478,97 @@ class Engine():
         # Commit data
         self.session.commit()
 
+        # Cache the catalogue entities used by the operation as they are already committed
+        for entity, key, instance in self.catalogue_entries:
+            catalogue_cache.put(entity, key, instance)
+        # end for
+
         return exit_codes["OK"]["status"]
 
     def _bulk_insert_mappings(self, entity, mappings):
+        """
+        Method to insert a list of mappings skipping (and logging) the rows violating the integrity of the DDBB.
+        The mappings are inserted in batches with INSERT ... ON CONFLICT DO NOTHING RETURNING so that the conflicting
+        rows are skipped by the DDBB in the same statement. Other integrity violations (e.g. foreign keys) are isolated
+        by bisecting the batch (see _insert_mappings_skipping_integrity_errors)
+
+        :param entity: class of the datamodel associated to the table
+        :type entity: sqlalchemy declarative class
+        :param mappings: list of dictionaries with the values of the columns of each row
+        :type mappings: list
+        """
+        # Normalize the mappings to use the same columns in the multi-row VALUES clause
+        columns = [column.name for column in entity.__table__.columns if any(column.name in mapping for mapping in mappings)]
+        mappings = [{column: mapping.get(column) for column in columns} for mapping in mappings]
+
+        batch_size = config.get("BULK_INSERT_MAPPINGS_BATCH_SIZE") or 1000
+        for i in range(0, len(mappings), batch_size):
+            self._insert_mappings_skipping_integrity_errors(entity, mappings[i:i + batch_size])
+        # end for
+    # end def
+
+    def _insert_mappings_skipping_integrity_errors(self, entity, mappings):
+        """
+        Method to insert a batch of mappings inside a savepoint with INSERT ... ON CONFLICT DO NOTHING RETURNING.
+        The mappings not returned by the DDBB have been skipped due to conflicts and they are logged.
+        If the statement raises an IntegrityError not managed by the ON CONFLICT clause, the batch is split in halves
+        until the offending mappings are isolated and skipped
+
+        :param entity: class of the datamodel associated to the table
+        :type entity: sqlalchemy declarative class
+        :param mappings: list of dictionaries with the values of the columns of each row
+        :type mappings: list
+        """
+        primary_key = list(entity.__table__.primary_key.columns)[0]
+        statement = insert(entity.__table__).values(mappings).on_conflict_do_nothing().returning(primary_key)
         self.session.begin_nested()
         try:
-            self.session.bulk_insert_mappings(entity, mappings)
-        except IntegrityError:
+            inserted_keys = set([row[0] for row in self.session.execute(statement)])
+        except IntegrityError as e:
             self.session.rollback()
-            for mapping in mappings:
-                self.session.begin_nested()
-                try:
-                    self.session.bulk_insert_mappings(entity, [mapping])
-                except IntegrityError as e:
-                    logger.info("Mapping ##{}## is skipped because the following exception was raised ##{}##".format(mapping, str(e)))
-                    self.session.rollback()
-                # end try
-                self.session.commit()
-            # end for
+            if "psycopg2.errors.ForeignKeyViolation" in str(e) and len(self.catalogue_hits) > 0:
+                # The mapping could point to a cached catalogue entity removed by other process (see _treat_operation_data)
+                raise
+            # end if
+            if len(mappings) == 1:
+                logger.info("Mapping ##{}## is skipped because the following exception was raised ##{}##".format(mappings[0], str(e)))
+            else:
+                self._insert_mappings_skipping_integrity_errors(entity, mappings[:len(mappings) // 2])
+                self._insert_mappings_skipping_integrity_errors(entity, mappings[len(mappings) // 2:])
+            # end if
+            return
         # end try
         self.session.commit()
-    # end def
+
+        if len(inserted_keys) < len(mappings):
+            for mapping in mappings:
+                if not mapping[primary_key.name] in inserted_keys:
+                    logger.info("Mapping ##{}## is skipped because it conflicts with data already inserted".format(mapping))
+                # end if
+            # end for
+        # end if
+
+        return
+
+    def _bulk_load(self, entity, mappings):
+        """
+        Method to insert a list of mappings using the bulk loader specified in the configuration (BULK_LOADER):
+        - orm (default): session.bulk_insert_mappings
+        - copy: PostgreSQL command COPY FROM STDIN (see eboa.engine.bulk_loader)
+        Both loaders raise the same SQLAlchemy exceptions (IntegrityError, InternalError...)
+
+        :param entity: class of the datamodel associated to the table
+        :type entity: sqlalchemy declarative class
+        :param mappings: list of dictionaries with the values of the columns of each row
+        :type mappings: list
+        """
+        if config.get("BULK_LOADER") == "copy":
+            copy_mappings(self.session, entity, mappings)
+        else:
+            self.session.bulk_insert_mappings(entity, mappings)
+        # end if
+
+        return
 
     @debug
     def _insert_dim_signature(self):
@@ -1111,7 +1577,12 @@ class Engine():
         """
         dim_signature = self.operation.get("dim_signature")
         dim_name = dim_signature.get("name")
-        self.dim_signature = self.session.query(DimSignature).filter(DimSignature.dim_signature == dim_name).first()
+        self.dim_signature = catalogue_cache.get(self.session, DimSignature, (dim_name,))
+        if self.dim_signature:
+            self.catalogue_hits.append((DimSignature, (dim_name,)))
+            return
+        # end if
+        self.dim_signature = baked_queries.get_dim_signature(self.session, dim_name)
         if not self.dim_signature:
             id = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
             self.dim_signature = DimSignature(id, dim_name)
@@ -1125,10 +1596,11 @@ class Engine():
                 # re-using the session
                 self.session.rollback()
                 # Get the stored DIM signature
-                self.dim_signature = self.session.query(DimSignature).filter(DimSignature.dim_signature == dim_name).first()
+                self.dim_signature = baked_queries.get_dim_signature(self.session, dim_name)
                 pass
             # end try
         # end if
+        self.catalogue_entries.append((DimSignature, (dim_name,), self.dim_signature))
         
         return
 
@@ -1196,7 +1668,7 @@ class Engine():
         # end if
         
         id = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
-        if parser.parse(validity_stop).replace(tzinfo=None) < parser.parse(validity_start).replace(tzinfo=None) or parser.parse(reported_validity_stop).replace(tzinfo=None) < parser.parse(reported_validity_start).replace(tzinfo=None):
+        if parse_timestamp(validity_stop).replace(tzinfo=None) < parse_timestamp(validity_start).replace(tzinfo=None) or parse_timestamp(reported_validity_stop).replace(tzinfo=None) < parse_timestamp(reported_validity_start).replace(tzinfo=None):
             # The validity period is not correct (stop > start)
             # Create Source for registering the error in the DDBB
             self.source = Source(id, name, reception_time, generation_time,
@@ -1210,12 +1682,9 @@ class Engine():
             except IntegrityError:
                 # The DIM processing was already ingested
                 self.session.rollback()
-                self.source = self.session.query(Source).filter(Source.name == name,
-                                                                       Source.dim_signature_uuid == self.dim_signature.dim_signature_uuid,
-                                                                       Source.processor_version == version,
-                Source.processor == processor).first()
+                self.source = baked_queries.get_source(self.session, name, self.dim_signature.dim_signature_uuid, version, processor)
             # end try
-            if parser.parse(validity_stop).replace(tzinfo=None) < parser.parse(validity_start).replace(tzinfo=None):
+            if parse_timestamp(validity_stop).replace(tzinfo=None) < parse_timestamp(validity_start).replace(tzinfo=None):
                 raise WrongPeriod(exit_codes["WRONG_SOURCE_PERIOD"]["message"].format(name, self.dim_signature.dim_signature, processor, version, validity_stop, validity_start))
             else:
                 raise WrongReportedValidityPeriod(exit_codes["WRONG_SOURCE_REPORTED_VALIDITY_PERIOD"]["message"].format(name, self.dim_signature.dim_signature, processor, version, reported_validity_stop, reported_validity_start))
@@ -1225,18 +1694,15 @@ class Engine():
         # If duration of validity period is 0, shift the stop value by 1 microsecond and log a warning
         check_duration_0 = False
         warning_message_duration_0 = ""
-        if parser.parse(validity_stop).replace(tzinfo=None) == parser.parse(validity_start).replace(tzinfo=None):
-            new_validity_stop = (parser.parse(validity_stop).replace(tzinfo=None) + datetime.timedelta(microseconds=1)).isoformat()
+        if parse_timestamp(validity_stop).replace(tzinfo=None) == parse_timestamp(validity_start).replace(tzinfo=None):
+            new_validity_stop = (parse_timestamp(validity_stop).replace(tzinfo=None) + datetime.timedelta(microseconds=1)).isoformat()
             warning_message_duration_0 = exit_codes["SOURCE_VALIDITY_DURATION_0"]["message"].format(name, self.dim_signature.dim_signature, processor, version, validity_stop, validity_start, new_validity_stop)
             logger.warning(warning_message_duration_0)
             validity_stop = new_validity_stop
             check_duration_0 = True
         # end if
 
-        self.source = self.session.query(Source).filter(Source.name == name,
-                                                               Source.dim_signature_uuid == self.dim_signature.dim_signature_uuid,
-                                                               Source.processor_version == version,
-                Source.processor == processor).first()
+        self.source = baked_queries.get_source(self.session, name, self.dim_signature.dim_signature_uuid, version, processor)
         if self.source and self.source.ingested:
             # The source has been already ingested
             raise SourceAlreadyIngested(exit_codes["SOURCE_ALREADY_INGESTED"]["message"].format(name,
@@ -1245,22 +1711,22 @@ class Engine():
                                                                                                      version))
         elif self.source:
             # Source available in DDBB but with flag ingested equal to False. Upadte the information
-            self.source.validity_start = parser.parse(validity_start)
-            self.source.validity_stop = parser.parse(validity_stop)
-            self.source.reported_validity_start = parser.parse(reported_validity_start)
-            self.source.reported_validity_stop = parser.parse(reported_validity_stop)
-            self.source.reception_time = parser.parse(reception_time)
-            self.source.generation_time = parser.parse(generation_time)
-            self.source.reported_generation_time = parser.parse(reported_generation_time)
+            self.source.validity_start = parse_timestamp(validity_start)
+            self.source.validity_stop = parse_timestamp(validity_stop)
+            self.source.reported_validity_start = parse_timestamp(reported_validity_start)
+            self.source.reported_validity_stop = parse_timestamp(reported_validity_stop)
+            self.source.reception_time = parse_timestamp(reception_time)
+            self.source.generation_time = parse_timestamp(generation_time)
+            self.source.reported_generation_time = parse_timestamp(reported_generation_time)
             self.source.processing_duration = processing_duration
             self.source.priority = priority
             self.source.ingestion_completeness = ingestion_completeness_check
             self.source.ingestion_completeness_message = ingestion_completeness_message
         else:
             # Source not available in DDBB. Insert the information
-            self.source = Source(id, name, parser.parse(reception_time),
-                                 parser.parse(generation_time), version, self.dim_signature,
-                                 parser.parse(validity_start), parser.parse(validity_stop),
+            self.source = Source(id, name, parse_timestamp(reception_time),
+                                 parse_timestamp(generation_time), version, self.dim_signature,
+                                 parse_timestamp(validity_start), parse_timestamp(validity_stop),
                                  processor = processor, processing_duration = processing_duration,
                                  processor_progress = processor_progress, reported_generation_time = reported_generation_time,
                                  reported_validity_start = reported_validity_start,
@@ -1273,10 +1739,11 @@ class Engine():
             except IntegrityError:
                 # The source has been ingested between the query and the insertion
                 self.session.rollback()
-                self.source = self.session.query(Source).filter(Source.name == name,
-                                                                       Source.dim_signature_uuid == self.dim_signature.dim_signature_uuid,
-                                                                       Source.processor_version == version,
-                    Source.processor == processor).first()
+                self.source = baked_queries.get_source(self.session, name, self.dim_signature.dim_signature_uuid, version, processor)
+                if self.source == None:
+                    # Other integrity error (e.g. the cached DIM signature has been removed by other process)
+                    raise
+                # end if
                 raise SourceAlreadyIngested(exit_codes["SOURCE_ALREADY_INGESTED"]["message"].format(name,
                                                                   self.dim_signature.dim_signature,
                                                                   processor, 
@@ -1289,17 +1756,14 @@ class Engine():
             raise PriorityNotDefined(exit_codes["PRIORITY_NOT_DEFINED"]["message"].format(self.source.name, self.dim_signature.dim_signature, self.source.processor, self.source.processor_version))
         # end if
         
-        self.source_progress = self.session_progress.query(Source).filter(Source.name == name,
-                                                        Source.dim_signature_uuid == self.dim_signature.dim_signature_uuid,
-                                                        Source.processor_version == version,
-                                                        Source.processor == processor).first()
+        self.source_progress = baked_queries.get_source(self.session_progress, name, self.dim_signature.dim_signature_uuid, version, processor)
         
         list_alerts = []
         
         # Manage alerts
         if "alerts" in source:
-            alert_groups = insert_alert_groups(self.session, source)
-            alert_cnfs = insert_alert_cnfs(self.session, source, alert_groups)
+            alert_groups = insert_alert_groups(self.session, source, catalogue_entries = self.catalogue_entries, catalogue_hits = self.catalogue_hits)
+            alert_cnfs = insert_alert_cnfs(self.session, source, alert_groups, catalogue_entries = self.catalogue_entries, catalogue_hits = self.catalogue_hits)
             for alert in source["alerts"]:
                 alert_uuid = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
                 alert_cnf = alert_cnfs[alert.get("alert_cnf").get("name")]
@@ -1355,13 +1819,17 @@ class Engine():
         Method to insert the gauges
         """
         description = None
-        gauges = [(event.get("gauge").get("name"), event.get("gauge").get("system"), event.get("gauge").get("description"))  for event in self.operation.get("events") or []]
-        unique_gauges = sorted(set(gauges))
+        unique_gauges = sorted(get_items_summary(self.operation, "events").get("gauges", set()))
         for gauge in unique_gauges:
             name = gauge[0]
             system = gauge[1]
             description = gauge[2]
-            self.gauges[(name,system)] = self.session.query(Gauge).filter(Gauge.name == name, Gauge.system == system, Gauge.dim_signature_uuid == self.dim_signature.dim_signature_uuid).first()
+            self.gauges[(name,system)] = catalogue_cache.get(self.session, Gauge, (name, system, self.dim_signature.dim_signature_uuid))
+            if self.gauges[(name,system)]:
+                self.catalogue_hits.append((Gauge, (name, system, self.dim_signature.dim_signature_uuid)))
+                continue
+            # end if
+            self.gauges[(name,system)] = baked_queries.get_gauge(self.session, name, system, self.dim_signature.dim_signature_uuid)
             if not self.gauges[(name,system)]:
                 self.session.begin_nested()
                 id = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
@@ -1375,10 +1843,11 @@ class Engine():
                     # re-using the session
                     self.session.rollback()
                     # Get the stored gauge
-                    self.gauges[(name,system)] = self.session.query(Gauge).filter(Gauge.name == name, Gauge.system == system, Gauge.dim_signature_uuid == self.dim_signature.dim_signature_uuid).first()
+                    self.gauges[(name,system)] = baked_queries.get_gauge(self.session, name, system, self.dim_signature.dim_signature_uuid)
                     pass
                 # end try
             # end if
+            self.catalogue_entries.append((Gauge, (name, system, self.dim_signature.dim_signature_uuid), self.gauges[(name,system)]))
         # end for
         return
 
@@ -1387,13 +1856,17 @@ class Engine():
         """
         Method to insert the annotation configurations
         """
-        annotation_cnfs = [(annotation.get("annotation_cnf").get("name"), annotation.get("annotation_cnf").get("system"), annotation.get("annotation_cnf").get("description"))  for annotation in self.operation.get("annotations") or []]
-        unique_annotation_cnfs = sorted(set(annotation_cnfs))
+        unique_annotation_cnfs = sorted(get_items_summary(self.operation, "annotations").get("annotation_cnfs", set()))
         for annotation in unique_annotation_cnfs:
             name = annotation[0]
             system = annotation[1]
             description = annotation[2]
-            self.annotation_cnfs[(name,system)] = self.session.query(AnnotationCnf).filter(AnnotationCnf.name == name, AnnotationCnf.system == system, AnnotationCnf.dim_signature_uuid == self.dim_signature.dim_signature_uuid).first()
+            self.annotation_cnfs[(name,system)] = catalogue_cache.get(self.session, AnnotationCnf, (name, system, self.dim_signature.dim_signature_uuid))
+            if self.annotation_cnfs[(name,system)]:
+                self.catalogue_hits.append((AnnotationCnf, (name, system, self.dim_signature.dim_signature_uuid)))
+                continue
+            # end if
+            self.annotation_cnfs[(name,system)] = baked_queries.get_annotation_cnf(self.session, name, system, self.dim_signature.dim_signature_uuid)
             if not self.annotation_cnfs[(name,system)]:
                 self.session.begin_nested()
                 id = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
@@ -1407,10 +1880,11 @@ class Engine():
                     # re-using the session
                     self.session.rollback()
                     # Get the stored annotation configuration
-                    self.annotation_cnfs[(name,system)] = self.session.query(AnnotationCnf).filter(AnnotationCnf.name == name, AnnotationCnf.system == system, AnnotationCnf.dim_signature_uuid == self.dim_signature.dim_signature_uuid).first()
+                    self.annotation_cnfs[(name,system)] = baked_queries.get_annotation_cnf(self.session, name, system, self.dim_signature.dim_signature_uuid)
                     pass
                 # end try
             # end if
+            self.catalogue_entries.append((AnnotationCnf, (name, system, self.dim_signature.dim_signature_uuid), self.annotation_cnfs[(name,system)]))
         # end for
 
         return
@@ -1420,8 +1894,7 @@ class Engine():
         """
         Method to insert the groups of explicit references
         """
-        explicit_ref_groups = [explicit_ref.get("group") for explicit_ref in self.operation.get("explicit_references") or [] if explicit_ref.get("group")]
-        unique_explicit_ref_groups = sorted(set(explicit_ref_groups))
+        unique_explicit_ref_groups = sorted(get_items_summary(self.operation, "explicit_references").get("explicit_ref_groups", set()))
         
         for explicit_ref_group in unique_explicit_ref_groups or []:
             self.session.begin_nested()
@@ -1434,7 +1907,7 @@ class Engine():
             except IntegrityError:
                 # The explicit reference group exists already into DDBB
                 self.session.rollback()
-                expl_group_ddbb = self.session.query(ExplicitRefGrp).filter(ExplicitRefGrp.name == explicit_ref_group).first()
+                expl_group_ddbb = baked_queries.get_explicit_ref_group(self.session, explicit_ref_group)
                 pass
             # end try
             self.expl_groups[explicit_ref_group] = expl_group_ddbb
@@ -1449,54 +1922,78 @@ class Engine():
         """
 
         # Join all sources of explicit references
-        events_explicit_refs = [event.get("explicit_reference") for event in self.operation.get("events") or [] if event.get("explicit_reference")]
-        annotations_explicit_refs = [annotation.get("explicit_reference") for annotation in self.operation.get("annotations") or [] if annotation.get("explicit_reference")]
-        declared_explicit_refs = [i.get("name") for i in self.operation.get("explicit_references") or []]
-        linked_explicit_refs = [link.get("link") for explicit_ref in self.operation.get("explicit_references") or [] if explicit_ref.get("links") for link in explicit_ref.get("links")]
-        explicit_references = sorted(set(events_explicit_refs + annotations_explicit_refs + declared_explicit_refs + linked_explicit_refs))
-
-        for explicit_ref in explicit_references:
-            self.explicit_refs[explicit_ref] = self.session.query(ExplicitRef).filter(ExplicitRef.explicit_ref == explicit_ref).first()
-
-            explicit_ref_grp = None
-            # Get associated group if exists from the declared explicit references
-            declared_explicit_reference = next(iter([i for i in self.operation.get("explicit_references") or [] if i.get("name") == explicit_ref]), None)
-            if declared_explicit_reference:
-                explicit_ref_grp = self.expl_groups.get(declared_explicit_reference.get("group"))
-            # end if
-            
-            if not self.explicit_refs[explicit_ref]:
-                self.session.begin_nested()
-                id = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
-                self.explicit_refs[explicit_ref] = ExplicitRef(id, datetime.datetime.now(), explicit_ref, explicit_ref_grp)
-                self.session.add(self.explicit_refs[explicit_ref])
-                try:
-                    race_condition()
-                    self.session.commit()
-                except IntegrityError:
-                    # The explicit reference has been inserted between the query and the insertion. Roll back transaction for
-                    # re-using the session
-                    self.session.rollback()
-                    self.explicit_refs[explicit_ref] = self.session.query(ExplicitRef).filter(ExplicitRef.explicit_ref == explicit_ref).first()
-                    pass
-                # end try
-            # end if
+        explicit_refs_summary = get_items_summary(self.operation, "explicit_references")
+        events_explicit_refs = get_items_summary(self.operation, "events").get("explicit_refs", set())
+        annotations_explicit_refs = get_items_summary(self.operation, "annotations").get("explicit_refs", set())
+        declared_explicit_refs = explicit_refs_summary.get("explicit_refs", set())
+        linked_explicit_refs = explicit_refs_summary.get("linked_explicit_refs", set())
+        explicit_references = sorted(events_explicit_refs | annotations_explicit_refs | declared_explicit_refs | linked_explicit_refs)
+
+        if len(explicit_references) == 0:
+            return
+        # end if
+
+        # Get associated groups from the declared explicit references (the first declaration prevails)
+        explicit_ref_grps = {name: self.expl_groups.get(group) for name, group in explicit_refs_summary.get("groups_by_explicit_ref", {}).items()}
+
+        # Resolve the stored explicit references with one query
+        stored_explicit_refs = {explicit_ref[0]: explicit_ref[1] for explicit_ref in self.session.query(ExplicitRef.explicit_ref, ExplicitRef.expl_ref_cnf_uuid).filter(ExplicitRef.explicit_ref.in_(explicit_references))}
+        missing_explicit_refs = [explicit_ref for explicit_ref in explicit_references if not explicit_ref in stored_explicit_refs]
+
+        if len(missing_explicit_refs) > 0:
+            ingestion_time = datetime.datetime.now()
+            list_explicit_refs = []
+            for explicit_ref in missing_explicit_refs:
+                explicit_ref_grp = explicit_ref_grps.get(explicit_ref)
+                expl_ref_cnf_uuid = None
+                if explicit_ref_grp != None:
+                    expl_ref_cnf_uuid = explicit_ref_grp.expl_ref_cnf_uuid
+                # end if
+                list_explicit_refs.append(dict(explicit_ref_uuid = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14)),
+                                               ingestion_time = ingestion_time,
+                                               explicit_ref = explicit_ref,
+                                               expl_ref_cnf_uuid = expl_ref_cnf_uuid))
+            # end for
 
+            # Insert the missing explicit references with one statement. The explicit references
+            # inserted between the query and the insertion are skipped by the DDBB
+            self.session.begin_nested()
+            race_condition()
+            inserted_explicit_refs = set([row[0] for row in self.session.execute(insert(ExplicitRef.__table__).values(list_explicit_refs).on_conflict_do_nothing(index_elements = ["explicit_ref"]).returning(ExplicitRef.__table__.c.explicit_ref))])
+            self.session.commit()
 
-            # Update group information if available (this is to reduce the effort at ingestion level of synchronizing groups.
-            # The ingestion developer has to take into account using always the same groups accross ingestion
-            # processors for the same explicit references to avoid clashes)
-            if explicit_ref_grp != None:
-                self.explicit_refs[explicit_ref].group = explicit_ref_grp
+            # Re-read the explicit references inserted by other processes
+            conflicting_explicit_refs = [explicit_ref for explicit_ref in missing_explicit_refs if not explicit_ref in inserted_explicit_refs]
+            if len(conflicting_explicit_refs) > 0:
+                stored_explicit_refs.update({explicit_ref[0]: explicit_ref[1] for explicit_ref in self.session.query(ExplicitRef.explicit_ref, ExplicitRef.expl_ref_cnf_uuid).filter(ExplicitRef.explicit_ref.in_(conflicting_explicit_refs))})
             # end if
+        # end if
+
+        # Update group information if available (this is to reduce the effort at ingestion level of synchronizing groups.
+        # The ingestion developer has to take into account using always the same groups accross ingestion
+        # processors for the same explicit references to avoid clashes)
+        explicit_refs_per_grp = {}
+        for explicit_ref in stored_explicit_refs:
+            explicit_ref_grp = explicit_ref_grps.get(explicit_ref)
+            if explicit_ref_grp != None and stored_explicit_refs[explicit_ref] != explicit_ref_grp.expl_ref_cnf_uuid:
+                explicit_refs_per_grp.setdefault(explicit_ref_grp.expl_ref_cnf_uuid, []).append(explicit_ref)
+            # end if
+        # end for
+        for expl_ref_cnf_uuid in explicit_refs_per_grp:
+            self.session.query(ExplicitRef).filter(ExplicitRef.explicit_ref.in_(explicit_refs_per_grp[expl_ref_cnf_uuid])).update({"expl_ref_cnf_uuid": expl_ref_cnf_uuid}, synchronize_session = False)
+        # end for
+
+        # Load the explicit references for the rest of the ingestion
+        for explicit_ref in self.session.query(ExplicitRef).filter(ExplicitRef.explicit_ref.in_(explicit_references)).populate_existing():
+            self.explicit_refs[explicit_ref.explicit_ref] = explicit_ref
         # end for
 
         # Manage alerts
         list_alerts = []
         explicit_refs_with_alerts = [explicit_ref for explicit_ref in self.operation.get("explicit_references") or [] if "alerts" in explicit_ref]
         for explicit_ref in explicit_refs_with_alerts:
-                alert_groups = insert_alert_groups(self.session, explicit_ref)
-                alert_cnfs = insert_alert_cnfs(self.session, explicit_ref, alert_groups)
+                alert_groups = insert_alert_groups(self.session, explicit_ref, catalogue_entries = self.catalogue_entries, catalogue_hits = self.catalogue_hits)
+                alert_cnfs = insert_alert_cnfs(self.session, explicit_ref, alert_groups, catalogue_entries = self.catalogue_entries, catalogue_hits = self.catalogue_hits)
                 for alert in explicit_ref["alerts"]:
                     alert_uuid = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
                     alert_cnf = alert_cnfs[alert.get("alert_cnf").get("name")]
@@ -1507,7 +2004,7 @@ class Engine():
                     kwargs["notification_time"] = alert.get("notification_time")
                     kwargs["alert_uuid"] = alert_cnf.alert_uuid
                     kwargs["explicit_ref_alert_uuid"] = alert_uuid
-                    kwargs["explicit_ref_uuid"] = id
+                    kwargs["explicit_ref_uuid"] = self.explicit_refs[explicit_ref.get("name")].explicit_ref_uuid
                     list_alerts.append(dict(kwargs))
                 # end for
             # end if
@@ -1583,10 +2080,10 @@ class Engine():
         :type source_id: uuid
         """
         if not type(start) == datetime.datetime:
-            start = parser.parse(start).replace(tzinfo=None)
+            start = parse_timestamp(start).replace(tzinfo=None)
         # end if
         if not type(stop) == datetime.datetime:
-            stop = parser.parse(stop).replace(tzinfo=None)
+            stop = parse_timestamp(stop).replace(tzinfo=None)
         # end if
         if stop < start:
             # The period of the event is not correct (stop > start)
@@ -1595,7 +2092,7 @@ class Engine():
         # end if
         
         if source == None:
-            source = self.session.query(Source).filter(Source.source_uuid == source_id).first()
+            source = baked_queries.get_source_by_uuid(self.session, source_id)
         # end if
 
         source_start = source.validity_start
@@ -1625,19 +2122,35 @@ class Engine():
         
         list_values = {}
         check_duration_0 = False
+        batch_size = config.get("INSERT_EVENTS_BATCH_SIZE") or 0
         for event in self.operation.get("events") or []:
+            if batch_size > 0 and len(list_events) >= batch_size:
+                # Bulk insert the events in batches to limit the memory used by the lists for bulk ingestion
+                self._bulk_insert_events(list_events, list_keys, list_values, list_alerts)
+                list_events = []
+                list_keys = []
+                list_alerts = []
+                list_values = {}
+            # end if
             id = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
             self.dict_event_uuids_aliases[id] = []
             start = event.get("start")
             stop = event.get("stop")
 
+            # Parse the period of the event once for all the stages of the insertion
+            start_timestamp = parse_timestamp(start)
+            stop_timestamp = parse_timestamp(stop)
+            start_datetime = start_timestamp.replace(tzinfo=None)
+            stop_datetime = stop_timestamp.replace(tzinfo=None)
+
             # If duration of event period is 0, shift the stop value by 1 microsecond and log a warning
-            if parser.parse(stop).replace(tzinfo=None) == parser.parse(start).replace(tzinfo=None):
-                stop_datetime = parser.parse(stop).replace(tzinfo=None) + datetime.timedelta(microseconds=1)
+            if stop_datetime == start_datetime:
+                stop_datetime = stop_datetime + datetime.timedelta(microseconds=1)
+                stop_timestamp = stop_datetime
                 stop = stop_datetime.isoformat()
                 check_duration_0 = True
                 # Check if validity period of the source needs to be adjusted to accommodate the new stop value of the event
-                if parser.parse(stop).replace(tzinfo=None) > self.source.validity_stop.replace(tzinfo=None):
+                if stop_datetime > self.source.validity_stop.replace(tzinfo=None):
                     warning_message_duration_0_at_end = exit_codes["EVENT_DURATION_0_AT_THE_VALIDITY_END"]["message"].format(self.source.name, self.dim_signature.dim_signature, self.source.processor, self.source.processor_version, self.source.validity_start.isoformat(), self.source.validity_stop.isoformat(), stop)
                     logger.warning(warning_message_duration_0_at_end)
                     self.source.validity_stop = stop_datetime
@@ -1664,7 +2177,7 @@ class Engine():
                     # Initialize the list of segments to be reviewed
                     self.insert_and_erase_per_event_gauges[gauge.gauge_uuid] = []
                 # end if
-                self.insert_and_erase_per_event_gauges[gauge.gauge_uuid].append((start, stop))
+                self.insert_and_erase_per_event_gauges[gauge.gauge_uuid].append((start_timestamp, stop_timestamp))
             elif gauge_info["insertion_type"] == "INSERT_and_ERASE_with_PRIORITY":
                 self.insert_and_erase_with_priority_gauges[gauge.gauge_uuid] = None
             elif gauge_info["insertion_type"] == "INSERT_and_ERASE_with_EQUAL_or_LOWER_PRIORITY":
@@ -1676,14 +2189,14 @@ class Engine():
                     # Initialize the list of segments to be reviewed
                     self.insert_and_erase_per_event_with_priority_gauges[gauge.gauge_uuid] = []
                 # end if
-                self.insert_and_erase_per_event_with_priority_gauges[gauge.gauge_uuid].append((start, stop))
+                self.insert_and_erase_per_event_with_priority_gauges[gauge.gauge_uuid].append((start_timestamp, stop_timestamp))
             elif gauge_info["insertion_type"] == "EVENT_KEYS":
                 self.keys_events[(key, str(self.dim_signature.dim_signature_uuid))] = None
             elif gauge_info["insertion_type"] == "EVENT_KEYS_with_PRIORITY":
                 self.keys_events_with_priority[(key, str(self.dim_signature.dim_signature_uuid))] = None
             elif gauge_info["insertion_type"] == "UPDATE_COUNTER":
 
-                counter_key = (self.dim_signature.dim_signature, gauge_info.get("name"), gauge_info.get("system"), parser.parse(start), parser.parse(stop))
+                counter_key = (self.dim_signature.dim_signature, gauge_info.get("name"), gauge_info.get("system"), start_timestamp, stop_timestamp)
                 if counter_key in self.set_counters:
                     raise MixedOperationsWithCounter(exit_codes["MIXED_OPERATIONS_WITH_COUNTER"]["message"].format(self.source.name, self.dim_signature.dim_signature, self.source.processor, self.source.processor_version, gauge_info.get("name"), gauge_info.get("system")))
                 # end if
@@ -1735,7 +2248,7 @@ class Engine():
             # end if
 
             # Insert the event into the list for bulk ingestion
-            self._insert_event(list_events, id, start, stop, gauge.gauge_uuid, explicit_ref_uuid,
+            self._insert_event(list_events, id, start_datetime, stop_datetime, gauge.gauge_uuid, explicit_ref_uuid,
                                     visible, source = self.source)
 
             # Insert the key into the list for bulk ingestion
@@ -1747,7 +2260,8 @@ class Engine():
             # Insert values
             if "values" in event:
                 entity_uuid = {"name": "event_uuid",
-                               "id": id
+                               "id": id,
+                               "start": start_datetime
                 }
                 self._insert_values(event.get("values"), entity_uuid, list_values)
             # end if
@@ -1790,8 +2304,8 @@ class Engine():
 
             # Manage alerts
             if "alerts" in event:
-                alert_groups = insert_alert_groups(self.session, event)
-                alert_cnfs = insert_alert_cnfs(self.session, event, alert_groups)
+                alert_groups = insert_alert_groups(self.session, event, catalogue_entries = self.catalogue_entries, catalogue_hits = self.catalogue_hits)
+                alert_cnfs = insert_alert_cnfs(self.session, event, alert_groups, catalogue_entries = self.catalogue_entries, catalogue_hits = self.catalogue_hits)
                 for alert in event["alerts"]:
                     ####
                     # IMPORTANT NOTE: Remember to modify method
@@ -1814,31 +2328,55 @@ class Engine():
 
         # end for
 
+        # Bulk insert the remaining events
+        self._bulk_insert_events(list_events, list_keys, list_values, list_alerts)
+
+        # If there has been detected any event with duration 0, notify the relevant status
+        if check_duration_0:
+            warning_message_duration_0 = exit_codes["EVENT_DURATION_0"]["message"].format(self.source.name, self.dim_signature.dim_signature, self.source.processor, self.source.processor_version)
+            self._insert_source_status(exit_codes["EVENT_DURATION_0"]["status"], message=warning_message_duration_0)
+        # end if
+        
+        return
+
+    def _bulk_insert_events(self, list_events, list_keys, list_values, list_alerts):
+        """
+        Method to bulk insert the events with their keys, values and alerts
+
+        :param list_events: list of events to insert
+        :type list_events: list
+        :param list_keys: list of keys to insert
+        :type list_keys: list
+        :param list_values: lists of values to insert per type of value
+        :type list_values: dict
+        :param list_alerts: list of alerts to insert
+        :type list_alerts: list
+        """
         # Bulk insert events
-        self.session.bulk_insert_mappings(Event, list_events)
+        self._bulk_load(Event, list_events)
         # Bulk insert keys
-        self.session.bulk_insert_mappings(EventKey, list_keys)
+        self._bulk_load(EventKey, list_keys)
 
         # Bulk insert values
         try:
             if "objects" in list_values:
-                self.session.bulk_insert_mappings(EventObject, list_values["objects"])
+                self._bulk_load(EventObject, list_values["objects"])
             # end if
             if "booleans" in list_values:
-                self.session.bulk_insert_mappings(EventBoolean, list_values["booleans"])
+                self._bulk_load(EventBoolean, list_values["booleans"])
             # end if
             if "texts" in list_values:
-                self.session.bulk_insert_mappings(EventText, list_values["texts"])
+                self._bulk_load(EventText, list_values["texts"])
             # end if
             if "doubles" in list_values:
-                self.session.bulk_insert_mappings(EventDouble, list_values["doubles"])
+                self._bulk_load(EventDouble, list_values["doubles"])
             # end if
             if "timestamps" in list_values:
-                self.session.bulk_insert_mappings(EventTimestamp, list_values["timestamps"])
+                self._bulk_load(EventTimestamp, list_values["timestamps"])
             # end if
             if "geometries" in list_values:
                 try:
-                    self.session.bulk_insert_mappings(EventGeometry, list_values["geometries"])
+                    self._bulk_load(EventGeometry, list_values["geometries"])
                 except InternalError as e:
                     self.session.rollback()
                     raise WrongGeometry(exit_codes["WRONG_GEOMETRY"]["message"].format(self.source.name, self.dim_signature.dim_signature, self.source.processor, self.source.processor_version, e))
@@ -1853,12 +2391,6 @@ class Engine():
             self._bulk_insert_mappings(EventAlert, list_alerts)
         # end if
 
-        # If there has been detected any event with duration 0, notify the relevant status
-        if check_duration_0:
-            warning_message_duration_0 = exit_codes["EVENT_DURATION_0"]["message"].format(self.source.name, self.dim_signature.dim_signature, self.source.processor, self.source.processor_version)
-            self._insert_source_status(exit_codes["EVENT_DURATION_0"]["status"], message=warning_message_duration_0)
-        # end if
-        
         return
 
     def _get_event_uuid_aliases(self, event_uuid):
@@ -2003,8 +2535,8 @@ class Engine():
 
         :param values: list of values to be inserted
         :type values: list
-        :param entity_uuid: identifier of the event or annotation
-        :type entity_uuid: uuid
+        :param entity_uuid: identifier of the event or annotation (see eboa.engine.common_functions.insert_values)
+        :type entity_uuid: dict
         :param list_values: list with the inserted values for later bulk ingestion
         :type list_values: list
         :param position: value position inside the structure of values
@@ -2080,8 +2612,8 @@ class Engine():
 
             # Manage alerts
             if "alerts" in annotation:
-                alert_groups = insert_alert_groups(self.session, annotation)
-                alert_cnfs = insert_alert_cnfs(self.session, annotation, alert_groups)
+                alert_groups = insert_alert_groups(self.session, annotation, catalogue_entries = self.catalogue_entries, catalogue_hits = self.catalogue_hits)
+                alert_cnfs = insert_alert_cnfs(self.session, annotation, alert_groups, catalogue_entries = self.catalogue_entries, catalogue_hits = self.catalogue_hits)
                 for alert in annotation["alerts"]:
                     alert_uuid = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
                     alert_cnf = alert_cnfs[alert.get("alert_cnf").get("name")]
@@ -2100,28 +2632,28 @@ class Engine():
         # end for
             
         # Bulk insert annotations
-        self.session.bulk_insert_mappings(Annotation, list_annotations)
+        self._bulk_load(Annotation, list_annotations)
 
         # Bulk insert values
         try:
             if "objects" in list_values:
-                self.session.bulk_insert_mappings(AnnotationObject, list_values["objects"])
+                self._bulk_load(AnnotationObject, list_values["objects"])
             # end if
             if "booleans" in list_values:
-                self.session.bulk_insert_mappings(AnnotationBoolean, list_values["booleans"])
+                self._bulk_load(AnnotationBoolean, list_values["booleans"])
             # end if
             if "texts" in list_values:
-                self.session.bulk_insert_mappings(AnnotationText, list_values["texts"])
+                self._bulk_load(AnnotationText, list_values["texts"])
             # end if
             if "doubles" in list_values:
-                self.session.bulk_insert_mappings(AnnotationDouble, list_values["doubles"])
+                self._bulk_load(AnnotationDouble, list_values["doubles"])
             # end if
             if "timestamps" in list_values:
-                self.session.bulk_insert_mappings(AnnotationTimestamp, list_values["timestamps"])
+                self._bulk_load(AnnotationTimestamp, list_values["timestamps"])
             # end if
             if "geometries" in list_values:
                 try:
-                    self.session.bulk_insert_mappings(AnnotationGeometry, list_values["geometries"])
+                    self._bulk_load(AnnotationGeometry, list_values["geometries"])
                 except InternalError as e:
                     self.session.rollback()
                     raise WrongGeometry(exit_codes["WRONG_GEOMETRY"]["message"].format(self.source.name, self.dim_signature.dim_signature, self.source.processor, self.source.processor_version, e))
@@ -2143,7 +2675,7 @@ class Engine():
         """
         Method to insert the groups of alerts
         """
-        self.alert_groups = insert_alert_groups(self.session, self.operation)
+        self.alert_groups = insert_alert_groups(self.session, self.operation, catalogue_entries = self.catalogue_entries, catalogue_hits = self.catalogue_hits)
         
         return
     
@@ -2152,7 +2684,7 @@ class Engine():
         """
         Method to insert the alert configurations
         """
-        self.alert_cnfs = insert_alert_cnfs(self.session, self.operation, self.alert_groups)
+        self.alert_cnfs = insert_alert_cnfs(self.session, self.operation, self.alert_groups, catalogue_entries = self.catalogue_entries, catalogue_hits = self.catalogue_hits)
         
         return
     
@@ -2300,23 +2832,19 @@ class Engine():
                 }
 
                 counter = self.update_counters[counter_key]
-                events = self.session.query(Event).join(Gauge).join(DimSignature).filter(
-                    Gauge.name == counter["gauge_name"],
-                    Gauge.system == counter["gauge_system"],
-                    DimSignature.dim_signature == counter["dim_signature"],
-                    Event.start == counter["start"],
-                    Event.stop == counter["stop"]).limit(1).all()
+                event = baked_queries.get_counter_event(self.session, counter["gauge_name"], counter["gauge_system"], counter["dim_signature"], counter["start"], counter["stop"])
 
                 # Check if the counter was already stored in the DDBB
-                if len(events) > 0:
-                    event_value = self.session.query(EventDouble).filter(EventDouble.event_uuid == str(events[0].event_uuid)).first()
-                    self.session.query(EventDouble).filter(EventDouble.event_uuid == str(events[0].event_uuid)).update({"value": event_value.value + counter["value"]}, synchronize_session=False)
+                if event != None:
+                    event_value = baked_queries.get_event_double(self.session, event.event_uuid)
+                    self.session.query(EventDouble).filter(EventDouble.event_uuid == event.event_uuid).update({"value": event_value.value + counter["value"]}, synchronize_session=False)
                 else:
                     id = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
                     self._insert_event(list_events_to_create, id, counter["start"], counter["stop"], self.gauges[(counter["gauge_name"], counter["gauge_system"])].gauge_uuid, None, True, source = self.source)
                     entity_uuid = {
                         "name": "event_uuid",
-                        "id": id
+                        "id": id,
+                        "start": list_events_to_create[-1]["start"]
                     }
                     values = [{
                         "type": "double",
@@ -2367,23 +2895,19 @@ class Engine():
                 }
 
                 counter = self.set_counters[counter_key]
-                events = self.session.query(Event).join(Gauge).join(DimSignature).filter(
-                    Gauge.name == counter["gauge_name"],
-                    Gauge.system == counter["gauge_system"],
-                    DimSignature.dim_signature == counter["dim_signature"],
-                    Event.start == counter["start"],
-                    Event.stop == counter["stop"]).limit(1).all()
+                event = baked_queries.get_counter_event(self.session, counter["gauge_name"], counter["gauge_system"], counter["dim_signature"], counter["start"], counter["stop"])
 
                 # Check if the counter was already stored in the DDBB
-                if len(events) > 0:
-                    event_value = self.session.query(EventDouble).filter(EventDouble.event_uuid == str(events[0].event_uuid)).first()
-                    self.session.query(EventDouble).filter(EventDouble.event_uuid == str(events[0].event_uuid)).update({"value": counter["value"]}, synchronize_session=False)
+                if event != None:
+                    event_value = baked_queries.get_event_double(self.session, event.event_uuid)
+                    self.session.query(EventDouble).filter(EventDouble.event_uuid == event.event_uuid).update({"value": counter["value"]}, synchronize_session=False)
                 else:
                     id = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
                     self._insert_event(list_events_to_create, id, counter["start"], counter["stop"], self.gauges[(counter["gauge_name"], counter["gauge_system"])].gauge_uuid, None, True, source = self.source)
                     entity_uuid = {
                         "name": "event_uuid",
-                        "id": id
+                        "id": id,
+                        "start": list_events_to_create[-1]["start"]
                     }
                     values = [{
                         "type": "double",
@@ -2425,6 +2949,11 @@ class Engine():
         @self.synchronized(lock, external=True, lock_path="/dev/shm")
         def _remove_deprecated_data_synchronize(self):
 
+            # Register the event summaries which could be impacted before removing the deprecated events
+            if config.get("EVENT_SUMMARIES"):
+                self.event_summary_keys = self._get_event_summary_keys()
+            # end if
+
             if hasattr(self, "all_gauges_for_insert_and_erase") and self.all_gauges_for_insert_and_erase:
                 # Remove events due to insert_and_erase insertion mode
                 self._remove_deprecated_events_by_insert_and_erase_at_dim_signature_level()
@@ -2476,6 +3005,48 @@ class Engine():
 
         return
 
+    @debug
+    def _get_event_summary_keys(self):
+        """
+        Method to obtain the keys (gauge and day) of the event summaries which could be impacted by the ingestion of the source
+
+        :return: keys of the event summaries
+        :rtype: set
+        """
+        period = self.session.query(func.min(Event.start), func.max(Event.stop)).filter(Event.source_uuid == self.source.source_uuid).first()
+        start = min([date for date in [self.source.validity_start, period[0]] if date != None], default = None)
+        stop = max([date for date in [self.source.validity_stop, period[1]] if date != None], default = None)
+        if start == None or stop == None:
+            return set()
+        # end if
+        event_keys = sorted(get_items_summary(self.operation, "events").get("event_keys", set()))
+
+        return event_summaries.get_summary_keys(self.session, self.dim_signature.dim_signature_uuid, start, stop, event_keys = event_keys, source_uuid = self.source.source_uuid)
+
+    @debug
+    def _refresh_event_summaries(self):
+        """
+        Method to compute again the event summaries impacted by the ingestion of the source
+        (the ones registered before removing the deprecated events and the ones of the current events)
+        """
+        # Make this method process and thread safe
+        lock = "event_summaries" + self.dim_signature.dim_signature
+        @self.synchronized(lock, external=True, lock_path="/dev/shm")
+        def _refresh_event_summaries_synchronize(self):
+
+            keys = self._get_event_summary_keys() | self.event_summary_keys
+            event_summaries.refresh_summaries(self.session, keys)
+            self.event_summary_keys = set()
+
+            # Commit data
+            self.session.commit()
+
+        # end def
+
+        _refresh_event_summaries_synchronize(self)
+
+        return
+
     @debug
     def _remove_deprecated_events_by_insert_and_erase_at_dim_signature_level(self):
         """
@@ -2501,12 +3072,16 @@ class Engine():
             # Get the sources of events intersecting the validity period
             dim_signature = self.session.query(DimSignature).join(Gauge).filter(Gauge.gauge_uuid == gauge_uuid).first()
             sources = self.session.query(Source).filter(Source.dim_signature_uuid == dim_signature.dim_signature_uuid,
-                                                        or_(and_(Source.validity_start < self.source.validity_stop,
-                                                                 Source.validity_stop > self.source.validity_start))).order_by(Source.validity_start).all()
-            events = sorted(set([event for source in sources for event in source.events if
-                                 (event.gauge_uuid == gauge_uuid) and
-                                 (event.start < self.source.validity_stop and
-                                  event.stop > self.source.validity_start)]), key=lambda event: event.start)
+                                                        periods.get_overlap_condition("sources", Source.validity_start, Source.validity_stop, self.source.validity_start, self.source.validity_stop)).order_by(Source.validity_start).all()
+            if config.get("INSERT_AND_ERASE_AT_DIM_SIGNATURE_LEVEL_RESOLUTION") == "sql":
+                # Let the DDBB resolve the timeline and return only the events to be reviewed
+                events = self._get_events_to_review_by_insert_and_erase_at_dim_signature_level(gauge_uuid, dim_signature.dim_signature_uuid)
+            else:
+                events = sorted(set([event for source in sources for event in source.events if
+                                     (event.gauge_uuid == gauge_uuid) and
+                                     (event.start < self.source.validity_stop and
+                                      event.stop > self.source.validity_start)]), key=lambda event: event.start)
+            # end if
                       
             # Get the timeline of validity periods intersecting
             timeline_points = set(list(chain.from_iterable([[source.validity_start,source.validity_stop] for source in sources])))
@@ -2674,6 +3249,9 @@ class Engine():
             # end for
 
         # end for
+        # Replicate values, alerts and keys of the split events
+        self._replicate_split_events(list_event_uuids_aliases, list_events_to_be_created)
+
         # Bulk insert events
         self.session.bulk_insert_mappings(Event, list_events_to_be_created["events"])
         # Bulk insert keys
@@ -2683,8 +3261,7 @@ class Engine():
         self.session.bulk_insert_mappings(EventLink, list_events_to_be_created["links"])
 
         # Remove the events that were partially affected by the insert and erase operation
-        self.session.query(EventLink).filter(EventLink.event_uuid_link.in_(list_events_to_be_removed)).delete(synchronize_session=False)
-        self.session.query(Event).filter(Event.event_uuid.in_(list_events_to_be_removed)).delete(synchronize_session=False)
+        self._remove_events(list_events_to_be_removed)
 
         # Bulk insert alerts
         self.session.bulk_insert_mappings(EventAlert, list_events_to_be_created["alerts"])
@@ -2711,6 +3288,32 @@ class Engine():
 
         return
 
+    @debug
+    def _get_events_to_review_by_insert_and_erase_at_dim_signature_level(self, gauge_uuid, dim_signature_uuid):
+        """
+        Method to obtain the events of a gauge that need to be reviewed (split, removed or made visible)
+        due to insert and erase at dim signature level insertion mode. The timeline of the sources
+        overlapping the validity period of the current source and the source with the maximum
+        generation time (tie-break on the minimum ingestion time) per segment are resolved inside
+        the DDBB, so the events which are visible and belong to the unique winning source of every
+        segment they cover are not loaded
+
+        :param gauge_uuid: identifier of the gauge
+        :type gauge_uuid: uuid
+        :param dim_signature_uuid: identifier of the DIM signature
+        :type dim_signature_uuid: uuid
+
+        :return: events to be reviewed ordered by start
+        :rtype: list
+        """
+        query = self.session.query(Event).from_statement(text(events_to_review_by_insert_and_erase_at_dim_signature_level_statement)).params(
+            gauge_uuid = gauge_uuid,
+            dim_signature_uuid = dim_signature_uuid,
+            validity_start = self.source.validity_start,
+            validity_stop = self.source.validity_stop)
+
+        return query.all()
+
     @debug
     def _remove_deprecated_events_by_insert_and_erase_with_priority_at_dim_signature_level(self):
         """
@@ -2737,8 +3340,7 @@ class Engine():
             dim_signature = self.session.query(DimSignature).join(Gauge).filter(Gauge.gauge_uuid == gauge_uuid).first()
             sources = self.session.query(Source).filter(Source.dim_signature_uuid == dim_signature.dim_signature_uuid,
                                                         Source.priority != None,
-                                                        or_(and_(Source.validity_start < self.source.validity_stop,
-                                                                 Source.validity_stop > self.source.validity_start))).order_by(Source.validity_start).all()
+                                                        periods.get_overlap_condition("sources", Source.validity_start, Source.validity_stop, self.source.validity_start, self.source.validity_stop)).order_by(Source.validity_start).all()
             events = sorted(set([event for source in sources for event in source.events if
                                  (event.gauge_uuid == gauge_uuid) and
                                  (event.start < self.source.validity_stop and
@@ -2927,6 +3529,9 @@ class Engine():
             # end for
 
         # end for
+        # Replicate values, alerts and keys of the split events
+        self._replicate_split_events(list_event_uuids_aliases, list_events_to_be_created)
+
         # Bulk insert events
         self.session.bulk_insert_mappings(Event, list_events_to_be_created["events"])
         # Bulk insert keys
@@ -2936,8 +3541,7 @@ class Engine():
         self.session.bulk_insert_mappings(EventLink, list_events_to_be_created["links"])
 
         # Remove the events that were partially affected by the insert and erase operation
-        self.session.query(EventLink).filter(EventLink.event_uuid_link.in_(list_events_to_be_removed)).delete(synchronize_session=False)
-        self.session.query(Event).filter(Event.event_uuid.in_(list_events_to_be_removed)).delete(synchronize_session=False)
+        self._remove_events(list_events_to_be_removed)
 
         # Bulk insert alerts
         self.session.bulk_insert_mappings(EventAlert, list_events_to_be_created["alerts"])
@@ -2990,8 +3594,7 @@ class Engine():
             dim_signature = self.session.query(DimSignature).join(Gauge).filter(Gauge.gauge_uuid == gauge_uuid).first()
             sources = self.session.query(Source).filter(Source.dim_signature_uuid == dim_signature.dim_signature_uuid,
                                                                            Source.priority != None,
-                                                                                  or_(and_(Source.validity_start < self.source.validity_stop,
-                                                                                           Source.validity_stop > self.source.validity_start))).order_by(Source.validity_start).all()
+                                                                                  periods.get_overlap_condition("sources", Source.validity_start, Source.validity_stop, self.source.validity_start, self.source.validity_stop)).order_by(Source.validity_start).all()
             events = sorted(set([event for source in sources for event in source.events if
                                  (event.gauge_uuid == gauge_uuid) and
                                  (event.start < self.source.validity_stop and
@@ -3187,6 +3790,9 @@ class Engine():
             # end for
 
         # end for
+        # Replicate values, alerts and keys of the split events
+        self._replicate_split_events(list_event_uuids_aliases, list_events_to_be_created)
+
         # Bulk insert events
         self.session.bulk_insert_mappings(Event, list_events_to_be_created["events"])
         # Bulk insert keys
@@ -3196,8 +3802,7 @@ class Engine():
         self.session.bulk_insert_mappings(EventLink, list_events_to_be_created["links"])
 
         # Remove the events that were partially affected by the insert and erase operation
-        self.session.query(EventLink).filter(EventLink.event_uuid_link.in_(list_events_to_be_removed)).delete(synchronize_session=False)
-        self.session.query(Event).filter(Event.event_uuid.in_(list_events_to_be_removed)).delete(synchronize_session=False)
+        self._remove_events(list_events_to_be_removed)
 
         # Bulk insert alerts
         self.session.bulk_insert_mappings(EventAlert, list_events_to_be_created["alerts"])
@@ -3248,11 +3853,51 @@ class Engine():
         """
         id = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
         self._insert_event(list_events_to_be_created["events"], id, start, stop,
-                           event.gauge_uuid, event.explicit_ref_uuid, True, source_id = event.source_uuid)
-        self._replicate_event_values(event.event_uuid, id, list_events_to_be_created["events"][-1], list_events_to_be_created["values"])
-        self._replicate_event_alerts(event.event_uuid, id, list_events_to_be_created["alerts"])
+                           event.gauge_uuid, event.explicit_ref_uuid, True, source = event.source)
+        # The values, alerts and keys are replicated later for all
+        # the split events at once (see _replicate_split_events)
         self._create_event_uuid_alias(event.event_uuid, id, list_event_uuids_aliases)
-        self._replicate_event_keys(event.event_uuid, id, list_events_to_be_created["keys"])
+
+        return
+
+    def _remove_events(self, event_uuids, starts = None):
+        """
+        Method to remove events and the links pointing to them.
+        The removal is bounded by the starts of the events, so that only the partitions containing them
+        are accessed when the events are partitioned by start (see datamodel/eboa_events_partitioning.sql)
+
+        :param event_uuids: identifiers of the events to remove
+        :type event_uuids: list
+        :param starts: starts of the events to remove (by default, the starts of the events loaded in the session)
+        :type starts: list
+        """
+        if len(event_uuids) == 0:
+            return
+        # end if
+
+        if starts == None:
+            starts = []
+            for event_uuid in set(event_uuids):
+                event = self.session.identity_map.get(identity_key(Event, event_uuid))
+                # The expired events are not refreshed (the removal is then not bounded)
+                start = None
+                if event != None:
+                    start = inspect(event).dict.get("start")
+                # end if
+                if start == None:
+                    starts = None
+                    break
+                # end if
+                starts.append(start)
+            # end for
+        # end if
+
+        self.session.query(EventLink).filter(EventLink.event_uuid_link.in_(event_uuids)).delete(synchronize_session=False)
+        query = self.session.query(Event).filter(Event.event_uuid.in_(event_uuids))
+        if starts != None:
+            query = query.filter(Event.start >= min(starts), Event.start <= max(starts))
+        # end if
+        query.delete(synchronize_session=False)
 
         return
 
@@ -3274,8 +3919,7 @@ class Engine():
 
             # Get the sources of events intersecting the validity period
             sources = self.session.query(Source).join(Event).filter(Event.gauge_uuid == gauge_uuid,
-                                                                    or_(and_(Source.validity_start < self.source.validity_stop,
-                                                                             Source.validity_stop > self.source.validity_start))).order_by(Source.validity_start).all()
+                                                                    periods.get_overlap_condition("sources", Source.validity_start, Source.validity_stop, self.source.validity_start, self.source.validity_stop)).order_by(Source.validity_start).all()
             events = sorted(set([event for source in sources for event in source.events if
                                  (event.gauge_uuid == gauge_uuid) and
                                  (event.start < self.source.validity_stop and
@@ -3455,6 +4099,9 @@ class Engine():
             # end for
 
         # end for
+        # Replicate values, alerts and keys of the split events
+        self._replicate_split_events(list_event_uuids_aliases, list_events_to_be_created)
+
         # Bulk insert events
         self.session.bulk_insert_mappings(Event, list_events_to_be_created["events"])
         # Bulk insert keys
@@ -3464,8 +4111,7 @@ class Engine():
         self.session.bulk_insert_mappings(EventLink, list_events_to_be_created["links"])
 
         # Remove the events that were partially affected by the insert and erase operation
-        self.session.query(EventLink).filter(EventLink.event_uuid_link.in_(list_events_to_be_removed)).delete(synchronize_session=False)
-        self.session.query(Event).filter(Event.event_uuid.in_(list_events_to_be_removed)).delete(synchronize_session=False)
+        self._remove_events(list_events_to_be_removed)
 
         # Bulk insert alerts
         self.session.bulk_insert_mappings(EventAlert, list_events_to_be_created["alerts"])
@@ -3511,8 +4157,7 @@ class Engine():
             # Get the sources of events intersecting the validity period defined for the current source
             sources = self.session.query(Source).join(Event).filter(Event.gauge_uuid == gauge_uuid,
                                                                        Source.priority != None,
-                                                                    or_(and_(Source.validity_start < self.source.validity_stop,
-                                                                             Source.validity_stop > self.source.validity_start))).order_by(Event.start).all()
+                                                                    periods.get_overlap_condition("sources", Source.validity_start, Source.validity_stop, self.source.validity_start, self.source.validity_stop)).order_by(Event.start).all()
             events = sorted(set([event for source in sources for event in source.events if
                                  (event.gauge_uuid == gauge_uuid) and
                                  (event.start < self.source.validity_stop and
@@ -3704,6 +4349,9 @@ class Engine():
             # end for
 
         # end for
+        # Replicate values, alerts and keys of the split events
+        self._replicate_split_events(list_event_uuids_aliases, list_events_to_be_created)
+
         # Bulk insert events
         self.session.bulk_insert_mappings(Event, list_events_to_be_created["events"])
         # Bulk insert keys
@@ -3713,8 +4361,7 @@ class Engine():
         self.session.bulk_insert_mappings(EventLink, list_events_to_be_created["links"])
 
         # Remove the events that were partially affected by the insert and erase operation
-        self.session.query(EventLink).filter(EventLink.event_uuid_link.in_(list_events_to_be_removed)).delete(synchronize_session=False)
-        self.session.query(Event).filter(Event.event_uuid.in_(list_events_to_be_removed)).delete(synchronize_session=False)
+        self._remove_events(list_events_to_be_removed)
 
         # Bulk insert alerts
         self.session.bulk_insert_mappings(EventAlert, list_events_to_be_created["alerts"])
@@ -3760,8 +4407,7 @@ class Engine():
             # Get the sources of events intersecting the validity period defined for the current source
             sources = self.session.query(Source).join(Event).filter(Event.gauge_uuid == gauge_uuid,
                                                                        Source.priority != None,
-                                                                    or_(and_(Source.validity_start < self.source.validity_stop,
-                                                                             Source.validity_stop > self.source.validity_start))).order_by(Event.start).all()
+                                                                    periods.get_overlap_condition("sources", Source.validity_start, Source.validity_stop, self.source.validity_start, self.source.validity_stop)).order_by(Event.start).all()
             events = sorted(set([event for source in sources for event in source.events if
                                  (event.gauge_uuid == gauge_uuid) and
                                  (event.start < self.source.validity_stop and
@@ -3958,6 +4604,9 @@ class Engine():
             # end for
 
         # end for
+        # Replicate values, alerts and keys of the split events
+        self._replicate_split_events(list_event_uuids_aliases, list_events_to_be_created)
+
         # Bulk insert events
         self.session.bulk_insert_mappings(Event, list_events_to_be_created["events"])
         # Bulk insert keys
@@ -3967,8 +4616,7 @@ class Engine():
         self.session.bulk_insert_mappings(EventLink, list_events_to_be_created["links"])
 
         # Remove the events that were partially affected by the insert and erase operation
-        self.session.query(EventLink).filter(EventLink.event_uuid_link.in_(list_events_to_be_removed)).delete(synchronize_session=False)
-        self.session.query(Event).filter(Event.event_uuid.in_(list_events_to_be_removed)).delete(synchronize_session=False)
+        self._remove_events(list_events_to_be_removed)
 
         # Bulk insert alerts
         self.session.bulk_insert_mappings(EventAlert, list_events_to_be_created["alerts"])
@@ -4014,8 +4662,7 @@ class Engine():
             # Get the events intersecting the validity period defined for the current source with priority set
             events = self.session.query(Event).join(Source).filter(Event.gauge_uuid == gauge_uuid,
                                                                    Source.priority != None,
-                                                                   or_(and_(Event.start < self.source.validity_stop,
-                                                                            Event.stop > self.source.validity_start))).order_by(Event.start).all()
+                                                                   periods.get_overlap_condition("events", Event.start, Event.stop, self.source.validity_start, self.source.validity_stop)).order_by(Event.start).all()
             sources = sorted(set([event.source for event in events]), key=lambda source: source.validity_start)
             
             # Get the timeline of event periods intersecting
@@ -4218,6 +4865,9 @@ class Engine():
             # end for
 
         # end for
+        # Replicate values, alerts and keys of the split events
+        self._replicate_split_events(list_event_uuids_aliases, list_events_to_be_created)
+
         # Bulk insert events
         self.session.bulk_insert_mappings(Event, list_events_to_be_created["events"])
         # Bulk insert keys
@@ -4227,8 +4877,7 @@ class Engine():
         self.session.bulk_insert_mappings(EventLink, list_events_to_be_created["links"])
 
         # Remove the events that were partially affected by the insert and erase operation
-        self.session.query(EventLink).filter(EventLink.event_uuid_link.in_(list_events_to_be_removed)).delete(synchronize_session=False)
-        self.session.query(Event).filter(Event.event_uuid.in_(list_events_to_be_removed)).delete(synchronize_session=False)
+        self._remove_events(list_events_to_be_removed)
 
         # Bulk insert alerts
         self.session.bulk_insert_mappings(EventAlert, list_events_to_be_created["alerts"])
@@ -4255,66 +4904,103 @@ class Engine():
 
         return
 
+    @debug
+    def _replicate_split_events(self, list_event_uuids_aliases, list_events_to_be_created):
+        """
+        Method to replicate the values, alerts and keys associated to events that were overwritten partially by other events.
+        The information of all the split events is obtained at once (one query per table) instead of per split event
+
+        :param list_event_uuids_aliases: list of the aliases of the event_uuids (original event UUID -> UUIDs of the new events)
+        :type list_event_uuids_aliases: dict
+        :param list_events_to_be_created: list of events to be created
+        :type list_events_to_be_created: dict with the following structure
+                list_events_to_be_created = {"events": [],
+                                     "values": {},
+                                     "alerts": [],
+                                     "keys": [],
+                                     "links": []}
+        """
+        if len(list_event_uuids_aliases) == 0:
+            return
+        # end if
+
+        events_to_be_created = {event["event_uuid"]: event for event in list_events_to_be_created["events"]}
+        if "REPLICATE_EVENT_VALUES_MODULE" in config and config["REPLICATE_EVENT_VALUES_MODULE"] != "":
+            # The external module works event by event
+            for from_event_uuid in list_event_uuids_aliases:
+                for to_event_uuid in list_event_uuids_aliases[from_event_uuid]:
+                    self._replicate_event_values(from_event_uuid, to_event_uuid, events_to_be_created[to_event_uuid], list_events_to_be_created["values"])
+                # end for
+            # end for
+        else:
+            self._replicate_event_values_no_external_module(list_event_uuids_aliases, list_events_to_be_created["values"], events_to_be_created)
+        # end if
+        self._replicate_event_alerts(list_event_uuids_aliases, list_events_to_be_created["alerts"])
+        self._replicate_event_keys(list_event_uuids_aliases, list_events_to_be_created["keys"])
+
+        return
+
     @debug
     def _replicate_event_values(self, from_event_uuid, to_event_uuid, to_event, list_values_to_be_created):
         """
         Method to replicate the values associated to events that were overwritten partially by other events
+        using the module specified in the configuration (REPLICATE_EVENT_VALUES_MODULE)
 
         :param from_event_uuid: original event where to get the associated values from
         :type from_event_uuid: uuid
         :param to_event_uuid: new event UUID to associate the values
         :type to_event_uuid: uuid
         :param to_event: new event to associate the values
-        :type to_event: Event
+        :type to_event: dict
         :param list_values_to_be_created: list of values to be stored later inside the DDBB
         :type list_values_to_be_created: list
         """
-        if "REPLICATE_EVENT_VALUES_MODULE" in config and config["REPLICATE_EVENT_VALUES_MODULE"] != "":
-            try:
-                processor_module = import_module(config["REPLICATE_EVENT_VALUES_MODULE"])
-                # Use an auxiliar list to be resiliant to failures when calling to replicate with no external module
-                list_values_to_be_created_aux = {}                
-                processor_module.replicate_event_values(self.query, from_event_uuid, to_event_uuid, to_event, list_values_to_be_created_aux)
-                for type in list_values_to_be_created_aux:
-                    if not type in list_values_to_be_created:
-                        list_values_to_be_created[type] = []
+        try:
+            processor_module = import_module(config["REPLICATE_EVENT_VALUES_MODULE"])
+            # Use an auxiliar list to be resiliant to failures when calling to replicate with no external module
+            list_values_to_be_created_aux = {}                
+            processor_module.replicate_event_values(self.query, from_event_uuid, to_event_uuid, to_event, list_values_to_be_created_aux)
+            for type in list_values_to_be_created_aux:
+                if not type in list_values_to_be_created:
+                    list_values_to_be_created[type] = []
+                # end if
+                for value in list_values_to_be_created_aux[type]:
+                    if type in (EventText, EventDouble):
+                        # The text and double values are partitioned by the start of the event
+                        value["event_start"] = to_event["start"]
                     # end if
-                    for value in list_values_to_be_created_aux[type]:
-                        list_values_to_be_created[type].append(value)
-                    # end for
+                    list_values_to_be_created[type].append(value)
                 # end for
-            except ImportError as e:
-                logger.error("The specified module {} for replicating the values of events does not exist. Returned error: {}".format(config["REPLICATE_EVENT_VALUES_MODULE"], str(e)))
-                self._replicate_event_values_no_external_module(from_event_uuid, to_event_uuid, list_values_to_be_created)
-            except Exception as e:
-                logger.error("An error occurred when calling to the method replicate_event_values of the specified module {}. Returned error: {}".format(config["REPLICATE_EVENT_VALUES_MODULE"], str(e)))
-                self._replicate_event_values_no_external_module(from_event_uuid, to_event_uuid, list_values_to_be_created)
-        else:
-            self._replicate_event_values_no_external_module(from_event_uuid, to_event_uuid, list_values_to_be_created)
-        # end if
+            # end for
+        except ImportError as e:
+            logger.error("The specified module {} for replicating the values of events does not exist. Returned error: {}".format(config["REPLICATE_EVENT_VALUES_MODULE"], str(e)))
+            self._replicate_event_values_no_external_module({from_event_uuid: [to_event_uuid]}, list_values_to_be_created, {to_event_uuid: to_event})
+        except Exception as e:
+            logger.error("An error occurred when calling to the method replicate_event_values of the specified module {}. Returned error: {}".format(config["REPLICATE_EVENT_VALUES_MODULE"], str(e)))
+            self._replicate_event_values_no_external_module({from_event_uuid: [to_event_uuid]}, list_values_to_be_created, {to_event_uuid: to_event})
+        # end try
         
         return
 
 
     @debug
-    def _replicate_event_values_no_external_module(self, from_event_uuid, to_event_uuid, list_values_to_be_created):
+    def _replicate_event_values_no_external_module(self, list_event_uuids_aliases, list_values_to_be_created, events_to_be_created):
         """
         Method to replicate the values associated to events that were overwritten partially by other events
 
-        :param from_event_uuid: original event where to get the associated values from
-        :type from_event_uuid: uuid
-        :param to_event_uuid: new event to associate the values
-        :type to_event_uuid: uuid
+        :param list_event_uuids_aliases: list of the aliases of the event_uuids (original event UUID -> UUIDs of the new events)
+        :type list_event_uuids_aliases: dict
         :param list_values_to_be_created: list of values to be stored later inside the DDBB
         :type list_values_to_be_created: list
+        :param events_to_be_created: new events indexed by their UUIDs
+        :type events_to_be_created: dict
         """
-        values = self.query.get_event_values(event_uuids = [from_event_uuid])
+        values = self.query.get_event_values(event_uuids = list(list_event_uuids_aliases.keys()))
         for value in values:
             if not type(value) in list_values_to_be_created:
                 list_values_to_be_created[type(value)] = []
             # end if
-            value_to_insert = {"event_uuid": to_event_uuid,
-                               "name": value.name,
+            value_to_insert = {"name": value.name,
                                "position": value.position,
                                "parent_level": value.parent_level,
                                "parent_position": value.parent_position
@@ -4324,41 +5010,47 @@ class Engine():
             elif type(value) == EventGeometry:
                 value_to_insert["value"] = to_shape(value.value).wkt
             # end if
-            list_values_to_be_created[type(value)].append(value_to_insert)
+            for to_event_uuid in list_event_uuids_aliases[value.event_uuid]:
+                list_values_to_be_created[type(value)].append(dict(value_to_insert, event_uuid = to_event_uuid))
+                if type(value) in (EventText, EventDouble):
+                    # The text and double values are partitioned by the start of the event
+                    list_values_to_be_created[type(value)][-1]["event_start"] = events_to_be_created[to_event_uuid]["start"]
+                # end if
+            # end for
         # end for
         
         return
 
     @debug
-    def _replicate_event_alerts(self, from_event_uuid, to_event_uuid, list_alerts_to_be_created):
+    def _replicate_event_alerts(self, list_event_uuids_aliases, list_alerts_to_be_created):
         """
         Method to replicate the alerts associated to events that were overwritten partially by other events
 
-        :param from_event_uuid: original event where to get the associated values from
-        :type from_event_uuid: uuid
-        :param to_event_uuid: new event UUID to associate the values
-        :type to_event_uuid: uuid
+        :param list_event_uuids_aliases: list of the aliases of the event_uuids (original event UUID -> UUIDs of the new events)
+        :type list_event_uuids_aliases: dict
         :param list_alerts_to_be_created: list of alerts to be stored later inside the DDBB
         :type list_alerts_to_be_created: list
         """
-        alerts = self.query.get_event_alerts(event_uuids = {"filter": [from_event_uuid], "op": "in"})
+        alerts = self.query.get_event_alerts(event_uuids = {"filter": list(list_event_uuids_aliases.keys()), "op": "in"})
         for alert in alerts:
-            id = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
-            alert_to_insert = {
-                "event_alert_uuid": id,
-                "message": alert.message,
-                "validated": alert.validated,
-                "ingestion_time": alert.ingestion_time,
-                "generator": alert.generator,
-                "notified": alert.notified,
-                "solved": alert.solved,
-                "solved_time": alert.solved_time,
-                "notification_time": alert.notification_time,
-                "justification": alert.justification,
-                "alert_uuid": alert.alertDefinition.alert_uuid,
-                "event_uuid": to_event_uuid
-            }
-            list_alerts_to_be_created.append(alert_to_insert)
+            for to_event_uuid in list_event_uuids_aliases[alert.event_uuid]:
+                id = uuid.uuid1(node = os.getpid(), clock_seq = random.getrandbits(14))
+                alert_to_insert = {
+                    "event_alert_uuid": id,
+                    "message": alert.message,
+                    "validated": alert.validated,
+                    "ingestion_time": alert.ingestion_time,
+                    "generator": alert.generator,
+                    "notified": alert.notified,
+                    "solved": alert.solved,
+                    "solved_time": alert.solved_time,
+                    "notification_time": alert.notification_time,
+                    "justification": alert.justification,
+                    "alert_uuid": alert.alert_uuid,
+                    "event_uuid": to_event_uuid
+                }
+                list_alerts_to_be_created.append(alert_to_insert)
+            # end for
         # end for
         
         return
@@ -4421,23 +5113,23 @@ class Engine():
         # end for
         return
 
-    def _replicate_event_keys(self, from_event_uuid, to_event_uuid, list_keys_to_be_created):
+    def _replicate_event_keys(self, list_event_uuids_aliases, list_keys_to_be_created):
         """
         Method to replicate the keys associated to events that were overwritten partially by other events
 
-        :param from_event_uuid: original event where to get the associated values from
-        :type from_event_uuid: uuid
-        :param to_event_uuid: new event to associate the values
-        :type to_event_uuid: uuid
+        :param list_event_uuids_aliases: list of the aliases of the event_uuids (original event UUID -> UUIDs of the new events)
+        :type list_event_uuids_aliases: dict
         :param list_keys_to_be_created: list of keys to be stored later inside the DDBB
         :type list_keys_to_be_created: list
         """
-        keys = self.query.get_event_keys(event_uuids = {"filter": [from_event_uuid], "op": "in"})
+        keys = self.query.get_event_keys(event_uuids = {"filter": list(list_event_uuids_aliases.keys()), "op": "in"})
         for key in keys:
-            list_keys_to_be_created.append(dict(event_key = key.event_key,
-                                                event_uuid = to_event_uuid,
-                                                visible = True,
-                                                dim_signature_uuid = key.dim_signature_uuid))
+            for to_event_uuid in list_event_uuids_aliases[key.event_uuid]:
+                list_keys_to_be_created.append(dict(event_key = key.event_key,
+                                                    event_uuid = to_event_uuid,
+                                                    visible = True,
+                                                    dim_signature_uuid = key.dim_signature_uuid))
+            # end for
         # end for
         
         return
@@ -4461,12 +5153,11 @@ class Engine():
                 list_events_to_be_created_not_ending_on_period = {}
                 list_split_events = {}
 
-                segment_start = parser.parse(segment[0])
-                segment_stop = parser.parse(segment[1])
+                segment_start = segment[0]
+                segment_stop = segment[1]
                 # Get the events intersecting the segment
                 events = self.session.query(Event).filter(Event.gauge_uuid == gauge_uuid,
-                                                          or_(and_(Event.start < segment_stop,
-                                                                   Event.stop > segment_start))).order_by(Event.start).all()
+                                                          periods.get_overlap_condition("events", Event.start, Event.stop, segment_start, segment_stop)).order_by(Event.start).all()
                 sources = sorted(set([event.source for event in events]), key=lambda source: source.validity_start)
                 # Get the timeline of validity periods intersecting
                 timeline_points = set(list(chain.from_iterable([[event.start,event.stop] for event in events])))
@@ -4626,6 +5317,9 @@ class Engine():
                     # end for
                 # end for
 
+                # Replicate values, alerts and keys of the split events
+                self._replicate_split_events(list_event_uuids_aliases, list_events_to_be_created)
+
                 # Bulk insert events
                 self.session.bulk_insert_mappings(Event, list_events_to_be_created["events"])
                 # Bulk insert keys
@@ -4635,8 +5329,7 @@ class Engine():
                 self.session.bulk_insert_mappings(EventLink, list_events_to_be_created["links"])
 
                 # Remove the events that were partially affected by the insert and erase operation
-                self.session.query(EventLink).filter(EventLink.event_uuid_link.in_(list_events_to_be_removed)).delete(synchronize_session=False)
-                self.session.query(Event).filter(Event.event_uuid.in_(list_events_to_be_removed)).delete(synchronize_session=False)
+                self._remove_events(list_events_to_be_removed)
 
                 # Bulk insert alerts
                 self.session.bulk_insert_mappings(EventAlert, list_events_to_be_created["alerts"])
@@ -4685,13 +5378,12 @@ class Engine():
                 list_events_to_be_created_not_ending_on_period = {}
                 list_split_events = {}
 
-                segment_start = parser.parse(segment[0])
-                segment_stop = parser.parse(segment[1])
+                segment_start = segment[0]
+                segment_stop = segment[1]
                 # Get the events intersecting the segment
                 events = self.session.query(Event).join(Source).filter(Event.gauge_uuid == gauge_uuid,
                                                                        Source.priority != None,
-                                                                       or_(and_(Event.start < segment_stop,
-                                                                                Event.stop > segment_start))).order_by(Event.start).all()
+                                                                       periods.get_overlap_condition("events", Event.start, Event.stop, segment_start, segment_stop)).order_by(Event.start).all()
                 sources = sorted(set([event.source for event in events]), key=lambda source: source.validity_start)
                 
                 # Get the timeline of validity periods intersecting
@@ -4867,6 +5559,9 @@ class Engine():
                     # end for
                 # end for
 
+                # Replicate values, alerts and keys of the split events
+                self._replicate_split_events(list_event_uuids_aliases, list_events_to_be_created)
+
                 # Bulk insert events
                 self.session.bulk_insert_mappings(Event, list_events_to_be_created["events"])
                 # Bulk insert keys
@@ -4876,8 +5571,7 @@ class Engine():
                 self.session.bulk_insert_mappings(EventLink, list_events_to_be_created["links"])
 
                 # Remove the events that were partially affected by the insert and erase operation
-                self.session.query(EventLink).filter(EventLink.event_uuid_link.in_(list_events_to_be_removed)).delete(synchronize_session=False)
-                self.session.query(Event).filter(Event.event_uuid.in_(list_events_to_be_removed)).delete(synchronize_session=False)
+                self._remove_events(list_events_to_be_removed)
 
                 # Bulk insert alerts
                 self.session.bulk_insert_mappings(EventAlert, list_events_to_be_created["alerts"])
@@ -4923,12 +5617,11 @@ class Engine():
                                                                                                             Source.dim_signature_uuid == dim_signature_uuid).order_by(Source.ingestion_time.nullslast()).first()
 
             # Delete deprecated events
-            events_uuids_to_delete = self.session.query(Event.event_uuid).join(Source).join(EventKey).filter(Event.source_uuid != event_max_generation_time.source_uuid,
+            events_to_delete = self.session.query(Event.event_uuid, Event.start).join(Source).join(EventKey).filter(Event.source_uuid != event_max_generation_time.source_uuid,
                                                                                                                     Source.generation_time <= max_generation_time,
                                                                                                                     EventKey.event_key == key,
-                                                                                                                    Source.dim_signature_uuid == dim_signature_uuid)
-            self.session.query(EventLink).filter(EventLink.event_uuid_link.in_(events_uuids_to_delete)).delete(synchronize_session=False)
-            self.session.query(Event).filter(Event.event_uuid.in_(events_uuids_to_delete)).delete(synchronize_session=False)
+                                                                                                                    Source.dim_signature_uuid == dim_signature_uuid).all()
+            self._remove_events([event.event_uuid for event in events_to_delete], [event.start for event in events_to_delete])
 
             # Make events visible
             events_uuids_to_update = self.session.query(Event.event_uuid).join(EventKey).filter(Event.source_uuid == event_max_generation_time.source_uuid,
@@ -4961,13 +5654,12 @@ class Engine():
                                                                                                      Source.dim_signature_uuid == dim_signature_uuid).order_by(Source.ingestion_time.nullslast()).first()
 
             # Delete deprecated events
-            events_uuids_to_delete = self.session.query(Event.event_uuid).join(Source).join(EventKey).filter(Event.source_uuid != event_max_generation_time.source_uuid,
+            events_to_delete = self.session.query(Event.event_uuid, Event.start).join(Source).join(EventKey).filter(Event.source_uuid != event_max_generation_time.source_uuid,
                                                                                                              Source.priority <= max_priority,
                                                                                                              Source.generation_time <= max_generation_time,
                                                                                                              EventKey.event_key == key,
-                                                                                                             Source.dim_signature_uuid == dim_signature_uuid)
-            self.session.query(EventLink).filter(EventLink.event_uuid_link.in_(events_uuids_to_delete)).delete(synchronize_session=False)
-            self.session.query(Event).filter(Event.event_uuid.in_(events_uuids_to_delete)).delete(synchronize_session=False)
+                                                                                                             Source.dim_signature_uuid == dim_signature_uuid).all()
+            self._remove_events([event.event_uuid for event in events_to_delete], [event.start for event in events_to_delete])
 
             # Make events visible
             events_uuids_to_update = self.session.query(Event.event_uuid).join(EventKey).filter(Event.source_uuid == event_max_generation_time.source_uuid,
@@ -5128,6 +5820,9 @@ class Engine():
         # end if
         event = self.session.query(Event).filter(Event.event_uuid == event_uuid).first()
         item = self.session.query(value_entity).filter(value_entity.parent_level == -1, value_entity.parent_position == 0, value_entity.name == value_name, value_entity.event_uuid == event_uuid).first()
+        if event:
+            entity_uuid["start"] = event.start
+        # end if
         while not item and event:
             list_values = {}
             event_values = self.query.get_event_values(event_uuids = [event_uuid])
@@ -5286,6 +5981,8 @@ def get_events_per_timestamp(events, timestamps):
     Timestamp:            |
     Events:     Event2, Event3, Event4
 
+    The association is resolved with the interval index of eboa.engine.intervals in O((n+k) log n)
+
     :param events: list of events to associate to the timestamps
     :type events: list
     :param timestamps: list of timestamps corresponding to the start and stop values of the received events
@@ -5295,54 +5992,10 @@ def get_events_per_timestamp(events, timestamps):
     :rtype: dictionary (key: timestamp, value: list of events associated)
     """
 
-    events_per_timestamp = {}
-    timeline_points_iterator = 0
-    for event in events:
-        specific_timeline_points_iterator = timeline_points_iterator
-        specific_covered_timestamps = {}
-        while specific_timeline_points_iterator < len(timestamps):
-            timestamp = timestamps[specific_timeline_points_iterator]
-
-            # Check if the event has to be assigned to the penultimate timestamp (latest timestamp is not used)
-            if specific_timeline_points_iterator == len(timestamps) - 1:
-                if event.stop > timestamp:
-                    if timestamp not in events_per_timestamp:
-                        events_per_timestamp[timestamp] = []
-                    # end if
-                    if timestamp not in specific_covered_timestamps:
-                        events_per_timestamp[timestamp].append(event)
-                        specific_covered_timestamps[timestamp] = None
-                    # end if
-                # end if
-                break
-            # end if
-
-            next_timestamp = timestamps[specific_timeline_points_iterator + 1]
-            specific_timeline_points_iterator += 1
-            # Improve performances by moving to the next timestamp for all events if the current event start is already >= next_timestamp
-            if event.start > next_timestamp:
-                timeline_points_iterator += 1
-            # end if
-
-            # Check that the event can still be allocated in the timeline if not continue with the following event
-            if event.stop <= timestamp and event.start < timestamp:
-                break
-            # end if
+    starts = [event.start for event in events]
+    stops = [event.stop for event in events]
 
-            if event.start < next_timestamp and event.stop > timestamp:
-                if timestamp not in events_per_timestamp:
-                    events_per_timestamp[timestamp] = []
-                # end if
-                if timestamp not in specific_covered_timestamps:
-                    events_per_timestamp[timestamp].append(event)
-                    specific_covered_timestamps[timestamp] = None
-                # end if
-            # end if
-
-        # end while
-    # end for
-
-    return events_per_timestamp
+    return get_items_per_timestamp(events, starts, stops, timestamps)
 
 def get_sources_per_timestamp(sources, timestamps):
     """
@@ -5370,6 +6023,8 @@ def get_sources_per_timestamp(sources, timestamps):
     Timestamp:            |
     Sources:     Source1, Source2, Source3, Source4
 
+    The association is resolved with the interval index of eboa.engine.intervals in O((n+k) log n)
+
     :param sources: list of sources to associate to the timestamps
     :type sources: list
     :param timestamps: list of timestamps corresponding to the start and stop values of the received sources
@@ -5379,51 +6034,7 @@ def get_sources_per_timestamp(sources, timestamps):
     :rtype: dictionary (key: timestamp, value: list of sources associated)
     """
 
-    sources_per_timestamp = {}
-    timeline_points_iterator = 0
-    for source in sources:
-        specific_timeline_points_iterator = timeline_points_iterator
-        specific_covered_timestamps = {}
-        while specific_timeline_points_iterator < len(timestamps):
-            timestamp = timestamps[specific_timeline_points_iterator]
-
-            # Check if the source has to be assigned to the penultimate timestamp (latest timestamp is not used)
-            if specific_timeline_points_iterator == len(timestamps) - 1:
-                if source.validity_stop > timestamp:
-                    if timestamp not in sources_per_timestamp:
-                        sources_per_timestamp[timestamp] = []
-                    # end if
-                    if timestamp not in specific_covered_timestamps:
-                        sources_per_timestamp[timestamp].append(source)
-                        specific_covered_timestamps[timestamp] = None
-                    # end if
-                # end if
-                break
-            # end if
-
-            next_timestamp = timestamps[specific_timeline_points_iterator + 1]
-            specific_timeline_points_iterator += 1
-            # Improve performances by moving to the next timestamp for all events if the current event start is already >= next_timestamp
-            if source.validity_start > next_timestamp:
-                timeline_points_iterator += 1
-            # end if
-
-            # Check that the source can still be allocated in the timeline if not continue with the following source
-            if source.validity_stop <= timestamp and source.validity_start < timestamp:
-                break
-            # end if
-
-            if source.validity_start < next_timestamp and source.validity_stop > timestamp:
-                if timestamp not in sources_per_timestamp:
-                    sources_per_timestamp[timestamp] = []
-                # end if
-                if timestamp not in specific_covered_timestamps:
-                    sources_per_timestamp[timestamp].append(source)
-                    specific_covered_timestamps[timestamp] = None
-                # end if
-            # end if
+    starts = [source.validity_start for source in sources]
+    stops = [source.validity_stop for source in sources]
 
-        # end while
-    # end for
-    
-    return sources_per_timestamp
+    return get_items_per_timestamp(sources, starts, stops, timestamps)
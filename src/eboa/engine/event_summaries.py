@@ -0,0 +1,142 @@
+"""
+Maintenance of the summaries of the visible events per gauge, explicit reference and day
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import datetime
+
+# Import SQLalchemy entities
+from sqlalchemy import select, func, extract, tuple_, cast, Date, or_, and_
+
+# Import datamodel
+from eboa.datamodel.events import Event, EventKey
+from eboa.datamodel.gauges import Gauge
+from eboa.datamodel.sources import Source
+from eboa.datamodel.event_summaries import EventSummary
+
+# Number of keys refreshed per statement
+KEYS_BATCH_SIZE = 1000
+
+def get_summary_keys(session, dim_signature_uuid, start, stop, event_keys = None, source_uuid = None):
+    """
+    Method to obtain the keys of the summaries (gauge and day) which could be impacted by an ingestion.
+    These are the keys of the events of the gauges of the DIM signature overlapping the period, of the events
+    with the received event keys and of the events of the received source
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param dim_signature_uuid: identifier of the DIM signature
+    :type dim_signature_uuid: uuid
+    :param start: start of the period
+    :type start: datetime
+    :param stop: stop of the period
+    :type stop: datetime
+    :param event_keys: event keys of the ingestion
+    :type event_keys: list
+    :param source_uuid: identifier of the source of the ingestion
+    :type source_uuid: uuid
+
+    :return: keys of the summaries as tuples (gauge_uuid, day)
+    :rtype: set
+    """
+    day = cast(Event.start, Date)
+    dim_signature_gauges = select([Gauge.gauge_uuid]).where(Gauge.dim_signature_uuid == dim_signature_uuid)
+    conditions = [and_(Event.gauge_uuid.in_(dim_signature_gauges), Event.start <= stop, Event.stop >= start)]
+    if event_keys:
+        events_with_keys = select([EventKey.event_uuid]).where(and_(EventKey.dim_signature_uuid == dim_signature_uuid, EventKey.event_key.in_(event_keys)))
+        conditions.append(Event.event_uuid.in_(events_with_keys))
+    # end if
+    if source_uuid != None:
+        conditions.append(Event.source_uuid == source_uuid)
+    # end if
+
+    query = session.query(Event.gauge_uuid, day).filter(or_(*conditions)).distinct()
+
+    return set([(gauge_uuid, event_day) for gauge_uuid, event_day in query])
+
+def get_deleted_summary_keys(session, query):
+    """
+    Method to obtain the keys of the summaries (gauge and day) impacted by the deletion of the entities
+    obtained by the received query. Only the deletions of sources and events remove events
+    from the summaries (the deletion of sources cascades to their events)
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param query: query of the entities to delete
+    :type query: sqlalchemy.orm.Query
+
+    :return: keys of the summaries as tuples (gauge_uuid, day)
+    :rtype: set
+    """
+    entity = query.column_descriptions[0]["entity"]
+    if entity == Event:
+        condition = Event.event_uuid.in_(query.with_entities(Event.event_uuid).subquery())
+    elif entity == Source:
+        condition = Event.source_uuid.in_(query.with_entities(Source.source_uuid).subquery())
+    else:
+        return set()
+    # end if
+
+    summary_keys = session.query(Event.gauge_uuid, cast(Event.start, Date)).filter(condition).distinct()
+
+    return set([(gauge_uuid, event_day) for gauge_uuid, event_day in summary_keys])
+
+def refresh_summaries(session, keys = None):
+    """
+    Method to compute again the summaries associated to the received keys from the visible events.
+    The changes are not committed
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param keys: keys of the summaries as tuples (gauge_uuid, day) (if None, all the summaries are computed again)
+    :type keys: set
+    """
+    if keys == None:
+        session.query(EventSummary).delete(synchronize_session=False)
+        _insert_summaries(session, [])
+        return
+    # end if
+
+    keys = sorted(keys)
+    for i in range(0, len(keys), KEYS_BATCH_SIZE):
+        keys_batch = keys[i:i + KEYS_BATCH_SIZE]
+        session.query(EventSummary).filter(tuple_(EventSummary.gauge_uuid, EventSummary.day).in_(keys_batch)).delete(synchronize_session=False)
+
+        # Restrict the events by gauge and period before matching the keys so that the indexes can be used
+        first_day = min([key[1] for key in keys_batch])
+        last_day = max([key[1] for key in keys_batch])
+        _insert_summaries(session, [Event.gauge_uuid.in_(set([key[0] for key in keys_batch])),
+                                    Event.start >= datetime.datetime.combine(first_day, datetime.time()),
+                                    Event.start < datetime.datetime.combine(last_day + datetime.timedelta(days = 1), datetime.time()),
+                                    tuple_(Event.gauge_uuid, cast(Event.start, Date)).in_(keys_batch)])
+    # end for
+
+    return
+
+def _insert_summaries(session, params):
+    """
+    Method to insert the summaries of the visible events fulfilling the received conditions
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param params: conditions over the events
+    :type params: list
+    """
+    day = cast(Event.start, Date)
+    summaries = select([Event.gauge_uuid,
+                        Event.explicit_ref_uuid,
+                        day,
+                        func.count(),
+                        func.sum(extract("epoch", Event.stop) - extract("epoch", Event.start)),
+                        func.min(Event.start),
+                        func.max(Event.start),
+                        func.min(Event.stop),
+                        func.max(Event.stop)]).where(and_(Event.visible == True, *params)).group_by(Event.gauge_uuid, Event.explicit_ref_uuid, day)
+
+    session.execute(EventSummary.__table__.insert().from_select(["gauge_uuid", "explicit_ref_uuid", "day", "event_count", "total_duration",
+                                                                  "min_start", "max_start", "min_stop", "max_stop"], summaries))
+
+    return
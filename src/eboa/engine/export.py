@@ -7,6 +7,10 @@ module eboa
 """
 from geoalchemy2.shape import to_shape
 
+# Import SQLalchemy entities
+from sqlalchemy import inspect
+from sqlalchemy.orm import Query, selectinload, object_session
+
 import logging
 from eboa.logging import Log
 
@@ -16,10 +20,226 @@ from eboa.engine.errors import ErrorParsingParameters
 logging = Log(name = __name__)
 logger = logging.logger
 
+########
+# Preload methods for exporting with a fixed number of queries
+########
+event_values_relations = ["eventTexts", "eventDoubles", "eventObjects", "eventGeometries", "eventBooleans", "eventTimestamps"]
+annotation_values_relations = ["annotationTexts", "annotationDoubles", "annotationObjects", "annotationGeometries", "annotationBooleans", "annotationTimestamps"]
+
+def _get_alert_loading_options():
+    """Function to obtain the loader options of the alerts associated to an entity
+
+    :return: loader options
+    :rtype: list
+    """
+    return [selectinload("alerts").selectinload("alertDefinition").selectinload("group")]
+
+def _get_source_loading_options(include_alerts = False):
+    """Function to obtain the loader options needed by export_sources
+
+    :param include_alerts: flag to indicate if the detail of the alerts has to be included
+    :type include_alerts: boolean
+
+    :return: loader options
+    :rtype: list
+    """
+    options = [selectinload("dimSignature"),
+               selectinload("statuses"),
+               # Only the number of events and annotations is exported
+               selectinload("events").load_only("event_uuid"),
+               selectinload("annotations").load_only("annotation_uuid")]
+    if include_alerts:
+        options += _get_alert_loading_options()
+    # end if
+
+    return options
+
+def _get_event_loading_options(include_ers = True, include_annotations = True, include_sources = True, include_alerts = False):
+    """Function to obtain the loader options needed by export_events
+
+    :param include_ers: flag to indicate if the detail of the explicit references has to be included
+    :type include_ers: boolean
+    :param include_annotations: flag to indicate if the detail of the annotations has to be included
+    :type include_annotations: boolean
+    :param include_sources: flag to indicate if the detail of the sources has to be included
+    :type include_sources: boolean
+    :param include_alerts: flag to indicate if the detail of the alerts has to be included
+    :type include_alerts: boolean
+
+    :return: loader options
+    :rtype: list
+    """
+    options = [selectinload("gauge").selectinload("dim_signature"),
+               selectinload("eventLinks")]
+    options += [selectinload(values_relation) for values_relation in event_values_relations]
+    if include_ers:
+        options.append(selectinload("explicitRef").options(*_get_er_loading_options(include_annotations = include_annotations, include_events = False, include_sources = include_sources)))
+    else:
+        options.append(selectinload("explicitRef"))
+    # end if
+    if include_sources:
+        options.append(selectinload("source").options(*_get_source_loading_options(include_alerts = include_alerts)))
+    else:
+        options.append(selectinload("source"))
+    # end if
+    if include_alerts:
+        options += _get_alert_loading_options()
+    # end if
+
+    return options
+
+def _get_annotation_loading_options(include_ers = True, include_events = True, include_sources = True, include_alerts = False):
+    """Function to obtain the loader options needed by export_annotations
+
+    :param include_ers: flag to indicate if the detail of the explicit references has to be included
+    :type include_ers: boolean
+    :param include_events: flag to indicate if the detail of the events has to be included
+    :type include_events: boolean
+    :param include_sources: flag to indicate if the detail of the sources has to be included
+    :type include_sources: boolean
+    :param include_alerts: flag to indicate if the detail of the alerts has to be included
+    :type include_alerts: boolean
+
+    :return: loader options
+    :rtype: list
+    """
+    options = [selectinload("annotationCnf").selectinload("dim_signature")]
+    options += [selectinload(values_relation) for values_relation in annotation_values_relations]
+    if include_ers:
+        options.append(selectinload("explicitRef").options(*_get_er_loading_options(include_annotations = False, include_events = include_events, include_sources = include_sources)))
+    else:
+        options.append(selectinload("explicitRef"))
+    # end if
+    if include_sources:
+        options.append(selectinload("source").options(*_get_source_loading_options(include_alerts = include_alerts)))
+    else:
+        options.append(selectinload("source"))
+    # end if
+    if include_alerts:
+        options += _get_alert_loading_options()
+    # end if
+
+    return options
+
+def _get_er_loading_options(include_annotations = True, include_events = True, include_sources = True, include_alerts = False):
+    """Function to obtain the loader options needed by export_ers
+
+    :param include_annotations: flag to indicate if the detail of the annotations has to be included
+    :type include_annotations: boolean
+    :param include_events: flag to indicate if the detail of the events has to be included
+    :type include_events: boolean
+    :param include_sources: flag to indicate if the detail of the sources associated to the annotations or events has to be included
+    :type include_sources: boolean
+    :param include_alerts: flag to indicate if the detail of the alerts has to be included
+    :type include_alerts: boolean
+
+    :return: loader options
+    :rtype: list
+    """
+    options = [selectinload("group")]
+    if include_annotations:
+        options.append(selectinload("annotations").options(*_get_annotation_loading_options(include_ers = False, include_events = False, include_sources = include_sources, include_alerts = include_alerts)))
+    # end if
+    if include_events:
+        options.append(selectinload("events").options(*_get_event_loading_options(include_ers = False, include_annotations = False, include_sources = include_sources, include_alerts = include_alerts)))
+    # end if
+    if include_alerts:
+        options += _get_alert_loading_options()
+    # end if
+
+    return options
+
+def _preload(entities, options):
+    """Function to load the entities with the received loader options.
+    The entities already present in the session receive the relationships which were not loaded yet,
+    so the number of queries depends on the loader options and not on the number of entities
+    (the relationships are loaded in batches of 500 entities)
+
+    :param entities: list of entities of the same class or query obtaining them
+    :type entities: list or sqlalchemy.orm.Query
+    :param options: loader options
+    :type options: list
+
+    :return: loaded entities
+    :rtype: list
+    """
+    if isinstance(entities, Query):
+        return entities.options(*options).all()
+    # end if
+
+    entities = list(entities)
+    if len(entities) == 0:
+        return entities
+    # end if
+
+    entity = type(entities[0])
+    primary_key = inspect(entity).primary_key[0]
+    primary_key_name = primary_key.key
+    object_session(entities[0]).query(entity).filter(primary_key.in_(set([getattr(item, primary_key_name) for item in entities]))).options(*options).all()
+
+    return entities
+
+def preload_events(events, include_ers = True, include_annotations = True, include_sources = True, include_alerts = False):
+    """Function to load, with a fixed number of set based queries, all the entities needed by export_events
+
+    :param events: list of events or query obtaining them
+    :type events: list(Event) or sqlalchemy.orm.Query
+    :param include_ers: flag to indicate if the detail of the explicit references has to be included
+    :type include_ers: boolean
+    :param include_annotations: flag to indicate if the detail of the annotations has to be included
+    :type include_annotations: boolean
+    :param include_sources: flag to indicate if the detail of the sources has to be included
+    :type include_sources: boolean
+    :param include_alerts: flag to indicate if the detail of the alerts has to be included
+    :type include_alerts: boolean
+
+    :return: events with the related entities loaded
+    :rtype: list(Event)
+    """
+    return _preload(events, _get_event_loading_options(include_ers = include_ers, include_annotations = include_annotations, include_sources = include_sources, include_alerts = include_alerts))
+
+def preload_annotations(annotations, include_ers = True, include_events = True, include_sources = True, include_alerts = False):
+    """Function to load, with a fixed number of set based queries, all the entities needed by export_annotations
+
+    :param annotations: list of annotations or query obtaining them
+    :type annotations: list(Annotation) or sqlalchemy.orm.Query
+    :param include_ers: flag to indicate if the detail of the explicit references has to be included
+    :type include_ers: boolean
+    :param include_events: flag to indicate if the detail of the events has to be included
+    :type include_events: boolean
+    :param include_sources: flag to indicate if the detail of the sources has to be included
+    :type include_sources: boolean
+    :param include_alerts: flag to indicate if the detail of the alerts has to be included
+    :type include_alerts: boolean
+
+    :return: annotations with the related entities loaded
+    :rtype: list(Annotation)
+    """
+    return _preload(annotations, _get_annotation_loading_options(include_ers = include_ers, include_events = include_events, include_sources = include_sources, include_alerts = include_alerts))
+
+def preload_ers(ers, include_annotations = True, include_events = True, include_sources = True, include_alerts = False):
+    """Function to load, with a fixed number of set based queries, all the entities needed by export_ers
+
+    :param ers: list of explicit references or query obtaining them
+    :type ers: list(ExplicitRef) or sqlalchemy.orm.Query
+    :param include_annotations: flag to indicate if the detail of the annotations has to be included
+    :type include_annotations: boolean
+    :param include_events: flag to indicate if the detail of the events has to be included
+    :type include_events: boolean
+    :param include_sources: flag to indicate if the detail of the sources associated to the annotations or events has to be included
+    :type include_sources: boolean
+    :param include_alerts: flag to indicate if the detail of the alerts has to be included
+    :type include_alerts: boolean
+
+    :return: explicit references with the related entities loaded
+    :rtype: list(ExplicitRef)
+    """
+    return _preload(ers, _get_er_loading_options(include_annotations = include_annotations, include_events = include_events, include_sources = include_sources, include_alerts = include_alerts))
+
 ########
 # Export methods in python dictionary format
 ########
-def export_events(structure, events, include_ers = True, include_annotations = True, include_sources = True, include_alerts = False, group = None):
+def export_events(structure, events, include_ers = True, include_annotations = True, include_sources = True, include_alerts = False, group = None, preload = False):
     """Function to insert the events with DDBB format into a dictionary
     
     :param structure: dictionary where to export the events to
@@ -36,6 +256,8 @@ def export_events(structure, events, include_ers = True, include_annotations = T
     :type include_alerts: boolean
     :param group: label to group the events
     :type group: str
+    :param preload: flag to indicate if the related entities have to be loaded with a fixed number of queries before exporting (see preload_events)
+    :type preload: boolean
 
     Output: The function will insert into the structure the
     corresponding events, leaving the structure like the following:
@@ -87,6 +309,10 @@ def export_events(structure, events, include_ers = True, include_annotations = T
         structure["gauges"] = {}
     # end if
 
+    if preload:
+        events = preload_events(events, include_ers = include_ers, include_annotations = include_annotations, include_sources = include_sources, include_alerts = include_alerts)
+    # end if
+
     for event in events:
 
         # Check if the event was already included in the structure
@@ -149,7 +375,7 @@ def export_events(structure, events, include_ers = True, include_annotations = T
 
     return structure
 
-def export_annotations(structure, annotations, include_ers = True, include_events = True, include_sources = True, include_alerts = False, group = None):
+def export_annotations(structure, annotations, include_ers = True, include_events = True, include_sources = True, include_alerts = False, group = None, preload = False):
     """Function to insert the annotations with DDBB format into a dictionary
     
     :param structure: dictionary where to export the annotations to
@@ -166,6 +392,8 @@ def export_annotations(structure, annotations, include_ers = True, include_event
     :type include_alerts: boolean
     :param group: label to group the annotations
     :type group: str
+    :param preload: flag to indicate if the related entities have to be loaded with a fixed number of queries before exporting (see preload_annotations)
+    :type preload: boolean
 
     Output: The function will insert into the structure the
     corresponding annotations, leaving the structure like the following:
@@ -212,6 +440,10 @@ def export_annotations(structure, annotations, include_ers = True, include_event
     if "annotations" not in structure:
         structure["annotations"] = {}
     # end if
+
+    if preload:
+        annotations = preload_annotations(annotations, include_ers = include_ers, include_events = include_events, include_sources = include_sources, include_alerts = include_alerts)
+    # end if
         
     for annotation in annotations:
 
@@ -264,7 +496,7 @@ def export_annotations(structure, annotations, include_ers = True, include_event
 
     return structure
 
-def export_ers(structure, ers, include_annotations = True, include_events = True, include_sources = True, include_alerts = False, group = None):
+def export_ers(structure, ers, include_annotations = True, include_events = True, include_sources = True, include_alerts = False, group = None, preload = False):
     """Function to insert the explicit reference with DDBB format into a dictionary
     
     :param structure: dictionary where to export the explicit refereces to
@@ -281,6 +513,8 @@ def export_ers(structure, ers, include_annotations = True, include_events = True
     :type include_alerts: boolean
     :param group: label to group the ERs
     :type group: str
+    :param preload: flag to indicate if the related entities have to be loaded with a fixed number of queries before exporting (see preload_ers)
+    :type preload: boolean
 
     Output: The function will insert into the structure the
     corresponding explicit references, leaving the structure like the following:
@@ -328,6 +562,10 @@ def export_ers(structure, ers, include_annotations = True, include_events = True
         structure["explicit_references"] = {}
     # end if
 
+    if preload:
+        ers = preload_ers(ers, include_annotations = include_annotations, include_events = include_events, include_sources = include_sources, include_alerts = include_alerts)
+    # end if
+
     for er in ers:
 
         # Insert the reference in the group
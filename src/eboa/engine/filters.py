@@ -0,0 +1,118 @@
+"""
+Filters definition for building the predicates of the query components
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import exceptions
+from eboa.engine.errors import InputError
+
+# Import operators
+from eboa.engine.operators import arithmetic_operators
+
+# Import auxiliary functions
+import eboa.engine.functions as functions
+
+# Table (built once) associating every operator of the text filters to the callable building the predicate over a column
+filter_operators = {
+    "like": lambda column, value: column.like(value),
+    "notlike": lambda column, value: column.notlike(value),
+    "in": lambda column, value: column.in_(value),
+    "notin": lambda column, value: column.notin_(value),
+    "regex": lambda column, value: column.op("~")(value)
+}
+for op in arithmetic_operators:
+    filter_operators[op] = arithmetic_operators[op]
+# end for
+
+def build_filter(column, op, value):
+    """
+    Method to build the predicate applying an operator over a column
+
+    :param column: column (or expression) to filter
+    :type column: sqlalchemy column
+    :param op: operator (arithmetic, text or regex operator)
+    :type op: str
+    :param value: value to compare with
+    :type value: any
+
+    :return: predicate
+    :rtype: sqlalchemy expression
+    """
+    return filter_operators[op](column, value)
+
+def build_text_filter(column, text_filter):
+    """
+    Method to build the predicate associated to a text filter over a column
+
+    PRE:
+    - The text filter has been validated (see eboa.engine.functions.is_valid_text_filter)
+
+    :param column: column (or expression) to filter
+    :type column: sqlalchemy column
+    :param text_filter: text filter
+    :type text_filter: text_filter
+
+    :return: predicate
+    :rtype: sqlalchemy expression
+    """
+    return filter_operators[text_filter["op"]](column, text_filter["filter"])
+
+def build_text_filters(entity, filter_columns, received_filters, tables = None):
+    """
+    Method to build the predicates associated to the text filters received by a query method.
+    The column filtered by every text filter is obtained from the table of the query component
+    associating the names of the text filters of the method to their columns (built once at import)
+
+    :param entity: class of the datamodel obtained by the query method
+    :type entity: sqlalchemy declarative class
+    :param filter_columns: table associating the names of the text filters of the query method to the columns they filter
+    :type filter_columns: dict
+    :param received_filters: text filters received by the query method by name (None if not received)
+    :type received_filters: dict
+    :param tables: list where to add the entities (different from the queried one) to join for applying the predicates
+    :type tables: list
+
+    :return: predicates
+    :rtype: list
+    """
+    params = []
+    for name in received_filters:
+        text_filter = received_filters[name]
+        if text_filter != None:
+            functions.is_valid_text_filter(text_filter)
+            column = filter_columns[name]
+            params.append(filter_operators[text_filter["op"]](column, text_filter["filter"]))
+            if tables != None and column.class_ != entity:
+                tables.append(column.class_)
+            # end if
+        # end if
+    # end for
+
+    return params
+
+def build_order_by(entity, order_by):
+    """
+    Method to build the ordering statement associated to an order_by statement
+
+    PRE:
+    - The order_by statement has been validated (see eboa.engine.functions.is_valid_order_by)
+
+    :param entity: class of the datamodel to order
+    :type entity: sqlalchemy declarative class
+    :param order_by: field to order by
+    :type order_by: order_by statement
+
+    :return: ordering statement
+    :rtype: sqlalchemy expression
+    """
+    if not hasattr(entity, order_by["field"]):
+        raise InputError("The field {} of the parameter order_by is not a field of {}.".format(order_by["field"], entity.__tablename__))
+    # end if
+    field = getattr(entity, order_by["field"])
+    if order_by["descending"]:
+        return field.desc()
+    # end if
+
+    return field
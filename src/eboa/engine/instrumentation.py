@@ -0,0 +1,186 @@
+"""
+Instrumentation of the queries executed against the DDBB
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import sys
+import time
+import random
+import threading
+
+# Import SQLalchemy entities
+from sqlalchemy import event
+
+# Import auxiliary functions
+from eboa.engine.functions import read_configuration
+
+# Import logging
+from eboa.logging import Log
+
+config = read_configuration()
+
+logging = Log(name = __name__)
+logger = logging.logger
+
+class QueryInstrumentation():
+    """
+    Class for measuring the duration and the number of rows of the queries executed against the DDBB.
+    The statistics are grouped by the method of the query components (get_events, get_sources...) originating the queries.
+    The instrumentation registers listeners on the SQLAlchemy engine only when it is enabled,
+    so there is no cost when it is disabled
+    """
+
+    def __init__(self):
+        """
+        Class for instrumenting queries
+        """
+        self.engine = None
+        self.slow_query_threshold = None
+        self.sampling_rate = 1.0
+        self.statistics = {}
+        self.lock = threading.Lock()
+
+        return
+
+    def enable(self, engine, slow_query_threshold = None, sampling_rate = 1.0):
+        """
+        Method to start the instrumentation of the queries executed through the received engine
+
+        :param engine: SQLAlchemy engine to instrument
+        :type engine: sqlalchemy.engine.Engine
+        :param slow_query_threshold: number of seconds from which a query is logged as slow (None disables the slow query log)
+        :type slow_query_threshold: float
+        :param sampling_rate: fraction of the slow queries to log (between 0 and 1)
+        :type sampling_rate: float
+        """
+        if self.engine != None:
+            self.disable()
+        # end if
+        self.engine = engine
+        self.slow_query_threshold = slow_query_threshold
+        self.sampling_rate = sampling_rate
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+        return
+
+    def disable(self):
+        """
+        Method to stop the instrumentation of the queries
+        """
+        if self.engine != None:
+            event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(self.engine, "after_cursor_execute", self._after_cursor_execute)
+            self.engine = None
+        # end if
+
+        return
+
+    def is_enabled(self):
+        """
+        Method to check if the instrumentation is enabled
+
+        :return: True if the instrumentation is enabled
+        :rtype: bool
+        """
+        return self.engine != None
+
+    def get_statistics(self):
+        """
+        Method to obtain the statistics of the instrumented queries
+
+        :return: statistics per origin (key: origin of the queries, value: dictionary with the number of calls, the accumulated duration in seconds, the maximum duration in seconds and the number of rows)
+        :rtype: dict
+        """
+        with self.lock:
+            statistics = {origin: dict(origin_statistics) for origin, origin_statistics in self.statistics.items()}
+        # end with
+
+        return statistics
+
+    def reset(self):
+        """
+        Method to remove the statistics of the instrumented queries
+        """
+        with self.lock:
+            self.statistics.clear()
+        # end with
+
+        return
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        """
+        Listener registering the time before the execution of a statement (see SQLAlchemy before_cursor_execute event)
+        """
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+        return
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        """
+        Listener accumulating the statistics of the executed statement and logging it if it is slow (see SQLAlchemy after_cursor_execute event)
+        """
+        duration = time.perf_counter() - conn.info["query_start_time"].pop()
+        rows = cursor.rowcount if cursor.rowcount != None and cursor.rowcount > 0 else 0
+        origin = _get_origin()
+
+        with self.lock:
+            origin_statistics = self.statistics.setdefault(origin, {"calls": 0, "duration": 0.0, "max_duration": 0.0, "rows": 0})
+            origin_statistics["calls"] += 1
+            origin_statistics["duration"] += duration
+            origin_statistics["max_duration"] = max(origin_statistics["max_duration"], duration)
+            origin_statistics["rows"] += rows
+        # end with
+
+        if self.slow_query_threshold != None and duration >= self.slow_query_threshold and random.random() < self.sampling_rate:
+            logger.warning("Slow query originated by {} lasted {} seconds and returned {} rows: {} (parameters: {})".format(origin, duration, rows, statement, parameters))
+        # end if
+
+        return
+
+def _get_origin():
+    """
+    Method to obtain the method of the query or engine components which originated the query being executed
+    by walking the stack of calls
+
+    :return: name of the originating method (or the name of the module and method of the first caller outside SQLAlchemy)
+    :rtype: str
+    """
+    frame = sys._getframe(2)
+    first_caller = None
+    while frame != None:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith("sqlalchemy") and not module.startswith(__name__):
+            if first_caller == None:
+                first_caller = module + "." + frame.f_code.co_name
+            # end if
+            if (module.endswith(".engine.query") or module.endswith(".engine.engine")) and not frame.f_code.co_name.startswith("<"):
+                return frame.f_code.co_name
+            # end if
+        # end if
+        frame = frame.f_back
+    # end while
+
+    return first_caller or "unknown"
+
+query_instrumentation = QueryInstrumentation()
+
+def enable_from_configuration(engine):
+    """
+    Method to enable the instrumentation of the queries executed through the received engine
+    if it is enabled in the configuration (QUERY_INSTRUMENTATION of engine.json)
+
+    :param engine: SQLAlchemy engine to instrument
+    :type engine: sqlalchemy.engine.Engine
+    """
+    instrumentation_config = config.get("QUERY_INSTRUMENTATION") or {}
+    if instrumentation_config.get("ENABLED") and not query_instrumentation.is_enabled():
+        query_instrumentation.enable(engine,
+                                     slow_query_threshold = instrumentation_config.get("SLOW_QUERY_THRESHOLD"),
+                                     sampling_rate = instrumentation_config.get("SAMPLING_RATE", 1.0))
+    # end if
+
+    return
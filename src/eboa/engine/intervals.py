@@ -0,0 +1,109 @@
+"""
+Interval index definition for the engine component
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import datetime
+import numpy as np
+
+epoch = datetime.datetime(1970, 1, 1)
+microsecond = datetime.timedelta(microseconds=1)
+
+def to_datetime64(values):
+    """
+    Method to convert a list of naive datetimes into an array of numpy datetime64 values with microsecond resolution.
+    The conversion goes through the number of microseconds since the epoch as numpy is
+    considerably slower building the array from the datetime objects directly
+
+    :param values: list of naive datetimes (or an already built numpy array)
+    :type values: list or numpy.ndarray
+
+    :return: array of datetime64 values
+    :rtype: numpy.ndarray
+    """
+    if isinstance(values, np.ndarray):
+        return values.astype("datetime64[us]")
+    # end if
+
+    return np.fromiter(((value - epoch) // microsecond for value in values), dtype=np.int64, count=len(values)).view("datetime64[us]")
+
+def get_interval_indexes_per_timestamp(starts, stops, timestamps):
+    """
+    Method to associate intervals to the timestamps (starts of segments specified by the timestamps) by sweeping
+    the sorted timestamps with binary searches. An interval is associated to a timestamp:
+    if (start < next timestamp and stop > timestamp)
+    The last timestamp has no next timestamp so an interval is associated to it:
+    if (stop > timestamp)
+
+    Complexity is O((n + k) log n) where n is the number of intervals and timestamps and k the number of associations
+
+    PRE:
+    - The list of timestamps is sorted and without duplications
+
+    :param starts: start values of the intervals
+    :type starts: list or numpy.ndarray
+    :param stops: stop values of the intervals
+    :type stops: list or numpy.ndarray
+    :param timestamps: sorted timestamps defining the segments
+    :type timestamps: list or numpy.ndarray
+
+    :return: interval_indexes_per_timestamp
+    :rtype: dictionary (key: position of the timestamp, value: array of the positions of the intervals associated in ascending order)
+    """
+    starts = to_datetime64(starts)
+    stops = to_datetime64(stops)
+    timestamps = to_datetime64(timestamps)
+
+    if len(timestamps) == 0 or len(starts) == 0:
+        return {}
+    # end if
+
+    # First segment satisfying start < next timestamp
+    first_positions = np.maximum(np.searchsorted(timestamps, starts, side="right") - 1, 0)
+    # Last segment satisfying stop > timestamp
+    last_positions = np.searchsorted(timestamps, stops, side="left") - 1
+
+    counts = np.maximum(last_positions - first_positions + 1, 0)
+    total = int(counts.sum())
+    if total == 0:
+        return {}
+    # end if
+
+    # Expand every interval into the list of segments it covers
+    interval_indexes = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    timestamp_indexes = np.repeat(first_positions, counts) + offsets
+
+    # Group by segment keeping the order of the intervals
+    order = np.argsort(timestamp_indexes, kind="stable")
+    timestamp_indexes = timestamp_indexes[order]
+    interval_indexes = interval_indexes[order]
+    unique_timestamp_indexes, group_starts = np.unique(timestamp_indexes, return_index=True)
+    groups = np.split(interval_indexes, group_starts[1:])
+
+    return {int(timestamp_index): group for timestamp_index, group in zip(unique_timestamp_indexes, groups)}
+
+def get_items_per_timestamp(items, starts, stops, timestamps):
+    """
+    Method to associate items (events, sources...) to the timestamps (starts of segments specified by the timestamps)
+    following the rules of get_interval_indexes_per_timestamp
+
+    :param items: list of items to associate to the timestamps
+    :type items: list
+    :param starts: start values of the items
+    :type starts: list
+    :param stops: stop values of the items
+    :type stops: list
+    :param timestamps: sorted timestamps defining the segments
+    :type timestamps: list
+
+    :return: items_per_timestamp
+    :rtype: dictionary (key: timestamp, value: list of items associated)
+    """
+    interval_indexes_per_timestamp = get_interval_indexes_per_timestamp(starts, stops, timestamps)
+
+    return {timestamps[timestamp_index]: [items[interval_index] for interval_index in interval_indexes.tolist()]
+            for timestamp_index, interval_indexes in interval_indexes_per_timestamp.items()}
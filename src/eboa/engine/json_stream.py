@@ -0,0 +1,417 @@
+"""
+Incremental reader of json files with operations for the engine component
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import json
+
+decoder = json.JSONDecoder()
+whitespaces = " \t\n\r"
+
+# Arrays of the operations which are not kept in memory but read from the file every time they are iterated
+streamed_keys = ["events", "annotations", "explicit_references"]
+
+class JsonStream():
+    """
+    Class for reading incrementally the content of a json file keeping in memory only the
+    part of the file which has not been decoded yet
+    """
+
+    def __init__(self, input_file, buffer_size):
+        """
+        Instantiation method
+
+        :param input_file: opened json file
+        :type input_file: file object
+        :param buffer_size: minimum number of characters to read from the file each time
+        :type buffer_size: int
+        """
+        self.input_file = input_file
+        self.buffer_size = buffer_size
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+        # Number of characters consumed before the start of the buffer
+        self.buffer_start = 0
+        # Positions of the file (cookie, number of characters consumed) where the reads kept in the buffer started
+        self.reads = []
+
+        return
+
+    def _read(self):
+        """
+        Method to read more content from the file. The size of the read is doubled
+        with the size of the pending buffer to keep linear the decoding of big items
+
+        :return: False if the end of the file has been reached
+        :rtype: bool
+        """
+        if self.eof:
+            return False
+        # end if
+        self.buffer_start += self.position
+        self.buffer = self.buffer[self.position:]
+        self.position = 0
+        while len(self.reads) > 1 and self.reads[1][1] <= self.buffer_start:
+            self.reads.pop(0)
+        # end while
+        cookie = self.input_file.tell()
+        content = self.input_file.read(max(self.buffer_size, len(self.buffer)))
+        if content == "":
+            self.eof = True
+            return False
+        # end if
+        self.reads.append((cookie, self.buffer_start + len(self.buffer)))
+        self.buffer += content
+
+        return True
+
+    def next_character(self):
+        """
+        Method to obtain the next character which is not a white space without consuming it
+
+        :return: next character or None if the end of the file has been reached
+        :rtype: str
+        """
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in whitespaces:
+                self.position += 1
+            # end while
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            # end if
+            if not self._read():
+                return None
+            # end if
+        # end while
+
+    def expect(self, character):
+        """
+        Method to consume the expected character (skipping white spaces)
+
+        :param character: expected character
+        :type character: str
+        """
+        if self.next_character() != character:
+            raise ValueError("Expected character {} at position {} of the json file".format(character, self.buffer_start + self.position))
+        # end if
+        self.position += 1
+
+        return
+
+    def decode(self):
+        """
+        Method to decode the next json value
+
+        :return: decoded value
+        :rtype: any json value
+        """
+        self.next_character()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.position)
+                # A number could be truncated at the end of the buffer
+                if end < len(self.buffer) or self.eof or type(value) in (dict, list, str):
+                    self.position = end
+                    return value
+                # end if
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                # end if
+            # end try
+            if not self._read() and self.position >= len(self.buffer):
+                raise ValueError("Unexpected end of the json file")
+            # end if
+        # end while
+
+    def tell(self):
+        """
+        Method to obtain the position of the next character which is not a white space
+
+        :return: position to be used with seek (cookie of the file and number of characters to skip from it)
+        :rtype: tuple
+        """
+        if self.next_character() == None:
+            raise ValueError("Unexpected end of the json file")
+        # end if
+        offset = self.buffer_start + self.position
+        for cookie, start in reversed(self.reads):
+            if start <= offset:
+                return (cookie, offset - start)
+            # end if
+        # end for
+
+    def seek(self, position):
+        """
+        Method to continue reading the file from a position obtained with tell
+
+        :param position: cookie of the file and number of characters to skip from it
+        :type position: tuple
+        """
+        cookie, characters_to_skip = position
+        self.input_file.seek(cookie)
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+        self.buffer_start = 0
+        self.reads = []
+        while characters_to_skip > 0:
+            if self.position >= len(self.buffer) and not self._read():
+                raise ValueError("Unexpected end of the json file")
+            # end if
+            skipped_characters = min(characters_to_skip, len(self.buffer) - self.position)
+            self.position += skipped_characters
+            characters_to_skip -= skipped_characters
+        # end while
+
+        return
+
+class StreamedArray():
+    """
+    Array of a json file which is not kept in memory.
+    Every iteration reads the items from the file in chunks, so that the memory needed is
+    proportional to the size of the chunks and not to the size of the array
+    """
+
+    def __init__(self, json_path, position, length, buffer_size = 1048576, summary = None):
+        """
+        Instantiation method
+
+        :param json_path: path to the json file
+        :type json_path: str
+        :param position: position of the array in the file (see JsonStream.tell)
+        :type position: tuple
+        :param length: number of items of the array
+        :type length: int
+        :param buffer_size: minimum number of characters to read from the file each time
+        :type buffer_size: int
+        :param summary: information collected from the items while loading the file (see load_data)
+        :type summary: dict
+        """
+        self.json_path = json_path
+        self.position = position
+        self.length = length
+        self.buffer_size = buffer_size
+        if summary == None:
+            summary = {}
+        # end if
+        self.summary = summary
+
+        return
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for chunk in self.iterate_chunks():
+            for item in chunk:
+                yield item
+            # end for
+        # end for
+
+    def iterate_chunks(self, chunk_size = 1000):
+        """
+        Method to iterate over the items of the array in chunks
+
+        :param chunk_size: maximum number of items of every chunk
+        :type chunk_size: int
+
+        :return: generator of lists of items
+        :rtype: generator
+        """
+        with open(self.json_path) as input_file:
+            stream = JsonStream(input_file, self.buffer_size)
+            stream.seek(self.position)
+            chunk = []
+            for item in iterate_array(stream):
+                chunk.append(item)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+                # end if
+            # end for
+            if len(chunk) > 0:
+                yield chunk
+            # end if
+        # end with
+
+    def __repr__(self):
+        return "StreamedArray({}, {} items)".format(self.json_path, self.length)
+
+def encode_streamed_array(value):
+    """
+    Method to encode the streamed arrays with json.dumps (default parameter) without loading their items.
+    The arrays are replaced by a reference to the file and the number of items
+
+    :param value: value not serializable by json.dumps
+    :type value: StreamedArray
+
+    :return: serializable value
+    :rtype: dict
+    """
+    if type(value) != StreamedArray:
+        raise TypeError("Object of type {} is not JSON serializable".format(type(value).__name__))
+    # end if
+
+    return {"streamed_from": value.json_path, "items": value.length}
+
+def iterate_array(stream, read_item = None):
+    """
+    Method to decode one by one the items of the array starting at the current position of the stream
+
+    :param stream: stream positioned at the start of the array
+    :type stream: JsonStream
+    :param read_item: function receiving the stream and returning the next item (JsonStream.decode by default)
+    :type read_item: function
+
+    :return: generator of items
+    :rtype: generator
+    """
+    if read_item == None:
+        read_item = JsonStream.decode
+    # end if
+    stream.expect("[")
+    if stream.next_character() == "]":
+        stream.expect("]")
+        return
+    # end if
+    while True:
+        yield read_item(stream)
+        if stream.next_character() == ",":
+            stream.expect(",")
+        else:
+            stream.expect("]")
+            break
+        # end if
+    # end while
+
+    return
+
+def _load_operation(stream, json_path, buffer_size, treat_items = None, chunk_size = 1000):
+    """
+    Method to decode an operation replacing the arrays in streamed_keys by streamed arrays
+
+    :param stream: stream positioned at the start of the operation
+    :type stream: JsonStream
+    :param json_path: path to the json file
+    :type json_path: str
+    :param buffer_size: minimum number of characters to read from the file each time
+    :type buffer_size: int
+    :param treat_items: function receiving the key of the array, a chunk of its items and the summary of the array (see load_data)
+    :type treat_items: function
+    :param chunk_size: maximum number of items passed to treat_items each time
+    :type chunk_size: int
+
+    :return: operation
+    :rtype: dict
+    """
+    if stream.next_character() != "{":
+        # The structure of the operation is checked by the validation of the data
+        return stream.decode()
+    # end if
+    stream.expect("{")
+    operation = {}
+    if stream.next_character() == "}":
+        stream.expect("}")
+        return operation
+    # end if
+    while True:
+        key = stream.decode()
+        if type(key) != str:
+            raise ValueError("The keys of the operation have to be strings")
+        # end if
+        stream.expect(":")
+        if key in streamed_keys and stream.next_character() == "[":
+            position = stream.tell()
+            length = 0
+            summary = {}
+            chunk = []
+            for item in iterate_array(stream):
+                length += 1
+                if treat_items != None:
+                    chunk.append(item)
+                    if len(chunk) >= chunk_size:
+                        treat_items(key, chunk, summary)
+                        chunk = []
+                    # end if
+                # end if
+            # end for
+            if len(chunk) > 0:
+                treat_items(key, chunk, summary)
+            # end if
+            operation[key] = StreamedArray(json_path, position, length, buffer_size, summary)
+        else:
+            operation[key] = stream.decode()
+        # end if
+        if stream.next_character() == ",":
+            stream.expect(",")
+        else:
+            stream.expect("}")
+            break
+        # end if
+    # end while
+
+    return operation
+
+def load_data(json_path, buffer_size = 1048576, treat_items = None):
+    """
+    Method to load a json file with operations keeping in memory only the headers of the operations.
+    The events, annotations and explicit references of the operations are replaced by streamed arrays
+    which read their items from the file in chunks every time they are iterated.
+    The whole file is decoded to check its structure, so a ValueError (as with json.load) is raised
+    before returning anything if the file is not valid.
+    The items decoded for this check can be treated by the caller (e.g. validated or summarized) to avoid
+    iterating the streamed arrays again: treat_items receives the key of the array, chunks of its items
+    and the summary of the array (dict kept in StreamedArray.summary) where to store the collected information
+
+    :param json_path: path to the json file
+    :type json_path: str
+    :param buffer_size: minimum number of characters to read from the file each time
+    :type buffer_size: int
+    :param treat_items: function to treat the items of the streamed arrays while loading the file (default None)
+    :type treat_items: function
+
+    :return: data with the operations
+    :rtype: dict
+    """
+    data = {}
+    with open(json_path) as input_file:
+        stream = JsonStream(input_file, buffer_size)
+        if stream.next_character() != "{":
+            # The structure of the data is checked by the validation of the data
+            data = stream.decode()
+        else:
+            stream.expect("{")
+            if stream.next_character() == "}":
+                stream.expect("}")
+            else:
+                while True:
+                    key = stream.decode()
+                    if type(key) != str:
+                        raise ValueError("The keys of the json file have to be strings")
+                    # end if
+                    stream.expect(":")
+                    if key == "operations" and stream.next_character() == "[":
+                        data[key] = list(iterate_array(stream, lambda stream: _load_operation(stream, json_path, buffer_size, treat_items)))
+                    else:
+                        data[key] = stream.decode()
+                    # end if
+                    if stream.next_character() == ",":
+                        stream.expect(",")
+                    else:
+                        stream.expect("}")
+                        break
+                    # end if
+                # end while
+            # end if
+        # end if
+        if stream.next_character() != None:
+            raise ValueError("Extra data after the content of the json file")
+        # end if
+    # end with
+
+    return data
@@ -0,0 +1,218 @@
+"""
+Keyset pagination definition for the query component
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import base64
+import datetime
+import json
+import uuid
+
+# Import SQLalchemy entities
+from sqlalchemy import and_, or_, tuple_, inspect
+
+# Import exceptions
+from eboa.engine.errors import InputError
+
+# Import auxiliary functions
+import eboa.engine.functions as functions
+
+def _encode_value(value):
+    """
+    Method to encode the value of the ordering field into a json serializable structure
+
+    :param value: value of the ordering field
+    :type value: None, str, bool, int, float, uuid, datetime or timedelta
+
+    :return: encoded value
+    :rtype: dict
+    """
+    if type(value) == datetime.datetime:
+        return {"type": "datetime", "value": value.isoformat()}
+    elif type(value) == datetime.timedelta:
+        return {"type": "timedelta", "value": value.total_seconds()}
+    elif type(value) == uuid.UUID:
+        return {"type": "uuid", "value": str(value)}
+    elif value is None or type(value) in (str, bool, int, float):
+        return {"type": "json", "value": value}
+    # end if
+
+    raise InputError("The values of type {} cannot be used for keyset pagination (received value: {}).".format(type(value), value))
+
+def _decode_value(encoded_value):
+    """
+    Method to decode the value of the ordering field encoded by _encode_value
+
+    :param encoded_value: encoded value
+    :type encoded_value: dict
+
+    :return: value of the ordering field
+    :rtype: None, str, bool, int, float, uuid, datetime or timedelta
+    """
+    if encoded_value["type"] == "datetime":
+        return datetime.datetime.fromisoformat(encoded_value["value"])
+    elif encoded_value["type"] == "timedelta":
+        return datetime.timedelta(seconds = encoded_value["value"])
+    elif encoded_value["type"] == "uuid":
+        return uuid.UUID(encoded_value["value"])
+    # end if
+
+    return encoded_value["value"]
+
+def get_page_token(items, order_by):
+    """
+    Method to obtain the token to request the page following the received one (parameter after of the query methods)
+
+    :param items: page of entities obtained with the received order_by
+    :type items: list
+    :param order_by: field to order by used to obtain the page
+    :type order_by: order_by statement
+
+    :return: token pointing to the last entity of the page or None if the page is empty
+    :rtype: str
+    """
+    functions.is_valid_order_by(order_by)
+    if len(items) == 0:
+        return None
+    # end if
+
+    last_item = items[-1]
+    primary_key_name = inspect(type(last_item)).primary_key[0].key
+    token = {"primary_key": str(getattr(last_item, primary_key_name)),
+             "field": order_by["field"],
+             "descending": order_by["descending"],
+             "value": _encode_value(getattr(last_item, order_by["field"]))}
+
+    return base64.urlsafe_b64encode(json.dumps(token).encode()).decode()
+
+def _decode_page_token(after):
+    """
+    Method to decode a token obtained with get_page_token
+
+    :param after: token
+    :type after: str
+
+    :return: decoded token
+    :rtype: dict
+    """
+    try:
+        token = json.loads(base64.urlsafe_b64decode(after.encode()).decode())
+        token["primary_key"] = uuid.UUID(token["primary_key"])
+        token["value"] = _decode_value(token["value"])
+        functions.is_valid_order_by({"field": token["field"], "descending": token["descending"]})
+    except (AttributeError, ValueError, TypeError, KeyError) as e:
+        raise InputError("The parameter after must be a token obtained with get_page_token (received after: {}).".format(after))
+    # end try
+
+    return token
+
+def _check_field(entity, field, parameter):
+    """
+    Method to check that the field used for ordering is a column of the entity
+    (relationships, hybrid properties or methods cannot be used)
+
+    :param entity: class of the datamodel obtained by the query
+    :type entity: sqlalchemy declarative class
+    :param field: name of the field
+    :type field: str
+    :param parameter: name of the parameter containing the field (for the error message)
+    :type parameter: str
+    """
+    column_names = [attribute.key for attribute in inspect(entity).column_attrs]
+    if not field in column_names:
+        raise InputError("The field {} of the parameter {} is not a column of {} (available columns: {}).".format(field, parameter, entity.__tablename__, column_names))
+    # end if
+
+    return
+
+def get_page_order_by(entity, order_by = None, after = None):
+    """
+    Method to obtain the ordering of a page whose token is requested: the received order_by,
+    the one used to obtain the token (after) or, if none of them is received, the primary key of the entity
+
+    :param entity: class of the datamodel obtained by the query
+    :type entity: sqlalchemy declarative class
+    :param order_by: field to order by
+    :type order_by: order_by statement
+    :param after: token obtained with get_page_token from the previous page
+    :type after: str
+
+    :return: field to order by
+    :rtype: order_by statement
+    """
+    if order_by != None:
+        return order_by
+    elif after != None:
+        token = _decode_page_token(after)
+        return {"field": token["field"], "descending": token["descending"]}
+    # end if
+
+    return {"field": inspect(entity).primary_key[0].key, "descending": False}
+
+def apply_order_by(query, entity, order_by = None, after = None):
+    """
+    Method to apply the ordering and the keyset pagination to a query.
+    When order_by is received, the primary key is used as second ordering field so that the order is total.
+    When after is received, only the entities placed after the one pointed by the token are obtained,
+    so that every page costs the same as the first one (contrary to offset).
+    PostgreSQL places NULL values last in ascending order and first in descending order
+
+    :param query: query to order
+    :type query: sqlalchemy.orm.Query
+    :param entity: class of the datamodel obtained by the query
+    :type entity: sqlalchemy declarative class
+    :param order_by: field to order by (if not received, the one used to obtain the token is applied)
+    :type order_by: order_by statement
+    :param after: token obtained with get_page_token from the previous page
+    :type after: str
+
+    :return: ordered query
+    :rtype: sqlalchemy.orm.Query
+    """
+    if order_by != None:
+        functions.is_valid_order_by(order_by)
+        _check_field(entity, order_by["field"], "order_by")
+    # end if
+
+    primary_key = inspect(entity).primary_key[0]
+
+    if after != None:
+        token = _decode_page_token(after)
+        if order_by == None:
+            order_by = {"field": token["field"], "descending": token["descending"]}
+        elif token["field"] != order_by["field"] or token["descending"] != order_by["descending"]:
+            raise InputError("The parameter after was obtained with a different order_by (received order_by: {}).".format(order_by))
+        # end if
+        _check_field(entity, order_by["field"], "after")
+
+        field = getattr(entity, order_by["field"])
+        value = token["value"]
+        if not order_by["descending"]:
+            if value is None:
+                query = query.filter(and_(field == None, primary_key > token["primary_key"]))
+            else:
+                # Row value comparison so that an index on (field, primary key) can be used
+                query = query.filter(or_(tuple_(field, primary_key) > tuple_(value, token["primary_key"]), field == None))
+            # end if
+        else:
+            if value is None:
+                query = query.filter(or_(field != None, and_(field == None, primary_key < token["primary_key"])))
+            else:
+                query = query.filter(tuple_(field, primary_key) < tuple_(value, token["primary_key"]))
+            # end if
+        # end if
+    # end if
+
+    if order_by != None:
+        field = getattr(entity, order_by["field"])
+        if order_by["descending"]:
+            query = query.order_by(field.desc(), primary_key.desc())
+        else:
+            query = query.order_by(field, primary_key)
+        # end if
+    # end if
+
+    return query
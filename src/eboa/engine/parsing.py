@@ -11,6 +11,9 @@ from eboa.engine.errors import ErrorParsingDictionary
 # Import auxiliary functions
 from eboa.engine.functions import is_datetime
 
+# Import arrays streamed from json files
+from eboa.engine.json_stream import StreamedArray
+
 def validate_data_dictionary(data):
     """
     """
@@ -48,6 +51,38 @@ def validate_data_dictionary(data):
     # end for
     return
 
+def validate_items(key, items):
+    """
+    Method to validate the items of one of the arrays of an insert operation (explicit_references, events or annotations).
+    Used for validating the streamed arrays while loading the json file (see json_stream.load_data)
+
+    :param key: key of the array inside the operation
+    :type key: str
+    :param items: items to validate
+    :type items: list
+    """
+    if key == "explicit_references":
+        _validate_explicit_references(items)
+    elif key == "events":
+        _validate_events(items)
+    elif key == "annotations":
+        _validate_annotations(items)
+    # end if
+
+    return
+
+def _is_validated(data):
+    """
+    Method to check whether the items of an array were already validated while loading the json file
+
+    :param data: array to check
+    :type data: list or StreamedArray
+
+    :return: True if the array is a streamed array whose items were validated
+    :rtype: bool
+    """
+    return type(data) == StreamedArray and data.summary.get("validated") == True
+
 def _validate_insert_structure(data):
 
     check_items = [item in ["mode", "dim_signature", "source", "explicit_references", "events", "annotations", "alerts"] for item in data.keys()]
@@ -224,10 +259,15 @@ def _validate_ingestion_completeness(data):
 
 def _validate_explicit_references(data):
 
-    if type(data) != list:
+    if type(data) != list and type(data) != StreamedArray:
         raise ErrorParsingDictionary("The tag explicit_references has to be of type list")
     # end if
 
+    if _is_validated(data):
+        # The items were validated while loading the json file
+        return
+    # end if
+
     for explicit_reference in data:
         if type(explicit_reference) != dict:
             raise ErrorParsingDictionary("The items inside the explicit_references structure have to be of type dict")
@@ -298,10 +338,15 @@ def _validate_explicit_reference_links(data):
 
 def _validate_events(data):
 
-    if type(data) != list:
+    if type(data) != list and type(data) != StreamedArray:
         raise ErrorParsingDictionary("The tag events has to be of type list")
     # end if
 
+    if _is_validated(data):
+        # The items were validated while loading the json file
+        return
+    # end if
+
     for event in data:
         if type(event) != dict:
             raise ErrorParsingDictionary("The event inside the events structure have to be of type dict")
@@ -451,10 +496,15 @@ def _validate_event_links(data):
 
 def _validate_annotations(data):
 
-    if type(data) != list:
+    if type(data) != list and type(data) != StreamedArray:
         raise ErrorParsingDictionary("The tag annotations has to be of type list")
     # end if
 
+    if _is_validated(data):
+        # The items were validated while loading the json file
+        return
+    # end if
+
     for annotation in data:
         if type(annotation) != dict:
             raise ErrorParsingDictionary("The annotation inside the annotations structure have to be of type dict")
@@ -0,0 +1,217 @@
+"""
+Management of the partitions of the events (see datamodel/eboa_events_partitioning.sql)
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import datetime
+import re
+from dateutil import parser
+from dateutil.relativedelta import relativedelta
+
+# Import SQLalchemy entities
+from sqlalchemy import text
+
+# Import datamodel
+from eboa.datamodel.event_summaries import EventSummary
+
+# Import logging
+from eboa.logging import Log
+
+logging = Log(name = __name__)
+logger = logging.logger
+
+# Tables referencing the events whose rows have to be removed with the events
+event_references = ["event_booleans", "event_timestamps", "event_doubles", "event_texts", "event_objects",
+                    "event_geometries", "event_links", "event_keys", "event_alerts"]
+
+# Tables partitioned by the start of the events with the same monthly partitions (table -> partition key)
+partitioned_tables = {"events": "start", "event_doubles": "event_start", "event_texts": "event_start"}
+
+partition_bound_regex = re.compile(r"FOR VALUES FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+def is_events_table_partitioned(session):
+    """
+    Method to check if the table of the events is partitioned
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+
+    :return: True if the table of the events is partitioned
+    :rtype: bool
+    """
+    statement = text("SELECT count(*) FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid " +
+                     "JOIN pg_namespace n ON n.oid = c.relnamespace WHERE n.nspname = 'eboa' AND c.relname = 'events'")
+
+    return session.execute(statement).scalar() > 0
+
+def get_events_partitions(session, table = "events"):
+    """
+    Method to obtain the partitions by range of start of the table of the events or of one of the tables partitioned with it
+    (the default partition is not included)
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param table: name of the partitioned table (see partitioned_tables)
+    :type table: str
+
+    :return: partitions ordered by start with the following structure {"name": name, "start": start, "stop": stop}
+    :rtype: list
+    """
+    statement = text("SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i " +
+                     "JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent " +
+                     "JOIN pg_namespace n ON n.oid = p.relnamespace WHERE n.nspname = 'eboa' AND p.relname = :table")
+    partitions = []
+    for name, bound in session.execute(statement, {"table": table}):
+        match = partition_bound_regex.match(bound)
+        if match == None:
+            # Default partition or partitions with unbounded limits
+            continue
+        # end if
+        partitions.append({"name": name,
+                           "start": parser.parse(match.group(1)),
+                           "stop": parser.parse(match.group(2))})
+    # end for
+
+    return sorted(partitions, key = lambda partition: partition["start"])
+
+def _create_partition(session, table, name, start, stop):
+    """
+    Method to create a partition of a table partitioned by the start of the events.
+    If the default partition contains rows of the period, they are moved to the new partition
+    (the partition is created apart, filled with the rows and attached), so that the partitions
+    of past periods can be created once the data has been ingested
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param table: name of the partitioned table (see partitioned_tables)
+    :type table: str
+    :param name: name of the partition
+    :type name: str
+    :param start: start of the period of the partition
+    :type start: datetime
+    :param stop: stop of the period of the partition
+    :type stop: datetime
+    """
+    partition_key = partitioned_tables[table]
+    bounds = "FOR VALUES FROM ('{}') TO ('{}')".format(start.isoformat(), stop.isoformat())
+    period_condition = "{} >= :start AND {} < :stop".format(partition_key, partition_key)
+    period = {"start": start, "stop": stop}
+
+    rows_in_default = session.execute(text("SELECT count(*) FROM eboa.{}_default WHERE {}".format(table, period_condition)), period).scalar()
+    if rows_in_default == 0:
+        session.execute(text("CREATE TABLE eboa.\"{}\" PARTITION OF eboa.{} {}".format(name, table, bounds)))
+    else:
+        # Deleting directly from the default partition does not execute the triggers of the root table
+        session.execute(text("CREATE TABLE eboa.\"{}\" (LIKE eboa.{} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)".format(name, table)))
+        session.execute(text("INSERT INTO eboa.\"{}\" SELECT * FROM eboa.{}_default WHERE {}".format(name, table, period_condition)), period)
+        session.execute(text("DELETE FROM eboa.{}_default WHERE {}".format(table, period_condition)), period)
+        session.execute(text("ALTER TABLE eboa.{} ATTACH PARTITION eboa.\"{}\" {}".format(table, name, bounds)))
+        logger.info("{} rows of the period {}_{} have been moved from the default partition to the partition {}".format(rows_in_default, start.isoformat(), stop.isoformat(), name))
+    # end if
+
+    return
+
+def create_events_partitions(session, start, stop):
+    """
+    Method to create the monthly partitions of the events, doubles and texts covering the received period.
+    The rows of the months already stored in the default partitions (historical or backfilled data)
+    are moved to the new partitions.
+    The changes are not committed
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param start: start of the period
+    :type start: datetime
+    :param stop: stop of the period
+    :type stop: datetime
+
+    :return: names of the created partitions of the events
+    :rtype: list
+    """
+    existing_partitions = set([partition["name"] for table in partitioned_tables for partition in get_events_partitions(session, table)])
+
+    created_partitions = []
+    month = datetime.datetime(start.year, start.month, 1)
+    while month < stop:
+        next_month = month + relativedelta(months = 1)
+        for table in partitioned_tables:
+            name = "{}_{}".format(table, month.strftime("%Y%m"))
+            if not name in existing_partitions:
+                _create_partition(session, table, name, month, next_month)
+                if table == "events":
+                    created_partitions.append(name)
+                # end if
+            # end if
+        # end for
+        month = next_month
+    # end while
+
+    return created_partitions
+
+def drop_events_partitions(session, retention_limit):
+    """
+    Method to remove the events starting before the retention limit by dropping whole partitions.
+    Only the partitions ending before (or at) the retention limit are dropped.
+    The partitions of the doubles and texts of the same months are dropped with the partitions of the events.
+    The rest of the associated information (booleans, timestamps, objects, geometries, links, keys and alerts)
+    is not partitioned by time, so it is deleted with one statement per table over the events of the
+    partition before dropping it. The summaries of the days of the partition are also deleted.
+    The changes are not committed
+
+    :param session: session to the DDBB
+    :type session: sqlalchemy.orm.Session
+    :param retention_limit: limit of the retention (events starting before are removed)
+    :type retention_limit: datetime
+
+    :return: dropped partitions of the events with the following structure {"name": name, "start": start, "stop": stop}
+    :rtype: list
+    """
+    value_partitions = {}
+    for table in partitioned_tables:
+        if table != "events":
+            value_partitions[table] = {(partition["start"], partition["stop"]): partition["name"] for partition in get_events_partitions(session, table)}
+        # end if
+    # end for
+
+    dropped_partitions = []
+    for partition in get_events_partitions(session):
+        if partition["stop"] > retention_limit:
+            break
+        # end if
+
+        # Dropping a partition does not execute the deletion trigger of the events
+        partition_event_uuids = "SELECT event_uuid FROM eboa.\"{}\"".format(partition["name"])
+        for table in event_references:
+            if not table in partitioned_tables:
+                session.execute(text("DELETE FROM eboa.{} WHERE event_uuid IN ({})".format(table, partition_event_uuids)))
+            # end if
+        # end for
+        session.execute(text("DELETE FROM eboa.event_links WHERE event_uuid_link IN ({})".format(partition_event_uuids)))
+
+        for table in value_partitions:
+            value_partition = value_partitions[table].get((partition["start"], partition["stop"]))
+            if value_partition != None:
+                session.execute(text("ALTER TABLE eboa.{} DETACH PARTITION eboa.\"{}\"".format(table, value_partition)))
+                session.execute(text("DROP TABLE eboa.\"{}\"".format(value_partition)))
+            else:
+                # The values of the month are in the default partition
+                session.execute(text("DELETE FROM eboa.{} WHERE event_start >= :start AND event_start < :stop".format(table)),
+                                {"start": partition["start"], "stop": partition["stop"]})
+            # end if
+        # end for
+
+        session.execute(text("ALTER TABLE eboa.events DETACH PARTITION eboa.\"{}\"".format(partition["name"])))
+        session.execute(text("DROP TABLE eboa.\"{}\"".format(partition["name"])))
+
+        # The summaries are associated to the day of the start of the events
+        session.query(EventSummary).filter(EventSummary.day >= partition["start"].date(),
+                                           EventSummary.day < partition["stop"].date()).delete(synchronize_session=False)
+
+        logger.info("The partition {} of the events ({}_{}) has been dropped".format(partition["name"], partition["start"].isoformat(), partition["stop"].isoformat()))
+        dropped_partitions.append(partition)
+    # end for
+
+    return dropped_partitions
@@ -0,0 +1,160 @@
+"""
+Overlap conditions over the periods of the events and the validity periods of the sources
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+from dateutil import parser
+
+# Import SQLalchemy entities
+from sqlalchemy import and_, func, literal_column, text, cast, DateTime
+
+# Import datamodel
+from eboa.datamodel.base import engine
+
+# Import auxiliary functions
+from eboa.engine.functions import read_configuration
+
+# Import logging
+from eboa.logging import Log
+
+config = read_configuration()
+
+logging = Log(name = __name__)
+logger = logging.logger
+
+# GiST indexes over the periods (see eboa_data_model.sql and scripts/eboa_add_period_indexes.sql)
+period_indexes = {
+    "events": "idx_events_period",
+    "sources": "idx_sources_validity_period"
+}
+
+# Availability of the period indexes in the DDBB (obtained once per process)
+available_period_indexes = None
+
+def _get_range(start, stop):
+    """
+    Method to build the closed range of timestamps used by the GiST indexes over the periods.
+    The expression has to be the same as the one used in the definition of the indexes
+
+    :param start: start of the period (timestamp without time zone)
+    :type start: sqlalchemy column, sqlalchemy expression or naive datetime
+    :param stop: stop of the period (timestamp without time zone)
+    :type stop: sqlalchemy column, sqlalchemy expression or naive datetime
+
+    :return: range expression
+    :rtype: sqlalchemy expression
+    """
+    return func.tsrange(start, stop, literal_column("'[]'"))
+
+def use_period_indexes(table_name):
+    """
+    Method to check if the overlap conditions over the periods of the received table have to use the GiST index.
+    The usage is configured with PERIOD_INDEXES in engine.json (true, false or auto, to use the indexes when they are available in the DDBB)
+
+    :param table_name: name of the table (events or sources)
+    :type table_name: str
+
+    :return: True if the GiST index has to be used
+    :rtype: bool
+    """
+    global available_period_indexes
+    configured = config.get("PERIOD_INDEXES", "auto")
+    if configured != "auto":
+        return configured == True
+    # end if
+
+    if available_period_indexes == None:
+        try:
+            with engine.connect() as connection:
+                index_names = [row[0] for row in connection.execute(text("SELECT indexname FROM pg_indexes WHERE indexname IN :index_names").bindparams(index_names = tuple(period_indexes.values())))]
+            # end with
+        except Exception as e:
+            logger.warning("The availability of the period indexes could not be checked: {}".format(e))
+            index_names = []
+        # end try
+        available_period_indexes = set([table for table, index_name in period_indexes.items() if index_name in index_names])
+    # end if
+
+    return table_name in available_period_indexes
+
+def get_overlap_condition(table_name, start_column, stop_column, start, stop):
+    """
+    Method to build the condition selecting the periods intersecting (start < received stop and stop > received start) the received period.
+    If the GiST index is used, the condition on the ranges selects the candidates and the comparisons keep the semantics
+
+    :param table_name: name of the table of the columns (events or sources)
+    :type table_name: str
+    :param start_column: column with the start of the periods
+    :type start_column: sqlalchemy column
+    :param stop_column: column with the stop of the periods
+    :type stop_column: sqlalchemy column
+    :param start: start of the received period
+    :type start: datetime
+    :param stop: stop of the received period
+    :type stop: datetime
+
+    :return: condition
+    :rtype: sqlalchemy expression
+    """
+    condition = and_(start_column < stop, stop_column > start)
+    try:
+        valid_period = start <= stop
+    except TypeError:
+        # Dates which cannot be compared (with and without time zone) are left to the comparisons
+        valid_period = False
+    # end try
+    if use_period_indexes(table_name) and valid_period:
+        # Dates with time zone are sent as timestamptz, which is not implicitly casted to the timestamp expected by tsrange.
+        # The cast converts them with the time zone of the session, as the comparisons with the columns do
+        condition = and_(_get_range(start_column, stop_column).op("&&")(_get_range(cast(start, DateTime), cast(stop, DateTime))), condition)
+    # end if
+
+    return condition
+
+def get_overlap_condition_from_filters(table_name, start_column, stop_column, start_filters, stop_filters):
+    """
+    Method to build a condition, redundant with the received filters, allowing the usage of the GiST index
+    when the filters select the periods intersecting a period (upper bound for the start and lower bound for the stop)
+
+    PRE:
+    - The filters have been validated (see eboa.engine.functions.is_valid_date_filters)
+
+    :param table_name: name of the table of the columns (events or sources)
+    :type table_name: str
+    :param start_column: column with the start of the periods
+    :type start_column: sqlalchemy column
+    :param stop_column: column with the stop of the periods
+    :type stop_column: sqlalchemy column
+    :param start_filters: filters over the start of the periods
+    :type start_filters: date_filters
+    :param stop_filters: filters over the stop of the periods
+    :type stop_filters: date_filters
+
+    :return: condition or None if the filters do not define an intersection or the GiST index is not used
+    :rtype: sqlalchemy expression
+    """
+    if start_filters == None or stop_filters == None or not use_period_indexes(table_name):
+        return None
+    # end if
+
+    try:
+        # The filters are sent as strings, so the DDBB ignores their time zone when comparing them with the columns (timestamp without time zone)
+        upper_bounds = [parser.parse(start_filter["date"]).replace(tzinfo=None) for start_filter in start_filters if start_filter["op"] in ["<", "<=", "=="]]
+        lower_bounds = [parser.parse(stop_filter["date"]).replace(tzinfo=None) for stop_filter in stop_filters if stop_filter["op"] in [">", ">=", "=="]]
+        if len(upper_bounds) == 0 or len(lower_bounds) == 0:
+            return None
+        # end if
+        upper_bound = min(upper_bounds)
+        lower_bound = max(lower_bounds)
+        if lower_bound > upper_bound:
+            return None
+        # end if
+    except (ValueError, TypeError, OverflowError):
+        # Dates which cannot be parsed are left to the filters
+        return None
+    # end try
+
+    return _get_range(start_column, stop_column).op("&&")(_get_range(lower_bound, upper_bound))
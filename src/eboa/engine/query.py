@@ -12,13 +12,14 @@ from datetime import timedelta
 from lxml import etree
 import uuid
 from oslo_concurrency import lockutils
+from dateutil import parser
 
 # Import GEOalchemy entities
 from geoalchemy2 import functions
 from geoalchemy2.shape import to_shape
 
 # Import SQLalchemy entities
-from sqlalchemy import extract
+from sqlalchemy import extract, select, union_all, cast, null, literal_column, Integer, Text, func
 from sqlalchemy.orm import scoped_session, aliased
 
 # Import datamodel
@@ -29,6 +30,7 @@ from eboa.datamodel.events import Event, EventLink, EventKey, EventText, EventDo
 from eboa.datamodel.gauges import Gauge
 from eboa.datamodel.sources import Source, SourceStatus
 from eboa.datamodel.explicit_refs import ExplicitRef, ExplicitRefGrp, ExplicitRefLink
+from eboa.datamodel.event_summaries import EventSummary
 from eboa.datamodel.annotations import Annotation, AnnotationCnf, AnnotationText, AnnotationDouble, AnnotationObject, AnnotationGeometry, AnnotationBoolean, AnnotationTimestamp
 from sqlalchemy.dialects import postgresql
 from rboa.datamodel.reports import Report, ReportGroup, ReportStatus, ReportText, ReportDouble, ReportObject, ReportGeometry, ReportBoolean, ReportTimestamp
@@ -40,15 +42,23 @@ from eboa.engine.errors import InputError, ErrorParsingFilters
 
 # Import auxiliary functions
 import eboa.engine.functions as functions
+from eboa.engine.functions import read_configuration
 
 # Import logging
+from logging import DEBUG
 from eboa.logging import Log
 
+# Import query instrumentation
+from eboa.engine.instrumentation import enable_from_configuration
+
 # Import query printing facilities
 from eboa.engine.printing import literal_query
 
 # Import operators
-from eboa.engine.operators import arithmetic_operators, text_operators, regex_operators
+from eboa.engine.operators import arithmetic_operators
+
+# Import filters
+import eboa.engine.filters as filters
 
 # Import SQLalchemy exceptions
 from sqlalchemy.orm.exc import StaleDataError
@@ -56,12 +66,64 @@ from sqlalchemy.orm.exc import StaleDataError
 # Import alert severity codes
 from eboa.engine.alerts import alert_severity_codes
 
+# Import catalogue cache
+from eboa.engine.catalogue_cache import catalogue_cache
+
 # Import parsing module
 import eboa.engine.parsing as parsing
 
+# Import keyset pagination
+import eboa.engine.pagination as pagination
+
+# Import event summaries
+import eboa.engine.event_summaries as event_summaries
+
+# Import overlap conditions
+import eboa.engine.periods as periods
+
 logging = Log(name = __name__)
 logger = logging.logger
 
+config = read_configuration()
+
+# Instrument the queries if requested by the configuration
+enable_from_configuration(engine)
+
+# Tables (built once) associating the names of the text filters of the query methods to the columns they filter
+text_filter_columns = {
+    "get_dim_signatures": {
+        "dim_signature_uuids": DimSignature.dim_signature_uuid,
+        "dim_signatures": DimSignature.dim_signature
+    },
+    "get_report_groups": {
+        "report_group_uuids": ReportGroup.report_group_uuid,
+        "names": ReportGroup.name
+    },
+    "get_gauges": {
+        "gauge_uuids": Gauge.gauge_uuid,
+        "names": Gauge.name,
+        "systems": Gauge.system,
+        "dim_signature_uuids": Gauge.dim_signature_uuid,
+        "dim_signatures": DimSignature.dim_signature
+    },
+    "get_event_keys": {
+        "dim_signature_uuids": EventKey.dim_signature_uuid,
+        "event_uuids": EventKey.event_uuid,
+        "keys": EventKey.event_key
+    },
+    "get_annotation_cnfs": {
+        "dim_signature_uuids": AnnotationCnf.dim_signature_uuid,
+        "dim_signatures": DimSignature.dim_signature,
+        "annotation_cnf_uuids": AnnotationCnf.annotation_cnf_uuid,
+        "names": AnnotationCnf.name,
+        "systems": AnnotationCnf.system
+    },
+    "get_explicit_refs_groups": {
+        "group_ids": ExplicitRefGrp.expl_ref_cnf_uuid,
+        "names": ExplicitRefGrp.name
+    }
+}
+
 event_value_entities = {
     "text": EventText,
     "boolean": EventBoolean,
@@ -82,6 +144,11 @@ annotation_value_entities = {
 
 def log_query(query):
 
+    # The compilation of the statement is only performed when the debug level is enabled
+    if not logger.isEnabledFor(DEBUG):
+        return
+    # end if
+
     try:
         logger.debug("The following query is going to be executed: {}".format(literal_query(query.statement)))
     except NotImplementedError as e:
@@ -122,15 +189,26 @@ class Query():
         for table in reversed(Base.metadata.sorted_tables):
             engine.execute(table.delete())
         # end for
+        catalogue_cache.invalidate()
 
     def delete(self, query):
         logger.info("Deletion request received")
         query_executed = False
         while not query_executed:
             try:
+                summary_keys = set()
+                if config.get("EVENT_SUMMARIES"):
+                    summary_keys = event_summaries.get_deleted_summary_keys(self.session, query)
+                # end if
                 query.delete(synchronize_session=False)
+                # The summaries of the removed events are computed again from the remaining ones
+                if len(summary_keys) > 0:
+                    event_summaries.refresh_summaries(self.session, summary_keys)
+                # end if
                 self.session.commit()
                 query_executed = True
+                # The deletion could cascade to catalogue entities
+                catalogue_cache.invalidate()
             except StaleDataError:
                 pass
             # end try
@@ -156,41 +234,15 @@ class Query():
         """
         params = []
 
-        # DIM signature UUIDs
-        if dim_signature_uuids != None:
-            functions.is_valid_text_filter(dim_signature_uuids)
-            if dim_signature_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[dim_signature_uuids["op"]]
-                params.append(op(DimSignature.dim_signature_uuid, dim_signature_uuids["filter"]))
-            else:
-                filter = eval('DimSignature.dim_signature_uuid.' + text_operators[dim_signature_uuids["op"]])
-                params.append(filter(dim_signature_uuids["filter"]))
-            # end if
-        # end if
-
-        # DIM signatures
-        if dim_signatures != None:
-            functions.is_valid_text_filter(dim_signatures)
-            if dim_signatures["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[dim_signatures["op"]]
-                params.append(op(DimSignature.dim_signature, dim_signatures["filter"]))
-            else:
-                filter = eval('DimSignature.dim_signature.' + text_operators[dim_signatures["op"]])
-                params.append(filter(dim_signatures["filter"]))
-            # end if
-        # end if
+        # Text filters
+        params += filters.build_text_filters(DimSignature, text_filter_columns["get_dim_signatures"], {"dim_signature_uuids": dim_signature_uuids, "dim_signatures": dim_signatures})
 
         query = self.session.query(DimSignature).filter(*params)
 
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("DimSignature." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("DimSignature." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(DimSignature, order_by))
         # end if
 
         # Limit
@@ -210,7 +262,47 @@ class Query():
 
         return dim_signatures
 
-    def get_sources(self, names = None, validity_start_filters = None, validity_stop_filters = None, validity_duration_filters = None, reported_validity_start_filters = None, reported_validity_stop_filters = None, reported_validity_duration_filters = None, reception_time_filters = None, generation_time_filters = None, reported_generation_time_filters = None, ingestion_time_filters = None, processing_duration_filters = None, ingestion_duration_filters = None, processors = None, processor_version_filters = None, ingestion_completeness = None, ingested = None, ingestion_error = None, dim_signature_uuids = None, source_uuids = None, dim_signatures = None, statuses = None, delete = False, synchronize_deletion = True, order_by = None, limit = None, offset = None):
+    def _iterate_query(self, query, entity, batch_size, columns):
+        """
+        Method to stream the results of a query in chunks using a server side cursor
+
+        :param query: query to stream
+        :type query: sqlalchemy.orm.Query
+        :param entity: class of the datamodel obtained by the query
+        :type entity: sqlalchemy declarative class
+        :param batch_size: number of rows to fetch from the DDBB each time
+        :type batch_size: Positive integer
+        :param columns: names of the columns to obtain instead of the entities
+        :type columns: list of str
+
+        :return: generator of entities (or named tuples with the requested columns)
+        :rtype: generator
+        """
+        functions.is_valid_positive_integer(batch_size)
+        if int(batch_size) == 0:
+            raise InputError("The parameter batch_size must be greater than 0 (received batch_size: {}).".format(batch_size))
+        # end if
+
+        if columns != None:
+            if type(columns) != list or len(columns) == 0:
+                raise InputError("The parameter columns must be a non empty list (received columns: {}).".format(columns))
+            # end if
+            column_names = [column.key for column in entity.__table__.columns]
+            for column in columns:
+                if column not in column_names:
+                    raise InputError("The column {} is not a column of {} (available columns: {}).".format(column, entity.__tablename__, column_names))
+                # end if
+            # end for
+            # The rows are returned as named tuples not registered in the identity map of the session
+            query = query.with_entities(*[getattr(entity, column) for column in columns])
+        # end if
+
+        # yield_per streams the results through a named cursor (stream_results)
+        query = query.yield_per(int(batch_size))
+
+        return (item for item in query)
+
+    def get_sources(self, names = None, validity_start_filters = None, validity_stop_filters = None, validity_duration_filters = None, reported_validity_start_filters = None, reported_validity_stop_filters = None, reported_validity_duration_filters = None, reception_time_filters = None, generation_time_filters = None, reported_generation_time_filters = None, ingestion_time_filters = None, processing_duration_filters = None, ingestion_duration_filters = None, processors = None, processor_version_filters = None, ingestion_completeness = None, ingested = None, ingestion_error = None, dim_signature_uuids = None, source_uuids = None, dim_signatures = None, statuses = None, delete = False, synchronize_deletion = True, order_by = None, limit = None, offset = None, after = None, return_page_token = False, return_query = False):
         """
         Method to obtain the sources entities filtered by the received parameters
 
@@ -268,46 +360,35 @@ class Query():
         :type limit: Positive integer
         :param offset: Positive integer to offset the pointer to the list of results
         :type offset: Positive integer
-
-        :return: found sources
-        :rtype: list
+        :param after: token obtained with eboa.engine.pagination.get_page_token from the previous page to obtain the following one (keyset pagination)
+        :type after: str
+        :param return_page_token: flag to indicate if the token to request the following page (parameter after) has to be returned with the entities.
+        If order_by and after are not received, the entities are ordered by their primary key
+        :type return_page_token: bool
+        :param return_query: flag to indicate if the query has to be returned instead of executed (the deletion is not performed)
+        :type return_query: bool
+
+        :return: found sources (or the query if return_query is True, or the found sources and the token of the following page if return_page_token is True)
+        :rtype: list or tuple
         """
         params = []
         tables = []
         # DIM signature UUIDs
         if dim_signature_uuids != None:
             functions.is_valid_text_filter(dim_signature_uuids)
-            if dim_signature_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[dim_signature_uuids["op"]]
-                params.append(op(Source.dim_signature_uuid, dim_signature_uuids["filter"]))
-            else:
-                filter = eval('Source.dim_signature_uuid.' + text_operators[dim_signature_uuids["op"]])
-                params.append(filter(dim_signature_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.dim_signature_uuid, dim_signature_uuids))
         # end if
 
         # Source UUIDs
         if source_uuids != None:
             functions.is_valid_text_filter(source_uuids)
-            if source_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[source_uuids["op"]]
-                params.append(op(Source.source_uuid, source_uuids["filter"]))
-            else:
-                filter = eval('Source.source_uuid.' + text_operators[source_uuids["op"]])
-                params.append(filter(source_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.source_uuid, source_uuids))
         # end if
 
         # Source names
         if names != None:
             functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(Source.name, names["filter"]))
-            else:
-                filter = eval('Source.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.name, names))
         # end if
 
         # validity_start filters
@@ -328,6 +409,12 @@ class Query():
             # end for
         # end if
 
+        # Intersection with a period (allows the usage of the index over the validity periods)
+        overlap_condition = periods.get_overlap_condition_from_filters("sources", Source.validity_start, Source.validity_stop, validity_start_filters, validity_stop_filters)
+        if overlap_condition is not None:
+            params.append(overlap_condition)
+        # end if
+
         # validity duration filters
         if validity_duration_filters != None:
             functions.is_valid_float_filters(validity_duration_filters)
@@ -440,13 +527,7 @@ class Query():
         # Processors
         if processors != None:
             functions.is_valid_text_filter(processors)
-            if processors["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[processors["op"]]
-                params.append(op(Source.processor, processors["filter"]))
-            else:
-                filter = eval('Source.processor.' + text_operators[processors["op"]])
-                params.append(filter(processors["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.processor, processors))
         # end if
 
         # processor_version filters
@@ -454,39 +535,21 @@ class Query():
             for processor_version_filter in processor_version_filters:
                 functions.is_valid_text_filter(processor_version_filter)
 
-                if processor_version_filter["op"] in arithmetic_operators.keys():
-                    op = arithmetic_operators[processor_version_filter["op"]]
-                    params.append(op(Source.processor_version, processor_version_filter["filter"]))
-                else:
-                    filter = eval('Source.processor_version.' + text_operators[processor_version_filter["op"]])
-                    params.append(filter(processor_version_filter["filter"]))
-                # end if
+                params.append(filters.build_text_filter(Source.processor_version, processor_version_filter))
             # end for
         # end if
 
         # status filters
         if statuses != None:
             functions.is_valid_text_filter(statuses)
-            if statuses["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[statuses["op"]]
-                params.append(op(SourceStatus.status, statuses["filter"]))
-            else:
-                filter = eval('SourceStatus.status.' + text_operators[statuses["op"]])
-                params.append(filter(statuses["filter"]))
-            # end if
+            params.append(filters.build_text_filter(SourceStatus.status, statuses))
             tables.append(SourceStatus)
         # end if
 
         # DIM signatures
         if dim_signatures != None:
             functions.is_valid_text_filter(dim_signatures)
-            if dim_signatures["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[dim_signatures["op"]]
-                params.append(op(DimSignature.dim_signature, dim_signatures["filter"]))
-            else:
-                filter = eval('DimSignature.dim_signature.' + text_operators[dim_signatures["op"]])
-                params.append(filter(dim_signatures["filter"]))
-            # end if
+            params.append(filters.build_text_filter(DimSignature.dim_signature, dim_signatures))
             tables.append(DimSignature)
         # end if
 
@@ -497,16 +560,11 @@ class Query():
 
         query = query.filter(*params)
 
-        # Order by
-        if order_by != None:
-            functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("Source." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("Source." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+        # Order by (and keyset pagination)
+        if return_page_token:
+            order_by = pagination.get_page_order_by(Source, order_by, after)
         # end if
+        query = pagination.apply_order_by(query, Source, order_by, after)
 
         # Limit
         if limit != None:
@@ -522,6 +580,10 @@ class Query():
 
         log_query(query)
 
+        if return_query:
+            return query
+        # end if
+
         sources = []
         if delete:
             if synchronize_deletion:
@@ -560,8 +622,36 @@ class Query():
             sources = query.all()
         # end if
 
+        if return_page_token:
+            page_token = None
+            if not delete:
+                page_token = pagination.get_page_token(sources, order_by)
+            # end if
+            return (sources, page_token)
+        # end if
+
         return sources
 
+    def iter_sources(self, batch_size = 1000, columns = None, **filters):
+        """
+        Method to iterate over the sources filtered by the received filters streaming them from the DDBB in chunks,
+        so that the memory needed does not depend on the number of sources found.
+        The session must not be committed or closed while iterating
+
+        :param batch_size: number of rows to fetch from the DDBB each time
+        :type batch_size: Positive integer
+        :param columns: names of the columns to obtain as lightweight named tuples instead of the sources (e.g. ["source_uuid"])
+        :type columns: list of str
+        :param filters: filters accepted by get_sources
+        :type filters: dict
+
+        :return: generator of sources (or named tuples with the requested columns)
+        :rtype: generator
+        """
+        query = self.get_sources(return_query = True, **filters)
+
+        return self._iterate_query(query, Source, batch_size, columns)
+
     def get_source_alerts(self, source_alert_uuids = None, source_uuids = None, dim_signature_uuids = None, source_names = None, validity_start_filters = None, validity_stop_filters = None, validity_duration_filters = None, reported_validity_start_filters = None, reported_validity_stop_filters = None, reported_validity_duration_filters = None, reception_time_filters = None, generation_time_filters = None, reported_generation_time_filters = None, source_ingestion_time_filters = None, processing_duration_filters = None, ingestion_duration_filters = None, ingestion_completeness = None, ingested = None, ingestion_error = None, processors = None, processor_version_filters = None, dim_signatures = None, statuses = None, names = None, severities = None, groups = None, alert_uuids = None, validated = None, alert_ingestion_time_filters = None, generators = None, notified = None, solved = None, solved_time_filters = None, notification_time_filters = None, order_by = None, limit = None, offset = None, delete = False):
         """
         Method to obtain the alerts associated to source entities filtered by the received filters
@@ -654,50 +744,26 @@ class Query():
         # source_alert_uuids
         if source_alert_uuids != None:
             functions.is_valid_text_filter(source_alert_uuids)
-            if source_alert_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[source_alert_uuids["op"]]
-                params.append(op(SourceAlert.source_alert_uuid, source_alert_uuids["filter"]))
-            else:
-                filter = eval('SourceAlert.source_alert_uuid.' + text_operators[source_alert_uuids["op"]])
-                params.append(filter(source_alert_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(SourceAlert.source_alert_uuid, source_alert_uuids))
         # end if
 
         # Source UUIDs
         if source_uuids != None:
             functions.is_valid_text_filter(source_uuids)
-            if source_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[source_uuids["op"]]
-                params.append(op(SourceAlert.source_uuid, source_uuids["filter"]))
-            else:
-                filter = eval('SourceAlert.source_uuid.' + text_operators[source_uuids["op"]])
-                params.append(filter(source_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(SourceAlert.source_uuid, source_uuids))
         # end if
 
         # DIM signature UUIDs
         if dim_signature_uuids != None:
             functions.is_valid_text_filter(dim_signature_uuids)
-            if dim_signature_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[dim_signature_uuids["op"]]
-                params.append(op(Source.dim_signature_uuid, dim_signature_uuids["filter"]))
-            else:
-                filter = eval('Source.dim_signature_uuid.' + text_operators[dim_signature_uuids["op"]])
-                params.append(filter(dim_signature_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.dim_signature_uuid, dim_signature_uuids))
             join_tables = True
         # end if
 
         # Source names
         if source_names != None:
             functions.is_valid_text_filter(source_names)
-            if source_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[source_names["op"]]
-                params.append(op(Source.name, source_names["filter"]))
-            else:
-                filter = eval('Source.name.' + text_operators[source_names["op"]])
-                params.append(filter(source_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.name, source_names))
             join_tables = True
         # end if
 
@@ -845,13 +911,7 @@ class Query():
         # Processors
         if processors != None:
             functions.is_valid_text_filter(processors)
-            if processors["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[processors["op"]]
-                params.append(op(Source.processor, processors["filter"]))
-            else:
-                filter = eval('Source.processor.' + text_operators[processors["op"]])
-                params.append(filter(processors["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.processor, processors))
             join_tables = True
         # end if
 
@@ -860,13 +920,7 @@ class Query():
             for processor_version_filter in processor_version_filters:
                 functions.is_valid_text_filter(processor_version_filter)
 
-                if processor_version_filter["op"] in arithmetic_operators.keys():
-                    op = arithmetic_operators[processor_version_filter["op"]]
-                    params.append(op(Source.processor_version, processor_version_filter["filter"]))
-                else:
-                    filter = eval('Source.processor_version.' + text_operators[processor_version_filter["op"]])
-                    params.append(filter(processor_version_filter["filter"]))
-                # end if
+                params.append(filters.build_text_filter(Source.processor_version, processor_version_filter))
             # end for
             join_tables = True
         # end if
@@ -874,13 +928,7 @@ class Query():
         # status filters
         if statuses != None:
             functions.is_valid_text_filter(statuses)
-            if statuses["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[statuses["op"]]
-                params.append(op(SourceStatus.status, statuses["filter"]))
-            else:
-                filter = eval('SourceStatus.status.' + text_operators[statuses["op"]])
-                params.append(filter(statuses["filter"]))
-            # end if
+            params.append(filters.build_text_filter(SourceStatus.status, statuses))
             join_tables = True
             tables[SourceStatus] = SourceStatus.source_uuid==Source.source_uuid
         # end if
@@ -888,13 +936,7 @@ class Query():
         # DIM signatures
         if dim_signatures != None:
             functions.is_valid_text_filter(dim_signatures)
-            if dim_signatures["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[dim_signatures["op"]]
-                params.append(op(DimSignature.dim_signature, dim_signatures["filter"]))
-            else:
-                filter = eval('DimSignature.dim_signature.' + text_operators[dim_signatures["op"]])
-                params.append(filter(dim_signatures["filter"]))
-            # end if
+            params.append(filters.build_text_filter(DimSignature.dim_signature, dim_signatures))
             join_tables = True
             tables[DimSignature] = DimSignature.dim_signature_uuid==Source.dim_signature_uuid
         # end if
@@ -913,13 +955,7 @@ class Query():
         # Alert configuration names
         if names != None:
             functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(Alert.name, names["filter"]))
-            else:
-                filter = eval('Alert.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Alert.name, names))
             join_tables = True
         # end if
 
@@ -935,8 +971,7 @@ class Query():
                 else:
                     filters_to_apply = severities["filter"]
                 # end if
-                filter = eval('Alert.severity.' + text_operators[severities["op"]])
-                params.append(filter(filters_to_apply))
+                params.append(filters.build_filter(Alert.severity, severities["op"], filters_to_apply))
             # end if
             join_tables = True
         # end if
@@ -944,13 +979,7 @@ class Query():
         # Alert groups
         if groups != None:
             functions.is_valid_text_filter(groups)
-            if groups["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[groups["op"]]
-                params.append(op(AlertGroup.name, groups["filter"]))
-            else:
-                filter = eval('AlertGroup.name.' + text_operators[groups["op"]])
-                params.append(filter(groups["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AlertGroup.name, groups))
             join_tables = True
             tables[AlertGroup] = AlertGroup.alert_group_uuid==Alert.alert_group_uuid
         # end if
@@ -965,13 +994,7 @@ class Query():
         # Alert UUIDs
         if alert_uuids != None:
             functions.is_valid_text_filter(alert_uuids)
-            if alert_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[alert_uuids["op"]]
-                params.append(op(SourceAlert.alert_uuid, alert_uuids["filter"]))
-            else:
-                filter = eval('SourceAlert.alert_uuid.' + text_operators[alert_uuids["op"]])
-                params.append(filter(alert_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(SourceAlert.alert_uuid, alert_uuids))
         # end if
         
         # validated filter
@@ -992,13 +1015,7 @@ class Query():
         # Generators
         if generators != None:
             functions.is_valid_text_filter(generators)
-            if generators["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[generators["op"]]
-                params.append(op(SourceAlert.generator, generators["filter"]))
-            else:
-                filter = eval('SourceAlert.generator.' + text_operators[generators["op"]])
-                params.append(filter(generators["filter"]))
-            # end if
+            params.append(filters.build_text_filter(SourceAlert.generator, generators))
         # end if
 
         # notified filter
@@ -1036,12 +1053,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("SourceAlert." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("SourceAlert." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(SourceAlert, order_by))
         # end if
 
         # Limit
@@ -1067,7 +1079,7 @@ class Query():
 
         return source_alerts
 
-    def get_reports(self, names = None, generation_modes = None, validity_start_filters = None, validity_stop_filters = None, validity_duration_filters = None, triggering_time_filters = None, generation_start_filters = None, generation_stop_filters = None, metadata_ingestion_duration_filters = None, generated = None, compressed = None, generators = None, generator_version_filters = None, generation_error = None, report_group_uuids = None, report_uuids = None, report_groups = None, statuses = None, delete = False, synchronize_deletion = True, order_by = None, limit = None, offset = None):
+    def get_reports(self, names = None, generation_modes = None, validity_start_filters = None, validity_stop_filters = None, validity_duration_filters = None, triggering_time_filters = None, generation_start_filters = None, generation_stop_filters = None, metadata_ingestion_duration_filters = None, generated = None, compressed = None, generators = None, generator_version_filters = None, generation_error = None, report_group_uuids = None, report_uuids = None, report_groups = None, statuses = None, delete = False, synchronize_deletion = True, order_by = None, limit = None, offset = None, after = None, return_page_token = False):
         """
         Method to obtain the reports entities filtered by the received parameters
 
@@ -1110,8 +1122,8 @@ class Query():
         :param statuses: status filters
         :type statuses: float_filter
 
-        :return: found reports
-        :rtype: list
+        :return: found reports (or the found reports and the token of the following page if return_page_token is True)
+        :rtype: list or tuple
         """
         params = []
         tables = []
@@ -1119,25 +1131,13 @@ class Query():
         # Report names
         if names != None:
             functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(Report.name, names["filter"]))
-            else:
-                filter = eval('Report.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Report.name, names))
         # end if
 
         # Report generation modes
         if generation_modes != None:
             functions.is_valid_text_filter(generation_modes)
-            if generation_modes["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[generation_modes["op"]]
-                params.append(op(Report.generation_mode, generation_modes["filter"]))
-            else:
-                filter = eval('Report.generation_mode.' + text_operators[generation_modes["op"]])
-                params.append(filter(generation_modes["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Report.generation_mode, generation_modes))
         # end if
 
         # validity_start filters
@@ -1209,13 +1209,7 @@ class Query():
         # Generators
         if generators != None:
             functions.is_valid_text_filter(generators)
-            if generators["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[generators["op"]]
-                params.append(op(Report.generator, generators["filter"]))
-            else:
-                filter = eval('Report.generator.' + text_operators[generators["op"]])
-                params.append(filter(generators["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Report.generator, generators))
         # end if
 
         # generator_version filters
@@ -1223,13 +1217,7 @@ class Query():
             for generator_version_filter in generator_version_filters:
                 functions.is_valid_text_filter(generator_version_filter)
 
-                if generator_version_filter["op"] in arithmetic_operators.keys():
-                    op = arithmetic_operators[generator_version_filter["op"]]
-                    params.append(op(Report.generator_version, generator_version_filter["filter"]))
-                else:
-                    filter = eval('Report.generator_version.' + text_operators[generator_version_filter["op"]])
-                    params.append(filter(generator_version_filter["filter"]))
-                # end if
+                params.append(filters.build_text_filter(Report.generator_version, generator_version_filter))
             # end for
         # end if
 
@@ -1243,50 +1231,26 @@ class Query():
         # Report group UUIDs
         if report_group_uuids != None:
             functions.is_valid_text_filter(report_group_uuids)
-            if report_group_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[report_group_uuids["op"]]
-                params.append(op(Report.report_group_uuid, report_group_uuids["filter"]))
-            else:
-                filter = eval('Report.report_group_uuid.' + text_operators[report_group_uuids["op"]])
-                params.append(filter(report_group_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Report.report_group_uuid, report_group_uuids))
         # end if
 
         # Report UUIDs
         if report_uuids != None:
             functions.is_valid_text_filter(report_uuids)
-            if report_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[report_uuids["op"]]
-                params.append(op(Report.report_uuid, report_uuids["filter"]))
-            else:
-                filter = eval('Report.report_uuid.' + text_operators[report_uuids["op"]])
-                params.append(filter(report_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Report.report_uuid, report_uuids))
         # end if
         
         # Report groups
         if report_groups != None:
             functions.is_valid_text_filter(report_groups)
-            if report_groups["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[report_groups["op"]]
-                params.append(op(ReportGroup.name, report_groups["filter"]))
-            else:
-                filter = eval('ReportGroup.name.' + text_operators[report_groups["op"]])
-                params.append(filter(report_groups["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ReportGroup.name, report_groups))
             tables.append(ReportGroup)
         # end if
 
         # status filters
         if statuses != None:
             functions.is_valid_text_filter(statuses)
-            if statuses["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[statuses["op"]]
-                params.append(op(ReportStatus.status, statuses["filter"]))
-            else:
-                filter = eval('ReportStatus.status.' + text_operators[statuses["op"]])
-                params.append(filter(statuses["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ReportStatus.status, statuses))
             tables.append(ReportStatus)
         # end if
 
@@ -1297,16 +1261,11 @@ class Query():
 
         query = query.filter(*params)
 
-        # Order by
-        if order_by != None:
-            functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("Report." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("Report." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+        # Order by (and keyset pagination)
+        if return_page_token:
+            order_by = pagination.get_page_order_by(Report, order_by, after)
         # end if
+        query = pagination.apply_order_by(query, Report, order_by, after)
 
         # Limit
         if limit != None:
@@ -1346,6 +1305,14 @@ class Query():
             reports = query.all()
         # end if
 
+        if return_page_token:
+            page_token = None
+            if not delete:
+                page_token = pagination.get_page_token(reports, order_by)
+            # end if
+            return (reports, page_token)
+        # end if
+
         return reports
 
     def get_report_alerts(self, report_alert_uuids = None, report_uuids = None, report_group_uuids = None, report_names = None, generation_modes = None, validity_start_filters = None, validity_stop_filters = None, validity_duration_filters = None, triggering_time_filters = None, generation_start_filters = None, generation_stop_filters = None, generated = None, compressed = None, generation_error = None, report_generators_filters = None, generator_version_filters = None, statuses = None, report_groups = None, names = None, severities = None, groups = None, alert_uuids = None, validated = None, alert_ingestion_time_filters = None, generators = None, notified = None, solved = None, solved_time_filters = None, notification_time_filters = None, order_by = None, limit = None, offset = None, delete = None):
@@ -1365,63 +1332,33 @@ class Query():
         # report_alert_uuids
         if report_alert_uuids != None:
             functions.is_valid_text_filter(report_alert_uuids)
-            if report_alert_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[report_alert_uuids["op"]]
-                params.append(op(ReportAlert.report_alert_uuid, report_alert_uuids["filter"]))
-            else:
-                filter = eval('ReportAlert.report_alert_uuid.' + text_operators[report_alert_uuids["op"]])
-                params.append(filter(report_alert_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ReportAlert.report_alert_uuid, report_alert_uuids))
         # end if
 
         # Report UUIDs
         if report_uuids != None:
             functions.is_valid_text_filter(report_uuids)
-            if report_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[report_uuids["op"]]
-                params.append(op(ReportAlert.report_uuid, report_uuids["filter"]))
-            else:
-                filter = eval('ReportAlert.report_uuid.' + text_operators[report_uuids["op"]])
-                params.append(filter(report_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ReportAlert.report_uuid, report_uuids))
         # end if
 
         # Report group UUIDs
         if report_group_uuids != None:
             functions.is_valid_text_filter(report_group_uuids)
-            if report_group_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[report_group_uuids["op"]]
-                params.append(op(Report.report_group_uuid, report_group_uuids["filter"]))
-            else:
-                filter = eval('Report.report_group_uuid.' + text_operators[report_group_uuids["op"]])
-                params.append(filter(report_group_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Report.report_group_uuid, report_group_uuids))
             join_tables = True
         # end if
 
         # Report names
         if report_names != None:
             functions.is_valid_text_filter(report_names)
-            if report_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[report_names["op"]]
-                params.append(op(Report.name, report_names["filter"]))
-            else:
-                filter = eval('Report.name.' + text_operators[report_names["op"]])
-                params.append(filter(report_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Report.name, report_names))
             join_tables = True
         # end if
 
         # Report generation modes
         if generation_modes != None:
             functions.is_valid_text_filter(generation_modes)
-            if generation_modes["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[generation_modes["op"]]
-                params.append(op(Report.generation_mode, generation_modes["filter"]))
-            else:
-                filter = eval('Report.generation_mode.' + text_operators[generation_modes["op"]])
-                params.append(filter(generation_modes["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Report.generation_mode, generation_modes))
         # end if
 
         # validity_start filters
@@ -1509,13 +1446,7 @@ class Query():
         # Generators
         if report_generators_filters != None:
             functions.is_valid_text_filter(report_generators_filters)
-            if report_generators_filters["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[report_generators_filters["op"]]
-                params.append(op(Report.generator, report_generators_filters["filter"]))
-            else:
-                filter = eval('Report.generator.' + text_operators[report_generators_filters["op"]])
-                params.append(filter(report_generators_filters["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Report.generator, report_generators_filters))
             join_tables = True
         # end if
 
@@ -1524,13 +1455,7 @@ class Query():
             for generator_version_filter in generator_version_filters:
                 functions.is_valid_text_filter(generator_version_filter)
 
-                if generator_version_filter["op"] in arithmetic_operators.keys():
-                    op = arithmetic_operators[generator_version_filter["op"]]
-                    params.append(op(Report.generator_version, generator_version_filter["filter"]))
-                else:
-                    filter = eval('Report.generator_version.' + text_operators[generator_version_filter["op"]])
-                    params.append(filter(generator_version_filter["filter"]))
-                # end if
+                params.append(filters.build_text_filter(Report.generator_version, generator_version_filter))
             # end for
             join_tables = True
         # end if
@@ -1538,13 +1463,7 @@ class Query():
         # status filters
         if statuses != None:
             functions.is_valid_text_filter(statuses)
-            if statuses["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[statuses["op"]]
-                params.append(op(ReportStatus.status, statuses["filter"]))
-            else:
-                filter = eval('ReportStatus.status.' + text_operators[statuses["op"]])
-                params.append(filter(statuses["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ReportStatus.status, statuses))
             join_tables = True
             tables[ReportStatus] = ReportStatus.report_uuid==Report.report_uuid
         # end if
@@ -1552,13 +1471,7 @@ class Query():
         # Report groups
         if report_groups != None:
             functions.is_valid_text_filter(report_groups)
-            if report_groups["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[report_groups["op"]]
-                params.append(op(ReportGroup.name, report_groups["filter"]))
-            else:
-                filter = eval('ReportGroup.name.' + text_operators[report_groups["op"]])
-                params.append(filter(report_groups["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ReportGroup.name, report_groups))
             join_tables = True
             tables[ReportGroup] = ReportGroup.report_group_uuid==Report.report_group_uuid
         # end if
@@ -1577,13 +1490,7 @@ class Query():
         # Alert configuration names
         if names != None:
             functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(Alert.name, names["filter"]))
-            else:
-                filter = eval('Alert.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Alert.name, names))
             join_tables = True
         # end if
 
@@ -1599,8 +1506,7 @@ class Query():
                 else:
                     filters_to_apply = severities["filter"]
                 # end if
-                filter = eval('Alert.severity.' + text_operators[severities["op"]])
-                params.append(filter(filters_to_apply))
+                params.append(filters.build_filter(Alert.severity, severities["op"], filters_to_apply))
             # end if
             join_tables = True
         # end if
@@ -1608,13 +1514,7 @@ class Query():
         # Alert groups
         if groups != None:
             functions.is_valid_text_filter(groups)
-            if groups["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[groups["op"]]
-                params.append(op(AlertGroup.name, groups["filter"]))
-            else:
-                filter = eval('AlertGroup.name.' + text_operators[groups["op"]])
-                params.append(filter(groups["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AlertGroup.name, groups))
             join_tables = True
             tables[AlertGroup] = AlertGroup.alert_group_uuid==Alert.alert_group_uuid
         # end if
@@ -1629,13 +1529,7 @@ class Query():
         # Alert UUIDs
         if alert_uuids != None:
             functions.is_valid_text_filter(alert_uuids)
-            if alert_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[alert_uuids["op"]]
-                params.append(op(ReportAlert.alert_uuid, alert_uuids["filter"]))
-            else:
-                filter = eval('ReportAlert.alert_uuid.' + text_operators[alert_uuids["op"]])
-                params.append(filter(alert_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ReportAlert.alert_uuid, alert_uuids))
         # end if
         
         # validated filter
@@ -1656,13 +1550,7 @@ class Query():
         # Generators
         if generators != None:
             functions.is_valid_text_filter(generators)
-            if generators["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[generators["op"]]
-                params.append(op(ReportAlert.generator, generators["filter"]))
-            else:
-                filter = eval('ReportAlert.generator.' + text_operators[generators["op"]])
-                params.append(filter(generators["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ReportAlert.generator, generators))
         # end if
 
         # notified filter
@@ -1700,12 +1588,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("ReportAlert." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("ReportAlert." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(ReportAlert, order_by))
         # end if
 
         # Limit
@@ -1745,41 +1628,15 @@ class Query():
         """
         params = []
 
-        # DIM signature UUIDs
-        if report_group_uuids != None:
-            functions.is_valid_text_filter(report_group_uuids)
-            if report_group_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[report_group_uuids["op"]]
-                params.append(op(ReportGroup.report_group_uuid, report_group_uuids["filter"]))
-            else:
-                filter = eval('ReportGroup.report_group_uuid.' + text_operators[report_group_uuids["op"]])
-                params.append(filter(report_group_uuids["filter"]))
-            # end if
-        # end if
-
-        # DIM signatures
-        if names != None:
-            functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(ReportGroup.name, names["filter"]))
-            else:
-                filter = eval('ReportGroup.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
-        # end if
+        # Text filters
+        params += filters.build_text_filters(ReportGroup, text_filter_columns["get_report_groups"], {"report_group_uuids": report_group_uuids, "names": names})
 
         query = self.session.query(ReportGroup).filter(*params)
 
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("ReportGroup." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("ReportGroup." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(ReportGroup, order_by))
         # end if
 
         # Limit
@@ -1820,66 +1677,8 @@ class Query():
         params = []
         tables = []
 
-        # Gauge UUIDs
-        if gauge_uuids != None:
-            functions.is_valid_text_filter(gauge_uuids)
-            if gauge_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_uuids["op"]]
-                params.append(op(Gauge.gauge_uuid, gauge_uuids["filter"]))
-            else:
-                filter = eval('Gauge.gauge_uuid.' + text_operators[gauge_uuids["op"]])
-                params.append(filter(gauge_uuids["filter"]))
-            # end if
-        # end if
-
-        # Gauge names
-        if names != None:
-            functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(Gauge.name, names["filter"]))
-            else:
-                filter = eval('Gauge.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
-        # end if
-
-        # Gauge systems
-        if systems != None:
-            functions.is_valid_text_filter(systems)
-            if systems["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[systems["op"]]
-                params.append(op(Gauge.system, systems["filter"]))
-            else:
-                filter = eval('Gauge.system.' + text_operators[systems["op"]])
-                params.append(filter(systems["filter"]))
-            # end if
-        # end if
-
-        # DIM signature UUIDs
-        if dim_signature_uuids != None:
-            functions.is_valid_text_filter(dim_signature_uuids)
-            if dim_signature_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[dim_signature_uuids["op"]]
-                params.append(op(Gauge.dim_signature_uuid, dim_signature_uuids["filter"]))
-            else:
-                filter = eval('Gauge.dim_signature_uuid.' + text_operators[dim_signature_uuids["op"]])
-                params.append(filter(dim_signature_uuids["filter"]))
-            # end if
-        # end if
-
-        # DIM signatures
-        if dim_signatures != None:
-            functions.is_valid_text_filter(dim_signatures)
-            if dim_signatures["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[dim_signatures["op"]]
-                params.append(op(DimSignature.dim_signature, dim_signatures["filter"]))
-            else:
-                filter = eval('DimSignature.dim_signature.' + text_operators[dim_signatures["op"]])
-                params.append(filter(dim_signatures["filter"]))
-            # end if
-            tables.append(DimSignature)
-        # end if
+        # Text filters
+        params += filters.build_text_filters(Gauge, text_filter_columns["get_gauges"], {"gauge_uuids": gauge_uuids, "names": names, "systems": systems, "dim_signature_uuids": dim_signature_uuids, "dim_signatures": dim_signatures}, tables = tables)
 
         query = self.session.query(Gauge)
         for table in set(tables):
@@ -1891,12 +1690,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("Gauge." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("Gauge." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(Gauge, order_by))
         # end if
 
         # Limit
@@ -1929,30 +1723,18 @@ class Query():
                 # end if
 
                 # Name
-                if value_filter["name"]["op"] in arithmetic_operators.keys():
-                    op = arithmetic_operators[value_filter["name"]["op"]]
-                    params.append(op(eval("value_table_alias.name"), value_filter["name"]["filter"]))
-                else:
-                    filter = eval('value_table_alias.name.' + text_operators[value_filter["name"]["op"]])
-                    params.append(filter(value_filter["name"]["filter"]))
-                # end if
+                params.append(filters.build_text_filter(value_table_alias.name, value_filter["name"]))
 
                 # Value
                 if "value" in value_filter:
                     value = value_filter["value"]
-                    if value["op"] in arithmetic_operators.keys():
-                        op = arithmetic_operators[value["op"]]
-                        params.append(op(value_table_alias.value, value["filter"]))
-                    else:
-                        op = eval("value_table_alias.value." + text_operators[value["op"]])
-                        params.append(op(value["filter"]))
-                    # end if
+                    params.append(filters.build_text_filter(value_table_alias.value, value))
                 # end if
             # end for
         # end if
     # end def
 
-    def get_events(self, event_uuids = None, start_filters = None, stop_filters = None, duration_filters = None, ingestion_time_filters = None, value_filters = None, gauge_uuids = None, source_uuids = None, explicit_ref_uuids = None, sources = None, explicit_refs = None, gauge_names = None, gauge_systems = None, keys = None, order_by = None, limit = None, offset = None):
+    def get_events(self, event_uuids = None, start_filters = None, stop_filters = None, duration_filters = None, ingestion_time_filters = None, value_filters = None, gauge_uuids = None, source_uuids = None, explicit_ref_uuids = None, sources = None, explicit_refs = None, gauge_names = None, gauge_systems = None, keys = None, order_by = None, limit = None, offset = None, after = None, return_page_token = False, return_query = False):
         """
         """
         params = []
@@ -1964,115 +1746,59 @@ class Query():
         # event_uuids
         if event_uuids != None:
             functions.is_valid_text_filter(event_uuids)
-            if event_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[event_uuids["op"]]
-                params.append(op(Event.event_uuid, event_uuids["filter"]))
-            else:
-                filter = eval('Event.event_uuid.' + text_operators[event_uuids["op"]])
-                params.append(filter(event_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.event_uuid, event_uuids))
         # end if
 
         # source_uuids
         if source_uuids != None:
             functions.is_valid_text_filter(source_uuids)
-            if source_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[source_uuids["op"]]
-                params.append(op(Event.source_uuid, source_uuids["filter"]))
-            else:
-                filter = eval('Event.source_uuid.' + text_operators[source_uuids["op"]])
-                params.append(filter(source_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.source_uuid, source_uuids))
         # end if
 
         # explicit_ref_uuids
         if explicit_ref_uuids != None:
             functions.is_valid_text_filter(explicit_ref_uuids)
-            if explicit_ref_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_ref_uuids["op"]]
-                params.append(op(Event.explicit_ref_uuid, explicit_ref_uuids["filter"]))
-            else:
-                filter = eval('Event.explicit_ref_uuid.' + text_operators[explicit_ref_uuids["op"]])
-                params.append(filter(explicit_ref_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.explicit_ref_uuid, explicit_ref_uuids))
         # end if
 
         # gauge_uuids
         if gauge_uuids != None:
             functions.is_valid_text_filter(gauge_uuids)
-            if gauge_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_uuids["op"]]
-                params.append(op(Event.gauge_uuid, gauge_uuids["filter"]))
-            else:
-                filter = eval('Event.gauge_uuid.' + text_operators[gauge_uuids["op"]])
-                params.append(filter(gauge_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.gauge_uuid, gauge_uuids))
         # end if
 
         # Sources
         if sources != None:
             functions.is_valid_text_filter(sources)
-            if sources["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[sources["op"]]
-                params.append(op(Source.name, sources["filter"]))
-            else:
-                filter = eval('Source.name.' + text_operators[sources["op"]])
-                params.append(filter(sources["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.name, sources))
             tables.append(Source)
         # end if
 
         # Explicit references
         if explicit_refs != None:
             functions.is_valid_text_filter(explicit_refs)
-            if explicit_refs["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_refs["op"]]
-                params.append(op(ExplicitRef.explicit_ref, explicit_refs["filter"]))
-            elif explicit_refs["op"] in regex_operators.keys():
-                params.append(text("explicit_refs.explicit_ref ~ '" + explicit_refs["filter"] + "'"))
-            else:
-                filter = eval('ExplicitRef.explicit_ref.' + text_operators[explicit_refs["op"]])
-                params.append(filter(explicit_refs["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRef.explicit_ref, explicit_refs))
             tables.append(ExplicitRef)
         # end if
 
         # Gauge names
         if gauge_names != None:
             functions.is_valid_text_filter(gauge_names)
-            if gauge_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_names["op"]]
-                params.append(op(Gauge.name, gauge_names["filter"]))
-            else:
-                filter = eval('Gauge.name.' + text_operators[gauge_names["op"]])
-                params.append(filter(gauge_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Gauge.name, gauge_names))
             tables.append(Gauge)
         # end if
 
         # Gauge systems
         if gauge_systems != None:
             functions.is_valid_text_filter(gauge_systems)
-            if gauge_systems["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_systems["op"]]
-                params.append(op(Gauge.system, gauge_systems["filter"]))
-            else:
-                filter = eval('Gauge.system.' + text_operators[gauge_systems["op"]])
-                params.append(filter(gauge_systems["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Gauge.system, gauge_systems))
             tables.append(Gauge)
         # end if
 
         # keys
         if keys != None:
             functions.is_valid_text_filter(keys)
-            if keys["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[keys["op"]]
-                params.append(op(EventKey.event_key, keys["filter"]))
-            else:
-                filter = eval('EventKey.event_key.' + text_operators[keys["op"]])
-                params.append(filter(keys["filter"]))
-            # end if
+            params.append(filters.build_text_filter(EventKey.event_key, keys))
             tables.append(EventKey)
         # end if
 
@@ -2094,6 +1820,12 @@ class Query():
             # end for
         # end if
 
+        # Intersection with a period (allows the usage of the index over the periods of the events)
+        overlap_condition = periods.get_overlap_condition_from_filters("events", Event.start, Event.stop, start_filters, stop_filters)
+        if overlap_condition is not None:
+            params.append(overlap_condition)
+        # end if
+
         # duration filters
         if duration_filters != None:
             functions.is_valid_float_filters(duration_filters)
@@ -2122,16 +1854,11 @@ class Query():
 
         query = query.filter(*params)
 
-        # Order by
-        if order_by != None:
-            functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("Event." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("Event." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+        # Order by (and keyset pagination)
+        if return_page_token:
+            order_by = pagination.get_page_order_by(Event, order_by, after)
         # end if
+        query = pagination.apply_order_by(query, Event, order_by, after)
 
         # Limit
         if limit != None:
@@ -2146,19 +1873,48 @@ class Query():
         # end if
 
         log_query(query)
+
+        if return_query:
+            return query
+        # end if
+
         events = query.all()
 
+        if return_page_token:
+            return (events, pagination.get_page_token(events, order_by))
+        # end if
+
         return events
 
-    def get_event_alerts(self, event_alert_uuids = None, event_uuids = None, source_uuids = None, explicit_ref_uuids = None, gauge_uuids = None, sources = None, explicit_refs = None, gauge_names = None, gauge_systems = None, keys = None, start_filters = None, stop_filters = None, duration_filters = None, event_ingestion_time_filters = None, value_filters = None, names = None, severities = None, groups = None, alert_uuids = None, validated = None, alert_ingestion_time_filters = None, generators = None, notified = None, solved = None, solved_time_filters = None, notification_time_filters = None, order_by = None, limit = None, offset = None, delete = None):
+    def iter_events(self, batch_size = 1000, columns = None, **filters):
+        """
+        Method to iterate over the events filtered by the received filters streaming them from the DDBB in chunks,
+        so that the memory needed does not depend on the number of events found.
+        The session must not be committed or closed while iterating
+
+        :param batch_size: number of rows to fetch from the DDBB each time
+        :type batch_size: Positive integer
+        :param columns: names of the columns to obtain as lightweight named tuples instead of the events (e.g. ["event_uuid"])
+        :type columns: list of str
+        :param filters: filters accepted by get_events
+        :type filters: dict
+
+        :return: generator of events (or named tuples with the requested columns)
+        :rtype: generator
+        """
+        query = self.get_events(return_query = True, **filters)
+
+        return self._iterate_query(query, Event, batch_size, columns)
+
+    def get_event_alerts(self, event_alert_uuids = None, event_uuids = None, source_uuids = None, explicit_ref_uuids = None, gauge_uuids = None, sources = None, explicit_refs = None, gauge_names = None, gauge_systems = None, keys = None, start_filters = None, stop_filters = None, duration_filters = None, event_ingestion_time_filters = None, value_filters = None, names = None, severities = None, groups = None, alert_uuids = None, validated = None, alert_ingestion_time_filters = None, generators = None, notified = None, solved = None, solved_time_filters = None, notification_time_filters = None, order_by = None, limit = None, offset = None, after = None, return_page_token = False, delete = None):
         """
         Method to obtain the alerts associated to event entities filtered by the received filters
 
         :param filters: dictionary with the filters to apply to the query
         :type filters: dict
 
-        :return: found event_alerts
-        :rtype: list
+        :return: found event_alerts (or the found event_alerts and the token of the following page if return_page_token is True)
+        :rtype: list or tuple
         """
 
         params = []
@@ -2168,76 +1924,40 @@ class Query():
         # event_alert_uuids
         if event_alert_uuids != None:
             functions.is_valid_text_filter(event_alert_uuids)
-            if event_alert_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[event_alert_uuids["op"]]
-                params.append(op(EventAlert.event_alert_uuid, event_alert_uuids["filter"]))
-            else:
-                filter = eval('EventAlert.event_alert_uuid.' + text_operators[event_alert_uuids["op"]])
-                params.append(filter(event_alert_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(EventAlert.event_alert_uuid, event_alert_uuids))
         # end if
 
         # event_uuids
         if event_uuids != None:
             functions.is_valid_text_filter(event_uuids)
-            if event_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[event_uuids["op"]]
-                params.append(op(EventAlert.event_uuid, event_uuids["filter"]))
-            else:
-                filter = eval('EventAlert.event_uuid.' + text_operators[event_uuids["op"]])
-                params.append(filter(event_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(EventAlert.event_uuid, event_uuids))
         # end if
 
         # source_uuids
         if source_uuids != None:
             functions.is_valid_text_filter(source_uuids)
-            if source_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[source_uuids["op"]]
-                params.append(op(Event.source_uuid, source_uuids["filter"]))
-            else:
-                filter = eval('Event.source_uuid.' + text_operators[source_uuids["op"]])
-                params.append(filter(source_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.source_uuid, source_uuids))
             join_tables = True
         # end if
 
         # explicit_ref_uuids
         if explicit_ref_uuids != None:
             functions.is_valid_text_filter(explicit_ref_uuids)
-            if explicit_ref_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_ref_uuids["op"]]
-                params.append(op(Event.explicit_ref_uuid, explicit_ref_uuids["filter"]))
-            else:
-                filter = eval('Event.explicit_ref_uuid.' + text_operators[explicit_ref_uuids["op"]])
-                params.append(filter(explicit_ref_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.explicit_ref_uuid, explicit_ref_uuids))
             join_tables = True
         # end if
 
         # gauge_uuids
         if gauge_uuids != None:
             functions.is_valid_text_filter(gauge_uuids)
-            if gauge_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_uuids["op"]]
-                params.append(op(Event.gauge_uuid, gauge_uuids["filter"]))
-            else:
-                filter = eval('Event.gauge_uuid.' + text_operators[gauge_uuids["op"]])
-                params.append(filter(gauge_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.gauge_uuid, gauge_uuids))
             join_tables = True
         # end if
 
         # Sources
         if sources != None:
             functions.is_valid_text_filter(sources)
-            if sources["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[sources["op"]]
-                params.append(op(Source.name, sources["filter"]))
-            else:
-                filter = eval('Source.name.' + text_operators[sources["op"]])
-                params.append(filter(sources["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.name, sources))
             join_tables = True
             tables[Source] = Source.source_uuid==Event.source_uuid
         # end if
@@ -2245,15 +1965,7 @@ class Query():
         # Explicit references
         if explicit_refs != None:
             functions.is_valid_text_filter(explicit_refs)
-            if explicit_refs["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_refs["op"]]
-                params.append(op(ExplicitRef.explicit_ref, explicit_refs["filter"]))
-            elif explicit_refs["op"] in regex_operators.keys():
-                params.append(text("explicit_refs.explicit_ref ~ '" + explicit_refs["filter"] + "'"))
-            else:
-                filter = eval('ExplicitRef.explicit_ref.' + text_operators[explicit_refs["op"]])
-                params.append(filter(explicit_refs["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRef.explicit_ref, explicit_refs))
             join_tables = True
             tables[ExplicitRef] = ExplicitRef.explicit_ref_uuid==Event.explicit_ref_uuid
         # end if
@@ -2261,13 +1973,7 @@ class Query():
         # Gauge names
         if gauge_names != None:
             functions.is_valid_text_filter(gauge_names)
-            if gauge_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_names["op"]]
-                params.append(op(Gauge.name, gauge_names["filter"]))
-            else:
-                filter = eval('Gauge.name.' + text_operators[gauge_names["op"]])
-                params.append(filter(gauge_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Gauge.name, gauge_names))
             join_tables = True
             tables[Gauge] = Gauge.gauge_uuid==Event.gauge_uuid
         # end if
@@ -2275,13 +1981,7 @@ class Query():
         # Gauge systems
         if gauge_systems != None:
             functions.is_valid_text_filter(gauge_systems)
-            if gauge_systems["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_systems["op"]]
-                params.append(op(Gauge.system, gauge_systems["filter"]))
-            else:
-                filter = eval('Gauge.system.' + text_operators[gauge_systems["op"]])
-                params.append(filter(gauge_systems["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Gauge.system, gauge_systems))
             join_tables = True
             tables[Gauge] = Gauge.gauge_uuid==Event.gauge_uuid
         # end if
@@ -2289,13 +1989,7 @@ class Query():
         # keys
         if keys != None:
             functions.is_valid_text_filter(keys)
-            if keys["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[keys["op"]]
-                params.append(op(EventKey.event_key, keys["filter"]))
-            else:
-                filter = eval('EventKey.event_key.' + text_operators[keys["op"]])
-                params.append(filter(keys["filter"]))
-            # end if
+            params.append(filters.build_text_filter(EventKey.event_key, keys))
             join_tables = True
             tables[EventKey] = EventKey.event_uuid==Event.event_uuid
         # end if
@@ -2363,13 +2057,7 @@ class Query():
         # Alert configuration names
         if names != None:
             functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(Alert.name, names["filter"]))
-            else:
-                filter = eval('Alert.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Alert.name, names))
             join_tables = True
         # end if
 
@@ -2385,8 +2073,7 @@ class Query():
                 else:
                     filters_to_apply = severities["filter"]
                 # end if
-                filter = eval('Alert.severity.' + text_operators[severities["op"]])
-                params.append(filter(filters_to_apply))
+                params.append(filters.build_filter(Alert.severity, severities["op"], filters_to_apply))
             # end if
             join_tables = True
         # end if
@@ -2394,13 +2081,7 @@ class Query():
         # Alert groups
         if groups != None:
             functions.is_valid_text_filter(groups)
-            if groups["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[groups["op"]]
-                params.append(op(AlertGroup.name, groups["filter"]))
-            else:
-                filter = eval('AlertGroup.name.' + text_operators[groups["op"]])
-                params.append(filter(groups["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AlertGroup.name, groups))
             join_tables = True
             tables[AlertGroup] = AlertGroup.alert_group_uuid==Alert.alert_group_uuid
         # end if
@@ -2415,13 +2096,7 @@ class Query():
         # Alert UUIDs
         if alert_uuids != None:
             functions.is_valid_text_filter(alert_uuids)
-            if alert_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[alert_uuids["op"]]
-                params.append(op(EventAlert.alert_uuid, alert_uuids["filter"]))
-            else:
-                filter = eval('EventAlert.alert_uuid.' + text_operators[alert_uuids["op"]])
-                params.append(filter(alert_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(EventAlert.alert_uuid, alert_uuids))
         # end if
         
         # validated filter
@@ -2442,13 +2117,7 @@ class Query():
         # Generators
         if generators != None:
             functions.is_valid_text_filter(generators)
-            if generators["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[generators["op"]]
-                params.append(op(EventAlert.generator, generators["filter"]))
-            else:
-                filter = eval('EventAlert.generator.' + text_operators[generators["op"]])
-                params.append(filter(generators["filter"]))
-            # end if
+            params.append(filters.build_text_filter(EventAlert.generator, generators))
         # end if
 
         # notified filter
@@ -2483,16 +2152,11 @@ class Query():
                 
         query = query.filter(*params)
 
-        # Order by
-        if order_by != None:
-            functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("EventAlert." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("EventAlert." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+        # Order by (and keyset pagination)
+        if return_page_token:
+            order_by = pagination.get_page_order_by(EventAlert, order_by, after)
         # end if
+        query = pagination.apply_order_by(query, EventAlert, order_by, after)
 
         # Limit
         if limit != None:
@@ -2515,6 +2179,14 @@ class Query():
             event_alerts = query.all()
         # end if
 
+        if return_page_token:
+            page_token = None
+            if not delete:
+                page_token = pagination.get_page_token(event_alerts, order_by)
+            # end if
+            return (event_alerts, page_token)
+        # end if
+
         return event_alerts
     
     def get_event_keys(self, event_uuids = None, dim_signature_uuids = None, keys = None, order_by = None, limit = None, offset = None):
@@ -2522,53 +2194,15 @@ class Query():
         """
         params = []
 
-        # DIM signature UUIDs
-        if dim_signature_uuids != None:
-            functions.is_valid_text_filter(dim_signature_uuids)
-            if dim_signature_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[dim_signature_uuids["op"]]
-                params.append(op(EventKey.dim_signature_uuid, dim_signature_uuids["filter"]))
-            else:
-                filter = eval('EventKey.dim_signature_uuid.' + text_operators[dim_signature_uuids["op"]])
-                params.append(filter(dim_signature_uuids["filter"]))
-            # end if
-        # end if
-
-        # event_uuids
-        if event_uuids != None:
-            functions.is_valid_text_filter(event_uuids)
-            if event_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[event_uuids["op"]]
-                params.append(op(EventKey.event_uuid, event_uuids["filter"]))
-            else:
-                filter = eval('EventKey.event_uuid.' + text_operators[event_uuids["op"]])
-                params.append(filter(event_uuids["filter"]))
-            # end if
-        # end if
-
-        # keys
-        if keys != None:
-            functions.is_valid_text_filter(keys)
-            if keys["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[keys["op"]]
-                params.append(op(EventKey.event_key, keys["filter"]))
-            else:
-                filter = eval('EventKey.event_key.' + text_operators[keys["op"]])
-                params.append(filter(keys["filter"]))
-            # end if
-        # end if
+        # Text filters
+        params += filters.build_text_filters(EventKey, text_filter_columns["get_event_keys"], {"dim_signature_uuids": dim_signature_uuids, "event_uuids": event_uuids, "keys": keys})
 
         query = self.session.query(EventKey).filter(*params)
         
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("EventKey." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("EventKey." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(EventKey, order_by))
         # end if
 
         # Limit
@@ -2594,35 +2228,17 @@ class Query():
         params = []
         if event_uuid_links:
             functions.is_valid_text_filter(event_uuid_links)
-            if event_uuid_links["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[event_uuid_links["op"]]
-                params.append(op(EventLink.event_uuid_link, event_uuid_links["filter"]))
-            else:
-                filter = eval('EventLink.event_uuid_link.' + text_operators[event_uuid_links["op"]])
-                params.append(filter(event_uuid_links["filter"]))
-            # end if
+            params.append(filters.build_text_filter(EventLink.event_uuid_link, event_uuid_links))
         # end if
 
         if event_uuids:
             functions.is_valid_text_filter(event_uuids)
-            if event_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[event_uuids["op"]]
-                params.append(op(EventLink.event_uuid, event_uuids["filter"]))
-            else:
-                filter = eval('EventLink.event_uuid.' + text_operators[event_uuids["op"]])
-                params.append(filter(event_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(EventLink.event_uuid, event_uuids))
         # end if
 
         if link_names:
             functions.is_valid_text_filter(link_names)
-            if link_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[link_names["op"]]
-                params.append(op(EventLink.name, link_names["filter"]))
-            else:
-                filter = eval('EventLink.name.' + text_operators[link_names["op"]])
-                params.append(filter(link_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(EventLink.name, link_names))
         # end if
 
         query = self.session.query(EventLink).filter(*params)
@@ -2677,47 +2293,123 @@ class Query():
             raise InputError("The parameter event_uuid has to be specified and must be a UUID (received event_uuid: {}).".format(event_uuid))
         # end if
 
+        # Obtain the prime event, the linked events and the events linking in one query
+        graph = self.get_linked_events_graph(event_uuids = {"filter": [event_uuid], "op": "in"}, back_ref = back_ref)
+
         events = {}
         if return_prime_events:
-            events["prime_events"] = self.get_events(event_uuids = {"filter": [event_uuid], "op": "in"})
-        # end if
-
-        # Obtain the links from the prime events to other events
-        links = self.get_event_links(event_uuid_links = {"filter": [event_uuid], "op": "in"})
-
-        # Obtain the events linked by the prime events
-        linked_event_uuids = [str(link.event_uuid) for link in links]
-        linked_events = []
-        if len(linked_event_uuids) > 0:
-            linked_events = self.get_events(event_uuids = {"filter": linked_event_uuids, "op": "in"})
+            events["prime_events"] = list(graph["prime_events"].values())
         # end if
 
         events["linked_events"] = []
-        for link in links:
-            linked_event = [event for event in linked_events if event.event_uuid == link.event_uuid][0]
-            events["linked_events"].append({"link_name": link.name,
-                                            "event": linked_event})
+        for link in graph["links"].get(event_uuid, []):
+            events["linked_events"].append({"link_name": link["link_name"],
+                                            "event": graph["linked_events"][link["event_uuid"]]})
         # end for
 
         if back_ref:
-            # Obtain the events linking the prime events
-            links = self.get_event_links(event_uuids = {"filter": [event_uuid], "op": "in"})
-            event_linking_uuids = [str(link.event_uuid_link) for link in links]
-            events_linking = []
-            if len(event_linking_uuids) > 0:
-                events_linking = self.get_events(event_uuids = {"filter": event_linking_uuids, "op": "in"})
-            # end if
-
             events["events_linking"] = []
-            for link in links:
-                event_linking = [event for event in events_linking if event.event_uuid == link.event_uuid_link][0]
-                events["events_linking"].append({"link_name": link.name,
-                                                "event": event_linking})
+            for link in graph["back_links"].get(event_uuid, []):
+                events["events_linking"].append({"link_name": link["link_name"],
+                                                "event": graph["events_linking"][link["event_uuid_link"]]})
             # end for
         # end if
 
         return events
 
+    def get_linked_events_graph(self, event_uuids = None, source_uuids = None, explicit_ref_uuids = None, gauge_uuids = None, start_filters = None, stop_filters = None, link_names = None, sources = None, explicit_refs = None, gauge_names = None, gauge_systems = None, value_filters = None, keys = None, max_depth = 1, back_ref = False, order_by = None, limit = None, offset = None):
+        """
+        Method to obtain the graph of events linked by the prime events (the events selected by the filters) with one query.
+        The links are followed by a recursive query up to max_depth hops, so that the events linked by the linked events are also obtained when max_depth is greater than 1.
+        Only the visible events are traversed and every link is returned once (with the depth of the shortest path to it)
+
+        :param link_names: filter applied to the names of the links followed in every hop
+        :type link_names: text_filter
+        :param max_depth: maximum number of hops to follow from the prime events
+        :type max_depth: int
+        :param back_ref: flag to indicate if the events linking the prime events (one hop) have to be obtained
+        :type back_ref: bool
+
+        The rest of parameters are the filters of get_events for selecting the prime events
+
+        :return: dictionary with the prime events (prime_events), the linked events (linked_events) and the events linking the prime events (events_linking, only if back_ref is True) indexed by their UUIDs,
+        the links followed indexed by the UUID of the event linking (links, values: list of dictionaries with the link_name, the event_uuid of the linked event and the depth of the hop)
+        and the links to the prime events indexed by the UUID of the prime event (back_links, only if back_ref is True, values: list of dictionaries with the link_name and the event_uuid_link of the event linking)
+        :rtype: dict
+        """
+        if type(max_depth) != int or max_depth < 1:
+            raise InputError("The parameter max_depth must be a positive integer (received max_depth: {}).".format(max_depth))
+        # end if
+
+        link_params = []
+        if link_names != None:
+            functions.is_valid_text_filter(link_names)
+            link_params.append(filters.build_text_filter(EventLink.name, link_names))
+        # end if
+
+        # Obtain prime events
+        prime_events_query = self.get_events(event_uuids = event_uuids, source_uuids = source_uuids, explicit_ref_uuids = explicit_ref_uuids, gauge_uuids = gauge_uuids, sources = sources, explicit_refs = explicit_refs, gauge_names = gauge_names, gauge_systems = gauge_systems, keys = keys, start_filters = start_filters, stop_filters = stop_filters, value_filters = value_filters, order_by = order_by, limit = limit, offset = offset, return_query = True)
+        prime_events = prime_events_query.with_entities(Event.event_uuid.label("event_uuid")).subquery()
+
+        # Every row of the traversal is an event reached (event_uuid) from another event (event_uuid_from)
+        # through a link (link_name) after a number of hops (depth). Prime events have depth 0
+        # and the events linking them have depth -1
+        traversal_selects = [select([prime_events.c.event_uuid.label("event_uuid"),
+                                     cast(null(), postgresql.UUID(as_uuid=True)).label("event_uuid_from"),
+                                     cast(null(), Text).label("link_name"),
+                                     literal_column("0", Integer).label("depth")])]
+        if back_ref:
+            traversal_selects.append(select([EventLink.event_uuid_link,
+                                             EventLink.event_uuid,
+                                             EventLink.name,
+                                             literal_column("-1", Integer)]).where(EventLink.event_uuid.in_(select([prime_events.c.event_uuid]))))
+        # end if
+        if len(traversal_selects) == 1:
+            traversal = traversal_selects[0].cte("linked_events_traversal", recursive = True)
+        else:
+            anchor = union_all(*traversal_selects).alias("prime_events_and_events_linking")
+            traversal = select([anchor]).cte("linked_events_traversal", recursive = True)
+        # end if
+        # The traversal does not continue through the events which are not visible (the prime events are visible as they are selected by get_events)
+        linked_events = select([EventLink.event_uuid,
+                                EventLink.event_uuid_link,
+                                EventLink.name,
+                                traversal.c.depth + 1]).where(EventLink.event_uuid_link == traversal.c.event_uuid).where(traversal.c.depth >= 0).where(traversal.c.depth < max_depth).where(EventLink.event_uuid == Event.event_uuid).where(Event.visible == True)
+        for link_param in link_params:
+            linked_events = linked_events.where(link_param)
+        # end for
+        # UNION discards the rows already obtained, so the events reached by several paths (e.g. diamonds) are not traversed again for the same depth
+        traversal = traversal.union(linked_events)
+
+        # Every link is returned once with the minimum depth (the sign of the depth separates the prime events, the links followed and the links to the prime events)
+        distinct_columns = [traversal.c.event_uuid_from, traversal.c.event_uuid, traversal.c.link_name, func.sign(traversal.c.depth)]
+        query = self.session.query(Event, traversal.c.event_uuid_from, traversal.c.link_name, traversal.c.depth).join(traversal, Event.event_uuid == traversal.c.event_uuid).filter(Event.visible == True).distinct(*distinct_columns).order_by(*(distinct_columns + [traversal.c.depth]))
+        log_query(query)
+
+        graph = {"prime_events": {},
+                 "linked_events": {},
+                 "links": {}}
+        if back_ref:
+            graph["events_linking"] = {}
+            graph["back_links"] = {}
+        # end if
+        for event, event_uuid_from, link_name, depth in query:
+            if depth == 0:
+                graph["prime_events"][event.event_uuid] = event
+            elif depth == -1:
+                graph["events_linking"][event.event_uuid] = event
+                graph["back_links"].setdefault(event_uuid_from, []).append({"link_name": link_name,
+                                                                           "event_uuid_link": event.event_uuid})
+            else:
+                graph["linked_events"][event.event_uuid] = event
+                graph["links"].setdefault(event_uuid_from, []).append({"link_name": link_name,
+                                                                      "event_uuid": event.event_uuid,
+                                                                      "depth": depth})
+            # end if
+        # end for
+
+        return graph
+
     def get_linking_events(self, event_uuids = None, source_uuids = None, explicit_ref_uuids = None, gauge_uuids = None, start_filters = None, stop_filters = None, link_names = None, sources = None, explicit_refs = None, gauge_names = None, gauge_systems = None, value_filters = None, return_prime_events = True, keys = None, back_ref = False, order_by = None, limit = None, offset = None):
 
         # Obtain prime events
@@ -2811,71 +2503,174 @@ class Query():
 
         return events
 
-    def get_annotation_cnfs(self, dim_signature_uuids = None, annotation_cnf_uuids = None, names = None, systems = None, dim_signatures = None, order_by = None, limit = None, offset = None):
+    def get_event_summaries(self, gauge_uuids = None, gauge_names = None, gauge_systems = None, explicit_ref_uuids = None, explicit_refs = None, day_filters = None, order_by = None, limit = None, offset = None):
+        """
+        Method to obtain the summaries of the visible events per gauge, explicit reference and day (of the start of the events) filtered by the received parameters.
+        The summaries are maintained by the engine when EVENT_SUMMARIES is enabled in the configuration
+
+        :param gauge_uuids: gauge identifier filters
+        :type gauge_uuids: text_filter
+        :param gauge_names: gauge name filters
+        :type gauge_names: text_filter
+        :param gauge_systems: gauge system filters
+        :type gauge_systems: text_filter
+        :param explicit_ref_uuids: explicit reference identifier filters
+        :type explicit_ref_uuids: text_filter
+        :param explicit_refs: explicit reference filters
+        :type explicit_refs: text_filter
+        :param day_filters: list of day filters
+        :type day_filters: date_filters
+        :param order_by: field to order by
+        :type order_by: order_by statement
+        :param limit: positive integer to limit the number of results of the query
+        :type limit: positive integer
+        :param offset: positive integer to offset the pointer to the list of results of the query
+        :type offset: positive integer
+
+        :return: found event summaries
+        :rtype: list
+        """
+        query = self._get_event_summaries_query(self.session.query(EventSummary), gauge_uuids = gauge_uuids, gauge_names = gauge_names, gauge_systems = gauge_systems, explicit_ref_uuids = explicit_ref_uuids, explicit_refs = explicit_refs, day_filters = day_filters)
+
+        # Order by
+        if order_by != None:
+            functions.is_valid_order_by(order_by)
+            query = query.order_by(filters.build_order_by(EventSummary, order_by))
+        # end if
+
+        # Limit
+        if limit != None:
+            functions.is_valid_positive_integer(limit)
+            query = query.limit(limit)
+        # end if
+
+        # Offset
+        if offset != None:
+            functions.is_valid_positive_integer(offset)
+            query = query.offset(offset)
+        # end if
+
+        log_query(query)
+        summaries = query.all()
+
+        return summaries
+
+    def get_event_statistics(self, gauge_uuids = None, gauge_names = None, gauge_systems = None, explicit_ref_uuids = None, explicit_refs = None, day_filters = None, group_by_explicit_ref = False):
         """
+        Method to obtain the statistics of the visible events per gauge (and explicit reference) from the event summaries
+        without accessing the events
+
+        The parameters are the filters of get_event_summaries
+
+        :param group_by_explicit_ref: flag to indicate if the statistics have to be obtained per explicit reference too
+        :type group_by_explicit_ref: bool
+
+        :return: list of dictionaries with the gauge_uuid (and explicit_ref_uuid), the number of events (event_count), the accumulated duration of the events in seconds (total_duration), the minimum start (start) and the maximum stop (stop)
+        :rtype: list
+        """
+        group_by = [EventSummary.gauge_uuid]
+        if group_by_explicit_ref:
+            group_by.append(EventSummary.explicit_ref_uuid)
+        # end if
+
+        query = self.session.query(*group_by,
+                                   func.sum(EventSummary.event_count),
+                                   func.sum(EventSummary.total_duration),
+                                   func.min(EventSummary.min_start),
+                                   func.max(EventSummary.max_stop))
+        query = self._get_event_summaries_query(query, gauge_uuids = gauge_uuids, gauge_names = gauge_names, gauge_systems = gauge_systems, explicit_ref_uuids = explicit_ref_uuids, explicit_refs = explicit_refs, day_filters = day_filters)
+        query = query.group_by(*group_by)
+
+        log_query(query)
+
+        statistics = []
+        for row in query:
+            row_statistics = {"gauge_uuid": row[0]}
+            if group_by_explicit_ref:
+                row_statistics["explicit_ref_uuid"] = row[1]
+            # end if
+            row_statistics["event_count"] = int(row[-4])
+            row_statistics["total_duration"] = row[-3]
+            row_statistics["start"] = row[-2]
+            row_statistics["stop"] = row[-1]
+            statistics.append(row_statistics)
+        # end for
+
+        return statistics
+
+    def _get_event_summaries_query(self, query, gauge_uuids = None, gauge_names = None, gauge_systems = None, explicit_ref_uuids = None, explicit_refs = None, day_filters = None):
+        """
+        Method to apply the filters of the event summaries to a query (see get_event_summaries)
         """
         params = []
         tables = []
-        # DIM signature UUIDs
-        if dim_signature_uuids != None:
-            functions.is_valid_text_filter(dim_signature_uuids)
-            if dim_signature_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[dim_signature_uuids["op"]]
-                params.append(op(AnnotationCnf.dim_signature_uuid, dim_signature_uuids["filter"]))
-            else:
-                filter = eval('AnnotationCnf.dim_signature_uuid.' + text_operators[dim_signature_uuids["op"]])
-                params.append(filter(dim_signature_uuids["filter"]))
-            # end if
+
+        # Gauge UUIDs
+        if gauge_uuids != None:
+            functions.is_valid_text_filter(gauge_uuids)
+            params.append(filters.build_text_filter(EventSummary.gauge_uuid, gauge_uuids))
         # end if
-        # DIM signatures
-        if dim_signatures != None:
-            functions.is_valid_text_filter(dim_signatures)
-            if dim_signatures["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[dim_signatures["op"]]
-                params.append(op(DimSignature.dim_signature, dim_signatures["filter"]))
-            else:
-                filter = eval('DimSignature.dim_signature.' + text_operators[dim_signatures["op"]])
-                params.append(filter(dim_signatures["filter"]))
-            # end if
-            tables.append(DimSignature)
+
+        # Gauge names
+        if gauge_names != None:
+            functions.is_valid_text_filter(gauge_names)
+            params.append(filters.build_text_filter(Gauge.name, gauge_names))
+            tables.append(Gauge)
         # end if
 
-        # AnnotationCnf UUIDs
-        if annotation_cnf_uuids != None:
-            functions.is_valid_text_filter(annotation_cnf_uuids)
-            if annotation_cnf_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_uuids["op"]]
-                params.append(op(AnnotationCnf.annotation_cnf_uuid, annotation_cnf_uuids["filter"]))
-            else:
-                filter = eval('AnnotationCnf.annotation_cnf_uuid.' + text_operators[annotation_cnf_uuids["op"]])
-                params.append(filter(annotation_cnf_uuids["filter"]))
-            # end if
+        # Gauge systems
+        if gauge_systems != None:
+            functions.is_valid_text_filter(gauge_systems)
+            params.append(filters.build_text_filter(Gauge.system, gauge_systems))
+            tables.append(Gauge)
         # end if
 
-        # AnnotationCnf names
-        if names != None:
-            functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(AnnotationCnf.name, names["filter"]))
-            else:
-                filter = eval('AnnotationCnf.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
+        # Explicit reference UUIDs
+        if explicit_ref_uuids != None:
+            functions.is_valid_text_filter(explicit_ref_uuids)
+            params.append(filters.build_text_filter(EventSummary.explicit_ref_uuid, explicit_ref_uuids))
         # end if
 
-        # AnnotationCnf systems
-        if systems != None:
-            functions.is_valid_text_filter(systems)
-            if systems["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[systems["op"]]
-                params.append(op(AnnotationCnf.system, systems["filter"]))
-            else:
-                filter = eval('AnnotationCnf.system.' + text_operators[systems["op"]])
-                params.append(filter(systems["filter"]))
-            # end if
+        # Explicit references
+        if explicit_refs != None:
+            functions.is_valid_text_filter(explicit_refs)
+            params.append(filters.build_text_filter(ExplicitRef.explicit_ref, explicit_refs))
+            tables.append(ExplicitRef)
+        # end if
+
+        # Day filters
+        if day_filters != None:
+            functions.is_valid_date_filters(day_filters)
+            for day_filter in day_filters:
+                op = arithmetic_operators[day_filter["op"]]
+                params.append(op(EventSummary.day, parser.parse(day_filter["date"]).date()))
+            # end for
         # end if
 
+        for table in set(tables):
+            query = query.join(table)
+        # end for
+
+        return query.filter(*params)
+
+    def refresh_event_summaries(self):
+        """
+        Method to compute again all the event summaries from the visible events
+        (the delete method only refreshes the summaries of the removed events)
+        """
+        event_summaries.refresh_summaries(self.session)
+        self.session.commit()
+
+        return
+
+    def get_annotation_cnfs(self, dim_signature_uuids = None, annotation_cnf_uuids = None, names = None, systems = None, dim_signatures = None, order_by = None, limit = None, offset = None):
+        """
+        """
+        params = []
+        tables = []
+        # Text filters
+        params += filters.build_text_filters(AnnotationCnf, text_filter_columns["get_annotation_cnfs"], {"dim_signature_uuids": dim_signature_uuids, "dim_signatures": dim_signatures, "annotation_cnf_uuids": annotation_cnf_uuids, "names": names, "systems": systems}, tables = tables)
+
         query = self.session.query(AnnotationCnf)
         for table in set(tables):
             query = query.join(table)
@@ -2886,12 +2681,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("AnnotationCnf." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("AnnotationCnf." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(AnnotationCnf, order_by))
         # end if
 
         # Limit
@@ -2911,7 +2701,7 @@ class Query():
 
         return annotation_cnfs
 
-    def get_annotations(self, source_uuids = None, explicit_ref_uuids = None, annotation_cnf_uuids = None, ingestion_time_filters = None, annotation_uuids = None, sources = None, explicit_refs = None, annotation_cnf_names = None, annotation_cnf_systems = None, value_filters = None, order_by = None, limit = None, offset = None):
+    def get_annotations(self, source_uuids = None, explicit_ref_uuids = None, annotation_cnf_uuids = None, ingestion_time_filters = None, annotation_uuids = None, sources = None, explicit_refs = None, annotation_cnf_names = None, annotation_cnf_systems = None, value_filters = None, order_by = None, limit = None, offset = None, after = None, return_page_token = False, return_query = False):
         """
         """
         params = []
@@ -2922,49 +2712,25 @@ class Query():
         # source_uuids
         if source_uuids != None:
             functions.is_valid_text_filter(source_uuids)
-            if source_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[source_uuids["op"]]
-                params.append(op(Annotation.source_uuid, source_uuids["filter"]))
-            else:
-                filter = eval('Annotation.source_uuid.' + text_operators[source_uuids["op"]])
-                params.append(filter(source_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Annotation.source_uuid, source_uuids))
         # end if
 
         # explicit_ref_uuids
         if explicit_ref_uuids != None:
             functions.is_valid_text_filter(explicit_ref_uuids)
-            if explicit_ref_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_ref_uuids["op"]]
-                params.append(op(Annotation.explicit_ref_uuid, explicit_ref_uuids["filter"]))
-            else:
-                filter = eval('Annotation.explicit_ref_uuid.' + text_operators[explicit_ref_uuids["op"]])
-                params.append(filter(explicit_ref_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Annotation.explicit_ref_uuid, explicit_ref_uuids))
         # end if
 
         # annotation_cnf_uuids
         if annotation_cnf_uuids != None:
             functions.is_valid_text_filter(annotation_cnf_uuids)
-            if annotation_cnf_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_uuids["op"]]
-                params.append(op(Annotation.annotation_cnf_uuid, annotation_cnf_uuids["filter"]))
-            else:
-                filter = eval('Annotation.annotation_cnf_uuid.' + text_operators[annotation_cnf_uuids["op"]])
-                params.append(filter(annotation_cnf_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Annotation.annotation_cnf_uuid, annotation_cnf_uuids))
         # end if
 
         # annotation_uuids
         if annotation_uuids != None:
             functions.is_valid_text_filter(annotation_uuids)
-            if annotation_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_uuids["op"]]
-                params.append(op(Annotation.annotation_uuid, annotation_uuids["filter"]))
-            else:
-                filter = eval('Annotation.annotation_uuid.' + text_operators[annotation_uuids["op"]])
-                params.append(filter(annotation_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Annotation.annotation_uuid, annotation_uuids))
         # end if
 
         # ingestion_time filters
@@ -2979,52 +2745,28 @@ class Query():
         # Sources
         if sources != None:
             functions.is_valid_text_filter(sources)
-            if sources["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[sources["op"]]
-                params.append(op(Source.name, sources["filter"]))
-            else:
-                filter = eval('Source.name.' + text_operators[sources["op"]])
-                params.append(filter(sources["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.name, sources))
             tables.append(Source)
         # end if
 
         # Explicit references
         if explicit_refs != None:
             functions.is_valid_text_filter(explicit_refs)
-            if explicit_refs["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_refs["op"]]
-                params.append(op(ExplicitRef.explicit_ref, explicit_refs["filter"]))
-            else:
-                filter = eval('ExplicitRef.explicit_ref.' + text_operators[explicit_refs["op"]])
-                params.append(filter(explicit_refs["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRef.explicit_ref, explicit_refs))
             tables.append(ExplicitRef)
         # end if
 
         # Annotation configuration names
         if annotation_cnf_names != None:
             functions.is_valid_text_filter(annotation_cnf_names)
-            if annotation_cnf_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_names["op"]]
-                params.append(op(AnnotationCnf.name, annotation_cnf_names["filter"]))
-            else:
-                filter = eval('AnnotationCnf.name.' + text_operators[annotation_cnf_names["op"]])
-                params.append(filter(annotation_cnf_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AnnotationCnf.name, annotation_cnf_names))
             tables.append(AnnotationCnf)
         # end if
 
         # Annotation configuration systems
         if annotation_cnf_systems != None:
             functions.is_valid_text_filter(annotation_cnf_systems)
-            if annotation_cnf_systems["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_systems["op"]]
-                params.append(op(AnnotationCnf.system, annotation_cnf_systems["filter"]))
-            else:
-                filter = eval('AnnotationCnf.system.' + text_operators[annotation_cnf_systems["op"]])
-                params.append(filter(annotation_cnf_systems["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AnnotationCnf.system, annotation_cnf_systems))
             tables.append(AnnotationCnf)
         # end if
 
@@ -3038,16 +2780,11 @@ class Query():
 
         query = query.filter(*params)
 
-        # Order by
-        if order_by != None:
-            functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("Annotation." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("Annotation." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+        # Order by (and keyset pagination)
+        if return_page_token:
+            order_by = pagination.get_page_order_by(Annotation, order_by, after)
         # end if
+        query = pagination.apply_order_by(query, Annotation, order_by, after)
 
         # Limit
         if limit != None:
@@ -3062,10 +2799,39 @@ class Query():
         # end if
         
         log_query(query)
+
+        if return_query:
+            return query
+        # end if
+
         annotations = query.all()
 
+        if return_page_token:
+            return (annotations, pagination.get_page_token(annotations, order_by))
+        # end if
+
         return annotations
 
+    def iter_annotations(self, batch_size = 1000, columns = None, **filters):
+        """
+        Method to iterate over the annotations filtered by the received filters streaming them from the DDBB in chunks,
+        so that the memory needed does not depend on the number of annotations found.
+        The session must not be committed or closed while iterating
+
+        :param batch_size: number of rows to fetch from the DDBB each time
+        :type batch_size: Positive integer
+        :param columns: names of the columns to obtain as lightweight named tuples instead of the annotations (e.g. ["annotation_uuid"])
+        :type columns: list of str
+        :param filters: filters accepted by get_annotations
+        :type filters: dict
+
+        :return: generator of annotations (or named tuples with the requested columns)
+        :rtype: generator
+        """
+        query = self.get_annotations(return_query = True, **filters)
+
+        return self._iterate_query(query, Annotation, batch_size, columns)
+
     def get_annotation_alerts(self, annotation_alert_uuids = None, annotation_uuids = None, source_uuids = None, explicit_ref_uuids = None, annotation_cnf_uuids = None, annotation_ingestion_time_filters = None, sources = None, explicit_refs = None, annotation_cnf_names = None, annotation_cnf_systems = None, value_filters = None, names = None, severities = None, groups = None, alert_uuids = None, validated = None, alert_ingestion_time_filters = None, generators = None, notified = None, solved = None, solved_time_filters = None, notification_time_filters = None, order_by = None, limit = None, offset = None, delete = None):
         """
         Method to obtain the alerts associated to annotation entities filtered by the received filters
@@ -3083,63 +2849,33 @@ class Query():
         # annotation_alert_uuids
         if annotation_alert_uuids != None:
             functions.is_valid_text_filter(annotation_alert_uuids)
-            if annotation_alert_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_alert_uuids["op"]]
-                params.append(op(AnnotationAlert.annotation_alert_uuid, annotation_alert_uuids["filter"]))
-            else:
-                filter = eval('AnnotationAlert.annotation_alert_uuid.' + text_operators[annotation_alert_uuids["op"]])
-                params.append(filter(annotation_alert_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AnnotationAlert.annotation_alert_uuid, annotation_alert_uuids))
         # end if
 
         # annotation_uuids
         if annotation_uuids != None:
             functions.is_valid_text_filter(annotation_uuids)
-            if annotation_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_uuids["op"]]
-                params.append(op(AnnotationAlert.annotation_uuid, annotation_uuids["filter"]))
-            else:
-                filter = eval('AnnotationAlert.annotation_uuid.' + text_operators[annotation_uuids["op"]])
-                params.append(filter(annotation_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AnnotationAlert.annotation_uuid, annotation_uuids))
         # end if
 
         # source_uuids
         if source_uuids != None:
             functions.is_valid_text_filter(source_uuids)
-            if source_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[source_uuids["op"]]
-                params.append(op(Annotation.source_uuid, source_uuids["filter"]))
-            else:
-                filter = eval('Annotation.source_uuid.' + text_operators[source_uuids["op"]])
-                params.append(filter(source_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Annotation.source_uuid, source_uuids))
             join_tables = True
         # end if
 
         # explicit_ref_uuids
         if explicit_ref_uuids != None:
             functions.is_valid_text_filter(explicit_ref_uuids)
-            if explicit_ref_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_ref_uuids["op"]]
-                params.append(op(Annotation.explicit_ref_uuid, explicit_ref_uuids["filter"]))
-            else:
-                filter = eval('Annotation.explicit_ref_uuid.' + text_operators[explicit_ref_uuids["op"]])
-                params.append(filter(explicit_ref_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Annotation.explicit_ref_uuid, explicit_ref_uuids))
             join_tables = True
         # end if
 
         # annotation_cnf_uuids
         if annotation_cnf_uuids != None:
             functions.is_valid_text_filter(annotation_cnf_uuids)
-            if annotation_cnf_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_uuids["op"]]
-                params.append(op(Annotation.annotation_cnf_uuid, annotation_cnf_uuids["filter"]))
-            else:
-                filter = eval('Annotation.annotation_cnf_uuid.' + text_operators[annotation_cnf_uuids["op"]])
-                params.append(filter(annotation_cnf_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Annotation.annotation_cnf_uuid, annotation_cnf_uuids))
             join_tables = True
         # end if
 
@@ -3156,13 +2892,7 @@ class Query():
         # Sources
         if sources != None:
             functions.is_valid_text_filter(sources)
-            if sources["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[sources["op"]]
-                params.append(op(Source.name, sources["filter"]))
-            else:
-                filter = eval('Source.name.' + text_operators[sources["op"]])
-                params.append(filter(sources["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.name, sources))
             join_tables = True
             tables[Source] = Source.source_uuid==Annotation.source_uuid
         # end if
@@ -3170,13 +2900,7 @@ class Query():
         # Explicit references
         if explicit_refs != None:
             functions.is_valid_text_filter(explicit_refs)
-            if explicit_refs["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_refs["op"]]
-                params.append(op(ExplicitRef.explicit_ref, explicit_refs["filter"]))
-            else:
-                filter = eval('ExplicitRef.explicit_ref.' + text_operators[explicit_refs["op"]])
-                params.append(filter(explicit_refs["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRef.explicit_ref, explicit_refs))
             join_tables = True
             tables[ExplicitRef] = ExplicitRef.explicit_ref_uuid==Annotation.explicit_ref_uuid
         # end if
@@ -3184,13 +2908,7 @@ class Query():
         # Annotation configuration names
         if annotation_cnf_names != None:
             functions.is_valid_text_filter(annotation_cnf_names)
-            if annotation_cnf_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_names["op"]]
-                params.append(op(AnnotationCnf.name, annotation_cnf_names["filter"]))
-            else:
-                filter = eval('AnnotationCnf.name.' + text_operators[annotation_cnf_names["op"]])
-                params.append(filter(annotation_cnf_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AnnotationCnf.name, annotation_cnf_names))
             join_tables = True
             tables[AnnotationCnf] = AnnotationCnf.annotation_cnf_uuid==Annotation.annotation_cnf_uuid
         # end if
@@ -3198,13 +2916,7 @@ class Query():
         # Annotation configuration systems
         if annotation_cnf_systems != None:
             functions.is_valid_text_filter(annotation_cnf_systems)
-            if annotation_cnf_systems["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_systems["op"]]
-                params.append(op(AnnotationCnf.system, annotation_cnf_systems["filter"]))
-            else:
-                filter = eval('AnnotationCnf.system.' + text_operators[annotation_cnf_systems["op"]])
-                params.append(filter(annotation_cnf_systems["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AnnotationCnf.system, annotation_cnf_systems))
             join_tables = True
             tables[AnnotationCnf] = AnnotationCnf.annotation_cnf_uuid==Annotation.annotation_cnf_uuid
         # end if
@@ -3232,13 +2944,7 @@ class Query():
         # Alert configuration names
         if names != None:
             functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(Alert.name, names["filter"]))
-            else:
-                filter = eval('Alert.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Alert.name, names))
             join_tables = True
         # end if
 
@@ -3254,8 +2960,7 @@ class Query():
                 else:
                     filters_to_apply = severities["filter"]
                 # end if
-                filter = eval('Alert.severity.' + text_operators[severities["op"]])
-                params.append(filter(filters_to_apply))
+                params.append(filters.build_filter(Alert.severity, severities["op"], filters_to_apply))
             # end if
             join_tables = True
         # end if
@@ -3263,13 +2968,7 @@ class Query():
         # Alert groups
         if groups != None:
             functions.is_valid_text_filter(groups)
-            if groups["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[groups["op"]]
-                params.append(op(AlertGroup.name, groups["filter"]))
-            else:
-                filter = eval('AlertGroup.name.' + text_operators[groups["op"]])
-                params.append(filter(groups["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AlertGroup.name, groups))
             join_tables = True
             tables[AlertGroup] = AlertGroup.alert_group_uuid==Alert.alert_group_uuid
         # end if
@@ -3284,13 +2983,7 @@ class Query():
         # Alert UUIDs
         if alert_uuids != None:
             functions.is_valid_text_filter(alert_uuids)
-            if alert_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[alert_uuids["op"]]
-                params.append(op(AnnotationAlert.alert_uuid, alert_uuids["filter"]))
-            else:
-                filter = eval('AnnotationAlert.alert_uuid.' + text_operators[alert_uuids["op"]])
-                params.append(filter(alert_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AnnotationAlert.alert_uuid, alert_uuids))
         # end if
         
         # validated filter
@@ -3311,13 +3004,7 @@ class Query():
         # Generators
         if generators != None:
             functions.is_valid_text_filter(generators)
-            if generators["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[generators["op"]]
-                params.append(op(AnnotationAlert.generator, generators["filter"]))
-            else:
-                filter = eval('AnnotationAlert.generator.' + text_operators[generators["op"]])
-                params.append(filter(generators["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AnnotationAlert.generator, generators))
         # end if
 
         # notified filter
@@ -3355,12 +3042,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("AnnotationAlert." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("AnnotationAlert." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(AnnotationAlert, order_by))
         # end if
 
         # Limit
@@ -3386,7 +3068,7 @@ class Query():
 
         return annotation_alerts
 
-    def get_explicit_refs(self, group_ids = None, explicit_ref_uuids = None, explicit_ref_ingestion_time_filters = None, explicit_refs = None, groups = None, sources = None, source_uuids = None, event_uuids = None, gauge_names = None, gauge_systems = None, gauge_uuids = None, start_filters = None, stop_filters = None, duration_filters = None, event_ingestion_time_filters = None, event_value_filters = None, keys = None, annotation_ingestion_time_filters = None, annotation_uuids = None, annotation_cnf_names = None, annotation_cnf_systems = None, annotation_cnf_uuids = None, annotation_value_filters = None, order_by = None, limit = None, offset = None):
+    def get_explicit_refs(self, group_ids = None, explicit_ref_uuids = None, explicit_ref_ingestion_time_filters = None, explicit_refs = None, groups = None, sources = None, source_uuids = None, event_uuids = None, gauge_names = None, gauge_systems = None, gauge_uuids = None, start_filters = None, stop_filters = None, duration_filters = None, event_ingestion_time_filters = None, event_value_filters = None, keys = None, annotation_ingestion_time_filters = None, annotation_uuids = None, annotation_cnf_names = None, annotation_cnf_systems = None, annotation_cnf_uuids = None, annotation_value_filters = None, order_by = None, limit = None, offset = None, return_query = False):
         """
         """
         params = []
@@ -3396,49 +3078,25 @@ class Query():
         # group_ids
         if group_ids != None:
             functions.is_valid_text_filter(group_ids)
-            if group_ids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[group_ids["op"]]
-                params.append(op(ExplicitRef.expl_ref_cnf_uuid, group_ids["filter"]))
-            else:
-                filter = eval('ExplicitRef.expl_ref_cnf_uuid.' + text_operators[group_ids["op"]])
-                params.append(filter(group_ids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRef.expl_ref_cnf_uuid, group_ids))
         # end if
 
         # explicit_ref_uuids
         if explicit_ref_uuids != None:
             functions.is_valid_text_filter(explicit_ref_uuids)
-            if explicit_ref_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_ref_uuids["op"]]
-                params.append(op(ExplicitRef.explicit_ref_uuid, explicit_ref_uuids["filter"]))
-            else:
-                filter = eval('ExplicitRef.explicit_ref_uuid.' + text_operators[explicit_ref_uuids["op"]])
-                params.append(filter(explicit_ref_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRef.explicit_ref_uuid, explicit_ref_uuids))
         # end if
 
         # Explicit references
         if explicit_refs != None:
             functions.is_valid_text_filter(explicit_refs)
-            if explicit_refs["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_refs["op"]]
-                params.append(op(ExplicitRef.explicit_ref, explicit_refs["filter"]))
-            else:
-                filter = eval('ExplicitRef.explicit_ref.' + text_operators[explicit_refs["op"]])
-                params.append(filter(explicit_refs["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRef.explicit_ref, explicit_refs))
         # end if
 
         # Groups
         if groups != None:
             functions.is_valid_text_filter(groups)
-            if groups["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[groups["op"]]
-                params.append(op(ExplicitRefGrp.name, groups["filter"]))
-            else:
-                filter = eval('ExplicitRefGrp.name.' + text_operators[groups["op"]])
-                params.append(filter(groups["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRefGrp.name, groups))
             tables[ExplicitRefGrp] = ExplicitRefGrp.expl_ref_cnf_uuid==ExplicitRef.expl_ref_cnf_uuid
         # end if
 
@@ -3463,39 +3121,21 @@ class Query():
         # event_uuids
         if event_uuids != None:
             functions.is_valid_text_filter(event_uuids)
-            if event_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[event_uuids["op"]]
-                params.append(op(Event.event_uuid, event_uuids["filter"]))
-            else:
-                filter = eval('Event.event_uuid.' + text_operators[event_uuids["op"]])
-                params.append(filter(event_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.event_uuid, event_uuids))
             join_tables = True
         # end if
 
         # source_uuids
         if source_uuids != None:
             functions.is_valid_text_filter(source_uuids)
-            if source_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[source_uuids["op"]]
-                params.append(op(Event.source_uuid, source_uuids["filter"]))
-            else:
-                filter = eval('Event.source_uuid.' + text_operators[source_uuids["op"]])
-                params.append(filter(source_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.source_uuid, source_uuids))
             join_tables = True
         # end if
         
         # Sources
         if sources != None:
             functions.is_valid_text_filter(sources)
-            if sources["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[sources["op"]]
-                params.append(op(Source.name, sources["filter"]))
-            else:
-                filter = eval('Source.name.' + text_operators[sources["op"]])
-                params.append(filter(sources["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.name, sources))
             join_tables = True
             tables[Source] = Source.source_uuid==Event.source_uuid
         # end if
@@ -3503,26 +3143,14 @@ class Query():
         # gauge_uuids
         if gauge_uuids != None:
             functions.is_valid_text_filter(gauge_uuids)
-            if gauge_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_uuids["op"]]
-                params.append(op(Event.gauge_uuid, gauge_uuids["filter"]))
-            else:
-                filter = eval('Event.gauge_uuid.' + text_operators[gauge_uuids["op"]])
-                params.append(filter(gauge_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.gauge_uuid, gauge_uuids))
             join_tables = True
         # end if
 
         # Gauge names
         if gauge_names != None:
             functions.is_valid_text_filter(gauge_names)
-            if gauge_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_names["op"]]
-                params.append(op(Gauge.name, gauge_names["filter"]))
-            else:
-                filter = eval('Gauge.name.' + text_operators[gauge_names["op"]])
-                params.append(filter(gauge_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Gauge.name, gauge_names))
             join_tables = True
             tables[Gauge] = Gauge.gauge_uuid==Event.gauge_uuid
         # end if
@@ -3530,13 +3158,7 @@ class Query():
         # Gauge systems
         if gauge_systems != None:
             functions.is_valid_text_filter(gauge_systems)
-            if gauge_systems["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_systems["op"]]
-                params.append(op(Gauge.system, gauge_systems["filter"]))
-            else:
-                filter = eval('Gauge.system.' + text_operators[gauge_systems["op"]])
-                params.append(filter(gauge_systems["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Gauge.system, gauge_systems))
             join_tables = True
             tables[Gauge] = Gauge.gauge_uuid==Event.gauge_uuid
         # end if
@@ -3544,13 +3166,7 @@ class Query():
         # keys
         if keys != None:
             functions.is_valid_text_filter(keys)
-            if keys["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[keys["op"]]
-                params.append(op(EventKey.event_key, keys["filter"]))
-            else:
-                filter = eval('EventKey.event_key.' + text_operators[keys["op"]])
-                params.append(filter(keys["filter"]))
-            # end if
+            params.append(filters.build_text_filter(EventKey.event_key, keys))
             join_tables = True
             tables[EventKey] = EventKey.event_uuid==Event.event_uuid
         # end if
@@ -3616,26 +3232,14 @@ class Query():
         # annotation_uuids
         if annotation_uuids != None:
             functions.is_valid_text_filter(annotation_uuids)
-            if annotation_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_uuids["op"]]
-                params.append(op(Annotation.annotation_uuid, annotation_uuids["filter"]))
-            else:
-                filter = eval('Annotation.annotation_uuid.' + text_operators[annotation_uuids["op"]])
-                params.append(filter(annotation_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Annotation.annotation_uuid, annotation_uuids))
             join_tables = True
         # end if
 
         # annotation_cnf_uuids
         if annotation_cnf_uuids != None:
             functions.is_valid_text_filter(annotation_cnf_uuids)
-            if annotation_cnf_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_uuids["op"]]
-                params.append(op(Annotation.annotation_cnf_uuid, annotation_cnf_uuids["filter"]))
-            else:
-                filter = eval('Annotation.annotation_cnf_uuid.' + text_operators[annotation_cnf_uuids["op"]])
-                params.append(filter(annotation_cnf_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Annotation.annotation_cnf_uuid, annotation_cnf_uuids))
             join_tables = True
         # end if
 
@@ -3652,13 +3256,7 @@ class Query():
         # Annotation configuration names
         if annotation_cnf_names != None:
             functions.is_valid_text_filter(annotation_cnf_names)
-            if annotation_cnf_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_names["op"]]
-                params.append(op(AnnotationCnf.name, annotation_cnf_names["filter"]))
-            else:
-                filter = eval('AnnotationCnf.name.' + text_operators[annotation_cnf_names["op"]])
-                params.append(filter(annotation_cnf_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AnnotationCnf.name, annotation_cnf_names))
             join_tables = True
             tables[AnnotationCnf] = AnnotationCnf.annotation_cnf_uuid==Annotation.annotation_cnf_uuid
         # end if
@@ -3666,13 +3264,7 @@ class Query():
         # Annotation configuration systems
         if annotation_cnf_systems != None:
             functions.is_valid_text_filter(annotation_cnf_systems)
-            if annotation_cnf_systems["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_systems["op"]]
-                params.append(op(AnnotationCnf.system, annotation_cnf_systems["filter"]))
-            else:
-                filter = eval('AnnotationCnf.system.' + text_operators[annotation_cnf_systems["op"]])
-                params.append(filter(annotation_cnf_systems["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AnnotationCnf.system, annotation_cnf_systems))
             join_tables = True
             tables[AnnotationCnf] = AnnotationCnf.annotation_cnf_uuid==Annotation.annotation_cnf_uuid
         # end if
@@ -3696,12 +3288,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("ExplicitRef." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("ExplicitRef." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(ExplicitRef, order_by))
         # end if
 
         # Limit
@@ -3717,10 +3304,35 @@ class Query():
         # end if
         
         log_query(query)
+
+        if return_query:
+            return query
+        # end if
+
         explicit_refs = query.all()
 
         return explicit_refs
 
+    def iter_explicit_refs(self, batch_size = 1000, columns = None, **filters):
+        """
+        Method to iterate over the explicit references filtered by the received filters streaming them from the DDBB in chunks,
+        so that the memory needed does not depend on the number of explicit references found.
+        The session must not be committed or closed while iterating
+
+        :param batch_size: number of rows to fetch from the DDBB each time
+        :type batch_size: Positive integer
+        :param columns: names of the columns to obtain as lightweight named tuples instead of the explicit references (e.g. ["explicit_ref_uuid"])
+        :type columns: list of str
+        :param filters: filters accepted by get_explicit_refs
+        :type filters: dict
+
+        :return: generator of explicit references (or named tuples with the requested columns)
+        :rtype: generator
+        """
+        query = self.get_explicit_refs(return_query = True, **filters)
+
+        return self._iterate_query(query, ExplicitRef, batch_size, columns)
+
     def get_explicit_ref_alerts(self, explicit_ref_alert_uuids = None, explicit_ref_uuids = None, explicit_ref_group_ids = None, explicit_refs = None, explicit_ref_groups = None, explicit_ref_ingestion_time_filters = None, event_uuids = None, source_uuids = None, sources = None, gauge_uuids = None, gauge_names = None, gauge_systems = None, keys = None, start_filters = None, stop_filters = None, duration_filters = None, event_ingestion_time_filters = None, event_value_filters = None, annotation_uuids = None, annotation_cnf_uuids = None, annotation_ingestion_time_filters = None, annotation_cnf_names = None, annotation_cnf_systems = None, annotation_value_filters = None, names = None, severities = None, groups = None, alert_uuids = None, validated = None, alert_ingestion_time_filters = None, generators = None, notified = None, solved = None, solved_time_filters = None, notification_time_filters = None, order_by = None, limit = None, offset = None, delete = None):
         """
         Method to obtain the alerts associated to explicit reference entities filtered by the received filters
@@ -3738,63 +3350,33 @@ class Query():
         # explicit_ref_alert_uuids
         if explicit_ref_alert_uuids != None:
             functions.is_valid_text_filter(explicit_ref_alert_uuids)
-            if explicit_ref_alert_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_ref_alert_uuids["op"]]
-                params.append(op(ExplicitRefAlert.explicit_ref_alert_uuid, explicit_ref_alert_uuids["filter"]))
-            else:
-                filter = eval('ExplicitRefAlert.explicit_ref_alert_uuid.' + text_operators[explicit_ref_alert_uuids["op"]])
-                params.append(filter(explicit_ref_alert_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRefAlert.explicit_ref_alert_uuid, explicit_ref_alert_uuids))
         # end if
 
         # explicit_ref_uuids
         if explicit_ref_uuids != None:
             functions.is_valid_text_filter(explicit_ref_uuids)
-            if explicit_ref_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_ref_uuids["op"]]
-                params.append(op(ExplicitRefAlert.explicit_ref_uuid, explicit_ref_uuids["filter"]))
-            else:
-                filter = eval('ExplicitRefAlert.explicit_ref_uuid.' + text_operators[explicit_ref_uuids["op"]])
-                params.append(filter(explicit_ref_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRefAlert.explicit_ref_uuid, explicit_ref_uuids))
         # end if
         
         # explicit_ref_group_ids
         if explicit_ref_group_ids != None:
             functions.is_valid_text_filter(explicit_ref_group_ids)
-            if explicit_ref_group_ids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_ref_group_ids["op"]]
-                params.append(op(ExplicitRef.expl_ref_cnf_uuid, explicit_ref_group_ids["filter"]))
-            else:
-                filter = eval('ExplicitRef.expl_ref_cnf_uuid.' + text_operators[explicit_ref_group_ids["op"]])
-                params.append(filter(explicit_ref_group_ids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRef.expl_ref_cnf_uuid, explicit_ref_group_ids))
             join_tables = True
         # end if
 
         # Explicit references
         if explicit_refs != None:
             functions.is_valid_text_filter(explicit_refs)
-            if explicit_refs["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_refs["op"]]
-                params.append(op(ExplicitRef.explicit_ref, explicit_refs["filter"]))
-            else:
-                filter = eval('ExplicitRef.explicit_ref.' + text_operators[explicit_refs["op"]])
-                params.append(filter(explicit_refs["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRef.explicit_ref, explicit_refs))
             join_tables = True
         # end if
 
         # Groups
         if explicit_ref_groups != None:
             functions.is_valid_text_filter(explicit_ref_groups)
-            if explicit_ref_groups["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_ref_groups["op"]]
-                params.append(op(ExplicitRefGrp.name, explicit_ref_groups["filter"]))
-            else:
-                filter = eval('ExplicitRefGrp.name.' + text_operators[explicit_ref_groups["op"]])
-                params.append(filter(explicit_ref_groups["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRefGrp.name, explicit_ref_groups))
             join_tables = True
             tables[ExplicitRefGrp] = ExplicitRefGrp.expl_ref_cnf_uuid==ExplicitRef.expl_ref_cnf_uuid
         # end if
@@ -3824,39 +3406,21 @@ class Query():
         # event_uuids
         if event_uuids != None:
             functions.is_valid_text_filter(event_uuids)
-            if event_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[event_uuids["op"]]
-                params.append(op(Event.event_uuid, event_uuids["filter"]))
-            else:
-                filter = eval('Event.event_uuid.' + text_operators[event_uuids["op"]])
-                params.append(filter(event_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.event_uuid, event_uuids))
             join_tables = True
         # end if
 
         # source_uuids
         if source_uuids != None:
             functions.is_valid_text_filter(source_uuids)
-            if source_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[source_uuids["op"]]
-                params.append(op(Event.source_uuid, source_uuids["filter"]))
-            else:
-                filter = eval('Event.source_uuid.' + text_operators[source_uuids["op"]])
-                params.append(filter(source_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.source_uuid, source_uuids))
             join_tables = True
         # end if
         
         # Sources
         if sources != None:
             functions.is_valid_text_filter(sources)
-            if sources["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[sources["op"]]
-                params.append(op(Source.name, sources["filter"]))
-            else:
-                filter = eval('Source.name.' + text_operators[sources["op"]])
-                params.append(filter(sources["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Source.name, sources))
             join_tables = True
             tables[Source] = Source.source_uuid==Event.source_uuid
         # end if
@@ -3864,26 +3428,14 @@ class Query():
         # gauge_uuids
         if gauge_uuids != None:
             functions.is_valid_text_filter(gauge_uuids)
-            if gauge_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_uuids["op"]]
-                params.append(op(Event.gauge_uuid, gauge_uuids["filter"]))
-            else:
-                filter = eval('Event.gauge_uuid.' + text_operators[gauge_uuids["op"]])
-                params.append(filter(gauge_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Event.gauge_uuid, gauge_uuids))
             join_tables = True
         # end if
 
         # Gauge names
         if gauge_names != None:
             functions.is_valid_text_filter(gauge_names)
-            if gauge_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_names["op"]]
-                params.append(op(Gauge.name, gauge_names["filter"]))
-            else:
-                filter = eval('Gauge.name.' + text_operators[gauge_names["op"]])
-                params.append(filter(gauge_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Gauge.name, gauge_names))
             join_tables = True
             tables[Gauge] = Gauge.gauge_uuid==Event.gauge_uuid
         # end if
@@ -3891,13 +3443,7 @@ class Query():
         # Gauge systems
         if gauge_systems != None:
             functions.is_valid_text_filter(gauge_systems)
-            if gauge_systems["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[gauge_systems["op"]]
-                params.append(op(Gauge.system, gauge_systems["filter"]))
-            else:
-                filter = eval('Gauge.system.' + text_operators[gauge_systems["op"]])
-                params.append(filter(gauge_systems["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Gauge.system, gauge_systems))
             join_tables = True
             tables[Gauge] = Gauge.gauge_uuid==Event.gauge_uuid
         # end if
@@ -3905,13 +3451,7 @@ class Query():
         # keys
         if keys != None:
             functions.is_valid_text_filter(keys)
-            if keys["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[keys["op"]]
-                params.append(op(EventKey.event_key, keys["filter"]))
-            else:
-                filter = eval('EventKey.event_key.' + text_operators[keys["op"]])
-                params.append(filter(keys["filter"]))
-            # end if
+            params.append(filters.build_text_filter(EventKey.event_key, keys))
             join_tables = True
             tables[EventKey] = EventKey.event_uuid==Event.event_uuid
         # end if
@@ -3979,26 +3519,14 @@ class Query():
         # annotation_uuids
         if annotation_uuids != None:
             functions.is_valid_text_filter(annotation_uuids)
-            if annotation_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_uuids["op"]]
-                params.append(op(Annotation.annotation_uuid, annotation_uuids["filter"]))
-            else:
-                filter = eval('Annotation.annotation_uuid.' + text_operators[annotation_uuids["op"]])
-                params.append(filter(annotation_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Annotation.annotation_uuid, annotation_uuids))
             join_tables = True
         # end if
 
         # annotation_cnf_uuids
         if annotation_cnf_uuids != None:
             functions.is_valid_text_filter(annotation_cnf_uuids)
-            if annotation_cnf_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_uuids["op"]]
-                params.append(op(Annotation.annotation_cnf_uuid, annotation_cnf_uuids["filter"]))
-            else:
-                filter = eval('Annotation.annotation_cnf_uuid.' + text_operators[annotation_cnf_uuids["op"]])
-                params.append(filter(annotation_cnf_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Annotation.annotation_cnf_uuid, annotation_cnf_uuids))
             join_tables = True
         # end if
 
@@ -4015,13 +3543,7 @@ class Query():
         # Annotation configuration names
         if annotation_cnf_names != None:
             functions.is_valid_text_filter(annotation_cnf_names)
-            if annotation_cnf_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_names["op"]]
-                params.append(op(AnnotationCnf.name, annotation_cnf_names["filter"]))
-            else:
-                filter = eval('AnnotationCnf.name.' + text_operators[annotation_cnf_names["op"]])
-                params.append(filter(annotation_cnf_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AnnotationCnf.name, annotation_cnf_names))
             join_tables = True
             tables[AnnotationCnf] = AnnotationCnf.annotation_cnf_uuid==Annotation.annotation_cnf_uuid
         # end if
@@ -4029,13 +3551,7 @@ class Query():
         # Annotation configuration systems
         if annotation_cnf_systems != None:
             functions.is_valid_text_filter(annotation_cnf_systems)
-            if annotation_cnf_systems["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_cnf_systems["op"]]
-                params.append(op(AnnotationCnf.system, annotation_cnf_systems["filter"]))
-            else:
-                filter = eval('AnnotationCnf.system.' + text_operators[annotation_cnf_systems["op"]])
-                params.append(filter(annotation_cnf_systems["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AnnotationCnf.system, annotation_cnf_systems))
             join_tables = True
             tables[AnnotationCnf] = AnnotationCnf.annotation_cnf_uuid==Annotation.annotation_cnf_uuid
         # end if
@@ -4062,13 +3578,7 @@ class Query():
         # Alert configuration names
         if names != None:
             functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(Alert.name, names["filter"]))
-            else:
-                filter = eval('Alert.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Alert.name, names))
             join_tables = True
         # end if
 
@@ -4084,8 +3594,7 @@ class Query():
                 else:
                     filters_to_apply = severities["filter"]
                 # end if
-                filter = eval('Alert.severity.' + text_operators[severities["op"]])
-                params.append(filter(filters_to_apply))
+                params.append(filters.build_filter(Alert.severity, severities["op"], filters_to_apply))
             # end if
             join_tables = True
         # end if
@@ -4093,13 +3602,7 @@ class Query():
         # Alert groups
         if groups != None:
             functions.is_valid_text_filter(groups)
-            if groups["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[groups["op"]]
-                params.append(op(AlertGroup.name, groups["filter"]))
-            else:
-                filter = eval('AlertGroup.name.' + text_operators[groups["op"]])
-                params.append(filter(groups["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AlertGroup.name, groups))
             join_tables = True
             tables[AlertGroup] = AlertGroup.alert_group_uuid==Alert.alert_group_uuid
         # end if
@@ -4114,13 +3617,7 @@ class Query():
         # Alert UUIDs
         if alert_uuids != None:
             functions.is_valid_text_filter(alert_uuids)
-            if alert_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[alert_uuids["op"]]
-                params.append(op(ExplicitRefAlert.alert_uuid, alert_uuids["filter"]))
-            else:
-                filter = eval('ExplicitRefAlert.alert_uuid.' + text_operators[alert_uuids["op"]])
-                params.append(filter(alert_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRefAlert.alert_uuid, alert_uuids))
         # end if
         
         # validated filter
@@ -4141,13 +3638,7 @@ class Query():
         # Generators
         if generators != None:
             functions.is_valid_text_filter(generators)
-            if generators["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[generators["op"]]
-                params.append(op(ExplicitRefAlert.generator, generators["filter"]))
-            else:
-                filter = eval('ExplicitRefAlert.generator.' + text_operators[generators["op"]])
-                params.append(filter(generators["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRefAlert.generator, generators))
         # end if
 
         # notified filter
@@ -4185,12 +3676,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("ExplicitRefAlert." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("ExplicitRefAlert." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(ExplicitRefAlert, order_by))
         # end if
 
         # Limit
@@ -4222,35 +3708,17 @@ class Query():
         params = []
         if explicit_ref_uuid_links:
             functions.is_valid_text_filter(explicit_ref_uuid_links)
-            if explicit_ref_uuid_links["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_ref_uuid_links["op"]]
-                params.append(op(DimSignature.explicit_ref_uuid_link, explicit_ref_uuid_links["filter"]))
-            else:
-                filter = eval('ExplicitRefLink.explicit_ref_uuid_link.' + text_operators[explicit_ref_uuid_links["op"]])
-                params.append(filter(explicit_ref_uuid_links["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRefLink.explicit_ref_uuid_link, explicit_ref_uuid_links))
         # end if
 
         if explicit_ref_uuids:
             functions.is_valid_text_filter(explicit_ref_uuids)
-            if explicit_ref_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[explicit_ref_uuids["op"]]
-                params.append(op(ExplicitRefLink.explicit_ref_uuid, explicit_ref_uuids["filter"]))
-            else:
-                filter = eval('ExplicitRefLink.explicit_ref_uuid.' + text_operators[explicit_ref_uuids["op"]])
-                params.append(filter(explicit_ref_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRefLink.explicit_ref_uuid, explicit_ref_uuids))
         # end if
 
         if link_names:
             functions.is_valid_text_filter(link_names)
-            if link_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[link_names["op"]]
-                params.append(op(ExplicitRefLink.name, link_names["filter"]))
-            else:
-                filter = eval('ExplicitRefLink.name.' + text_operators[link_names["op"]])
-                params.append(filter(link_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ExplicitRefLink.name, link_names))
         # end if
 
         query = self.session.query(ExplicitRefLink).filter(*params)
@@ -4433,41 +3901,15 @@ class Query():
         """
         """
         params = []
-        # Group UUIDs
-        if group_ids != None:
-            functions.is_valid_text_filter(group_ids)
-            if group_ids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[group_ids["op"]]
-                params.append(op(ExplicitRefGrp.expl_ref_cnf_uuid, group_ids["filter"]))
-            else:
-                filter = eval('ExplicitRefGrp.expl_ref_cnf_uuid.' + text_operators[group_ids["op"]])
-                params.append(filter(group_ids["filter"]))
-            # end if
-        # end if
-
-        # Gauge names
-        if names != None:
-            functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(ExplicitRefGrp.name, names["filter"]))
-            else:
-                filter = eval('ExplicitRefGrp.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
-        # end if
+        # Text filters
+        params += filters.build_text_filters(ExplicitRefGrp, text_filter_columns["get_explicit_refs_groups"], {"group_ids": group_ids, "names": names})
 
         query = self.session.query(ExplicitRefGrp).filter(*params)
 
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("ExplicitRefGrp." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("ExplicitRefGrp." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(ExplicitRefGrp, order_by))
         # end if
 
         # Limit
@@ -4523,13 +3965,7 @@ class Query():
         # event_uuids
         if event_uuids != None:
             functions.is_valid_text_filter(event_uuids)
-            if event_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[event_uuids["op"]]
-                params.append(op(event_value_entities[value_type].event_uuid, event_uuids["filter"]))
-            else:
-                filter = eval('event_value_entities[value_type].event_uuid.' + text_operators[event_uuids["op"]])
-                params.append(filter(event_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(event_value_entities[value_type].event_uuid, event_uuids))
         # end if
 
         # value filters
@@ -4579,13 +4015,7 @@ class Query():
         # annotation_uuids
         if annotation_uuids != None:
             functions.is_valid_text_filter(annotation_uuids)
-            if annotation_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[annotation_uuids["op"]]
-                params.append(op(annotation_value_entities[value_type].annotation_uuid, annotation_uuids["filter"]))
-            else:
-                filter = eval('annotation_value_entities[value_type].annotation_uuid.' + text_operators[annotation_uuids["op"]])
-                params.append(filter(annotation_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(annotation_value_entities[value_type].annotation_uuid, annotation_uuids))
         # end if
 
         # value filters
@@ -4607,13 +4037,7 @@ class Query():
         # Alert configuration names
         if names != None:
             functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(Alert.name, names["filter"]))
-            else:
-                filter = eval('Alert.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Alert.name, names))
         # end if
 
         # Alert severities
@@ -4628,21 +4052,14 @@ class Query():
                 else:
                     filters_to_apply = severities["filter"]
                 # end if
-                filter = eval('Alert.severity.' + text_operators[severities["op"]])
-                params.append(filter(filters_to_apply))
+                params.append(filters.build_filter(Alert.severity, severities["op"], filters_to_apply))
             # end if
         # end if
 
         # Alert groups
         if groups != None:
             functions.is_valid_text_filter(groups)
-            if groups["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[groups["op"]]
-                params.append(op(AlertGroup.name, groups["filter"]))
-            else:
-                filter = eval('AlertGroup.name.' + text_operators[groups["op"]])
-                params.append(filter(groups["filter"]))
-            # end if
+            params.append(filters.build_text_filter(AlertGroup.name, groups))
             tables.append(AlertGroup)
         # end if
 
@@ -4656,12 +4073,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("Alert." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("Alert." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(Alert, order_by))
         # end if
 
         # Limit
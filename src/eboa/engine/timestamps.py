@@ -0,0 +1,41 @@
+"""
+Parsing of the timestamps received by the engine
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import datetime
+from functools import lru_cache
+from dateutil import parser
+
+# Number of parsed timestamps kept in memory per process
+TIMESTAMPS_CACHE_SIZE = 65536
+
+@lru_cache(maxsize = TIMESTAMPS_CACHE_SIZE)
+def parse_timestamp(timestamp):
+    """
+    Method to parse a timestamp with the same result as dateutil.parser.parse.
+    The timestamps in ISO 8601 format with extended calendar date (YYYY-MM-DD followed by nothing,
+    T or space) are parsed with datetime.fromisoformat and the rest of formats (or the ISO 8601 variants not supported by
+    the python version) fall back to dateutil.
+    The parsed timestamps are memoised as the ingestion parses the same values repeatedly
+    (validity periods, periods of the events, counters...)
+
+    :param timestamp: timestamp to parse
+    :type timestamp: str
+
+    :return: parsed timestamp
+    :rtype: datetime
+    """
+    if (isinstance(timestamp, str) and len(timestamp) >= 10 and timestamp[4] == "-" and timestamp[7] == "-" and
+        (len(timestamp) == 10 or timestamp[10] in "Tt ")):
+        try:
+            return datetime.datetime.fromisoformat(timestamp)
+        except ValueError:
+            pass
+        # end try
+    # end if
+
+    return parser.parse(timestamp)
@@ -0,0 +1,116 @@
+"""
+Registry of compiled XML schemas and configuration files
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import os
+import threading
+
+# Import xml parser
+from lxml import etree
+
+def _get_file_signature(path):
+    """
+    Method to obtain the signature of a file which changes when the file is modified or replaced
+
+    :param path: path to the file
+    :type path: str
+
+    :return: signature of the file (modification time, size and inode)
+    :rtype: tuple
+    """
+    stat = os.stat(path)
+
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+class XmlRegistry():
+    """
+    Registry keeping, per process, the compiled XML schemas and the parsed (and validated) configuration files.
+    Every entry is compiled only once and it is compiled again only when the signature of any of the files
+    it was obtained from changes
+    """
+
+    def __init__(self):
+        """
+        Class for registering compiled XML schemas and configuration files
+        """
+        self.schemas = {}
+        self.configurations = {}
+        self.lock = threading.Lock()
+
+        return
+
+    def get_schema(self, schema_path):
+        """
+        Method to obtain the compiled XML schema
+
+        :param schema_path: path to the XSD file
+        :type schema_path: str
+
+        :return: compiled schema
+        :rtype: etree.XMLSchema
+        """
+        signature = _get_file_signature(schema_path)
+        with self.lock:
+            entry = self.schemas.get(schema_path)
+            if entry != None and entry[0] == signature:
+                return entry[1]
+            # end if
+        # end with
+
+        schema = etree.XMLSchema(etree.parse(schema_path))
+        with self.lock:
+            self.schemas[schema_path] = (signature, schema)
+        # end with
+
+        return schema
+
+    def get_configuration(self, configuration_path, schema_path):
+        """
+        Method to obtain the XPath evaluator over a configuration file validated against its schema.
+        Configuration files which cannot be read or do not pass the schema are not registered
+
+        :param configuration_path: path to the XML configuration file
+        :type configuration_path: str
+        :param schema_path: path to the XSD file
+        :type schema_path: str
+
+        :return: XPath evaluator over the configuration
+        :rtype: etree.XPathEvaluator
+
+        :raises etree.XMLSyntaxError: if the configuration file cannot be read
+        :raises etree.DocumentInvalid: if the configuration file does not pass the schema
+        """
+        schema = self.get_schema(schema_path)
+        signature = (_get_file_signature(configuration_path), _get_file_signature(schema_path))
+        with self.lock:
+            entry = self.configurations.get((configuration_path, schema_path))
+            if entry != None and entry[0] == signature:
+                return entry[1]
+            # end if
+        # end with
+
+        configuration_xml = etree.parse(configuration_path)
+        schema.assertValid(configuration_xml)
+        configuration_xpath = etree.XPathEvaluator(configuration_xml)
+        with self.lock:
+            self.configurations[(configuration_path, schema_path)] = (signature, configuration_xpath)
+        # end with
+
+        return configuration_xpath
+
+    def clear(self):
+        """
+        Method to remove all the registered schemas and configuration files
+        """
+        with self.lock:
+            self.schemas.clear()
+            self.configurations.clear()
+        # end with
+
+        return
+
+xml_registry = XmlRegistry()
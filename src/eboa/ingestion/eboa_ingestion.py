@@ -21,6 +21,9 @@ import datetime
 # Import auxiliary functions
 from eboa.engine.functions import is_datetime, read_configuration
 
+# Import xml registry
+from eboa.engine.xml_registry import xml_registry
+
 # Import logging
 from eboa.logging import Log
 
@@ -29,6 +32,9 @@ import eboa.engine.engine as eboa_engine
 from eboa.engine.engine import Engine
 from eboa.engine.query import Query
 
+# Import json stream
+from eboa.engine.json_stream import encode_streamed_array
+
 logging_module = Log(name = os.path.basename(__file__))
 logger = logging_module.logger
 
@@ -46,7 +52,7 @@ def insert_data_into_DDBB(data, filename, engine, processing_duration):
 
     return returned_statuses
 
-def command_process_file(processor, file_path, reception_time, output_path = None, schema_path = None):
+def command_process_file(processor, file_path, reception_time, output_path = None, schema_path = None, stream = None):
 
     filename = os.path.basename(file_path)
 
@@ -93,8 +99,7 @@ def command_process_file(processor, file_path, reception_time, output_path = Non
             return returned_statuses
         # end if
     
-        parsed_schema = etree.parse(schema_path)
-        schema = etree.XMLSchema(parsed_schema)
+        schema = xml_registry.get_schema(schema_path)
 
         # Get XML content of file, raise error if file is not an XML or the XML has incorrect content
         try:
@@ -137,8 +142,12 @@ def command_process_file(processor, file_path, reception_time, output_path = Non
     # end if
     
     # Process file
+    # Without processor, the file is a json file with the operations to be inserted
+    processor_module = None
     try:
-        processor_module = import_module(processor)
+        if processor != None:
+            processor_module = import_module(processor)
+        # end if
     except ImportError as e:
         logger.error("The specified processor {} for processing the file {} does not exist. Returned error: {}".format(processor, file_path, str(e)))
         # Log status
@@ -165,11 +174,26 @@ def command_process_file(processor, file_path, reception_time, output_path = Non
     while number_of_retries <= max_number_of_retries:
         success = True
 
+        if processor_module == None:
+            # The events, annotations and explicit references are streamed from the file if requested (see Engine.parse_data_from_json)
+            returned_value = engine.parse_data_from_json(file_path, stream = stream)
+            if returned_value != None:
+                returned_statuses[0]["status"] = returned_value
+                engine.close_session()
+                query.close_session()
+
+                return returned_statuses
+            # end if
+            data = engine.data
+        # end if
+
         try:
-            start = datetime.datetime.now()
-            data = processor_module.process_file(file_path, engine, query, reception_time)
-            stop = datetime.datetime.now()
-            processing_duration = stop - start
+            if processor_module != None:
+                start = datetime.datetime.now()
+                data = processor_module.process_file(file_path, engine, query, reception_time)
+                stop = datetime.datetime.now()
+                processing_duration = stop - start
+            # end if
         except Exception as e:
             logger.error("The processing of the file {} has ended unexpectedly with the following error: {}".format(file_path, str(e)))
             logger.error(traceback.format_exc())
@@ -221,7 +245,7 @@ def command_process_file(processor, file_path, reception_time, output_path = Non
             # end try
         else:
             with open(output_path, "w") as write_file:
-                json.dump(data, write_file, indent=4)
+                json.dump(data, write_file, indent=4, default = encode_streamed_array)
         # end if
 
         if success:
@@ -270,9 +294,9 @@ def command_process_file(processor, file_path, reception_time, output_path = Non
     
     return returned_statuses
 
-def command_process_file_main(processor, file_path, reception_time, output_path = None, schema_path = None):
+def command_process_file_main(processor, file_path, reception_time, output_path = None, schema_path = None, stream = None):
 
-    returned_statuses = command_process_file(processor, file_path, reception_time, output_path, schema_path)
+    returned_statuses = command_process_file(processor, file_path, reception_time, output_path, schema_path, stream)
 
     failures = [returned_status for returned_status in returned_statuses if not returned_status["status"] in [eboa_engine.exit_codes["OK"]["status"], eboa_engine.exit_codes["SOURCE_ALREADY_INGESTED"]["status"]]]
     if len(failures) > 0:
@@ -281,14 +305,14 @@ def command_process_file_main(processor, file_path, reception_time, output_path
 
     return 0
 
-def main(file_path, processor, output_path = None, reception_time = None, schema_path = None):
+def main(file_path, processor, output_path = None, reception_time = None, schema_path = None, stream = None):
         
-    return command_process_file_main(processor, file_path, reception_time, output_path, schema_path)
+    return command_process_file_main(processor, file_path, reception_time, output_path, schema_path, stream)
 
 if __name__ == "__main__":
     args_parser = argparse.ArgumentParser(description="Process NPPFs.")
     args_parser.add_argument("-p", dest="processor", type=str, nargs=1,
-                             help="processor module", required=True)
+                             help="processor module (if not specified, the file is a json file with the operations to be inserted)", required=False)
     args_parser.add_argument("-f", dest="file_path", type=str, nargs=1,
                              help="path to the file to process", required=True)
     args_parser.add_argument("-s", dest="schema_path", type=str, nargs=1,
@@ -297,11 +321,21 @@ if __name__ == "__main__":
                              help="reception time of the file", required=False)
     args_parser.add_argument("-o", dest="output_path", type=str, nargs=1,
                              help="path to the output file", required=False)
+    args_parser.add_argument("-j", dest="stream", action="store_true",
+                             help="stream the events, annotations and explicit references of the json file instead of loading them in memory (only without processor, by default the value of JSON_STREAM in the configuration is used)", required=False)
     args = args_parser.parse_args()
 
     file_path = args.file_path[0]
 
-    processor = args.processor[0]
+    processor = None
+    if args.processor != None:
+        processor = args.processor[0]
+    # end if
+
+    stream = None
+    if args.stream:
+        stream = True
+    # end if
 
     # Path to the schema if specified
     schema_path = None
@@ -320,7 +354,7 @@ if __name__ == "__main__":
         reception_time = parser.parse(args.reception_time[0]).isoformat()
     # end if
     
-    returned_value = main(file_path, processor, output_path, reception_time, schema_path)
+    returned_value = main(file_path, processor, output_path, reception_time, schema_path, stream)
 
     exit(returned_value)
     
@@ -0,0 +1,320 @@
+"""
+Cache of the positions of the satellites in the Earth fixed frame used for the generation of footprints in the EBOA component
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import os
+import time
+import glob
+import hashlib
+import threading
+import tempfile
+from collections import OrderedDict
+
+# Import numpy
+import numpy as np
+
+# Import auxiliary functions
+from eboa.engine.functions import read_configuration
+
+# Import logging
+from eboa.logging import Log
+
+logging = Log(name = __name__)
+logger = logging.logger
+
+config = read_configuration()
+
+# Elements of the orbit identifying the propagation of a satellite (the rest of attributes change with each propagation)
+orbit_elements = ["satnum", "epochyr", "epochdays", "jdsatepoch", "jdsatepochF", "ndot", "nddot", "bstar",
+                  "inclo", "nodeo", "ecco", "argpo", "mo", "no_kozai", "operationmode"]
+
+def get_orbit_key(satellite_orbit):
+    """
+    Method to obtain the hash identifying the orbit of a satellite
+
+    :param satellite_orbit: object defining the orbit of the satellite
+    :type satellite_orbit: orbit object
+
+    :return: hash of the elements of the orbit
+    :rtype: str
+    """
+    elements = [repr(getattr(satellite_orbit, element, None)) for element in orbit_elements]
+
+    return hashlib.sha1(",".join(elements).encode()).hexdigest()
+
+# Structure of the blocks of positions (sorted by epoch in microseconds since 1970-01-01)
+block_dtype = np.dtype([("epoch", np.int64), ("position", np.float64, (3,))])
+
+class EphemerisCache():
+    """
+    Cache with time to live of the positions of the satellites in the Earth fixed frame.
+    The positions are stored with their exact epochs, so the cache never changes the positions served.
+    The epochs are split in blocks by time (block_points intervals) identified by the orbit of the satellite,
+    the interval of the epoch grid and the position of the block, so that storing new positions only rewrites the blocks containing them.
+    The blocks are kept in memory (LRU) and, if a path is configured, in memory mapped files shared by the processes
+    """
+
+    def __init__(self, path = None, max_entries = 100, max_size = 104857600, ttl = 3600, block_points = 1024, aligned_epochs = False):
+        """
+        Class for caching positions of the satellites
+
+        :param path: directory where to store the blocks (None or empty disables the cache on disk)
+        :type path: str
+        :param max_entries: maximum number of blocks to keep in memory
+        :type max_entries: int
+        :param max_size: maximum number of bytes of the blocks stored on disk
+        :type max_size: int
+        :param ttl: number of seconds a block is kept in the cache (0 disables the cache)
+        :type ttl: float
+        :param block_points: number of intervals covered by every block (and maximum number of positions kept by the block)
+        :type block_points: int
+        :param aligned_epochs: flag to request the footprints on epochs aligned to 1970-01-01T00:00:00 (see eboa.ingestion.swath.get_footprint)
+        :type aligned_epochs: bool
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.ttl = ttl
+        self.block_points = block_points
+        self.aligned_epochs = aligned_epochs
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+        return
+
+    def _get_block_path(self, key):
+        return os.path.join(self.path, "{}_{}_{}.npy".format(key[0], key[1], key[2]))
+
+    def _load(self, key):
+        """
+        Method to obtain the block associated to the key from memory or from disk
+
+        :param key: (orbit key, interval of the grid in microseconds, position of the block)
+        :type key: tuple
+
+        :return: block of positions or None if it is not cached
+        :rtype: numpy.ndarray
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry != None:
+                if entry[0] < time.monotonic():
+                    del self.entries[key]
+                else:
+                    self.entries.move_to_end(key)
+                    return entry[1]
+                # end if
+            # end if
+        # end with
+
+        if not self.path:
+            return None
+        # end if
+
+        block_path = self._get_block_path(key)
+        try:
+            if os.path.getmtime(block_path) + self.ttl < time.time():
+                return None
+            # end if
+            block = np.load(block_path, mmap_mode = "r")
+        except (OSError, ValueError):
+            return None
+        # end try
+        if block.dtype != block_dtype:
+            return None
+        # end if
+
+        self._store_in_memory(key, block)
+
+        return block
+
+    def _store_in_memory(self, key, block):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, block)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last = False)
+            # end while
+        # end with
+
+        return
+
+    def _get_block_indexes(self, interval, epochs):
+        """
+        Method to obtain the blocks of the epochs
+
+        :param interval: interval of the epoch grid in seconds
+        :type interval: float
+        :param epochs: epochs in microseconds since 1970-01-01
+        :type epochs: numpy.ndarray
+
+        :return: (interval in microseconds, epochs, positions of the blocks)
+        :rtype: tuple
+        """
+        interval_microseconds = int(round(interval * 1e6))
+        epochs = np.asarray(epochs, dtype=np.int64)
+
+        return interval_microseconds, epochs, epochs // (max(interval_microseconds, 1) * self.block_points)
+
+    def get(self, satellite_orbit, interval, epochs):
+        """
+        Method to obtain the cached positions of the satellite for the received epochs
+
+        :param satellite_orbit: object defining the orbit of the satellite
+        :type satellite_orbit: orbit object
+        :param interval: interval of the epoch grid in seconds
+        :type interval: float
+        :param epochs: epochs in microseconds since 1970-01-01
+        :type epochs: numpy.ndarray
+
+        :return: (positions, found) tuple with the positions of the satellite (shape (n, 3)) and the mask of the epochs found in the cache
+        :rtype: tuple of numpy.ndarray
+        """
+        positions = np.empty((len(epochs), 3))
+        found = np.zeros(len(epochs), dtype=bool)
+        if self.ttl <= 0 or len(epochs) == 0:
+            return positions, found
+        # end if
+
+        orbit_key = get_orbit_key(satellite_orbit)
+        interval_microseconds, epochs, block_indexes = self._get_block_indexes(interval, epochs)
+        for block_index in np.unique(block_indexes):
+            block = self._load((orbit_key, interval_microseconds, int(block_index)))
+            if block is None or len(block) == 0:
+                continue
+            # end if
+            selection = np.flatnonzero(block_indexes == block_index)
+            indexes = np.minimum(np.searchsorted(block["epoch"], epochs[selection]), len(block) - 1)
+            cached = block["epoch"][indexes] == epochs[selection]
+            positions[selection[cached]] = block["position"][indexes[cached]]
+            found[selection[cached]] = True
+        # end for
+
+        return positions, found
+
+    def put(self, satellite_orbit, interval, epochs, positions):
+        """
+        Method to cache positions of the satellite.
+        Only the blocks containing the epochs are rewritten. A block exceeding block_points positions
+        (epochs of periods with different starts) is replaced by the new positions
+
+        :param satellite_orbit: object defining the orbit of the satellite
+        :type satellite_orbit: orbit object
+        :param interval: interval of the epoch grid in seconds
+        :type interval: float
+        :param epochs: epochs in microseconds since 1970-01-01
+        :type epochs: numpy.ndarray
+        :param positions: positions of the satellite in the Earth fixed frame (shape (n, 3))
+        :type positions: numpy.ndarray
+        """
+        if self.ttl <= 0 or len(epochs) == 0:
+            return
+        # end if
+
+        orbit_key = get_orbit_key(satellite_orbit)
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        interval_microseconds, epochs, block_indexes = self._get_block_indexes(interval, epochs)
+        stored_blocks = False
+        for block_index in np.unique(block_indexes):
+            key = (orbit_key, interval_microseconds, int(block_index))
+            selection = np.flatnonzero(block_indexes == block_index)
+            new_block = np.empty(len(selection), dtype=block_dtype)
+            new_block["epoch"] = epochs[selection]
+            new_block["position"] = positions[selection]
+
+            block = self._load(key)
+            if block is not None:
+                # The new positions go first to be kept by unique
+                merged_block = np.concatenate((new_block, block))
+                if len(np.unique(merged_block["epoch"])) <= self.block_points:
+                    new_block = merged_block
+                # end if
+            # end if
+            block = new_block[np.unique(new_block["epoch"], return_index = True)[1]]
+
+            self._store_in_memory(key, block)
+
+            if self.path:
+                try:
+                    os.makedirs(self.path, exist_ok = True)
+                    # Write to a temporary file and rename it so that the processes reading the block never see it incomplete
+                    file_descriptor, temporary_path = tempfile.mkstemp(dir = self.path, suffix = ".tmp")
+                    with os.fdopen(file_descriptor, "wb") as temporary_file:
+                        np.save(temporary_file, block)
+                    # end with
+                    os.replace(temporary_path, self._get_block_path(key))
+                    stored_blocks = True
+                except OSError as e:
+                    logger.warning("The positions of the satellite could not be stored in the cache {} due to: {}".format(self.path, e))
+                # end try
+            # end if
+        # end for
+
+        if stored_blocks:
+            self.evict()
+        # end if
+
+        return
+
+    def evict(self):
+        """
+        Method to remove the blocks stored on disk exceeding the time to live and,
+        while the size of the stored blocks exceeds the maximum size, the least recently modified ones
+
+        :return: paths of the removed blocks
+        :rtype: list
+        """
+        removed_blocks = []
+        if not self.path:
+            return removed_blocks
+        # end if
+
+        blocks = []
+        for block_path in glob.glob(os.path.join(self.path, "*.npy")):
+            try:
+                status = os.stat(block_path)
+            except OSError:
+                continue
+            # end try
+            blocks.append((status.st_mtime, status.st_size, block_path))
+        # end for
+        blocks.sort()
+
+        size = sum([block[1] for block in blocks])
+        now = time.time()
+        for modification_time, block_size, block_path in blocks:
+            if modification_time + self.ttl >= now and size <= self.max_size:
+                break
+            # end if
+            try:
+                os.remove(block_path)
+            except OSError:
+                continue
+            # end try
+            size -= block_size
+            removed_blocks.append(block_path)
+        # end for
+
+        return removed_blocks
+
+    def invalidate(self):
+        """
+        Method to remove all the cached positions kept in memory
+        """
+        with self.lock:
+            self.entries.clear()
+        # end with
+
+        return
+
+ephemeris_cache_config = config.get("EPHEMERIS_CACHE") or {}
+ephemeris_cache = EphemerisCache(path = ephemeris_cache_config.get("PATH"),
+                                 max_entries = ephemeris_cache_config.get("MAX_ENTRIES", 100),
+                                 max_size = ephemeris_cache_config.get("MAX_SIZE", 104857600),
+                                 ttl = ephemeris_cache_config.get("TTL", 3600),
+                                 block_points = ephemeris_cache_config.get("BLOCK_POINTS", 1024),
+                                 aligned_epochs = ephemeris_cache_config.get("ALIGNED_EPOCHS", False))
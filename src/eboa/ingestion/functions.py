@@ -13,6 +13,12 @@ from lxml import etree, objectify
 # Import LeapSeconds
 from astropy.utils.iers import LeapSeconds
 
+# Import columnar timelines
+from eboa.ingestion.timeline import get_intersection_indexes
+
+# Import timestamps parsing
+from eboa.engine.timestamps import parse_timestamp
+
 ###########
 # Functions for controling the ingestion
 ###########
@@ -38,14 +44,19 @@ def insert_event_for_ingestion(event, source, list_of_events):
     :param list_of_events: list of events
     :type parent: list
     """
+    event_start = parse_timestamp(event["start"])
+    event_stop = parse_timestamp(event["stop"])
+    validity_start = parse_timestamp(source["validity_start"])
+    validity_stop = parse_timestamp(source["validity_stop"])
+
     # Discard events that are not inside the validity period
-    if parser.parse(event["start"]) >= parser.parse(source["validity_stop"]) or parser.parse(event["stop"]) <= parser.parse(source["validity_start"]):
+    if event_start >= validity_stop or event_stop <= validity_start:
         return
-    elif parser.parse(event["start"]) < parser.parse(source["validity_start"]) and parser.parse(event["stop"]) <= parser.parse(source["validity_stop"]) and parser.parse(event["stop"]) > parser.parse(source["validity_start"]):
+    elif event_start < validity_start and event_stop <= validity_stop and event_stop > validity_start:
         event["start"] = source["validity_start"]
-    elif parser.parse(event["stop"]) > parser.parse(source["validity_stop"]) and parser.parse(event["start"]) < parser.parse(source["validity_stop"]) and parser.parse(event["start"]) >= parser.parse(source["validity_start"]):
+    elif event_stop > validity_stop and event_start < validity_stop and event_start >= validity_start:
         event["stop"] = source["validity_stop"]
-    elif parser.parse(event["start"]) < parser.parse(source["validity_start"]) and parser.parse(event["stop"]) > parser.parse(source["validity_stop"]):
+    elif event_start < validity_start and event_stop > validity_stop:
         event["start"] = source["validity_start"]
         event["stop"] = source["validity_stop"]
     # end if
@@ -148,28 +159,41 @@ def intersect_timelines (timeline1, timeline2):
     """
     Method to obtain the segments from timeline1 intersecting with timeline2
     PRE: the segments of the timelines are ordered in time (by the start value)
-    """
+
+    The intersecting pairs are obtained with the columnar timelines (see eboa.ingestion.timeline)
+    and the result keeps the order of the segments in timeline1 and then in timeline2
+    """
+    try:
+        indexes1, indexes2 = get_intersection_indexes([segment["start"] for segment in timeline1],
+                                                      [segment["stop"] for segment in timeline1],
+                                                      [segment["start"] for segment in timeline2],
+                                                      [segment["stop"] for segment in timeline2])
+        intersecting_segments = zip(indexes1.tolist(), indexes2.tolist())
+    except (TypeError, AttributeError):
+        # Values which are not datetimes are compared segment by segment
+        intersecting_segments = [(i1, i2) for i1, segment1 in enumerate(timeline1) for i2, segment2 in enumerate(timeline2)
+                                 if segment1["stop"] > segment2["start"] and segment1["start"] < segment2["stop"]]
+    # end try
+
     timeline = []
-    for segment1 in timeline1:
-        for segment2 in timeline2:
-            if segment1["stop"] > segment2["start"] and segment1["start"] < segment2["stop"]:
-                start = segment2["start"]
-                if segment1["start"] > segment2["start"]:
-                    start = segment1["start"]
-                # end if
-                stop = segment2["stop"]
-                if segment1["stop"] < segment2["stop"]:
-                    stop = segment1["stop"]
-                # end if
-                timeline.append({
-                    "id": str(segment1["id"]) + "#" + str(segment2["id"]),
-                    "id1": segment1["id"],
-                    "id2": segment2["id"],
-                    "start": start,
-                    "stop": stop
-                })
-            # end if
-        # end for
+    for i1, i2 in intersecting_segments:
+        segment1 = timeline1[i1]
+        segment2 = timeline2[i2]
+        start = segment2["start"]
+        if segment1["start"] > segment2["start"]:
+            start = segment1["start"]
+        # end if
+        stop = segment2["stop"]
+        if segment1["stop"] < segment2["stop"]:
+            stop = segment1["stop"]
+        # end if
+        timeline.append({
+            "id": str(segment1["id"]) + "#" + str(segment2["id"]),
+            "id1": segment1["id"],
+            "id2": segment2["id"],
+            "start": start,
+            "stop": stop
+        })
     # end for
     return timeline
 # end def
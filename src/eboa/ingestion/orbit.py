@@ -8,6 +8,7 @@ module eboa
 # Import python utilities
 from dateutil import parser
 import datetime
+import numpy as np
 from lxml import etree, objectify
 import re
 import math
@@ -100,6 +101,28 @@ def get_ephemeris(satellite_orbit, time):
 
     return satellite_orbit.sgp4(jd, fr)
 
+def get_ephemerides(satellite_orbit, times):
+    '''
+    Function to obtain the ephemerides of a satellite at the specified times propagating all of them in one call.
+    The times are considered with the same precision as get_ephemeris (seconds)
+
+    :param satellite_orbit: object defining the orbit of the satellite
+    :type satellite_orbit: orbit object
+    :param times: times of interest
+    :type times: list of datetimes
+
+    :return: (errors, positions, velocities) tuple corresponding to the ephemerides of the satellite in TEME system reference frame (positions and velocities with shape (n, 3))
+    :rtype: tuple of numpy.ndarray
+    '''
+
+    julian_dates = [jday(time.year, time.month, time.day,
+                         time.hour, time.minute,
+                         time.second) for time in times]
+    jd = np.array([julian_date[0] for julian_date in julian_dates], dtype=float)
+    fr = np.array([julian_date[1] for julian_date in julian_dates], dtype=float)
+
+    return satellite_orbit.sgp4_array(jd, fr)
+
 def get_orbit_duration(tle_string):
     """
     Method to obtain the orbit duration from a tle
@@ -190,22 +213,15 @@ def satellite_positions_to_fixed(inertial_satellite_positions, epochs):
     :rtype: list
     '''
 
-    # Obtain satellite positions referenced in the Earth fixed frame
-    satellite_positions = []
-    i = 0
-    j = 0
-    while i < len(inertial_satellite_positions):
-        time = Time(epochs[j], format="isot", scale="utc")
-        inertial_satellite_position = SkyCoord(x=inertial_satellite_positions[i], y=inertial_satellite_positions[i+1], z=inertial_satellite_positions[i+2], frame="teme", unit=("km", "km", "km"), representation_type="cartesian", obstime=time)
-        fixed_satellite_position = inertial_satellite_position.transform_to(ITRS())
-
-        # Store X, Y, Z values referenced in the Earth fixed frame
-        satellite_positions.append(fixed_satellite_position.earth_location.x.value)
-        satellite_positions.append(fixed_satellite_position.earth_location.y.value)
-        satellite_positions.append(fixed_satellite_position.earth_location.z.value)
-        i += 3
-        j += 1
-    # end while
+    # Obtain satellite positions referenced in the Earth fixed frame transforming all the epochs at once
+    positions = np.array(inertial_satellite_positions, dtype=float).reshape(-1, 3)
+    time = Time(list(epochs), format="isot", scale="utc")
+    inertial_coordinates = SkyCoord(x=positions[:, 0], y=positions[:, 1], z=positions[:, 2], frame="teme", unit=("km", "km", "km"), representation_type="cartesian", obstime=time)
+    fixed_satellite_positions = inertial_coordinates.transform_to(ITRS()).earth_location
 
-    return satellite_positions
+    # Store X, Y, Z values referenced in the Earth fixed frame
+    satellite_positions = np.column_stack((fixed_satellite_positions.x.value,
+                                           fixed_satellite_positions.y.value,
+                                           fixed_satellite_positions.z.value)).ravel().tolist()
 
+    return satellite_positions
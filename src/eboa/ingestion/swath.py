@@ -8,12 +8,15 @@ module eboa
 # Import python utilities
 import numpy as np
 import math
+import os
 from dateutil import parser
 import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 # Import astropy utilities
 from astropy.coordinates import SkyCoord, ITRS
 from astropy.time import Time
+from astropy.utils import iers
 
 # Import eboa vector
 import eboa.ingestion.vector as eboa_vector
@@ -21,6 +24,12 @@ import eboa.ingestion.vector as eboa_vector
 # Import eboa orbit
 import eboa.ingestion.orbit as eboa_orbit
 
+# Import cache of the positions of the satellites
+from eboa.ingestion.ephemeris_cache import ephemeris_cache
+
+# Import columnar timelines
+from eboa.ingestion.timeline import to_datetime64
+
 # Import eboa utilities
 from eboa.engine.errors import InputError
 
@@ -62,6 +71,15 @@ def get_footprint(start, stop, alpha, tle_string = None, semimajor = None, satel
     :type pitch: float
     :param yaw: yaw angle of the attitude of the satellite
     :type yaw: float
+    :param interval: interval in seconds between the positions of the satellite
+    :type interval: float
+
+    The positions are taken at start + j * interval and stop, with the interval stretched to fit in max_points,
+    and the cache of positions serves exactly those epochs, so the coordinates do not depend on the cache.
+    Only if EPHEMERIS_CACHE.ALIGNED_EPOCHS is enabled (and the cache too) the positions are taken on a grid aligned
+    to 1970-01-01T00:00:00 (see get_grid_times) with the interval doubled until the period fits in max_points,
+    so that overlapping periods with different starts reuse the cached positions. The coordinates then have a vertex at start,
+    at every epoch of the grid inside the period and at stop
 
     :return: satellite track and footprint coordinates with the following format
     coordinates = {
@@ -78,7 +96,12 @@ def get_footprint(start, stop, alpha, tle_string = None, semimajor = None, satel
     corrected_stop = corrected_stop_datetime.isoformat(timespec="microseconds")
 
     duration = (corrected_stop_datetime - corrected_start_datetime).total_seconds()
-    if (duration / interval) > max_points:
+    if ephemeris_cache.ttl > 0 and ephemeris_cache.aligned_epochs:
+        # Keep the epochs on the grid of the cache doubling the interval instead of stretching it
+        while (duration / interval) > max_points:
+            interval = interval * 2
+        # end while
+    elif (duration / interval) > max_points:
         interval = duration / max_points
     # end if
     
@@ -98,36 +121,215 @@ def get_footprint(start, stop, alpha, tle_string = None, semimajor = None, satel
         satellite_orbit = eboa_orbit.get_orbit(tle_string)
     # end if
 
-    # Obtain the satellite position during the period
-    time = corrected_start
-    j = 0
-    inertial_satellite_positions = []
-    epochs = []
-    while time < corrected_stop:
-        time = (parser.parse(corrected_start) + datetime.timedelta(seconds=j*interval)).replace(tzinfo=None).isoformat(timespec="microseconds")
-        if time > corrected_stop:
-            time = corrected_stop
-        # end if
-        # Get position of the satellite associated to time in the Earth inertial frame
-        error, position, velocity = eboa_orbit.get_ephemeris(satellite_orbit, time)
-
-        # Register position
-        inertial_satellite_positions.append(position[0])
-        inertial_satellite_positions.append(position[1])
-        inertial_satellite_positions.append(position[2])
-        epochs.append(time)
-        
-        j += 1
-    # end while
+    # Obtain the epochs of the satellite positions during the period
+    if ephemeris_cache.ttl > 0 and ephemeris_cache.aligned_epochs:
+        times = get_grid_times(corrected_start_datetime, corrected_stop_datetime, interval)
+        epochs = [time_datetime.isoformat(timespec="microseconds") for time_datetime in times]
+    else:
+        time = corrected_start
+        j = 0
+        times = []
+        epochs = []
+        while time < corrected_stop:
+            time_datetime = corrected_start_datetime + datetime.timedelta(seconds=j*interval)
+            time = time_datetime.isoformat(timespec="microseconds")
+            if time > corrected_stop:
+                time_datetime = corrected_stop_datetime
+                time = corrected_stop
+            # end if
+            times.append(time_datetime)
+            epochs.append(time)
+
+            j += 1
+        # end while
+    # end if
 
-    # Transform satellite positions to the Earth fixed frame
-    satellite_positions = eboa_orbit.satellite_positions_to_fixed(inertial_satellite_positions, epochs)
+    # Get positions of the satellite associated to the epochs in the Earth fixed frame
+    satellite_positions = get_fixed_satellite_positions(satellite_orbit, times, epochs, interval)
     
     # Get swath
     swath = get_satellite_swath(satellite_positions, alpha, roll, pitch, yaw, semimajor)
 
     return swath
 
+def get_footprints(requests, tle_string = None, semimajor = None, satellite_orbit = None, interval=30, processes = None):
+    '''
+    Function to obtain the footprints of the instrument of the satellite for several periods distributing them across a pool of processes.
+    The footprints are the same as the ones obtained calling get_footprint for every request.
+    The orbit of the satellite and the Earth orientation data are loaded once and shared with the processes.
+    When only satellite_orbit is received, the orbit can only be shared with processes started by fork (the objects of the orbits cannot be pickled)
+
+    :param requests: list of tuples (start, stop, alpha, roll, pitch, yaw) with the parameters of every footprint (see get_footprint)
+    :type requests: list of tuples
+    :param tle_string: TLE of the satellite (see get_footprint)
+    :type tle_string: str
+    :param semimajor: semimajor axis of the orbit of the satellite
+    :type semimajor: float
+    :param satellite_orbit: object defining the orbit of the satellite
+    :type satellite_orbit: orbit object
+    :param interval: interval in seconds between the positions of the satellite
+    :type interval: float
+    :param processes: maximum number of processes (default None, the number of CPUs is used)
+    :type processes: int
+
+    :return: list of satellite track and footprint coordinates (see get_footprint) in the order of the requests
+    :rtype: list of dicts
+    '''
+
+    # Check parameters are complete
+    if tle_string == None and satellite_orbit == None:
+        raise InputError("tle_string or satellite_orbit parameters should be defined")
+    # end if
+    if tle_string == None and semimajor == None:
+        raise InputError("tle_string or semimajor parameters should be defined")
+    elif tle_string != None:
+        # Obtain semimajor from TLE
+        semimajor = eboa_orbit.get_semimajor(tle_string)
+    # end if
+
+    if processes == None:
+        processes = os.cpu_count() or 1
+    # end if
+    processes = min(processes, len(requests))
+
+    if processes <= 1:
+        if satellite_orbit == None:
+            satellite_orbit = eboa_orbit.get_orbit(tle_string)
+        # end if
+        return [get_footprint(start, stop, alpha, semimajor = semimajor, satellite_orbit = satellite_orbit, roll = roll, pitch = pitch, yaw = yaw, interval = interval) for start, stop, alpha, roll, pitch, yaw in requests]
+    # end if
+
+    # The orbit is built again by the processes from the TLE to avoid pickling it
+    if tle_string != None:
+        satellite_orbit = None
+    # end if
+
+    # Load the Earth orientation data before starting the processes so that it is not loaded by each of them
+    earth_orientation_table = iers.earth_orientation_table.get()
+
+    with ProcessPoolExecutor(max_workers = processes, initializer = initialize_footprints_process,
+                             initargs = (tle_string, satellite_orbit, semimajor, interval, earth_orientation_table)) as executor:
+        footprints = list(executor.map(get_footprint_in_process, requests, chunksize = max(1, len(requests) // (processes * 4))))
+    # end with
+
+    return footprints
+
+# Context of the processes obtaining footprints (see get_footprints)
+footprints_process_context = {}
+
+def initialize_footprints_process(tle_string, satellite_orbit, semimajor, interval, earth_orientation_table):
+    '''
+    Function to initialize the context of a process obtaining footprints
+
+    :param tle_string: TLE of the satellite
+    :type tle_string: str
+    :param satellite_orbit: object defining the orbit of the satellite (used if tle_string is not defined)
+    :type satellite_orbit: orbit object
+    :param semimajor: semimajor axis of the orbit of the satellite
+    :type semimajor: float
+    :param interval: interval in seconds between the positions of the satellite
+    :type interval: float
+    :param earth_orientation_table: Earth orientation data used for the transformations to the Earth fixed frame
+    :type earth_orientation_table: astropy.utils.iers.IERS
+    '''
+
+    if tle_string != None:
+        satellite_orbit = eboa_orbit.get_orbit(tle_string)
+    # end if
+    iers.earth_orientation_table.set(earth_orientation_table)
+
+    footprints_process_context["satellite_orbit"] = satellite_orbit
+    footprints_process_context["semimajor"] = semimajor
+    footprints_process_context["interval"] = interval
+
+    return
+
+def get_footprint_in_process(request):
+    '''
+    Function to obtain the footprint associated to a request inside a process initialized by initialize_footprints_process
+
+    :param request: tuple (start, stop, alpha, roll, pitch, yaw) with the parameters of the footprint (see get_footprint)
+    :type request: tuple
+
+    :return: satellite track and footprint coordinates (see get_footprint)
+    :rtype: dict
+    '''
+    start, stop, alpha, roll, pitch, yaw = request
+
+    return get_footprint(start, stop, alpha, semimajor = footprints_process_context["semimajor"],
+                         satellite_orbit = footprints_process_context["satellite_orbit"],
+                         roll = roll, pitch = pitch, yaw = yaw, interval = footprints_process_context["interval"])
+
+def get_grid_times(start, stop, interval):
+    '''
+    Function to obtain the epochs of a period on the grid of epochs which are multiples
+    of the interval since 1970-01-01T00:00:00, so that the epochs do not depend on the start of the period
+
+    :param start: start of the period
+    :type start: datetime
+    :param stop: stop of the period
+    :type stop: datetime
+    :param interval: interval of the epoch grid in seconds
+    :type interval: float
+
+    :return: start, epochs of the grid inside the period and stop (empty if start is not before stop)
+    :rtype: list of datetimes
+    '''
+    if start >= stop:
+        return []
+    # end if
+
+    origin = datetime.datetime(1970, 1, 1)
+    interval_microseconds = int(round(interval * 1e6))
+    start_microseconds = (start - origin) // datetime.timedelta(microseconds = 1)
+    stop_microseconds = (stop - origin) // datetime.timedelta(microseconds = 1)
+
+    times = [start]
+    slot = start_microseconds // interval_microseconds + 1
+    while slot * interval_microseconds < stop_microseconds:
+        times.append(origin + datetime.timedelta(microseconds = slot * interval_microseconds))
+        slot += 1
+    # end while
+    times.append(stop)
+
+    return times
+
+def get_fixed_satellite_positions(satellite_orbit, times, epochs, interval):
+    '''
+    Function to obtain the positions of the satellite in the Earth fixed frame for the received epochs.
+    The positions already calculated for the orbit and the interval of the epoch grid are obtained from the cache
+    and only the missing epochs are propagated and transformed (only the epochs on the grid are cached)
+
+    :param satellite_orbit: object defining the orbit of the satellite
+    :type satellite_orbit: orbit object
+    :param times: epochs of the positions
+    :type times: list of datetimes
+    :param epochs: epochs of the positions in ISO 8601 format
+    :type epochs: list of str
+    :param interval: interval of the epoch grid in seconds
+    :type interval: float
+
+    :return: satellite positions in the Earth fixed frame with the format [x1, y1, z1, ..., xn, yn, zn]
+    :rtype: list
+    '''
+
+    epochs_microseconds = to_datetime64(times).astype(np.int64)
+    positions, found = ephemeris_cache.get(satellite_orbit, interval, epochs_microseconds)
+
+    missing_indexes = np.flatnonzero(~found)
+    if len(missing_indexes) > 0:
+        # Get positions of the satellite associated to the missing epochs in the Earth inertial frame
+        errors, inertial_positions, velocities = eboa_orbit.get_ephemerides(satellite_orbit, [times[i] for i in missing_indexes])
+
+        # Transform satellite positions to the Earth fixed frame
+        fixed_positions = eboa_orbit.satellite_positions_to_fixed(inertial_positions.ravel().tolist(), [epochs[i] for i in missing_indexes])
+        positions[missing_indexes] = np.array(fixed_positions).reshape(-1, 3)
+
+        ephemeris_cache.put(satellite_orbit, interval, epochs_microseconds[missing_indexes], positions[missing_indexes])
+    # end if
+
+    return positions.ravel().tolist()
+
 def get_satellite_swath(satellite_positions, alpha, roll, pitch, yaw, semimajor):
     '''
     Function to obtain the satellite footprint coordinates with the following format:
@@ -188,83 +390,54 @@ def get_satellite_swath(satellite_positions, alpha, roll, pitch, yaw, semimajor)
     roll_b2 = 180-roll_a2_degrees-roll
     roll_b3 = 180-roll_a3_degrees-roll-alpha
     
-    i = 0
-    satellite_coordinates = []
-    right_coordinates = []
-    left_coordinates = []
-    while i < len(satellite_positions):
-        # Get X, Y and Z position of the satellite
-        satellite_x = satellite_positions[i]
-        satellite_y = satellite_positions[i+1]
-        satellite_z = satellite_positions[i+2]
-
-        satellite_position = SkyCoord(x=satellite_x, y=satellite_y, z=satellite_z, frame='itrs', unit=("km", "km", "km"), representation_type="cartesian")
-        latitude = satellite_position.earth_location.lat.value
-        longitude = satellite_position.earth_location.lon.value
-        satellite_projection = SkyCoord(lat=latitude, lon=longitude, distance=earth_radius, frame='itrs', unit=("deg", "deg", "km"), representation_type="spherical")
-
-        satellite_projection_x = satellite_projection.earth_location.x.value
-        satellite_projection_y = satellite_projection.earth_location.y.value
-        satellite_projection_z = satellite_projection.earth_location.z.value
-
-        satellite_coordinates.append("{} {}".format(satellite_projection.earth_location.lon.value, satellite_projection.earth_location.lat.value))
-
-        i += 3
-
-        # Set the positions in the array of the sibling satellite position
-        x_position_sibling = i
-        y_position_sibling = i+1
-        z_position_sibling = i+2
-        rotation_axis_sign = 1
-        if i >= len(satellite_positions):
-            x_position_sibling = i-6
-            y_position_sibling = i-5
-            z_position_sibling = i-4
-            rotation_axis_sign = -1
-        # end if
+    # Get X, Y and Z position of the satellite
+    satellite_positions = np.array(satellite_positions, dtype=float).reshape(-1, 3)
+    number_of_positions = len(satellite_positions)
 
-        # Get X, Y and Z position for the following set
-        satellite_sibling_x = satellite_positions[x_position_sibling]
-        satellite_sibling_y = satellite_positions[y_position_sibling]
-        satellite_sibling_z = satellite_positions[z_position_sibling]
+    satellite_locations = SkyCoord(x=satellite_positions[:, 0], y=satellite_positions[:, 1], z=satellite_positions[:, 2], frame='itrs', unit=("km", "km", "km"), representation_type="cartesian").earth_location
+    satellite_projections = SkyCoord(lat=satellite_locations.lat.value, lon=satellite_locations.lon.value, distance=np.full(number_of_positions, earth_radius), frame='itrs', unit=("deg", "deg", "km"), representation_type="spherical").earth_location
 
-        # Get perpendicular vector to satellite positions
-        axis_pitch = np.cross([satellite_x, satellite_y, satellite_z], [satellite_sibling_x, satellite_sibling_y, satellite_sibling_z])*rotation_axis_sign
+    satellite_projection_positions = np.column_stack((satellite_projections.x.value, satellite_projections.y.value, satellite_projections.z.value))
 
-        # Define rotations for pitch
-        if pitch != 0:
-            axis_pitch_unit = axis_pitch / np.linalg.norm(axis_pitch)
-            rotation_pitch_b = eboa_vector.define_rotation_axis([axis_pitch_unit[0], axis_pitch_unit[1], axis_pitch_unit[2]], pitch_b_degrees)
+    satellite_coordinates = ["{} {}".format(longitude, latitude) for longitude, latitude in zip(satellite_projections.lon.value.tolist(), satellite_projections.lat.value.tolist())]
 
-            satellite_projection_pitch_b = rotation_pitch_b.apply([satellite_projection_x, satellite_projection_y, satellite_projection_z])
+    # Set the positions of the sibling satellite positions (the following one or the previous one for the last position)
+    sibling_indexes = np.arange(1, number_of_positions + 1)
+    sibling_indexes[-1] = max(number_of_positions - 2, 0)
+    rotation_axis_signs = np.ones(number_of_positions)
+    rotation_axis_signs[-1] = -1
 
-            axis_roll = np.cross([satellite_projection_pitch_b[0], satellite_projection_pitch_b[1], satellite_projection_pitch_b[2]], [axis_pitch[0], axis_pitch[1], axis_pitch[2]])
-        else:
-            satellite_projection_pitch_b = [satellite_projection_x, satellite_projection_y, satellite_projection_z]
-            axis_roll = np.cross([satellite_x, satellite_y, satellite_z], [axis_pitch[0], axis_pitch[1], axis_pitch[2]])
-        # end if
+    # Get perpendicular vectors to satellite positions
+    axis_pitch = np.cross(satellite_positions, satellite_positions[sibling_indexes])*rotation_axis_signs[:, np.newaxis]
 
-        # Define rotations for roll + alpha
-        axis_roll_unit = axis_roll / np.linalg.norm(axis_roll)
+    # Define rotations for pitch
+    if pitch != 0:
+        axis_pitch_unit = axis_pitch / eboa_vector.vector_norms(axis_pitch)[:, np.newaxis]
+        rotation_pitch_b = eboa_vector.define_rotation_axis(axis_pitch_unit, pitch_b_degrees)
 
-        rotation_roll_alpha_b1 = eboa_vector.define_rotation_axis([axis_roll_unit[0], axis_roll_unit[1], axis_roll_unit[2]], roll_b1)
-        rotation_roll_alpha_b3 = eboa_vector.define_rotation_axis([axis_roll_unit[0], axis_roll_unit[1], axis_roll_unit[2]], roll_b3)
+        satellite_projection_pitch_b = rotation_pitch_b.apply(satellite_projection_positions)
 
-        satellite_projection_roll_b1 = rotation_roll_alpha_b1.apply([satellite_projection_pitch_b[0], satellite_projection_pitch_b[1], satellite_projection_pitch_b[2]])
-        satellite_projection_roll_b3 = rotation_roll_alpha_b3.apply([satellite_projection_pitch_b[0], satellite_projection_pitch_b[1], satellite_projection_pitch_b[2]])
+        axis_roll = np.cross(satellite_projection_pitch_b, axis_pitch)
+    else:
+        satellite_projection_pitch_b = satellite_projection_positions
+        axis_roll = np.cross(satellite_positions, axis_pitch)
+    # end if
 
-        # Obtain latitude and longitudes of the footprint
-        footprint_right_position = satellite_projection_roll_b1
-        footprint_left_position = satellite_projection_roll_b3
+    # Define rotations for roll + alpha
+    axis_roll_unit = axis_roll / eboa_vector.vector_norms(axis_roll)[:, np.newaxis]
 
-        footprint_right_position = SkyCoord(x=satellite_projection_roll_b1[0], y=satellite_projection_roll_b1[1], z=satellite_projection_roll_b1[2], frame='itrs', unit=("km", "km", "km"), representation_type="cartesian")
-        right_coordinates.append("{} {}".format(footprint_right_position.earth_location.lon.value, footprint_right_position.earth_location.lat.value))
+    rotation_roll_alpha_b1 = eboa_vector.define_rotation_axis(axis_roll_unit, roll_b1)
+    rotation_roll_alpha_b3 = eboa_vector.define_rotation_axis(axis_roll_unit, roll_b3)
 
-        footprint_left_position = SkyCoord(x=satellite_projection_roll_b3[0], y=satellite_projection_roll_b3[1], z=satellite_projection_roll_b3[2], frame='itrs', unit=("km", "km", "km"), representation_type="cartesian")
-        left_coordinates.append("{} {}".format(footprint_left_position.earth_location.lon.value, footprint_left_position.earth_location.lat.value))
+    satellite_projection_roll_b1 = rotation_roll_alpha_b1.apply(satellite_projection_pitch_b)
+    satellite_projection_roll_b3 = rotation_roll_alpha_b3.apply(satellite_projection_pitch_b)
 
-        
-    # end while
+    # Obtain latitude and longitudes of the footprint
+    footprint_right_positions = SkyCoord(x=satellite_projection_roll_b1[:, 0], y=satellite_projection_roll_b1[:, 1], z=satellite_projection_roll_b1[:, 2], frame='itrs', unit=("km", "km", "km"), representation_type="cartesian").earth_location
+    right_coordinates = ["{} {}".format(longitude, latitude) for longitude, latitude in zip(footprint_right_positions.lon.value.tolist(), footprint_right_positions.lat.value.tolist())]
+
+    footprint_left_positions = SkyCoord(x=satellite_projection_roll_b3[:, 0], y=satellite_projection_roll_b3[:, 1], z=satellite_projection_roll_b3[:, 2], frame='itrs', unit=("km", "km", "km"), representation_type="cartesian").earth_location
+    left_coordinates = ["{} {}".format(longitude, latitude) for longitude, latitude in zip(footprint_left_positions.lon.value.tolist(), footprint_left_positions.lat.value.tolist())]
 
     # Build up satellite coordinates
     satellite_coordinates_to_reverse = satellite_coordinates.copy()
@@ -0,0 +1,337 @@
+"""
+Columnar timelines for the EBOA component
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import datetime
+
+# Import numpy
+import numpy as np
+
+epoch = datetime.datetime(1970, 1, 1)
+utc_epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+microsecond = datetime.timedelta(microseconds=1)
+
+def to_datetime64(values):
+    """
+    Method to convert a list of datetimes into an array of numpy datetime64 values with microsecond resolution.
+    Datetimes with time zone are converted to UTC
+
+    :param values: list of datetimes (or an already built numpy array)
+    :type values: list or numpy.ndarray
+
+    :return: array of datetime64 values
+    :rtype: numpy.ndarray
+    """
+    if isinstance(values, np.ndarray):
+        return values.astype("datetime64[us]")
+    # end if
+
+    return np.fromiter(((value - (utc_epoch if value.tzinfo != None else epoch)) // microsecond for value in values),
+                       dtype=np.int64, count=len(values)).view("datetime64[us]")
+
+def to_object_array(values):
+    """
+    Method to build a one dimension array of objects (the identifiers could be tuples or lists)
+
+    :param values: list of values
+    :type values: list
+
+    :return: array of objects
+    :rtype: numpy.ndarray
+    """
+    array = np.empty(len(values), dtype=object)
+    array[:] = list(values)
+
+    return array
+
+def _expand_ranges(first_positions, last_positions):
+    """
+    Method to expand ranges of positions [first, last) into the pairs (range, position)
+
+    :param first_positions: first position of every range
+    :type first_positions: numpy.ndarray
+    :param last_positions: position after the last position of every range
+    :type last_positions: numpy.ndarray
+
+    :return: indexes of the ranges and positions inside them
+    :rtype: tuple of numpy.ndarray
+    """
+    counts = np.maximum(last_positions - first_positions, 0)
+    total = int(counts.sum())
+    indexes = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    return indexes, np.repeat(first_positions, counts) + offsets
+
+def get_intersection_indexes(starts1, stops1, starts2, stops2):
+    """
+    Method to obtain the pairs of segments of two timelines intersecting (stop1 > start2 and start1 < stop2).
+    Every intersecting pair has either the start of the second segment inside the first segment (start1 <= start2 < stop1)
+    or the start of the first segment inside the second segment (start2 < start1 < stop2). Both sets of pairs are obtained
+    with binary searches over the sorted starts of the other timeline, so only pairs sharing time are generated
+    (long segments do not make the following segments candidates).
+
+    Complexity is O((n + m) log (n + m) + k) where n and m are the number of segments and k the number of intersections
+    (plus the pairs with segments having stop <= start, which are discarded)
+
+    :param starts1: start values of the segments of the first timeline
+    :type starts1: list or numpy.ndarray
+    :param stops1: stop values of the segments of the first timeline
+    :type stops1: list or numpy.ndarray
+    :param starts2: start values of the segments of the second timeline
+    :type starts2: list or numpy.ndarray
+    :param stops2: stop values of the segments of the second timeline
+    :type stops2: list or numpy.ndarray
+
+    :return: positions of the intersecting segments in the first and in the second timeline ordered by the first and then by the second
+    :rtype: tuple of numpy.ndarray
+    """
+    starts1 = to_datetime64(starts1)
+    stops1 = to_datetime64(stops1)
+    starts2 = to_datetime64(starts2)
+    stops2 = to_datetime64(stops2)
+
+    if len(starts1) == 0 or len(starts2) == 0:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    # end if
+
+    order1 = np.argsort(starts1, kind="stable")
+    sorted_starts1 = starts1[order1]
+    order2 = np.argsort(starts2, kind="stable")
+    sorted_starts2 = starts2[order2]
+
+    # Segments of the second timeline starting inside the segments of the first timeline
+    first_indexes1, sorted_indexes2 = _expand_ranges(np.searchsorted(sorted_starts2, starts1, side="left"),
+                                                     np.searchsorted(sorted_starts2, stops1, side="left"))
+
+    # Segments of the first timeline starting inside the segments of the second timeline (after their start)
+    second_indexes2, sorted_indexes1 = _expand_ranges(np.searchsorted(sorted_starts1, starts2, side="right"),
+                                                      np.searchsorted(sorted_starts1, stops2, side="left"))
+
+    indexes1 = np.concatenate((first_indexes1, order1[sorted_indexes1]))
+    indexes2 = np.concatenate((order2[sorted_indexes2], second_indexes2))
+
+    # Discard the pairs with segments having stop <= start
+    intersecting = (stops1[indexes1] > starts2[indexes2]) & (starts1[indexes1] < stops2[indexes2])
+    indexes1 = indexes1[intersecting]
+    indexes2 = indexes2[intersecting]
+
+    order = np.lexsort((indexes2, indexes1))
+
+    return indexes1[order], indexes2[order]
+
+class Timeline():
+    """
+    Timeline stored by columns (arrays of start values, stop values and identifiers) sorted by the start values
+    """
+
+    def __init__(self, starts, stops, ids = None):
+        """
+        :param starts: start values of the segments
+        :type starts: list or numpy.ndarray
+        :param stops: stop values of the segments
+        :type stops: list or numpy.ndarray
+        :param ids: identifiers of the segments (the positions of the segments by default)
+        :type ids: list or numpy.ndarray
+        """
+        starts = to_datetime64(starts)
+        stops = to_datetime64(stops)
+        if ids is None:
+            ids = list(range(len(starts)))
+        # end if
+        ids = to_object_array(ids)
+
+        order = np.argsort(starts, kind="stable")
+        self.starts = starts[order]
+        self.stops = stops[order]
+        self.ids = ids[order]
+
+    @classmethod
+    def from_segments(cls, timeline):
+        """
+        Method to build the columnar timeline from a timeline of segments with the structure {"id": id, "start": start, "stop": stop}
+
+        :param timeline: list of segments
+        :type timeline: list
+
+        :return: columnar timeline
+        :rtype: Timeline
+        """
+        return cls([segment["start"] for segment in timeline],
+                   [segment["stop"] for segment in timeline],
+                   [segment["id"] for segment in timeline])
+
+    @classmethod
+    def from_eboa_events(cls, timeline):
+        """
+        Method to build the columnar timeline from events extracted from EBOA (identified by their UUIDs)
+
+        :param timeline: list of events structured as the datamodel of EBOA
+        :type timeline: list
+
+        :return: columnar timeline
+        :rtype: Timeline
+        """
+        return cls([event.start for event in timeline],
+                   [event.stop for event in timeline],
+                   [event.event_uuid for event in timeline])
+
+    def to_segments(self):
+        """
+        Method to obtain the timeline of segments with the structure {"id": id, "start": start, "stop": stop}
+        (datetimes with time zone were converted to UTC and are returned without time zone)
+
+        :return: list of segments sorted by start
+        :rtype: list
+        """
+        return [{"id": id, "start": start, "stop": stop} for id, start, stop in zip(self.ids.tolist(), self.starts.tolist(), self.stops.tolist())]
+
+    def __len__(self):
+        return len(self.starts)
+
+    def intersect(self, timeline):
+        """
+        Method to obtain the segments intersecting with the received timeline
+
+        :param timeline: timeline to intersect with
+        :type timeline: Timeline
+
+        :return: timeline with the intersections identified by the identifiers of both segments (id1, id2)
+        :rtype: Timeline
+        """
+        indexes1, indexes2 = get_intersection_indexes(self.starts, self.stops, timeline.starts, timeline.stops)
+
+        return Timeline(np.maximum(self.starts[indexes1], timeline.starts[indexes2]),
+                        np.minimum(self.stops[indexes1], timeline.stops[indexes2]),
+                        list(zip(self.ids[indexes1].tolist(), timeline.ids[indexes2].tolist())))
+
+    @staticmethod
+    def intersect_many(timelines):
+        """
+        Method to obtain the timeline intersecting all the timelines in the received list
+
+        :param timelines: list of timelines
+        :type timelines: list of Timeline
+
+        :return: timeline with the intersections identified by the identifiers of the segments (id, (id, (...)))
+        :rtype: Timeline
+        """
+        intersected_timeline = Timeline([], [], [])
+        for i, timeline in enumerate(timelines):
+            if i == 0:
+                intersected_timeline = timeline
+            else:
+                intersected_timeline = timeline.intersect(intersected_timeline)
+            # end if
+        # end for
+
+        return intersected_timeline
+
+    def difference(self, timeline):
+        """
+        Method to obtain the segments covered only by one of the timelines (see difference_timelines)
+
+        PRE:
+        - The segments of each timeline do not overlap
+
+        :param timeline: timeline to compare with
+        :type timeline: Timeline
+
+        :return: timeline with the differences identified by the timeline covering them (1 or 2) and the identifier of the segment (1, id)
+        :rtype: Timeline
+        """
+        limits = np.unique(np.concatenate([self.starts, self.stops, timeline.starts, timeline.stops]))
+        if len(limits) < 2:
+            return Timeline([], [], [])
+        # end if
+        starts = limits[:-1]
+        stops = limits[1:]
+
+        # Segment of each timeline covering every period between consecutive limits
+        indexes1 = np.searchsorted(self.starts, starts, side="right") - 1
+        covered1 = (indexes1 >= 0) & (self.stops[np.maximum(indexes1, 0)] > starts) if len(self) > 0 else np.zeros(len(starts), dtype=bool)
+        indexes2 = np.searchsorted(timeline.starts, starts, side="right") - 1
+        covered2 = (indexes2 >= 0) & (timeline.stops[np.maximum(indexes2, 0)] > starts) if len(timeline) > 0 else np.zeros(len(starts), dtype=bool)
+
+        only1 = covered1 & ~covered2
+        selected = only1 | (covered2 & ~covered1)
+        origins = np.where(only1, 1, 2)[selected]
+        indexes = np.where(only1, indexes1, indexes2)[selected]
+        starts = starts[selected]
+        stops = stops[selected]
+        if len(starts) == 0:
+            return Timeline([], [], [])
+        # end if
+
+        # Join the consecutive periods covered by the same segment
+        new_segment = np.ones(len(starts), dtype=bool)
+        new_segment[1:] = (starts[1:] != stops[:-1]) | (origins[1:] != origins[:-1]) | (indexes[1:] != indexes[:-1])
+        segment_positions = np.flatnonzero(new_segment)
+        last_positions = np.append(segment_positions[1:] - 1, len(starts) - 1)
+
+        ids = [(int(origin), (self.ids if origin == 1 else timeline.ids)[index]) for origin, index in zip(origins[segment_positions].tolist(), indexes[segment_positions].tolist())]
+
+        return Timeline(starts[segment_positions], stops[last_positions], ids)
+
+    def merge(self):
+        """
+        Method to obtain the merged timeline (segments overlapping or touching are joined)
+
+        :return: timeline with the merged segments identified by the list of the identifiers of the segments joined
+        :rtype: Timeline
+        """
+        if len(self) == 0:
+            return Timeline([], [], [])
+        # end if
+
+        max_stops = np.maximum.accumulate(self.stops)
+        new_segment = np.ones(len(self), dtype=bool)
+        new_segment[1:] = self.starts[1:] > max_stops[:-1]
+        segment_positions = np.flatnonzero(new_segment)
+
+        return Timeline(self.starts[segment_positions],
+                        np.maximum.reduceat(self.stops, segment_positions),
+                        [ids.tolist() for ids in np.split(self.ids, segment_positions[1:])])
+
+    def duration(self):
+        """
+        Method to get the duration of the timeline (summing up the duration of every segment)
+
+        :return: duration of the timeline in seconds
+        :rtype: float
+        """
+        return float((self.stops - self.starts).astype(np.int64).sum()) / 1e6
+
+    def nearest(self, date):
+        """
+        Method to get the position of the segment with the start value nearest to the received date
+        (the first segment in case of equal distances)
+
+        :param date: date to compare with
+        :type date: datetime
+
+        :return: position of the nearest segment or None if the timeline is empty
+        :rtype: int
+        """
+        if len(self) == 0:
+            return None
+        # end if
+        date = to_datetime64([date])[0]
+
+        position = int(np.searchsorted(self.starts, date, side="left"))
+        if position == len(self):
+            # First segment with the last start value
+            return int(np.searchsorted(self.starts, self.starts[-1], side="left"))
+        # end if
+        if position > 0:
+            previous_position = int(np.searchsorted(self.starts, self.starts[position - 1], side="left"))
+            if date - self.starts[previous_position] <= self.starts[position] - date:
+                return previous_position
+            # end if
+        # end if
+
+        return position
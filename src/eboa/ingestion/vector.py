@@ -19,8 +19,8 @@ def define_rotation_axis(axis, degrees):
     '''
     Function to define the rotation axis given the axis and the degrees to rotate
 
-    :param axis: List of X, Y and Z values
-    :type axis: list
+    :param axis: List of X, Y and Z values (or array of axes with shape (n, 3) to define n rotations)
+    :type axis: list or numpy.ndarray
     :param degrees: degrees to rotate
     :type degrees: float
 
@@ -162,6 +162,21 @@ def calculate_vector_between_positions(position1, position2):
     
     return vector
 
+def vector_norms(vectors):
+    '''
+    Function to obtain the norms of a set of vectors.
+    The norms are calculated with the same operations as numpy.linalg.norm over each vector,
+    so that the results are identical to the ones obtained vector by vector
+
+    :param vectors: vectors with shape (n, 3)
+    :type vectors: numpy.ndarray
+
+    :return: norms of the vectors
+    :rtype: numpy.ndarray
+    '''
+
+    return np.sqrt(np.matmul(vectors[:, np.newaxis, :], vectors[:, :, np.newaxis])[:, 0, 0])
+
 def unit_vector(vector):
     '''
     Returns the unit vector of the vector.
@@ -21,6 +21,9 @@ from eboa.engine.functions import get_resources_path, get_schemas_path
 from lxml import etree
 import eboa.triggering.xpath_functions as xpath_functions
 
+# Import xml registry
+from eboa.engine.xml_registry import xml_registry
+
 # Import engine
 import eboa.engine.engine as eboa_engine
 from eboa.engine.engine import Engine
@@ -42,26 +45,18 @@ logger = logging_module.logger
 on_going_ingestions_folder = get_resources_path() + "/on_going_ingestions/"
 
 def get_triggering_conf():
-    schema_path = get_schemas_path() + "/triggering_schema.xsd"
-    parsed_schema = etree.parse(schema_path)
-    schema = etree.XMLSchema(parsed_schema)
-    # Get configuration
+    # Get configuration (compiled once per process while the files do not change)
     try:
-        triggering_xml = etree.parse(get_resources_path() + "/triggering.xml")
+        triggering_xpath = xml_registry.get_configuration(get_resources_path() + "/triggering.xml", get_schemas_path() + "/triggering_schema.xsd")
     except etree.XMLSyntaxError as e:
         error_message = f"The triggering configuration file ({get_resources_path() + '/triggering.xml'}) cannot be read"
         logger.error(error_message)
         raise TriggeringConfigCannotBeRead(error_message)
-    # end try
-
-    valid = schema.validate(triggering_xml)
-    if not valid:
+    except etree.DocumentInvalid as e:
         error_message = f"The triggering configuration file ({get_resources_path() + '/triggering.xml'}) does not pass the schema ({get_schemas_path() + '/triggering_schema.xsd'})"
         logger.error(error_message)
         raise TriggeringConfigDoesNotPassSchema(error_message)
-    # end if
-
-    triggering_xpath = etree.XPathEvaluator(triggering_xml)
+    # end try
 
     # Register needed xpath functions
     ns = etree.FunctionNamespace(None)
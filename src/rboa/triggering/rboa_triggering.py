@@ -22,6 +22,9 @@ from eboa.engine.functions import get_resources_path, get_schemas_path
 from lxml import etree
 import eboa.triggering.xpath_functions as xpath_functions
 
+# Import xml registry
+from eboa.engine.xml_registry import xml_registry
+
 # Import engine
 import rboa.engine.engine as rboa_engine
 from rboa.engine.engine import Engine
@@ -43,26 +46,18 @@ logger = logging_module.logger
 on_going_ingestions_folder = get_resources_path() + "/on_going_ingestions/"
 
 def get_reporting_conf():
-    schema_path = get_schemas_path() + "/reporting_generators_schema.xsd"
-    parsed_schema = etree.parse(schema_path)
-    schema = etree.XMLSchema(parsed_schema)
-    # Get configuration
+    # Get configuration (compiled once per process while the files do not change)
     try:
-        reporting_xml = etree.parse(get_resources_path() + "/reporting_generators.xml")
+        reporting_xpath = xml_registry.get_configuration(get_resources_path() + "/reporting_generators.xml", get_schemas_path() + "/reporting_generators_schema.xsd")
     except etree.XMLSyntaxError as e:
         log = "The reporting configuration file ({}) cannot be read".format(get_resources_path() + "/reporting_generators.xml")
         logger.error(log)
         raise ReportingConfigCannotBeRead(log)
-    # end try
-
-    valid = schema.validate(reporting_xml)
-    if not valid:
+    except etree.DocumentInvalid as e:
         log = "The reporting configuration file ({}) does not pass the schema ({})".format(get_resources_path() + "/reporting_generators.xml", get_schemas_path() + "/reporting_generators_schema.xsd")
         logger.error(log)
         raise ReportingConfigDoesNotPassSchema(log)
-    # end if
-
-    reporting_xpath = etree.XPathEvaluator(reporting_xml)
+    # end try
 
     return reporting_xpath
 
@@ -32,11 +32,30 @@ from sboa.logging import Log
 from eboa.engine.query import log_query
 
 # Import operators
-from eboa.engine.operators import arithmetic_operators, text_operators
+from eboa.engine.operators import arithmetic_operators
+
+# Import filters
+import eboa.engine.filters as filters
 
 logging = Log(name = __name__)
 logger = logging.logger
 
+# Tables (built once) associating the names of the text filters of the query methods to the columns they filter
+text_filter_columns = {
+    "get_rules": {
+        "rule_uuids": Rule.rule_uuid,
+        "names": Rule.name
+    },
+    "get_tasks": {
+        "task_uuids": Task.task_uuid,
+        "names": Task.name
+    },
+    "get_triggerings": {
+        "triggering_uuids": Triggering.triggering_uuid,
+        "task_names": Task.name
+    }
+}
+
 class Query():
 
     def __init__(self, session = None):
@@ -76,29 +95,8 @@ class Query():
         """
         params = []
 
-        # Rule UUIDs
-        if rule_uuids != None:
-            functions.is_valid_text_filter(rule_uuids)
-            if rule_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[rule_uuids["op"]]
-                params.append(op(Rule.rule_uuid, rule_uuids["filter"]))
-            else:
-                filter = eval('Rule.rule_uuid.' + text_operators[rule_uuids["op"]])
-                params.append(filter(rule_uuids["filter"]))
-            # end if
-        # end if
-
-        # Names
-        if names != None:
-            functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(Rule.name, names["filter"]))
-            else:
-                filter = eval('Rule.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
-        # end if
+        # Text filters
+        params += filters.build_text_filters(Rule, text_filter_columns["get_rules"], {"rule_uuids": rule_uuids, "names": names})
 
         # window size filters
         if window_size_filters != None:
@@ -114,12 +112,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("Rule." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("Rule." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(Rule, order_by))
         # end if
 
         # Limit
@@ -153,29 +146,8 @@ class Query():
         """
         params = []
         
-        # Task UUIDs
-        if task_uuids != None:
-            functions.is_valid_text_filter(task_uuids)
-            if task_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[task_uuids["op"]]
-                params.append(op(Task.task_uuid, task_uuids["filter"]))
-            else:
-                filter = eval('Task.task_uuid.' + text_operators[task_uuids["op"]])
-                params.append(filter(task_uuids["filter"]))
-            # end if
-        # end if
-
-        # Names
-        if names != None:
-            functions.is_valid_text_filter(names)
-            if names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[names["op"]]
-                params.append(op(Task.name, names["filter"]))
-            else:
-                filter = eval('Task.name.' + text_operators[names["op"]])
-                params.append(filter(names["filter"]))
-            # end if
-        # end if
+        # Text filters
+        params += filters.build_text_filters(Task, text_filter_columns["get_tasks"], {"task_uuids": task_uuids, "names": names})
 
         # triggering_time filters
         if triggering_time_filters != None:
@@ -191,12 +163,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("Task." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("Task." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(Task, order_by))
         # end if
 
         # Limit
@@ -234,17 +201,8 @@ class Query():
         params = []
         tables = []
         
-        # Triggering UUIDs
-        if triggering_uuids != None:
-            functions.is_valid_text_filter(triggering_uuids)
-            if triggering_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[triggering_uuids["op"]]
-                params.append(op(Triggering.triggering_uuid, triggering_uuids["filter"]))
-            else:
-                filter = eval('Triggering.triggering_uuid.' + text_operators[triggering_uuids["op"]])
-                params.append(filter(triggering_uuids["filter"]))
-            # end if
-        # end if
+        # Text filters
+        params += filters.build_text_filters(Triggering, text_filter_columns["get_triggerings"], {"triggering_uuids": triggering_uuids, "task_names": task_names}, tables = tables)
 
         # date filters
         if date_filters != None:
@@ -261,19 +219,6 @@ class Query():
             params.append(Triggering.triggered == triggered)
         # end if
         
-        # Names
-        if task_names != None:
-            functions.is_valid_text_filter(task_names)
-            if task_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[task_names["op"]]
-                params.append(op(Task.name, task_names["filter"]))
-            else:
-                filter = eval('Task.name.' + text_operators[task_names["op"]])
-                params.append(filter(task_names["filter"]))
-            # end if
-            tables.append(Task)
-        # end if
-
         query = self.session.query(Triggering)
         for table in set(tables):
             query = query.join(table)
@@ -284,12 +229,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("Triggering." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("Triggering." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(Triggering, order_by))
         # end if
 
         # Limit
@@ -0,0 +1,26 @@
+-- ###############################################################
+--
+-- Add the start of the events to the text and double values of the
+-- events of an existing DDBB of the eboa (the column is the
+-- partition key of these values in the partitioned layout, see
+-- datamodel/eboa_events_partitioning.sql)
+--
+-- Usage: modify_existing_ddbb.sh -f eboa_add_event_start_to_values.sql -d eboadb
+--
+-- Written by Daniel Brosnan Blázquez
+--
+-- module eboa
+-- ###############################################################
+
+ALTER TABLE eboa.event_texts ADD COLUMN IF NOT EXISTS event_start timestamp;
+-- ddl-end --
+ALTER TABLE eboa.event_doubles ADD COLUMN IF NOT EXISTS event_start timestamp;
+-- ddl-end --
+
+UPDATE eboa.event_texts SET event_start = events.start FROM eboa.events
+WHERE event_texts.event_uuid = events.event_uuid AND event_texts.event_start IS NULL;
+UPDATE eboa.event_doubles SET event_start = events.start FROM eboa.events
+WHERE event_doubles.event_uuid = events.event_uuid AND event_doubles.event_start IS NULL;
+
+ANALYZE eboa.event_texts;
+ANALYZE eboa.event_doubles;
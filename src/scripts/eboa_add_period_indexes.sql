@@ -0,0 +1,35 @@
+-- ###############################################################
+--
+-- Add the GiST indexes over the periods of the events and the
+-- validity periods of the sources to an existing DDBB of the eboa
+--
+-- Usage: modify_existing_ddbb.sh -f eboa_add_period_indexes.sql -d eboadb
+--
+-- The indexes are built concurrently so that the tables are not
+-- locked against writes while building them
+--
+-- Written by Daniel Brosnan Blázquez
+--
+-- module eboa
+-- ###############################################################
+
+-- object: idx_events_period | type: INDEX --
+-- DROP INDEX IF EXISTS eboa.idx_events_period CASCADE;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_period ON eboa.events
+	USING gist
+	(
+	  (tsrange(start, stop, '[]'))
+	);
+-- ddl-end --
+
+-- object: idx_sources_validity_period | type: INDEX --
+-- DROP INDEX IF EXISTS eboa.idx_sources_validity_period CASCADE;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sources_validity_period ON eboa.sources
+	USING gist
+	(
+	  (tsrange(validity_start, validity_stop, '[]'))
+	);
+-- ddl-end --
+
+ANALYZE eboa.events;
+ANALYZE eboa.sources;
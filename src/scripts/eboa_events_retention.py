@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Script for applying the retention of the events over a partitioned DDBB
+(see datamodel/eboa_events_partitioning.sql).
+The partitions of the events, doubles and texts are dropped, while the rest
+of values, links, keys and alerts of their events are deleted (these tables
+are not partitioned by time)
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import argparse
+import datetime
+from dateutil import parser
+from dateutil.relativedelta import relativedelta
+
+# Import datamodel
+from eboa.datamodel.base import Session
+
+# Import partitions management
+import eboa.engine.partitions as partitions
+
+def main():
+
+    args_parser = argparse.ArgumentParser(description="EBOA retention of the events by partitions.")
+    args_parser.add_argument("-l", dest="retention_limit", type=str, nargs=1,
+                             help="Retention limit (the partitions of events ending before this date are dropped)", required=False)
+    args_parser.add_argument("-d", dest="retention_days", type=int, nargs=1,
+                             help="Retention in days from now (the partitions of events ending before this number of days ago are dropped)", required=False)
+    args_parser.add_argument("-m", dest="months_ahead", type=int, nargs=1,
+                             help="Number of months ahead from now to create the partitions of events (default 3)", required=False)
+    args_parser.add_argument("-s", dest="partitions_start", type=str, nargs=1,
+                             help="Date from which to create the partitions of events (default now). The events of the past months stored in the default partitions are moved to the new partitions", required=False)
+
+    args = args_parser.parse_args()
+
+    if args.retention_limit != None and args.retention_days != None:
+        print("The options -l and -d cannot be provided at the same time")
+        exit(-1)
+    # end if
+
+    retention_limit = None
+    if args.retention_limit != None:
+        try:
+            retention_limit = parser.parse(args.retention_limit[0])
+        except ValueError:
+            print("The provided retention limit {} is not a valid date".format(args.retention_limit[0]))
+            exit(-1)
+        # end try
+    elif args.retention_days != None:
+        retention_limit = datetime.datetime.now() - datetime.timedelta(days = args.retention_days[0])
+    # end if
+
+    months_ahead = 3
+    if args.months_ahead != None:
+        months_ahead = args.months_ahead[0]
+    # end if
+
+    now = datetime.datetime.now()
+    partitions_start = now
+    if args.partitions_start != None:
+        try:
+            partitions_start = parser.parse(args.partitions_start[0])
+        except ValueError:
+            print("The provided date {} for the start of the partitions is not a valid date".format(args.partitions_start[0]))
+            exit(-1)
+        # end try
+    # end if
+
+    session = Session()
+    if not partitions.is_events_table_partitioned(session):
+        print("The table of the events is not partitioned (see the option -t of eboa_init_ddbb.sh)")
+        session.close()
+        exit(-1)
+    # end if
+
+    created_partitions = partitions.create_events_partitions(session, partitions_start, now + relativedelta(months = months_ahead))
+    session.commit()
+    for name in created_partitions:
+        print("The partition {} has been created".format(name))
+    # end for
+
+    if retention_limit != None:
+        dropped_partitions = partitions.drop_events_partitions(session, retention_limit)
+        session.commit()
+        for partition in dropped_partitions:
+            print("The partition {} with the events starting in the period {}_{} has been dropped".format(partition["name"], partition["start"].isoformat(), partition["stop"].isoformat()))
+        # end for
+    # end if
+
+    session.close()
+
+    exit(0)
+
+if __name__ == "__main__":
+
+    main()
@@ -23,7 +23,7 @@ config = read_configuration()
 
 db_configuration = config["DDBB_CONFIGURATION"]
 
-def init(datamodel_path = None):
+def init(datamodel_path = None, partitioning_path = None):
 
     # Path to the datamodel
     if datamodel_path != None:
@@ -37,10 +37,19 @@ def init(datamodel_path = None):
         datamodel_path = "/datamodel/eboa_data_model.sql"
     # end if
 
+    # Path to the partitioning of the datamodel (optional)
+    if partitioning_path != None and not os.path.isfile(partitioning_path):
+        print("The specified path to the partitioning file {} does not exist".format(partitioning_path))
+        exit(-1)
+    # end if
+
     datatabse_address = db_configuration["host"]
     datatabse_port = db_configuration["port"]
 
     command = "eboa_init_ddbb.sh -h {} -p {} -f {}".format(datatabse_address, datatabse_port, datamodel_path)
+    if partitioning_path != None:
+        command += " -t {}".format(partitioning_path)
+    # end if
     print("The EBOA database is going to be initialize using the datamodel SQL file {}...".format(datamodel_path))
     execute_command(command, "The EBOA database has been initialized successfully :-)")
     
@@ -49,6 +58,8 @@ def main():
     args_parser = argparse.ArgumentParser(description="Initialize EBOA environment (Scheduler).")
     args_parser.add_argument("-f", dest="datamodel_path", type=str, nargs=1,
                              help="path to the datamodel", required=False)
+    args_parser.add_argument("-t", dest="partitioning_path", type=str, nargs=1,
+                             help="path to the partitioning of the datamodel (e.g. eboa_events_partitioning.sql)", required=False)
     args_parser.add_argument("-y", "--accept_everything",
                              help="Accept by default every request (Be careful when using this because it will drop all the data without requesting any confirmation)", action="store_true")
 
@@ -71,8 +82,13 @@ def main():
         datamodel_path = args.datamodel_path[0]
     # end if
 
+    partitioning_path = None
+    if args.partitioning_path != None:
+        partitioning_path = args.partitioning_path[0]
+    # end if
+
     # Initialize DDBB
-    init(datamodel_path)
+    init(datamodel_path, partitioning_path)
     
     exit(0)
     
@@ -6,12 +6,13 @@
 #
 # module eboa
 #################################################################
-USAGE="Usage: `basename $0` -f datamodel_file -d ddbb -p port -h host"
+USAGE="Usage: `basename $0` -f datamodel_file -d ddbb -p port -h host [-t partitioning_file]"
 DATAMODEL_FILE=""
+PARTITIONING_FILE=""
 PORT="5432"
 HOST="localhost"
 
-while getopts f:d:p:h: option
+while getopts f:d:p:h:t: option
 do
     case "${option}"
         in
@@ -19,6 +20,7 @@ do
         d) DDBB=${OPTARG};;
         p) PORT=${OPTARG};;
         h) HOST=${OPTARG};;
+        t) PARTITIONING_FILE=${OPTARG};;
         ?) echo -e $USAGE
             exit -1
     esac
@@ -53,6 +55,13 @@ then
     exit -1
 fi
 
+# Check that the sql file for partitioning the DDBB exists
+if [ "$PARTITIONING_FILE" != "" ] && [ ! -f $PARTITIONING_FILE ];
+then
+    echo "ERROR: The file $PARTITIONING_FILE provided does not exist"
+    exit -1
+fi
+
 # Check that there are no connections to the DDBB if exists
 DATABASE=`psql -p "$PORT" -h "$HOST" -t -U postgres -c "SELECT count(*) FROM pg_database WHERE datname='$DDBB'";`
 if [ $DATABASE -eq 1 ];
@@ -91,6 +100,19 @@ then
     exit -1
 fi
 
+# Partition DDBB
+if [ "$PARTITIONING_FILE" != "" ];
+then
+    psql -p $PORT -h $HOST -U postgres -d $DDBB -v ON_ERROR_STOP=1 -f $PARTITIONING_FILE
+    status=$?
+
+    if [ $status -ne 0 ];
+    then
+        echo "ERROR: It was not possible to partition the DDBB"
+        exit -1
+    fi
+fi
+
 echo "DDBB has been initiated correctly!"
 
 exit 0
@@ -253,6 +253,39 @@ class TestEboaIngestion(unittest.TestCase):
         assert len([status for status in not_ingested_sources[0].statuses if status.status == eboa_engine.exit_codes["PROCESSING_ENDED_UNEXPECTEDLY"]["status"]]) == 1
 
 
+    def test_ingestion_json_file(self):
+
+        file_path = os.path.dirname(os.path.abspath(__file__)) + "/json_inputs/test_simple_update.json"
+
+        for stream in [None, True]:
+            self.query.clear_db()
+
+            # Without processor, the file contains the operations to be inserted
+            returned_statuses = eboa_ingestion.command_process_file(None, file_path, datetime.datetime.now().isoformat(), stream = stream)
+
+            assert len(returned_statuses) == 1
+            assert returned_statuses[0]["status"] == eboa_engine.exit_codes["OK"]["status"]
+
+            events = self.query.get_events()
+
+            assert len(events) == 2
+        # end for
+
+    def test_ingestion_json_file_not_valid(self):
+
+        file_path = os.path.dirname(os.path.abspath(__file__)) + "/json_inputs/test_wrong_structure.json"
+
+        returned_statuses = eboa_ingestion.command_process_file(None, file_path, datetime.datetime.now().isoformat(), stream = True)
+
+        assert len(returned_statuses) == 1
+        assert returned_statuses[0]["status"] == eboa_engine.exit_codes["FILE_NOT_VALID"]["status"]
+
+        sources = self.query.get_sources(names = {"filter": "test_wrong_structure.json", "op": "=="})
+
+        assert len(sources) == 1
+
+        assert sources[0].ingestion_error == True
+
     def test_input_file_does_not_exist(self):
 
         data = {"operations": [{
@@ -9,9 +9,11 @@ module eboa
 import os
 import sys
 import unittest
+import unittest.mock
 import datetime
 import uuid
 import random
+import tempfile
 import before_after
 
 # Import engine of the DDBB
@@ -21,6 +23,8 @@ from eboa.engine.query import Query
 from eboa.datamodel.base import Session, engine, Base
 from eboa.engine.errors import UndefinedEventLink, DuplicatedEventLinkRef, WrongPeriod, SourceAlreadyIngested, WrongValue, OddNumberOfCoordinates, EboaResourcesPathNotAvailable, WrongGeometry
 from eboa.engine.errors import LinksInconsistency
+from eboa.engine.catalogue_cache import catalogue_cache
+from eboa.engine.json_stream import StreamedArray
 
 # Import datamodel
 from eboa.datamodel.dim_signatures import DimSignature
@@ -1594,6 +1598,75 @@ class TestEngine(unittest.TestCase):
 
         assert len(values_ddbb) == 8
 
+    def test_insert_event_simple_update_values_copy_bulk_loader(self):
+
+        bulk_loader = eboa_engine.config.get("BULK_LOADER")
+        eboa_engine.config["BULK_LOADER"] = "copy"
+        self.addCleanup(eboa_engine.config.__setitem__, "BULK_LOADER", bulk_loader)
+
+        self.engine_eboa._initialize_context_insert_data()
+        data = {"dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T02:07:03",
+                           "validity_stop": "2018-06-05T08:07:36"},
+                "events": [{"gauge": {"name": "GAUGE_NAME",
+                                      "system": "GAUGE_SYSTEM",
+                                      "insertion_type": "SIMPLE_UPDATE"},
+                            "start": "2018-06-05T02:07:03",
+                            "stop": "2018-06-05T08:07:36",
+                            "values": [{"name": "VALUES",
+                                       "type": "object",
+                                       "values": [
+                                           {"type": "text",
+                                            "name": "TEXT",
+                                            "value": "TEXT"},
+                                           {"type": "boolean",
+                                            "name": "BOOLEAN",
+                                            "value": "true"},
+                                           {"type": "boolean",
+                                            "name": "BOOLEAN2",
+                                            "value": "false"},
+                                           {"type": "double",
+                                            "name": "DOUBLE",
+                                            "value": "0.9"},
+                                           {"type": "timestamp",
+                                            "name": "TIMESTAMP",
+                                            "value": "20180712T00:00:00"},
+                                           {"type": "object",
+                                            "name": "VALUES2",
+                                            "values": [
+                                                {"type": "geometry",
+                                                 "name": "GEOMETRY",
+                                                 "value": "29.012974905944 -118.33483458667 28.8650301641571 -118.372028380632 28.7171766138274 -118.409121707686 28.5693112139334 -118.44612300623 28.4213994944367 -118.483058731035 28.2734085660472 -118.519970531113 28.1253606038163 -118.556849863134 27.9772541759126 -118.593690316835 27.8291247153939 -118.630472520505 27.7544158362332 -118.64900551674 27.7282373644786 -118.48032600682 27.7015162098732 -118.314168792268 27.6742039940042 -118.150246300849 27.6462511775992 -117.98827485961 27.6176070520608 -117.827974178264 27.5882197156561 -117.669066835177 27.5580360448116 -117.511277813618 27.5270016492436 -117.354334035359 27.4950608291016 -117.197963963877 27.4621565093409 -117.041897175848 27.4282301711374 -116.885863967864 27.3932217651372 -116.729594956238 27.3570696128269 -116.572820673713 27.3197103000253 -116.415271199941 27.2810785491022 -116.256675748617 27.241107085821 -116.09676229722 27.1997272484913 -115.935260563566 27.1524952198729 -115.755436839005 27.2270348347386 -115.734960009089 27.3748346522356 -115.694299254844 27.5226008861849 -115.653563616829 27.6702779354428 -115.612760542177 27.8178690071708 -115.571901649363 27.9653506439026 -115.531000691074 28.1127600020619 -115.490011752733 28.2601469756437 -115.44890306179 28.4076546372628 -115.407649898021 28.455192866856 -115.589486631416 28.4968374106496 -115.752807970928 28.5370603096399 -115.91452902381 28.575931293904 -116.074924211465 28.6135193777855 -116.234273707691 28.6498895688451 -116.392847129762 28.6851057860975 -116.550917254638 28.7192301322012 -116.708756374584 28.752323018501 -116.866636764481 28.7844432583843 -117.024831047231 28.8156481533955 -117.183612605748 28.8459935678779 -117.343255995623 28.8755339855462 -117.504037348554 28.9043225601122 -117.666234808407 28.9324111491586 -117.830128960026 28.9598503481156 -117.996003330616 28.9866878706574 -118.164136222141 29.012974905944 -118.33483458667"}]
+                                        }]}]
+                }]
+            }
+        self.engine_eboa.operation = data
+        self.engine_eboa._insert_dim_signature()
+        self.engine_eboa._insert_source()
+        self.engine_eboa._insert_gauges()
+        self.engine_eboa.session.commit()
+        gauge_ddbb = self.session.query(Gauge).filter(Gauge.name == data["events"][0]["gauge"]["name"], Gauge.system == data["events"][0]["gauge"]["system"]).first()
+        source_ddbb = self.session.query(Source).filter(Source.name == data["source"]["name"], Source.validity_start == data["source"]["validity_start"], Source.validity_stop == data["source"]["validity_stop"], Source.generation_time == data["source"]["generation_time"], Source.processor_version == data["dim_signature"]["version"], Source.processor == data["dim_signature"]["exec"]).first()
+        dim_signature_ddbb = self.session.query(DimSignature).filter(DimSignature.dim_signature == data["dim_signature"]["name"]).first()
+        self.engine_eboa._insert_events()
+        self.engine_eboa.session.commit()
+        event_ddbb = self.session.query(Event).filter(Event.start == data["events"][0]["start"],
+                                                      Event.stop == data["events"][0]["stop"],
+                                                      Event.gauge_uuid == gauge_ddbb.gauge_uuid,
+                                                      Event.source_uuid == source_ddbb.source_uuid,
+                                                      Event.visible == True).all()
+
+        assert len(event_ddbb) == 1
+
+        values_ddbb = self.query_eboa.get_event_values()
+
+        assert len(values_ddbb) == 8
+
     def test_insert_event_simple_update_not_a_float_geometry(self):
 
         self.engine_eboa._initialize_context_insert_data()
@@ -2934,6 +3007,178 @@ class TestEngine(unittest.TestCase):
 
         assert len(annotation_cnfs_ddbb) == 1
 
+    def test_insert_json_stream(self):
+
+        filename = "test_simple_update.json"
+        self.engine_eboa.parse_data_from_json(os.path.dirname(os.path.abspath(__file__)) + "/json_inputs/" + filename, stream = True)
+
+        returned_value = self.engine_eboa.treat_data(source = filename)[0]["status"]
+
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+        sources_status = self.session.query(SourceStatus).join(Source).filter(SourceStatus.status == eboa_engine.exit_codes["OK"]["status"],
+                                                                                            Source.name == filename).all()
+
+        assert len(sources_status) == 1
+
+        events_ddbb = self.session.query(Event).all()
+
+        assert len(events_ddbb) == 2
+
+        annotations_ddbb = self.session.query(Annotation).all()
+
+        assert len(annotations_ddbb) == 1
+
+    def test_insert_json_stream_events_in_batches(self):
+
+        previous_batch_size = eboa_engine.config.get("INSERT_EVENTS_BATCH_SIZE")
+        eboa_engine.config["INSERT_EVENTS_BATCH_SIZE"] = 1
+        self.addCleanup(eboa_engine.config.__setitem__, "INSERT_EVENTS_BATCH_SIZE", previous_batch_size)
+        # Read the arrays of the operations in small pieces
+        previous_buffer_size = eboa_engine.config.get("JSON_STREAM_BUFFER_SIZE")
+        eboa_engine.config["JSON_STREAM_BUFFER_SIZE"] = 16
+        self.addCleanup(eboa_engine.config.__setitem__, "JSON_STREAM_BUFFER_SIZE", previous_buffer_size)
+
+        filename = "test_simple_update.json"
+        self.engine_eboa.parse_data_from_json(os.path.dirname(os.path.abspath(__file__)) + "/json_inputs/" + filename, stream = True)
+
+        returned_value = self.engine_eboa.treat_data(source = filename)[0]["status"]
+
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+        events_ddbb = self.session.query(Event).all()
+
+        assert len(events_ddbb) == 2
+
+        event_keys_ddbb = self.session.query(EventKey).all()
+
+        assert len(event_keys_ddbb) == 2
+
+    def test_insert_json_stream_reading_arrays_once(self):
+
+        # Count the times the streamed arrays are read from the file
+        iterations = []
+        iterate_chunks = StreamedArray.iterate_chunks
+        def count_iterations(streamed_array, *args, **kwargs):
+            iterations.append(streamed_array)
+            return iterate_chunks(streamed_array, *args, **kwargs)
+        # end def
+
+        filename = "test_simple_update.json"
+        self.engine_eboa.parse_data_from_json(os.path.dirname(os.path.abspath(__file__)) + "/json_inputs/" + filename, stream = True)
+
+        with unittest.mock.patch.object(StreamedArray, "iterate_chunks", count_iterations):
+            returned_value = self.engine_eboa.treat_data(source = filename)[0]["status"]
+        # end with
+
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+        # The validation and the catalogue entities use the summaries collected while loading the file,
+        # so the events and annotations are only read for their insertion
+        operation = self.engine_eboa.data["operations"][0]
+        assert len([streamed_array for streamed_array in iterations if streamed_array is operation["events"]]) == 1
+        assert len([streamed_array for streamed_array in iterations if streamed_array is operation["annotations"]]) == 1
+
+        events_ddbb = self.session.query(Event).all()
+
+        assert len(events_ddbb) == 2
+
+        explicit_refs_ddbb = self.session.query(ExplicitRef).all()
+
+        assert len(explicit_refs_ddbb) == 2
+
+    def test_insert_json_stream_by_configuration(self):
+
+        previous_json_stream = eboa_engine.config.get("JSON_STREAM")
+        eboa_engine.config["JSON_STREAM"] = True
+        self.addCleanup(eboa_engine.config.__setitem__, "JSON_STREAM", previous_json_stream)
+
+        filename = "test_simple_update.json"
+        self.engine_eboa.parse_data_from_json(os.path.dirname(os.path.abspath(__file__)) + "/json_inputs/" + filename)
+
+        assert type(self.engine_eboa.data["operations"][0]["events"]) == StreamedArray
+
+        returned_value = self.engine_eboa.treat_data(source = filename)[0]["status"]
+
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+    def test_wrong_json_stream(self):
+
+        filename = "test_wrong_structure.json"
+        returned_value = self.engine_eboa.parse_data_from_json(os.path.dirname(os.path.abspath(__file__)) + "/json_inputs/" + filename, stream = True)
+
+        assert returned_value == eboa_engine.exit_codes["FILE_NOT_VALID"]["status"]
+
+        sources_status = self.session.query(SourceStatus).join(Source).filter(SourceStatus.status == eboa_engine.exit_codes["FILE_NOT_VALID"]["status"],
+                                                                              Source.name == filename).all()
+
+        assert len(sources_status) == 1
+
+    def test_wrong_json_stream_without_checking_schema(self):
+
+        filename = "test_wrong_structure.json"
+        self.engine_eboa.parse_data_from_json(os.path.dirname(os.path.abspath(__file__)) + "/json_inputs/" + filename, check_schema = False, stream = True)
+
+        returned_value = self.engine_eboa.treat_data(source = filename)[0]["status"]
+
+        assert returned_value == eboa_engine.exit_codes["FILE_NOT_VALID"]["status"]
+
+    def test_not_json_stream(self):
+
+        filename = "test_not_json.json"
+        returned_value = self.engine_eboa.parse_data_from_json(os.path.dirname(os.path.abspath(__file__)) + "/json_inputs/" + filename, stream = True)
+
+        assert returned_value == eboa_engine.exit_codes["FILE_NOT_VALID"]["status"]
+
+        sources = self.session.query(Source).filter(Source.name == filename,
+                                                    Source.parse_error == "The json file cannot be loaded as it has a wrong structure").all()
+
+        assert len(sources) == 1
+
+    def test_truncated_json_stream(self):
+
+        with open(os.path.dirname(os.path.abspath(__file__)) + "/json_inputs/test_simple_update.json") as input_file:
+            content = input_file.read()
+        # end with
+
+        with tempfile.TemporaryDirectory() as path:
+            # The file is cut in the middle of the first event
+            json_path = path + "/test_truncated.json"
+            with open(json_path, "w") as output_file:
+                output_file.write(content[:content.index("explicit_reference", content.index('"events"'))])
+            # end with
+
+            returned_value = self.engine_eboa.parse_data_from_json(json_path, stream = True)
+        # end with
+
+        assert returned_value == eboa_engine.exit_codes["FILE_NOT_VALID"]["status"]
+
+        sources_status = self.session.query(SourceStatus).join(Source).filter(SourceStatus.status == eboa_engine.exit_codes["FILE_NOT_VALID"]["status"],
+                                                                              Source.name == "test_truncated.json").all()
+
+        assert len(sources_status) == 1
+
+        # Nothing has been ingested
+        events_ddbb = self.session.query(Event).all()
+
+        assert len(events_ddbb) == 0
+
+        dim_signatures_ddbb = self.session.query(DimSignature).all()
+
+        assert len(dim_signatures_ddbb) == 0
+
+    def test_missing_json_stream(self):
+
+        filename = "test_missing_file.json"
+        returned_value = self.engine_eboa.parse_data_from_json(os.path.dirname(os.path.abspath(__file__)) + "/json_inputs/" + filename, stream = True)
+
+        assert returned_value == eboa_engine.exit_codes["FILE_NOT_VALID"]["status"]
+
+        sources_status = self.session.query(SourceStatus).join(Source).filter(SourceStatus.status == eboa_engine.exit_codes["FILE_NOT_VALID"]["status"],
+                                                                              Source.name == filename).all()
+
+        assert len(sources_status) == 1
+
     def test_wrong_json(self):
 
         filename = "test_wrong_structure.json"
@@ -3543,6 +3788,54 @@ class TestEngine(unittest.TestCase):
 
         assert returned_value == eboa_engine.exit_codes["DUPLICATED_VALUES"]["status"]
 
+    def test_insert_duplicated_values_inside_event_copy_bulk_loader(self):
+        """
+        Method to test the insertion of duplicated values inside an event using the COPY bulk loader
+        """
+        bulk_loader = eboa_engine.config.get("BULK_LOADER")
+        eboa_engine.config["BULK_LOADER"] = "copy"
+        self.addCleanup(eboa_engine.config.__setitem__, "BULK_LOADER", bulk_loader)
+
+        data = {"operations": [{
+            "mode": "insert",
+            "dim_signature": {"name": "dim_signature",
+                              "exec": "exec",
+                              "version": "1.0"},
+            "source": {"name": "source.xml",
+                       "reception_time": "2018-06-06T13:33:29",
+                       "generation_time": "2018-07-05T02:07:03",
+                       "validity_start": "2018-06-05T02:07:03",
+                       "validity_stop": "2018-06-05T08:07:36"},
+            "events": [{"gauge": {"name": "GAUGE_NAME",
+                                  "system": "GAUGE_SYSTEM",
+                                  "insertion_type": "SIMPLE_UPDATE"},
+                        "start": "2018-06-05T02:07:03",
+                        "stop": "2018-06-05T08:07:36"
+                    },
+                       {"gauge": {"name": "GAUGE_NAME",
+                                  "system": "GAUGE_SYSTEM",
+                                  "insertion_type": "SIMPLE_UPDATE"},
+                        "start": "2018-06-05T02:07:03",
+                        "stop": "2018-06-05T08:07:36",
+                        "values": [{
+                            "name": "values",
+                            "type": "object",
+                            "values": [
+                                {"type": "text",
+                                 "name": "TEXT",
+                                 "value": "TEXT"},
+                                {"type": "text",
+                                 "name": "TEXT",
+                                 "value": "TEXT"}
+                            ]
+                        }]
+                    }]
+        }]
+        }
+        returned_value = self.engine_eboa.treat_data(data)[0]["status"]
+
+        assert returned_value == eboa_engine.exit_codes["DUPLICATED_VALUES"]["status"]
+
     def test_insert_alerts_by_ref(self):
 
         data = {"operations": [{
@@ -3658,6 +3951,322 @@ class TestEngine(unittest.TestCase):
                                                                                          AlertGroup.name == "alert_group").all()
         assert len(source_alert) == 1
 
+    def test_bulk_insert_mappings_skipping_integrity_errors(self):
+
+        data = {"operations": [{
+            "mode": "insert",
+            "dim_signature": {"name": "dim_signature",
+                              "exec": "exec",
+                              "version": "1.0"},
+            "source": {"name": "source.json",
+                       "reception_time": "2018-06-06T13:33:29",
+                       "generation_time": "2018-07-05T02:07:03",
+                       "validity_start": "2018-06-05T02:07:03",
+                       "validity_stop": "2018-06-05T08:07:36"},
+            "events": [{
+                "link_ref": "EVENT_REF",
+                "gauge": {"name": "GAUGE_NAME",
+                          "system": "GAUGE_SYSTEM",
+                          "insertion_type": "SIMPLE_UPDATE"},
+                "start": "2018-06-05T02:07:03",
+                "stop": "2018-06-05T08:07:36"
+            }],
+            "alerts": [{
+                "message": "Alert message",
+                "generator": "test",
+                "notification_time": "2018-06-05T08:07:36",
+                "alert_cnf": {
+                    "name": "alert_name1",
+                    "severity": "critical",
+                    "description": "Alert description",
+                    "group": "alert_group"
+                },
+                "entity": {
+                    "reference_mode": "by_ref",
+                    "reference": "EVENT_REF",
+                    "type": "event"
+                }
+            }]
+        }]
+        }
+        returned_value = self.engine_eboa.treat_data(data)[0]["status"]
+
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+        event_alerts = self.session.query(EventAlert).all()
+
+        assert len(event_alerts) == 1
+
+        def alert_mapping(event_alert_uuid, event_uuid):
+            return {"event_alert_uuid": event_alert_uuid,
+                    "message": "Alert message",
+                    "ingestion_time": datetime.datetime.now(),
+                    "generator": "test",
+                    "notification_time": "2018-06-05T08:07:36",
+                    "alert_uuid": event_alerts[0].alert_uuid,
+                    "event_uuid": event_uuid}
+
+        # Mappings with a conflict on the primary key, a non existing event and a correct alert
+        mappings = [alert_mapping(event_alerts[0].event_alert_uuid, event_alerts[0].event_uuid),
+                    alert_mapping(uuid.uuid1(), uuid.uuid1()),
+                    alert_mapping(uuid.uuid1(), event_alerts[0].event_uuid)]
+
+        self.engine_eboa._bulk_insert_mappings(EventAlert, mappings)
+        self.engine_eboa.session.commit()
+
+        event_alerts = self.session.query(EventAlert).all()
+
+        assert len(event_alerts) == 2
+
+    def test_insert_catalogue_entities_from_cache(self):
+
+        data = {"operations": [{
+            "mode": "insert",
+            "dim_signature": {"name": "dim_signature",
+                              "exec": "exec",
+                              "version": "1.0"},
+            "source": {"name": "source.json",
+                       "reception_time": "2018-06-06T13:33:29",
+                       "generation_time": "2018-07-05T02:07:03",
+                       "validity_start": "2018-06-05T02:07:03",
+                       "validity_stop": "2018-06-05T08:07:36"},
+            "events": [{
+                "link_ref": "EVENT_REF",
+                "gauge": {"name": "GAUGE_NAME",
+                          "system": "GAUGE_SYSTEM",
+                          "insertion_type": "SIMPLE_UPDATE"},
+                "start": "2018-06-05T02:07:03",
+                "stop": "2018-06-05T08:07:36",
+                "alerts": [{
+                    "message": "Alert message",
+                    "generator": "test",
+                    "notification_time": "2018-06-05T08:07:36",
+                    "alert_cnf": {
+                        "name": "alert_name1",
+                        "severity": "critical",
+                        "description": "Alert description",
+                        "group": "alert_group"
+                    }}]
+            }]
+        }]
+        }
+        returned_value = self.engine_eboa.treat_data(data)[0]["status"]
+
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+        dim_signature = self.session.query(DimSignature).first()
+        gauge = self.session.query(Gauge).first()
+        alert = self.session.query(Alert).first()
+
+        assert catalogue_cache.get(self.session, DimSignature, ("dim_signature",)).dim_signature_uuid == dim_signature.dim_signature_uuid
+        assert catalogue_cache.get(self.session, Gauge, ("GAUGE_NAME", "GAUGE_SYSTEM", dim_signature.dim_signature_uuid)).gauge_uuid == gauge.gauge_uuid
+        assert catalogue_cache.get(self.session, Alert, ("alert_name1",)).alert_uuid == alert.alert_uuid
+
+        # Ingest a second source resolving the catalogue entities from the cache
+        data["operations"][0]["source"]["name"] = "source2.json"
+        returned_value = self.engine_eboa.treat_data(data)[0]["status"]
+
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+        events = self.session.query(Event).filter(Event.gauge_uuid == gauge.gauge_uuid).all()
+
+        assert len(events) == 2
+
+        event_alerts = self.session.query(EventAlert).filter(EventAlert.alert_uuid == alert.alert_uuid).all()
+
+        assert len(event_alerts) == 2
+
+        # The cache is invalidated when clearing the DDBB
+        self.query_eboa.clear_db()
+
+        assert catalogue_cache.get(self.session, Gauge, ("GAUGE_NAME", "GAUGE_SYSTEM", dim_signature.dim_signature_uuid)) == None
+
+    def test_insert_catalogue_entities_removed_by_other_process(self):
+
+        data = {"operations": [{
+            "mode": "insert",
+            "dim_signature": {"name": "dim_signature",
+                              "exec": "exec",
+                              "version": "1.0"},
+            "source": {"name": "source.json",
+                       "reception_time": "2018-06-06T13:33:29",
+                       "generation_time": "2018-07-05T02:07:03",
+                       "validity_start": "2018-06-05T02:07:03",
+                       "validity_stop": "2018-06-05T08:07:36"},
+            "events": [{
+                "link_ref": "EVENT_REF",
+                "gauge": {"name": "GAUGE_NAME",
+                          "system": "GAUGE_SYSTEM",
+                          "insertion_type": "SIMPLE_UPDATE"},
+                "start": "2018-06-05T02:07:03",
+                "stop": "2018-06-05T08:07:36",
+                "alerts": [{
+                    "message": "Alert message",
+                    "generator": "test",
+                    "notification_time": "2018-06-05T08:07:36",
+                    "alert_cnf": {
+                        "name": "alert_name1",
+                        "severity": "critical",
+                        "description": "Alert description",
+                        "group": "alert_group"
+                    }}]
+            }]
+        }]
+        }
+        returned_value = self.engine_eboa.treat_data(data)[0]["status"]
+
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+        # Other process removes the catalogue entities (the cache of this process is not invalidated)
+        with unittest.mock.patch.object(catalogue_cache, "invalidate"):
+            self.query_eboa.clear_db()
+        # end with
+
+        assert catalogue_cache.get(self.session, Gauge, ("GAUGE_NAME", "GAUGE_SYSTEM", self.engine_eboa.dim_signature.dim_signature_uuid)) != None
+
+        # The stale entities are removed from the cache and looked up again in the DDBB
+        data["operations"][0]["source"]["name"] = "source2.json"
+        returned_value = self.engine_eboa.treat_data(data)[0]["status"]
+
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+        dim_signature = self.session.query(DimSignature).first()
+        gauge = self.session.query(Gauge).first()
+        alert = self.session.query(Alert).first()
+
+        events = self.session.query(Event).filter(Event.gauge_uuid == gauge.gauge_uuid).all()
+
+        assert len(events) == 1
+
+        event_alerts = self.session.query(EventAlert).filter(EventAlert.alert_uuid == alert.alert_uuid).all()
+
+        assert len(event_alerts) == 1
+
+        assert catalogue_cache.get(self.session, DimSignature, ("dim_signature",)).dim_signature_uuid == dim_signature.dim_signature_uuid
+        assert catalogue_cache.get(self.session, Gauge, ("GAUGE_NAME", "GAUGE_SYSTEM", dim_signature.dim_signature_uuid)).gauge_uuid == gauge.gauge_uuid
+        assert catalogue_cache.get(self.session, Alert, ("alert_name1",)).alert_uuid == alert.alert_uuid
+
+    def test_treat_data_operations_in_parallel(self):
+
+        def operation(dim_signature, source, link_ref, link):
+            return {
+                "mode": "insert",
+                "dim_signature": {"name": dim_signature,
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": source,
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T02:07:03",
+                           "validity_stop": "2018-06-05T08:07:36"},
+                "events": [{
+                    "link_ref": link_ref,
+                    "gauge": {"name": "GAUGE_NAME",
+                              "system": "GAUGE_SYSTEM",
+                              "insertion_type": "SIMPLE_UPDATE"},
+                    "start": "2018-06-05T02:07:03",
+                    "stop": "2018-06-05T08:07:36",
+                    "links": [{
+                        "link": link,
+                        "link_mode": "by_ref",
+                        "name": "EVENT_LINK_NAME"
+                    }]
+                }]
+            }
+
+        # The links by reference cross the operations of different DIM signatures
+        data = {"operations": [operation("dim_signature1", "source1.json", "EVENT_LINK1", "EVENT_LINK2"),
+                               operation("dim_signature2", "source2.json", "EVENT_LINK2", "EVENT_LINK3"),
+                               operation("dim_signature3", "source3.json", "EVENT_LINK3", "EVENT_LINK1")]
+        }
+
+        assert [[position for position, operation in partition] for partition in eboa_engine.get_operation_partitions(data["operations"])] == [[0], [1], [2]]
+
+        exit_status = self.engine_eboa.treat_data(data, processes = 3)
+
+        assert [item["source"] for item in exit_status] == ["source1.json", "source2.json", "source3.json"]
+        assert len([item for item in exit_status if item["status"] != eboa_engine.exit_codes["OK"]["status"]]) == 0
+
+        events = self.session.query(Event).all()
+
+        assert len(events) == 3
+
+        event_links = self.session.query(EventLink).all()
+
+        assert len(event_links) == 3
+
+    def test_treat_data_operations_in_parallel_with_alerts_by_ref(self):
+
+        def operation(dim_signature, source):
+            return {
+                "mode": "insert",
+                "dim_signature": {"name": dim_signature,
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": source,
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T02:07:03",
+                           "validity_stop": "2018-06-05T08:07:36"}
+            }
+
+        def alert(entity_type, reference):
+            return {
+                "message": "Alert message",
+                "generator": "test",
+                "notification_time": "2018-06-05T08:07:36",
+                "alert_cnf": {
+                    "name": "alert_name1",
+                    "severity": "critical",
+                    "description": "Alert description",
+                    "group": "alert_group"
+                },
+                "entity": {
+                    "reference_mode": "by_ref",
+                    "reference": reference,
+                    "type": entity_type
+                }
+            }
+
+        operation1 = operation("dim_signature1", "source1.json")
+        operation1["events"] = [{
+            "link_ref": "EVENT_LINK1",
+            "explicit_reference": "EXPLICIT_REFERENCE1",
+            "gauge": {"name": "GAUGE_NAME",
+                      "system": "GAUGE_SYSTEM",
+                      "insertion_type": "SIMPLE_UPDATE"},
+            "start": "2018-06-05T02:07:03",
+            "stop": "2018-06-05T08:07:36"
+        }]
+
+        # The alerts by reference point to entities defined by the operation of another DIM signature
+        operation2 = operation("dim_signature2", "source2.json")
+        operation2["explicit_references"] = [{"name": "EXPLICIT_REFERENCE1"}]
+        operation2["alerts"] = [alert("event", "EVENT_LINK1"), alert("explicit_ref", "EXPLICIT_REFERENCE1")]
+
+        operation3 = operation("dim_signature3", "source3.json")
+
+        data = {"operations": [operation1, operation2, operation3]}
+
+        assert [[position for position, operation in partition] for partition in eboa_engine.get_operation_partitions(data["operations"])] == [[0, 1], [2]]
+
+        exit_status = self.engine_eboa.treat_data(data, processes = 2)
+
+        assert [item["source"] for item in exit_status] == ["source1.json", "source2.json", "source3.json"]
+        assert len([item for item in exit_status if item["status"] != eboa_engine.exit_codes["OK"]["status"]]) == 0
+
+        events = self.session.query(Event).all()
+
+        assert len(events) == 1
+
+        event_alerts = self.session.query(EventAlert).filter(EventAlert.event_uuid == events[0].event_uuid).all()
+
+        assert len(event_alerts) == 1
+
+        explicit_ref_alerts = self.session.query(ExplicitRefAlert).join(ExplicitRef).filter(ExplicitRef.explicit_ref == "EXPLICIT_REFERENCE1").all()
+
+        assert len(explicit_ref_alerts) == 1
+
     def test_insert_data_with_processing_duration_as_argument(self):
 
         data = {"operations": [{
@@ -3925,6 +4534,55 @@ class TestEngine(unittest.TestCase):
 
         assert len(ers) == 1
 
+    def test_insert_explicit_reference_update_group(self):
+
+        data = {"operations": [{
+            "mode": "insert",
+            "dim_signature": {"name": "dim_signature",
+                              "exec": "exec",
+                              "version": "1.0"},
+            "source": {"name": "source.json",
+                       "reception_time": "2018-06-06T13:33:29",
+                       "generation_time": "2018-07-05T02:07:03",
+                       "validity_start": "2018-06-05T02:07:03",
+                       "validity_stop": "2018-06-05T08:07:36"},
+            "explicit_references": [{
+                "name": "EXPLICIT_REFERENCE"
+            },{
+                "name": "EXPLICIT_REFERENCE2",
+                "group": "EXPL_GROUP"
+            }]
+        },{
+            "mode": "insert",
+            "dim_signature": {"name": "dim_signature",
+                              "exec": "exec",
+                              "version": "1.0"},
+            "source": {"name": "source2.json",
+                       "reception_time": "2018-06-06T13:33:29",
+                       "generation_time": "2018-07-05T02:07:03",
+                       "validity_start": "2018-06-05T02:07:03",
+                       "validity_stop": "2018-06-05T08:07:36"},
+            "explicit_references": [{
+                "name": "EXPLICIT_REFERENCE",
+                "group": "EXPL_GROUP2"
+            },{
+                "name": "EXPLICIT_REFERENCE2",
+                "group": "EXPL_GROUP2"
+            },{
+                "name": "EXPLICIT_REFERENCE3",
+                "group": "EXPL_GROUP2"
+            }]
+        }]
+                }
+
+        exit_status = self.engine_eboa.treat_data(data)
+
+        assert len([item for item in exit_status if item["status"] != eboa_engine.exit_codes["OK"]["status"]]) == 0
+
+        ers = self.session.query(ExplicitRef).join(ExplicitRefGrp).filter(ExplicitRefGrp.name == "EXPL_GROUP2").all()
+
+        assert len(ers) == 3
+
     def test_insert_alerts_events_sources_annotations_ers(self):
 
         data = {"operations": [{
@@ -7,6 +7,10 @@ module eboa
 """
 # Import python utilities
 import unittest
+from sqlalchemy import event
+
+# Import datamodel
+from eboa.datamodel.base import engine
 
 # Import engine of the DDBB
 import eboa.engine.engine as eboa_engine
@@ -19,6 +23,61 @@ from eboa.engine import export
 # Import EBOA errors
 from eboa.engine.errors import ErrorParsingParameters
 
+def get_data_for_preload(number_of_events):
+    """
+    Generate an operation with events, annotations and alerts associated to different explicit references
+    """
+    return {"operations": [{
+        "mode": "insert",
+        "dim_signature": {"name": "dim_signature",
+                          "exec": "exec",
+                          "version": "1.0"},
+        "source": {"name": "source1.xml",
+                   "reception_time": "2018-01-01T00:00:00",
+                   "generation_time": "2018-01-01T00:00:00",
+                   "validity_start": "2018-01-01T00:00:00",
+                   "validity_stop": "2018-01-02T00:00:00",
+                   "priority": 30},
+        "events": [{
+            "link_ref": "EVENT_" + str(i),
+            "explicit_reference": "ER_" + str(i),
+            "gauge": {"name": "GAUGE_NAME",
+                      "system": "GAUGE_SYSTEM",
+                      "insertion_type": "SIMPLE_UPDATE"},
+            "start": "2018-01-01T04:00:00",
+            "stop": "2018-01-01T05:00:00",
+            "links": [{"name": "PREVIOUS",
+                       "link": "EVENT_" + str(i - 1),
+                       "link_mode": "by_ref"}] if i > 0 else [],
+            "values": [{"name": "VALUES",
+                        "type": "object",
+                        "values": [{"type": "text",
+                                    "name": "TEXT",
+                                    "value": "TEXT_" + str(i)},
+                                   {"type": "double",
+                                    "name": "DOUBLE",
+                                    "value": str(i)}]}],
+            "alerts": [{
+                "message": "Alert message",
+                "generator": "test",
+                "notification_time": "2018-06-05T08:07:36",
+                "alert_cnf": {
+                    "name": "alert_name1",
+                    "severity": "critical",
+                    "description": "Alert description",
+                    "group": "alert_group"
+                }}]
+        } for i in range(number_of_events)],
+        "annotations": [{
+            "explicit_reference": "ER_" + str(i),
+            "annotation_cnf": {"name": "NAME",
+                               "system": "SYSTEM"},
+            "values": [{"type": "text",
+                        "name": "TEXT",
+                        "value": "TEXT_" + str(i)}]
+        } for i in range(number_of_events)]
+    }]}
+
 class TestExport(unittest.TestCase):
     def setUp(self):
         # Create the engine to manage the data
@@ -1608,6 +1667,66 @@ class TestExport(unittest.TestCase):
             }
         }
 
+    def _export_counting_queries(self, export_function, get_entities, number_of_entities, preload):
+        """
+        Export the requested number of entities in a new session returning the structure and the number of queries executed by the export
+        """
+        query = Query()
+        entities = get_entities(query)[:number_of_entities]
+
+        executed_queries = []
+        def count_query(conn, cursor, statement, parameters, context, executemany):
+            executed_queries.append(statement)
+        # end def
+        event.listen(engine, "before_cursor_execute", count_query)
+        try:
+            structure = {}
+            export_function(structure, entities, include_alerts = True, preload = preload)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_query)
+            query.close_session()
+        # end try
+
+        return structure, len(executed_queries)
+
+    def test_export_events_preload(self):
+        """
+        Method to test the export_events function preloading the related entities
+        """
+        exit_status = self.engine_eboa.treat_data(get_data_for_preload(20))
+
+        assert len([item for item in exit_status if item["status"] != eboa_engine.exit_codes["OK"]["status"]]) == 0
+
+        get_events = lambda query: query.get_events(order_by = {"field": "event_uuid", "descending": False})
+
+        structure, number_of_queries = self._export_counting_queries(export.export_events, get_events, 20, preload = False)
+        preloaded_structure, number_of_queries_preloading_20 = self._export_counting_queries(export.export_events, get_events, 20, preload = True)
+        preloaded_structure_5, number_of_queries_preloading_5 = self._export_counting_queries(export.export_events, get_events, 5, preload = True)
+
+        assert preloaded_structure == structure
+        assert number_of_queries_preloading_20 == number_of_queries_preloading_5
+        assert number_of_queries_preloading_20 < number_of_queries
+        print()
+        print("Exporting 20 events lasted {} queries without preloading and {} queries preloading (5 events: {} queries).".format(number_of_queries, number_of_queries_preloading_20, number_of_queries_preloading_5))
+
+    def test_export_ers_preload(self):
+        """
+        Method to test the export_ers function preloading the related entities
+        """
+        exit_status = self.engine_eboa.treat_data(get_data_for_preload(20))
+
+        assert len([item for item in exit_status if item["status"] != eboa_engine.exit_codes["OK"]["status"]]) == 0
+
+        get_ers = lambda query: query.get_explicit_refs(order_by = {"field": "explicit_ref", "descending": False})
+
+        structure, number_of_queries = self._export_counting_queries(export.export_ers, get_ers, 20, preload = False)
+        preloaded_structure, number_of_queries_preloading_20 = self._export_counting_queries(export.export_ers, get_ers, 20, preload = True)
+        preloaded_structure_5, number_of_queries_preloading_5 = self._export_counting_queries(export.export_ers, get_ers, 5, preload = True)
+
+        assert preloaded_structure == structure
+        assert number_of_queries_preloading_20 == number_of_queries_preloading_5
+        assert number_of_queries_preloading_20 < number_of_queries
+
     def test_export_annotations_wrong_structure(self):
         """
         Method to test the export_annotations function with wrong structure argument
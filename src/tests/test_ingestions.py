@@ -10,11 +10,19 @@ from dateutil import parser
 import os
 import sys
 import unittest
+import unittest.mock
 import datetime
 
+# Import numpy
+import numpy as np
+
 # Import ingestion functions
 import eboa.ingestion.functions as ingestion_functions
 
+# Import columnar timelines
+import eboa.ingestion.timeline as eboa_timeline
+from eboa.ingestion.timeline import Timeline
+
 class TestInsertEvent(unittest.TestCase):
     def test_event_out_of_source_validity_period(self):
         """
@@ -240,3 +248,105 @@ class TestDifferenceTimelines(unittest.TestCase):
         assert timeline_res == [{"start":parser.parse("2018-01-01T00:00:00"),"stop":parser.parse("2018-01-02T00:00:00"),"id":"timeline1", "timeline":timeline1},{"start":parser.parse("2018-01-03T00:00:00"),"stop":parser.parse("2018-01-04T00:00:00"),"id":"timeline2", "timeline":timeline2}]
 
 
+
+class TestIntersectTimelines(unittest.TestCase):
+
+    def test_empty_timelines(self):
+        """
+        Empty timelines
+        """
+        timeline1 = [{"start":parser.parse("2018-01-01T00:00:00"),"stop":parser.parse("2018-01-02T00:00:00"),"id":"timeline1"}]
+        assert ingestion_functions.intersect_timelines([], timeline1) == []
+        assert ingestion_functions.intersect_timelines(timeline1, []) == []
+
+    def test_overlapping_segments(self):
+        """
+        Every segment of timeline1 is intersected with every segment of timeline2 overlapping it (segments in timeline2 overlap each other)
+        |--------------|    |----|
+          |---|  |-----------|
+             |--|
+        """
+        timeline1 = [{"start":parser.parse("2018-01-01T00:00:00"),"stop":parser.parse("2018-01-01T10:00:00"),"id":"a"},
+                     {"start":parser.parse("2018-01-01T12:00:00"),"stop":parser.parse("2018-01-01T14:00:00"),"id":"b"}]
+        timeline2 = [{"start":parser.parse("2018-01-01T01:00:00"),"stop":parser.parse("2018-01-01T03:00:00"),"id":"c"},
+                     {"start":parser.parse("2018-01-01T02:00:00"),"stop":parser.parse("2018-01-01T02:30:00"),"id":"d"},
+                     {"start":parser.parse("2018-01-01T05:00:00"),"stop":parser.parse("2018-01-01T12:00:00"),"id":"e"}]
+        timeline_res = ingestion_functions.intersect_timelines(timeline1, timeline2)
+        assert timeline_res == [{"id": "a#c", "id1": "a", "id2": "c", "start":parser.parse("2018-01-01T01:00:00"),"stop":parser.parse("2018-01-01T03:00:00")},
+                                {"id": "a#d", "id1": "a", "id2": "d", "start":parser.parse("2018-01-01T02:00:00"),"stop":parser.parse("2018-01-01T02:30:00")},
+                                {"id": "a#e", "id1": "a", "id2": "e", "start":parser.parse("2018-01-01T05:00:00"),"stop":parser.parse("2018-01-01T10:00:00")}]
+
+    def test_intersect_many_timelines(self):
+        """
+        Intersection of three timelines
+        """
+        timeline1 = [{"start":parser.parse("2018-01-01T00:00:00"),"stop":parser.parse("2018-01-01T10:00:00"),"id":"a"}]
+        timeline2 = [{"start":parser.parse("2018-01-01T02:00:00"),"stop":parser.parse("2018-01-01T12:00:00"),"id":"b"}]
+        timeline3 = [{"start":parser.parse("2018-01-01T04:00:00"),"stop":parser.parse("2018-01-01T05:00:00"),"id":"c"}]
+        timeline_res = ingestion_functions.intersect_many_timelines([timeline1, timeline2, timeline3])
+        assert [(segment["id"], segment["start"], segment["stop"]) for segment in timeline_res] == [("c#b#a", parser.parse("2018-01-01T04:00:00"), parser.parse("2018-01-01T05:00:00"))]
+
+class TestColumnarTimeline(unittest.TestCase):
+
+    def setUp(self):
+        self.timeline1 = [{"start":parser.parse("2018-01-01T00:00:00"),"stop":parser.parse("2018-01-01T04:00:00"),"id":"a"},
+                          {"start":parser.parse("2018-01-01T03:00:00"),"stop":parser.parse("2018-01-01T06:00:00"),"id":"b"},
+                          {"start":parser.parse("2018-01-01T08:00:00"),"stop":parser.parse("2018-01-01T10:00:00"),"id":"c"}]
+        self.timeline2 = [{"start":parser.parse("2018-01-01T05:00:00"),"stop":parser.parse("2018-01-01T09:00:00"),"id":"d"}]
+
+    def test_intersect(self):
+        timeline_res = Timeline.from_segments(self.timeline1).intersect(Timeline.from_segments(self.timeline2)).to_segments()
+        assert timeline_res == [{"id": ("b", "d"), "start":parser.parse("2018-01-01T05:00:00"),"stop":parser.parse("2018-01-01T06:00:00")},
+                                {"id": ("c", "d"), "start":parser.parse("2018-01-01T08:00:00"),"stop":parser.parse("2018-01-01T09:00:00")}]
+
+    def test_intersection_indexes_with_long_segment(self):
+        start = datetime.datetime(2018, 1, 1)
+        starts = np.array([start + datetime.timedelta(minutes = 10 * i) for i in range(5000)], dtype="datetime64[us]")
+        starts1 = starts
+        stops1 = starts + np.timedelta64(5, "m")
+        # Segments of the second timeline shifted 2 minutes plus a segment of 2 days covering the beginning
+        starts2 = np.concatenate((np.array([start], dtype="datetime64[us]"), starts + np.timedelta64(2, "m")))
+        stops2 = np.concatenate((np.array([start + datetime.timedelta(days = 2)], dtype="datetime64[us]"), starts + np.timedelta64(7, "m")))
+
+        expand_ranges = eboa_timeline._expand_ranges
+        candidates = []
+        def count_candidates(first_positions, last_positions):
+            indexes, positions = expand_ranges(first_positions, last_positions)
+            candidates.append(len(indexes))
+            return indexes, positions
+        # end def
+
+        with unittest.mock.patch.object(eboa_timeline, "_expand_ranges", count_candidates):
+            indexes1, indexes2 = eboa_timeline.get_intersection_indexes(starts1, stops1, starts2, stops2)
+        # end with
+
+        expected_indexes1, expected_indexes2 = np.nonzero((stops1[:, np.newaxis] > starts2[np.newaxis, :]) & (starts1[:, np.newaxis] < stops2[np.newaxis, :]))
+        assert indexes1.tolist() == expected_indexes1.tolist()
+        assert indexes2.tolist() == expected_indexes2.tolist()
+
+        # Only the intersecting pairs are generated (the long segment does not make the following segments candidates)
+        assert len(indexes1) == 5000 + 2 * 24 * 6
+        assert sum(candidates) == len(indexes1)
+
+    def test_merge(self):
+        timeline_res = Timeline.from_segments(self.timeline1).merge().to_segments()
+        assert timeline_res == ingestion_functions.merge_timeline(self.timeline1)
+
+    def test_difference(self):
+        timeline1 = ingestion_functions.merge_timeline(self.timeline1)
+        timeline_res = Timeline.from_segments(timeline1).difference(Timeline.from_segments(self.timeline2)).to_segments()
+        expected_timeline = [{"id": (1 if segment["timeline"] is timeline1 else 2, segment["id"]), "start": segment["start"], "stop": segment["stop"]}
+                             for segment in ingestion_functions.difference_timelines(timeline1, self.timeline2)]
+        assert timeline_res == expected_timeline
+
+    def test_duration(self):
+        assert Timeline.from_segments(self.timeline1).duration() == ingestion_functions.get_timeline_duration(self.timeline1)
+        assert Timeline([], [], []).duration() == 0
+
+    def test_nearest(self):
+        timeline = Timeline.from_segments(self.timeline1)
+        assert timeline.nearest(parser.parse("2018-01-01T01:00:00")) == 0
+        assert timeline.nearest(parser.parse("2018-01-01T01:30:00")) == 0
+        assert timeline.nearest(parser.parse("2018-01-01T02:00:00")) == 1
+        assert timeline.nearest(parser.parse("2018-01-02T00:00:00")) == 2
+        assert Timeline([], [], []).nearest(parser.parse("2018-01-02T00:00:00")) == None
@@ -1690,3 +1690,108 @@ class TestInsertEventsInsertAndEraseAtDim(unittest.TestCase):
         events = self.session.query(Event).all()
 
         assert len(events) == 1
+
+    def test_insert_and_erase_at_dim_signature_level_with_split_event_in_the_middle_sql_resolution(self):
+
+        resolution = eboa_engine.config.get("INSERT_AND_ERASE_AT_DIM_SIGNATURE_LEVEL_RESOLUTION")
+        eboa_engine.config["INSERT_AND_ERASE_AT_DIM_SIGNATURE_LEVEL_RESOLUTION"] = "sql"
+        self.addCleanup(eboa_engine.config.__setitem__, "INSERT_AND_ERASE_AT_DIM_SIGNATURE_LEVEL_RESOLUTION", resolution)
+
+        data = {"operations": [{
+            "mode": "insert",
+            "dim_signature": {"name": "dim_signature",
+                              "exec": "processor",
+                              "version": "1.0"},
+            "source": {"name": "source1.xml",
+                       "reception_time": "2018-06-06T13:33:29",
+                       "generation_time": "2018-07-07T02:07:03",
+                       "validity_start": "2018-06-05T02:07:03",
+                       "validity_stop": "2018-06-05T06:07:36"},
+            "events": [{
+                "gauge": {"name": "GAUGE_NAME",
+                          "system": "GAUGE_SYSTEM",
+                          "insertion_type": "SIMPLE_UPDATE"},
+                "start": "2018-06-05T02:07:03",
+                "stop": "2018-06-05T06:07:36"
+            }],
+
+        }]}
+
+        self.engine_eboa.data = data
+        returned_value = self.engine_eboa.treat_data()[0]["status"]
+        
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+        data = {"operations": [{
+            "mode": "insert",
+            "dim_signature": {"name": "dim_signature",
+                              "exec": "processor",
+                              "version": "1.0"},
+            "source": {"name": "source2.xml",
+                       "reception_time": "2018-06-06T13:33:29",
+                       "generation_time": "2018-07-06T02:07:03",
+                       "validity_start": "2018-06-05T05:07:03",
+                       "validity_stop": "2018-06-05T07:07:03"},
+            "events": [{
+                "gauge": {"name": "GAUGE_NAME",
+                          "system": "GAUGE_SYSTEM",
+                          "insertion_type": "SIMPLE_UPDATE"},
+                "start": "2018-06-05T05:07:03",
+                "stop": "2018-06-05T07:07:03"
+            }],
+
+        }]}
+
+        self.engine_eboa.data = data
+        returned_value = self.engine_eboa.treat_data()[0]["status"]
+        
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+        data = {"operations": [{
+            "mode": "insert_and_erase",
+            "dim_signature": {"name": "dim_signature",
+                              "exec": "processor",
+                              "version": "1.0"},
+            "source": {"name": "source3.xml",
+                       "reception_time": "2018-06-06T13:33:29",
+                       "generation_time": "2018-07-06T02:07:03",
+                       "validity_start": "2018-06-05T02:07:03",
+                       "validity_stop": "2018-06-05T08:07:36"},
+            "events": [{
+                "gauge": {"name": "GAUGE_NAME",
+                          "system": "GAUGE_SYSTEM",
+                          "insertion_type": "SIMPLE_UPDATE"},
+                "start": "2018-06-05T02:07:03",
+                "stop": "2018-06-05T08:07:36"
+            }],
+
+        }]}
+
+        self.engine_eboa.data = data
+        returned_value = self.engine_eboa.treat_data()[0]["status"]
+
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+        events = self.session.query(Event).all()
+
+        assert len(events) == 3
+
+        events = self.session.query(Event).join(Source).filter(Source.name == "source1.xml",
+                                                               Event.start == "2018-06-05T02:07:03",
+                                                               Event.stop == "2018-06-05T06:07:36").all()
+
+
+        assert len(events) == 1
+
+        events = self.session.query(Event).join(Source).filter(Source.name == "source2.xml",
+                                                               Event.start == "2018-06-05T06:07:36",
+                                                               Event.stop == "2018-06-05T07:07:03").all()
+
+
+        assert len(events) == 1
+
+        events = self.session.query(Event).join(Source).filter(Source.name == "source3.xml",
+                                                               Event.start == "2018-06-05T07:07:03",
+                                                               Event.stop == "2018-06-05T08:07:36").all()
+
+        assert len(events) == 1
@@ -0,0 +1,113 @@
+"""
+Automated tests for the interval index used by the engine submodule
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import unittest
+import datetime
+import random
+
+# Import interval index
+from eboa.engine.intervals import get_interval_indexes_per_timestamp, get_items_per_timestamp
+
+def get_intervals_per_timestamp_by_loops(intervals, timestamps):
+    """
+    Reference implementation (nested loops) of the association of intervals to timestamps
+    used by the engine before the interval index was available
+    """
+    intervals_per_timestamp = {}
+    timeline_points_iterator = 0
+    for interval in intervals:
+        start = interval[0]
+        stop = interval[1]
+        specific_timeline_points_iterator = timeline_points_iterator
+        while specific_timeline_points_iterator < len(timestamps):
+            timestamp = timestamps[specific_timeline_points_iterator]
+            if specific_timeline_points_iterator == len(timestamps) - 1:
+                if stop > timestamp:
+                    intervals_per_timestamp.setdefault(timestamp, []).append(interval)
+                # end if
+                break
+            # end if
+            next_timestamp = timestamps[specific_timeline_points_iterator + 1]
+            specific_timeline_points_iterator += 1
+            if start > next_timestamp:
+                timeline_points_iterator += 1
+            # end if
+            if stop <= timestamp and start < timestamp:
+                break
+            # end if
+            if start < next_timestamp and stop > timestamp:
+                intervals_per_timestamp.setdefault(timestamp, []).append(interval)
+            # end if
+        # end while
+    # end for
+
+    return intervals_per_timestamp
+
+def generate_intervals(number_of_intervals, number_of_timestamps, durations, seed = 0):
+    """
+    Generate intervals inside a day sorted by start and the timestamps defined by
+    a subset of their limits (as the validity periods of the sources)
+    """
+    generator = random.Random(seed)
+    reference = datetime.datetime(2018, 6, 5)
+    intervals = []
+    for i in range(number_of_intervals):
+        start = reference + datetime.timedelta(seconds = generator.randint(0, 86400))
+        stop = start + datetime.timedelta(seconds = generator.choice(durations))
+        intervals.append((start, stop))
+    # end for
+    intervals.sort(key=lambda interval: interval[0])
+    limits = set()
+    for interval in generator.sample(intervals, min(number_of_timestamps, number_of_intervals)):
+        limits.add(interval[0])
+        limits.add(interval[1])
+    # end for
+    timestamps = sorted(limits)
+
+    return intervals, timestamps
+
+class TestIntervals(unittest.TestCase):
+
+    def test_get_interval_indexes_per_timestamp(self):
+
+        timestamps = [datetime.datetime(2018, 6, 5, 2), datetime.datetime(2018, 6, 5, 4), datetime.datetime(2018, 6, 5, 6)]
+        starts = [datetime.datetime(2018, 6, 5, 2), datetime.datetime(2018, 6, 5, 4), datetime.datetime(2018, 6, 5, 4), datetime.datetime(2018, 6, 5, 2), datetime.datetime(2018, 6, 5, 5)]
+        stops = [datetime.datetime(2018, 6, 5, 4), datetime.datetime(2018, 6, 5, 4), datetime.datetime(2018, 6, 5, 6), datetime.datetime(2018, 6, 5, 6), datetime.datetime(2018, 6, 5, 7)]
+
+        interval_indexes_per_timestamp = get_interval_indexes_per_timestamp(starts, stops, timestamps)
+
+        assert {timestamp_index: list(indexes) for timestamp_index, indexes in interval_indexes_per_timestamp.items()} == {
+            0: [0, 3],
+            1: [2, 3, 4],
+            2: [4]
+        }
+
+    def test_get_items_per_timestamp_no_timestamps(self):
+
+        assert get_items_per_timestamp(["item"], [datetime.datetime(2018, 6, 5, 2)], [datetime.datetime(2018, 6, 5, 4)], []) == {}
+
+    def test_get_items_per_timestamp_same_result_as_loops(self):
+
+        for seed in range(10):
+            intervals, timestamps = generate_intervals(2000, 50, [0, 1, 10, 600, 3600], seed)
+            starts = [interval[0] for interval in intervals]
+            stops = [interval[1] for interval in intervals]
+
+            assert get_items_per_timestamp(intervals, starts, stops, timestamps) == get_intervals_per_timestamp_by_loops(intervals, timestamps)
+        # end for
+
+    def test_get_items_per_timestamp_many_intervals(self):
+        """
+        Association for a gauge with 100k events overlapping several segments of the timeline
+        (the durations are compared in test_performance.py)
+        """
+        intervals, timestamps = generate_intervals(100000, 500, [60, 600, 3600, 7200])
+        starts = [interval[0] for interval in intervals]
+        stops = [interval[1] for interval in intervals]
+
+        assert get_items_per_timestamp(intervals, starts, stops, timestamps) == get_intervals_per_timestamp_by_loops(intervals, timestamps)
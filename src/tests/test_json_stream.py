@@ -0,0 +1,101 @@
+"""
+Automated tests for the incremental reading of json files used by the engine submodule
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import unittest
+import os
+import json
+import pickle
+import tempfile
+
+# Import json stream
+from eboa.engine.json_stream import load_data, StreamedArray, encode_streamed_array
+
+def load_streamed_arrays(data):
+    """
+    Method to replace the streamed arrays by lists with their items
+    """
+    if type(data) == StreamedArray or type(data) == list:
+        return [load_streamed_arrays(item) for item in data]
+    elif type(data) == dict:
+        return {key: load_streamed_arrays(value) for key, value in data.items()}
+    # end if
+
+    return data
+
+class TestJsonStream(unittest.TestCase):
+
+    def setUp(self):
+        self.data = {"operations": [{"mode": "insert",
+                                     "dim_signature": {"name": "dim_signature", "exec": "exec", "version": "1.0"},
+                                     "source": {"name": "source.json"},
+                                     "events": [{"key": "ñ" * (i % 3), "start": "2018-06-05T02:07:03", "values": [{"value": i * 1.5e10}]} for i in range(2500)],
+                                     "annotations": []},
+                                    {"mode": "insert", "explicit_references": [{"name": "er_{}".format(i)} for i in range(10)]}]}
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.json_path = os.path.join(self.directory.name, "data.json")
+        with open(self.json_path, "w") as output_file:
+            json.dump(self.data, output_file, ensure_ascii = False, indent = 1)
+        # end with
+
+    def test_load_data(self):
+
+        for buffer_size in [7, 101, 1048576]:
+            data = load_data(self.json_path, buffer_size = buffer_size)
+
+            events = data["operations"][0]["events"]
+            assert type(events) == StreamedArray
+            assert len(events) == 2500
+            assert len(data["operations"][0]["annotations"]) == 0
+            assert load_streamed_arrays(data) == self.data
+
+            # Streamed arrays are iterated in chunks and can be sent to other processes
+            assert [len(chunk) for chunk in events.iterate_chunks(1000)] == [1000, 1000, 500]
+            assert load_streamed_arrays(pickle.loads(pickle.dumps(data))) == self.data
+        # end for
+
+        assert json.loads(json.dumps(data["operations"][1], default = encode_streamed_array))["explicit_references"] == {"streamed_from": self.json_path, "items": 10}
+
+    def test_load_data_treating_items(self):
+
+        treated_items = []
+        def treat_items(key, items, summary):
+            treated_items.append((key, len(items)))
+            summary["n_items"] = summary.get("n_items", 0) + len(items)
+        # end def
+
+        data = load_data(self.json_path, buffer_size = 101, treat_items = treat_items)
+
+        # The items are treated in chunks while loading the file (empty arrays are not treated)
+        assert treated_items == [("events", 1000), ("events", 1000), ("events", 500), ("explicit_references", 10)]
+        assert data["operations"][0]["events"].summary == {"n_items": 2500}
+        assert data["operations"][0]["annotations"].summary == {}
+        assert data["operations"][1]["explicit_references"].summary == {"n_items": 10}
+        assert load_streamed_arrays(data) == self.data
+
+        # The summaries are kept when sending the arrays to other processes
+        assert pickle.loads(pickle.dumps(data))["operations"][0]["events"].summary == {"n_items": 2500}
+
+    def test_load_wrong_data(self):
+
+        with open(self.json_path) as input_file:
+            content = input_file.read()
+        # end with
+
+        for wrong_content in [content[:-2], content[:len(content) // 2], content + "{}", "not json"]:
+            with open(self.json_path, "w") as output_file:
+                output_file.write(wrong_content)
+            # end with
+            with self.assertRaises(ValueError):
+                load_data(self.json_path, buffer_size = 64)
+            # end with
+        # end for
+
+        with self.assertRaises(OSError):
+            load_data(os.path.join(self.directory.name, "missing.json"))
+        # end with
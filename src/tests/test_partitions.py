@@ -0,0 +1,341 @@
+"""
+Automated tests for the management of the partitions of the events
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import unittest
+import datetime
+import os
+import re
+
+# Import datamodel
+from eboa.datamodel.base import engine
+from eboa.datamodel.events import Event, EventLink, EventText, EventDouble, EventBoolean
+from eboa.datamodel.sources import Source
+
+# Import engine of the DDBB
+from eboa.engine.engine import Engine
+from eboa.engine.query import Query
+
+# Import partitions management
+import eboa.engine.partitions as partitions
+
+datamodel_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "datamodel")
+
+def execute_sql(sql):
+    """
+    Method to execute a sql script over the DDBB
+    """
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(sql)
+        connection.commit()
+    finally:
+        connection.close()
+    # end try
+
+def restore_events_layout():
+    """
+    Method to restore the layout of the events defined in eboa_data_model.sql
+    after applying eboa_events_partitioning.sql
+    """
+    statements = ["DROP TABLE eboa.events, eboa.event_texts, eboa.event_doubles CASCADE;",
+                  "DROP FUNCTION eboa.delete_event_references() CASCADE;",
+                  "DROP FUNCTION eboa.delete_referencing_events() CASCADE;"]
+    with open(os.path.join(datamodel_path, "eboa_data_model.sql")) as input_file:
+        content = input_file.read()
+    # end with
+    # Objects of the data model over the tables replaced by the partitioning
+    for block in content.split("-- object: ")[1:]:
+        sql = "\n".join([line for line in block.splitlines() if not line.startswith("--")]).strip()
+        if re.search(r"\beboa\.(events|event_texts|event_doubles)\b", sql):
+            statements.append(sql)
+        # end if
+    # end for
+    execute_sql("SET search_path TO pg_catalog,public,eboa;\n" + "\n".join(statements))
+
+class TestPartitions(unittest.TestCase):
+    def setUp(self):
+        # Instantiate the query component
+        self.query = Query()
+
+        # Create the engine to manage the data
+        self.engine_eboa = Engine()
+
+        # Clear all tables before executing the test
+        self.query.clear_db()
+
+    def tearDown(self):
+        # Close connections to the DDBB
+        self.engine_eboa.close_session()
+        self.query.close_session()
+
+    def test_partition_bound_regex(self):
+
+        match = partitions.partition_bound_regex.match("FOR VALUES FROM ('2018-06-01 00:00:00') TO ('2018-07-01 00:00:00')")
+
+        assert match.groups() == ("2018-06-01 00:00:00", "2018-07-01 00:00:00")
+
+        assert partitions.partition_bound_regex.match("DEFAULT") == None
+
+    def test_drop_events_partitions_not_partitioned(self):
+
+        data = {"operations": [{
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T00:00:00",
+                           "validity_stop": "2018-06-06T00:00:00"},
+                "events": [{
+                    "gauge": {"name": "GAUGE_NAME",
+                              "system": "GAUGE_SYSTEM",
+                              "insertion_type": "SIMPLE_UPDATE"},
+                    "start": "2018-06-05T01:00:00",
+                    "stop": "2018-06-05T02:00:00"
+                }]
+            }]}
+        self.engine_eboa.treat_data(data)
+
+        session = self.query.session
+
+        # The default datamodel has no partitions
+        assert partitions.is_events_table_partitioned(session) == False
+
+        assert partitions.get_events_partitions(session) == []
+
+        assert partitions.drop_events_partitions(session, datetime.datetime(2019, 1, 1)) == []
+
+        assert len(self.query.get_events()) == 1
+
+class TestPartitionedEvents(unittest.TestCase):
+    def setUp(self):
+        # Clear all tables before partitioning the events
+        query = Query()
+        query.clear_db()
+        query.close_session()
+
+        with open(os.path.join(datamodel_path, "eboa_events_partitioning.sql")) as input_file:
+            execute_sql(input_file.read())
+        # end with
+
+        # Instantiate the query component
+        self.query = Query()
+
+        # Create the engine to manage the data
+        self.engine_eboa = Engine()
+
+    def tearDown(self):
+        # Close connections to the DDBB
+        self.engine_eboa.close_session()
+        self.query.close_session()
+
+        # Restore the layout of the events for the rest of tests
+        query = Query()
+        query.clear_db()
+        query.close_session()
+        restore_events_layout()
+
+    def ingest_events(self):
+
+        def event(link_ref, link, start, stop):
+            return {
+                "link_ref": link_ref,
+                "gauge": {"name": "GAUGE_NAME",
+                          "system": "GAUGE_SYSTEM",
+                          "insertion_type": "SIMPLE_UPDATE"},
+                "start": start,
+                "stop": stop,
+                "values": [{"name": "TEXT",
+                            "type": "text",
+                            "value": "TEXT"},
+                           {"name": "DOUBLE",
+                            "type": "double",
+                            "value": "1.4"},
+                           {"name": "BOOLEAN",
+                            "type": "boolean",
+                            "value": "true"}],
+                "links": [{"name": "EVENT_LINK_NAME",
+                           "link": link,
+                           "link_mode": "by_ref",
+                           "back_ref": "EVENT_BACK_LINK_NAME"}]
+            }
+
+        data = {"operations": [{
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-08-06T13:33:29",
+                           "generation_time": "2018-08-05T02:07:03",
+                           "validity_start": "2018-06-01T00:00:00",
+                           "validity_stop": "2018-08-01T00:00:00"},
+                "events": [event("EVENT_JUNE1", "EVENT_JULY", "2018-06-05T01:00:00", "2018-06-05T02:00:00"),
+                           event("EVENT_JUNE2", "EVENT_JUNE1", "2018-06-30T23:00:00", "2018-07-01T01:00:00"),
+                           event("EVENT_JULY", "EVENT_JUNE2", "2018-07-05T01:00:00", "2018-07-05T02:00:00")]
+            }]}
+        exit_status = self.engine_eboa.treat_data(data)
+
+        assert len([item for item in exit_status if item["status"] != 0]) == 0
+
+    def test_drop_events_partitions(self):
+
+        session = self.query.session
+
+        assert partitions.is_events_table_partitioned(session) == True
+
+        assert partitions.create_events_partitions(session, datetime.datetime(2018, 6, 15), datetime.datetime(2018, 8, 1)) == ["events_201806", "events_201807"]
+        session.commit()
+
+        self.ingest_events()
+
+        assert len(session.query(Event).all()) == 3
+        assert len(session.query(EventText).all()) == 3
+        assert len(session.query(EventDouble).all()) == 3
+        assert len(session.query(EventBoolean).all()) == 3
+        assert len(session.query(EventLink).all()) == 6
+
+        # The doubles and texts are stored in the partitions of the months of the start of their events
+        for value_class in [EventText, EventDouble]:
+            assert set([(value.event_start, value.event.start) for value in session.query(value_class).all()]) == set([(event.start, event.start) for event in session.query(Event).all()])
+        # end for
+        assert session.execute("SELECT count(*) FROM eboa.event_texts_201806").scalar() == 2
+        assert session.execute("SELECT count(*) FROM eboa.event_doubles_201807").scalar() == 1
+
+        # The partition of June is dropped with the partitions of its doubles and texts and with the values and the links of its events
+        dropped_partitions = partitions.drop_events_partitions(session, datetime.datetime(2018, 7, 15))
+        session.commit()
+
+        assert [partition["name"] for partition in dropped_partitions] == ["events_201806"]
+
+        assert [partition["name"] for partition in partitions.get_events_partitions(session)] == ["events_201807"]
+        assert [partition["name"] for partition in partitions.get_events_partitions(session, "event_texts")] == ["event_texts_201807"]
+        assert [partition["name"] for partition in partitions.get_events_partitions(session, "event_doubles")] == ["event_doubles_201807"]
+
+        events = session.query(Event).all()
+
+        assert len(events) == 1
+        assert events[0].start == datetime.datetime(2018, 7, 5, 1, 0, 0)
+
+        for value_class in [EventText, EventDouble, EventBoolean]:
+            values = session.query(value_class).all()
+            assert [value.event_uuid for value in values] == [events[0].event_uuid]
+        # end for
+
+        assert len(session.query(EventLink).all()) == 0
+
+    def test_create_events_partitions_with_data_in_default(self):
+
+        session = self.query.session
+
+        # Historical data is ingested before creating its partitions
+        self.ingest_events()
+
+        assert session.execute("SELECT count(*) FROM eboa.events_default").scalar() == 3
+
+        # The partitions of the past months are created moving the rows of the default partitions
+        assert partitions.create_events_partitions(session, datetime.datetime(2018, 6, 1), datetime.datetime(2018, 8, 1)) == ["events_201806", "events_201807"]
+        session.commit()
+
+        for table in ["events", "event_texts", "event_doubles"]:
+            assert session.execute("SELECT count(*) FROM eboa.{}_default".format(table)).scalar() == 0
+            assert session.execute("SELECT count(*) FROM eboa.{}_201806".format(table)).scalar() == 2
+            assert session.execute("SELECT count(*) FROM eboa.{}_201807".format(table)).scalar() == 1
+        # end for
+
+        # Moving the rows does not remove the associated information
+        assert len(session.query(EventBoolean).all()) == 3
+        assert len(session.query(EventLink).all()) == 6
+
+        # The created partitions can be dropped
+        assert [partition["name"] for partition in partitions.drop_events_partitions(session, datetime.datetime(2018, 8, 1))] == ["events_201806", "events_201807"]
+        session.commit()
+
+        assert len(session.query(Event).all()) == 0
+        assert len(session.query(EventText).all()) == 0
+        assert len(session.query(EventBoolean).all()) == 0
+
+    def test_split_events_partitioned(self):
+
+        session = self.query.session
+
+        partitions.create_events_partitions(session, datetime.datetime(2018, 6, 1), datetime.datetime(2018, 8, 1))
+        session.commit()
+
+        def operation(generation_time, validity_start, validity_stop, events):
+            return {
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source_{}.xml".format(generation_time),
+                           "reception_time": generation_time,
+                           "generation_time": generation_time,
+                           "validity_start": validity_start,
+                           "validity_stop": validity_stop},
+                "events": events
+            }
+
+        event = {"gauge": {"name": "GAUGE_NAME",
+                           "system": "GAUGE_SYSTEM",
+                           "insertion_type": "INSERT_and_ERASE"},
+                 "start": "2018-06-05T00:00:00",
+                 "stop": "2018-07-05T00:00:00",
+                 "values": [{"name": "TEXT",
+                             "type": "text",
+                             "value": "TEXT"},
+                            {"name": "DOUBLE",
+                             "type": "double",
+                             "value": "1.4"}]}
+
+        exit_status = self.engine_eboa.treat_data({"operations": [operation("2018-08-01T00:00:00", "2018-06-01T00:00:00", "2018-08-01T00:00:00", [event])]})
+        assert len([item for item in exit_status if item["status"] != 0]) == 0
+
+        # A newer source covering the middle of the event splits it
+        exit_status = self.engine_eboa.treat_data({"operations": [operation("2018-08-02T00:00:00", "2018-06-10T00:00:00", "2018-06-20T00:00:00", [])]})
+        assert len([item for item in exit_status if item["status"] != 0]) == 0
+
+        events = session.query(Event).order_by(Event.start).all()
+        assert [(event.start, event.stop) for event in events] == [(datetime.datetime(2018, 6, 5), datetime.datetime(2018, 6, 10)),
+                                                                   (datetime.datetime(2018, 6, 20), datetime.datetime(2018, 7, 5))]
+
+        # The replicated doubles and texts are stored with the start of the new events
+        for value_class in [EventText, EventDouble]:
+            assert sorted([(value.event_uuid, value.event_start) for value in session.query(value_class).all()]) == sorted([(event.event_uuid, event.start) for event in events])
+        # end for
+
+    def test_delete_events_partitioned(self):
+
+        session = self.query.session
+
+        partitions.create_events_partitions(session, datetime.datetime(2018, 6, 1), datetime.datetime(2018, 8, 1))
+        session.commit()
+
+        self.ingest_events()
+
+        # Deletions through the root table remove the associated information once per statement
+        self.query.delete(session.query(Event).filter(Event.start < datetime.datetime(2018, 7, 1)))
+
+        events = session.query(Event).all()
+
+        assert len(events) == 1
+        assert len(session.query(EventText).all()) == 1
+
+        # As with the foreign keys of the default layout, the links are removed with the event of their event_uuid
+        assert [link.event_uuid for link in session.query(EventLink).all()] == [events[0].event_uuid, events[0].event_uuid]
+
+        # Deletions cascaded from the sources remove the events and their associated information
+        self.query.delete(session.query(Source))
+
+        assert len(session.query(Event).all()) == 0
+        assert len(session.query(EventText).all()) == 0
+        assert len(session.query(EventDouble).all()) == 0
+        assert len(session.query(EventBoolean).all()) == 0
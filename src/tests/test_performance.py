@@ -13,6 +13,15 @@ import eboa.engine.engine as eboa_engine
 from eboa.engine.engine import Engine
 from eboa.engine.query import Query
 from eboa.datamodel.base import Session, engine, Base
+import eboa.engine.baked_queries as baked_queries
+
+# Import datamodel
+from eboa.datamodel.dim_signatures import DimSignature
+from eboa.datamodel.gauges import Gauge
+
+# Import interval index
+from eboa.engine.intervals import get_items_per_timestamp
+from test_intervals import get_intervals_per_timestamp_by_loops, generate_intervals
 
 class TestEngine(unittest.TestCase):
     def setUp(self):
@@ -163,3 +172,89 @@ class TestEngine(unittest.TestCase):
         print("The insertion lasted {} seconds.".format((stop - start).total_seconds()))
 
         assert len(self.query_eboa.get_annotations()) == 5000
+
+    def test_performance_baked_lookups(self):
+        """
+        Method to compare the number of compilations of the SQL statements of the lookups
+        repeated by the engine without and with the baked queries
+        """
+        print()
+        data = {"operations": [{
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T02:07:03",
+                           "validity_stop": "2018-06-05T08:07:36"},
+                "events": [{
+                    "gauge": {"name": "GAUGE_NAME",
+                              "system": "GAUGE_SYSTEM",
+                              "insertion_type": "SIMPLE_UPDATE"},
+                    "start": "2018-06-05T02:07:03",
+                    "stop": "2018-06-05T08:07:36"
+                }]
+            }]
+        }
+        returned_value = self.engine_eboa.treat_data(data)[0]["status"]
+        assert returned_value == eboa_engine.exit_codes["OK"]["status"]
+
+        dim_signature = self.session.query(DimSignature).first()
+
+        # Count the compilations of SQL statements made through the engine of the DDBB
+        compilations = []
+        class CountingCompiler(engine.dialect.statement_compiler):
+            def __init__(self, *args, **kwargs):
+                compilations.append(1)
+                super().__init__(*args, **kwargs)
+        engine.dialect.statement_compiler = CountingCompiler
+        self.addCleanup(delattr, engine.dialect, "statement_compiler")
+
+        start = datetime.datetime.now()
+        for i in range(0,1000):
+            gauge = self.session.query(Gauge).filter(Gauge.name == "GAUGE_NAME", Gauge.system == "GAUGE_SYSTEM", Gauge.dim_signature_uuid == dim_signature.dim_signature_uuid).first()
+            assert gauge != None
+        # end for
+        stop = datetime.datetime.now()
+        compilations_without_baking = len(compilations)
+        print("The lookups without baked queries lasted {} seconds and compiled {} statements.".format((stop - start).total_seconds(), compilations_without_baking))
+
+        del compilations[:]
+        start = datetime.datetime.now()
+        for i in range(0,1000):
+            gauge = baked_queries.get_gauge(self.session, "GAUGE_NAME", "GAUGE_SYSTEM", dim_signature.dim_signature_uuid)
+            assert gauge != None
+        # end for
+        stop = datetime.datetime.now()
+        compilations_with_baking = len(compilations)
+        print("The lookups with baked queries lasted {} seconds and compiled {} statements.".format((stop - start).total_seconds(), compilations_with_baking))
+
+        assert compilations_without_baking == 1000
+        # The statement could be already compiled by the ingestion
+        assert compilations_with_baking <= 1
+
+class TestIntervals(unittest.TestCase):
+
+    def test_performance_get_items_per_timestamp(self):
+        """
+        Micro-benchmark comparing the nested loops against the interval index for a gauge with 100k events
+        overlapping several segments of the timeline
+        """
+        print()
+        intervals, timestamps = generate_intervals(100000, 500, [60, 600, 3600, 7200])
+        starts = [interval[0] for interval in intervals]
+        stops = [interval[1] for interval in intervals]
+
+        start = datetime.datetime.now()
+        intervals_per_timestamp_by_loops = get_intervals_per_timestamp_by_loops(intervals, timestamps)
+        stop = datetime.datetime.now()
+        print("The association with nested loops lasted {} seconds.".format((stop - start).total_seconds()))
+
+        start = datetime.datetime.now()
+        intervals_per_timestamp = get_items_per_timestamp(intervals, starts, stops, timestamps)
+        stop = datetime.datetime.now()
+        print("The association with the interval index lasted {} seconds.".format((stop - start).total_seconds()))
+
+        assert intervals_per_timestamp == intervals_per_timestamp_by_loops
@@ -10,6 +10,7 @@ import os
 import sys
 import unittest
 import datetime
+import uuid
 
 # Import engine of the DDBB
 import eboa.engine.engine as eboa_engine
@@ -32,6 +33,16 @@ from sqlalchemy.dialects import postgresql
 # Import exceptions
 from eboa.engine.errors import InputError
 
+# Import keyset pagination
+from eboa.engine.pagination import get_page_token
+
+# Import query logging and instrumentation
+import eboa.engine.query as eboa_query
+from eboa.engine.instrumentation import query_instrumentation
+
+# Import overlap conditions
+import eboa.engine.periods as periods
+
 class TestQuery(unittest.TestCase):
     def setUp(self):
         # Instantiate the query component
@@ -1028,6 +1039,316 @@ class TestQuery(unittest.TestCase):
 
         assert result == True
 
+    def test_query_events_text_filter_operators(self):
+        data = {"operations": [{
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T00:00:00",
+                           "validity_stop": "2018-06-06T00:00:00"},
+                "events": [{
+                    "explicit_reference": "EXPLICIT_REFERENCE" + str(i),
+                    "gauge": {
+                        "name": "GAUGE" + str(i),
+                        "system": "SYSTEM",
+                        "insertion_type": "SIMPLE_UPDATE"
+                    },
+                    "start": "2018-06-05T" + str(i).zfill(2) + ":00:00",
+                    "stop": "2018-06-05T" + str(i).zfill(2) + ":30:00"
+                } for i in range(3)]
+            }]}
+        self.engine_eboa.treat_data(data)
+
+        order_by = {"field": "start", "descending": False}
+
+        events = self.query.get_events(gauge_names = {"filter": "GAUGE1", "op": "=="})
+
+        assert len(events) == 1
+
+        events = self.query.get_events(gauge_names = {"filter": "GAUGE1", "op": "!="})
+
+        assert len(events) == 2
+
+        events = self.query.get_events(gauge_names = {"filter": "GAUGE%", "op": "like"})
+
+        assert len(events) == 3
+
+        events = self.query.get_events(gauge_names = {"filter": "%1", "op": "notlike"})
+
+        assert len(events) == 2
+
+        events = self.query.get_events(gauge_names = {"filter": ["GAUGE0", "GAUGE2"], "op": "in"}, order_by = order_by)
+
+        assert [event.gauge.name for event in events] == ["GAUGE0", "GAUGE2"]
+
+        events = self.query.get_events(gauge_names = {"filter": ["GAUGE0", "GAUGE2"], "op": "notin"})
+
+        assert len(events) == 1
+
+        events = self.query.get_events(gauge_names = {"filter": "^GAUGE[12]$", "op": "regex"}, order_by = order_by)
+
+        assert [event.gauge.name for event in events] == ["GAUGE1", "GAUGE2"]
+
+        events = self.query.get_events(explicit_refs = {"filter": "0$", "op": "regex"})
+
+        assert len(events) == 1
+
+        events = self.query.get_events(order_by = {"field": "start", "descending": True})
+
+        assert [event.gauge.name for event in events] == ["GAUGE2", "GAUGE1", "GAUGE0"]
+
+    def test_iter_events(self):
+        data = {"operations": [{
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T00:00:00",
+                           "validity_stop": "2018-06-06T00:00:00"},
+                "events": [{
+                    "explicit_reference": "EXPLICIT_REFERENCE" + str(i % 2),
+                    "gauge": {
+                        "name": "GAUGE" + str(i % 3),
+                        "system": "SYSTEM",
+                        "insertion_type": "SIMPLE_UPDATE"
+                    },
+                    "start": "2018-06-05T" + str(i).zfill(2) + ":00:00",
+                    "stop": "2018-06-05T" + str(i).zfill(2) + ":30:00"
+                } for i in range(10)],
+                "annotations": [{
+                    "explicit_reference": "EXPLICIT_REFERENCE" + str(i % 2),
+                    "annotation_cnf": {
+                        "name": "NAME" + str(i),
+                        "system": "SYSTEM"
+                    }
+                } for i in range(4)]
+            }]}
+        self.engine_eboa.treat_data(data)
+
+        order_by = {"field": "start", "descending": False}
+        events = self.query.get_events(gauge_names = {"filter": ["GAUGE0", "GAUGE1"], "op": "in"}, order_by = order_by)
+
+        assert len(events) == 7
+
+        iterated_events = self.query.iter_events(batch_size = 2, gauge_names = {"filter": ["GAUGE0", "GAUGE1"], "op": "in"}, order_by = order_by)
+
+        assert [event.event_uuid for event in iterated_events] == [event.event_uuid for event in events]
+
+        rows = list(self.query.iter_events(batch_size = 3, columns = ["event_uuid", "start"], gauge_names = {"filter": ["GAUGE0", "GAUGE1"], "op": "in"}, order_by = order_by))
+
+        assert [(row.event_uuid, row.start) for row in rows] == [(event.event_uuid, event.start) for event in events]
+
+        sources = self.query.get_sources()
+
+        assert [source.source_uuid for source in self.query.iter_sources(batch_size = 1)] == [source.source_uuid for source in sources]
+
+        annotations = self.query.get_annotations(explicit_refs = {"filter": "EXPLICIT_REFERENCE0", "op": "=="}, order_by = {"field": "annotation_uuid", "descending": False})
+
+        assert len(annotations) == 2
+        assert [row.annotation_uuid for row in self.query.iter_annotations(batch_size = 1, columns = ["annotation_uuid"], explicit_refs = {"filter": "EXPLICIT_REFERENCE0", "op": "=="}, order_by = {"field": "annotation_uuid", "descending": False})] == [annotation.annotation_uuid for annotation in annotations]
+
+        explicit_refs = self.query.get_explicit_refs(order_by = {"field": "explicit_ref", "descending": False})
+
+        assert len(explicit_refs) == 2
+        assert [explicit_ref.explicit_ref for explicit_ref in self.query.iter_explicit_refs(batch_size = 1, order_by = {"field": "explicit_ref", "descending": False})] == ["EXPLICIT_REFERENCE0", "EXPLICIT_REFERENCE1"]
+
+    def test_wrong_inputs_iter_events(self):
+
+        result = False
+        try:
+            self.query.iter_events(batch_size = 0)
+        except InputError:
+            result = True
+        # end try
+
+        assert result == True
+
+        result = False
+        try:
+            self.query.iter_events(columns = ["not_a_column"])
+        except InputError:
+            result = True
+        # end try
+
+        assert result == True
+
+        result = False
+        try:
+            self.query.iter_events(source_uuids = "not_a_list")
+        except InputError:
+            result = True
+        # end try
+
+        assert result == True
+
+    def test_query_event_keyset_pagination(self):
+        data = {"operations": [{
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T00:00:00",
+                           "validity_stop": "2018-06-06T00:00:00"},
+                "events": [{
+                    "gauge": {
+                        "name": "GAUGE",
+                        "system": "SYSTEM",
+                        "insertion_type": "SIMPLE_UPDATE"
+                    },
+                    # Repeated starts to check the order by the primary key
+                    "start": "2018-06-05T" + str(i // 2).zfill(2) + ":00:00",
+                    "stop": "2018-06-05T" + str(i // 2).zfill(2) + ":30:00"
+                } for i in range(11)]
+            }]}
+        self.engine_eboa.treat_data(data)
+
+        for order_by in [{"field": "start", "descending": False}, {"field": "start", "descending": True}]:
+            events = self.query.get_events(order_by = order_by)
+
+            assert len(events) == 11
+
+            paginated_events = []
+            page = self.query.get_events(order_by = order_by, limit = 3)
+            while len(page) > 0:
+                paginated_events += page
+                page = self.query.get_events(order_by = order_by, limit = 3, after = get_page_token(page, order_by))
+            # end while
+
+            assert [event.event_uuid for event in paginated_events] == [event.event_uuid for event in events]
+        # end for
+
+        # The order of the token is applied if order_by is not received
+        order_by = {"field": "start", "descending": False}
+        page = self.query.get_events(order_by = order_by, limit = 4)
+        next_page = self.query.get_events(limit = 4, after = get_page_token(page, order_by))
+
+        assert [event.event_uuid for event in page + next_page] == [event.event_uuid for event in events[::-1][0:8]]
+
+        sources = self.query.get_sources(order_by = {"field": "name", "descending": False}, after = get_page_token(self.query.get_sources(order_by = {"field": "name", "descending": False}), {"field": "name", "descending": False}))
+
+        assert len(sources) == 0
+
+        # The query methods return the token of the next page if requested
+        paginated_events = []
+        page, token = self.query.get_events(order_by = {"field": "start", "descending": False}, limit = 3, return_page_token = True)
+        while len(page) > 0:
+            paginated_events += page
+            page, token = self.query.get_events(limit = 3, after = token, return_page_token = True)
+        # end while
+
+        assert [event.event_uuid for event in paginated_events] == [event.event_uuid for event in events[::-1]]
+
+        assert token == None
+
+        # The primary key is used to order the pages if there is no order_by nor token
+        paginated_events = []
+        page, token = self.query.get_events(limit = 3, return_page_token = True)
+        while len(page) > 0:
+            paginated_events += page
+            page, token = self.query.get_events(limit = 3, after = token, return_page_token = True)
+        # end while
+
+        assert [event.event_uuid for event in paginated_events] == sorted([event.event_uuid for event in events])
+
+    def test_wrong_inputs_query_event_keyset_pagination(self):
+
+        result = False
+        try:
+            self.query.get_events(after = "not_a_token")
+        except InputError:
+            result = True
+        # end try
+
+        assert result == True
+
+        result = False
+        try:
+            event = Event(uuid.uuid1(), datetime.datetime(2018, 6, 5), datetime.datetime(2018, 6, 6), datetime.datetime.now(), None, None)
+            self.query.get_events(order_by = {"field": "stop", "descending": False}, after = get_page_token([event], {"field": "start", "descending": False}))
+        except InputError:
+            result = True
+        # end try
+
+        assert result == True
+
+        # The fields have to be columns of the entity
+        result = False
+        try:
+            self.query.get_events(order_by = {"field": "gauge", "descending": False})
+        except InputError:
+            result = True
+        # end try
+
+        assert result == True
+
+    def test_log_query_not_compiled_without_debug_level(self):
+
+        class QueryNotToCompile():
+            @property
+            def statement(self):
+                raise AssertionError("The statement should not be compiled")
+
+        previous_level = eboa_query.logger.level
+        self.addCleanup(eboa_query.logger.setLevel, previous_level)
+        eboa_query.logger.setLevel("INFO")
+
+        eboa_query.log_query(QueryNotToCompile())
+
+    def test_query_instrumentation(self):
+        data = {"operations": [{
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T00:00:00",
+                           "validity_stop": "2018-06-06T00:00:00"},
+                "events": [{
+                    "gauge": {
+                        "name": "GAUGE",
+                        "system": "SYSTEM",
+                        "insertion_type": "SIMPLE_UPDATE"
+                    },
+                    "start": "2018-06-05T0" + str(i) + ":00:00",
+                    "stop": "2018-06-05T0" + str(i) + ":30:00"
+                } for i in range(3)]
+            }]}
+        self.engine_eboa.treat_data(data)
+
+        query_instrumentation.enable(engine, slow_query_threshold = 0)
+        self.addCleanup(query_instrumentation.disable)
+        query_instrumentation.reset()
+
+        events = self.query.get_events()
+        self.query.get_events(limit = 1)
+
+        assert len(events) == 3
+
+        statistics = query_instrumentation.get_statistics()
+
+        assert statistics["get_events"]["calls"] == 2
+        assert statistics["get_events"]["rows"] == 4
+        assert statistics["get_events"]["duration"] >= statistics["get_events"]["max_duration"]
+
+        query_instrumentation.disable()
+        query_instrumentation.reset()
+
+        self.query.get_events()
+
+        assert query_instrumentation.get_statistics() == {}
+
     def test_query_event_key(self):
         data = {"operations": [{
                 "mode": "insert",
@@ -1508,6 +1829,386 @@ class TestQuery(unittest.TestCase):
         assert result == True
 
 
+    def test_query_event_summaries(self):
+
+        event_summaries = eboa_engine.config.get("EVENT_SUMMARIES")
+        eboa_engine.config["EVENT_SUMMARIES"] = True
+        self.addCleanup(eboa_engine.config.__setitem__, "EVENT_SUMMARIES", event_summaries)
+
+        data = {"operations": [{
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T00:00:00",
+                           "validity_stop": "2018-06-07T00:00:00"},
+                "events": [{
+                    "explicit_reference": "EXPLICIT_REFERENCE",
+                    "gauge": {"name": "GAUGE_NAME",
+                              "system": "GAUGE_SYSTEM",
+                              "insertion_type": "INSERT_and_ERASE"},
+                    "start": "2018-06-05T01:00:00",
+                    "stop": "2018-06-05T02:00:00"
+                },{
+                    "explicit_reference": "EXPLICIT_REFERENCE",
+                    "gauge": {"name": "GAUGE_NAME",
+                              "system": "GAUGE_SYSTEM",
+                              "insertion_type": "INSERT_and_ERASE"},
+                    "start": "2018-06-05T03:00:00",
+                    "stop": "2018-06-05T05:00:00"
+                },{
+                    "explicit_reference": "EXPLICIT_REFERENCE",
+                    "gauge": {"name": "GAUGE_NAME",
+                              "system": "GAUGE_SYSTEM",
+                              "insertion_type": "INSERT_and_ERASE"},
+                    "start": "2018-06-06T01:00:00",
+                    "stop": "2018-06-06T01:30:00"
+                }]
+            }]}
+        self.engine_eboa.treat_data(data)
+
+        summaries = self.query.get_event_summaries(gauge_names = {"filter": "GAUGE_NAME", "op": "=="}, order_by = {"field": "day", "descending": False})
+
+        assert [(summary.day, summary.event_count, summary.total_duration) for summary in summaries] == [
+            (datetime.date(2018, 6, 5), 2, 10800.0),
+            (datetime.date(2018, 6, 6), 1, 1800.0)
+        ]
+        assert summaries[0].min_start == datetime.datetime(2018, 6, 5, 1, 0, 0)
+        assert summaries[0].max_stop == datetime.datetime(2018, 6, 5, 5, 0, 0)
+
+        # Newer source replacing the events of the first day
+        data["operations"][0]["source"] = {"name": "source2.xml",
+                                           "reception_time": "2018-06-06T13:33:29",
+                                           "generation_time": "2018-07-06T02:07:03",
+                                           "validity_start": "2018-06-05T00:00:00",
+                                           "validity_stop": "2018-06-06T00:00:00"}
+        data["operations"][0]["events"] = [{
+            "explicit_reference": "EXPLICIT_REFERENCE",
+            "gauge": {"name": "GAUGE_NAME",
+                      "system": "GAUGE_SYSTEM",
+                      "insertion_type": "INSERT_and_ERASE"},
+            "start": "2018-06-05T10:00:00",
+            "stop": "2018-06-05T11:00:00"
+        }]
+        self.engine_eboa.treat_data(data)
+
+        summaries = self.query.get_event_summaries(explicit_refs = {"filter": "EXPLICIT_REFERENCE", "op": "=="}, order_by = {"field": "day", "descending": False})
+
+        assert [(summary.day, summary.event_count, summary.total_duration) for summary in summaries] == [
+            (datetime.date(2018, 6, 5), 1, 3600.0),
+            (datetime.date(2018, 6, 6), 1, 1800.0)
+        ]
+
+        summaries = self.query.get_event_summaries(day_filters = [{"date": "2018-06-06T00:00:00", "op": ">="}])
+
+        assert len(summaries) == 1
+
+        statistics = self.query.get_event_statistics(gauge_names = {"filter": "GAUGE_NAME", "op": "=="})
+
+        assert statistics == [{"gauge_uuid": summaries[0].gauge_uuid,
+                               "event_count": 2,
+                               "total_duration": 5400.0,
+                               "start": datetime.datetime(2018, 6, 5, 10, 0, 0),
+                               "stop": datetime.datetime(2018, 6, 6, 1, 30, 0)}]
+
+        # The summaries computed again from the events are the same
+        self.query.refresh_event_summaries()
+
+        assert self.query.get_event_statistics(gauge_names = {"filter": "GAUGE_NAME", "op": "=="}) == statistics
+
+        # The deletion of a source refreshes the summaries of its events
+        query_event_summaries = eboa_query.config.get("EVENT_SUMMARIES")
+        eboa_query.config["EVENT_SUMMARIES"] = True
+        self.addCleanup(eboa_query.config.__setitem__, "EVENT_SUMMARIES", query_event_summaries)
+
+        self.query.get_sources(names = {"filter": "source2.xml", "op": "=="}, delete = True)
+
+        summaries = self.query.get_event_summaries(order_by = {"field": "day", "descending": False})
+
+        assert [(summary.day, summary.event_count, summary.total_duration) for summary in summaries] == [
+            (datetime.date(2018, 6, 6), 1, 1800.0)
+        ]
+
+        # The deletion of events refreshes the summaries of their days
+        self.query.delete(self.query.session.query(Event).filter(Event.start >= datetime.datetime(2018, 6, 6)))
+
+        assert len(self.query.get_event_summaries()) == 0
+
+    def test_query_events_period_indexes(self):
+
+        period_indexes = periods.config.get("PERIOD_INDEXES")
+        periods.config["PERIOD_INDEXES"] = True
+        self.addCleanup(periods.config.__setitem__, "PERIOD_INDEXES", period_indexes)
+
+        data = {"operations": [{
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T00:00:00",
+                           "validity_stop": "2018-06-06T00:00:00"},
+                "events": [{
+                    "gauge": {"name": "GAUGE_NAME",
+                              "system": "GAUGE_SYSTEM",
+                              "insertion_type": "INSERT_and_ERASE"},
+                    "start": "2018-06-05T01:00:00",
+                    "stop": "2018-06-05T02:00:00"
+                },{
+                    "gauge": {"name": "GAUGE_NAME",
+                              "system": "GAUGE_SYSTEM",
+                              "insertion_type": "INSERT_and_ERASE"},
+                    "start": "2018-06-05T03:00:00",
+                    "stop": "2018-06-05T05:00:00"
+                }]
+            }]}
+        self.engine_eboa.treat_data(data)
+
+        # Newer source removing the events of its validity period through the overlap conditions
+        data["operations"][0]["source"] = {"name": "source2.xml",
+                                           "reception_time": "2018-06-06T13:33:29",
+                                           "generation_time": "2018-07-06T02:07:03",
+                                           "validity_start": "2018-06-05T01:30:00",
+                                           "validity_stop": "2018-06-05T02:30:00"}
+        data["operations"][0]["events"] = [{
+            "gauge": {"name": "GAUGE_NAME",
+                      "system": "GAUGE_SYSTEM",
+                      "insertion_type": "INSERT_and_ERASE"},
+            "start": "2018-06-05T01:30:00",
+            "stop": "2018-06-05T02:30:00"
+        }]
+        self.engine_eboa.treat_data(data)
+
+        query = self.query.get_events(start_filters = [{"date": "2018-06-05T02:00:00", "op": "<"}],
+                                      stop_filters = [{"date": "2018-06-05T01:00:00", "op": ">"}], return_query = True)
+
+        assert "&&" in str(query.statement.compile(dialect=postgresql.dialect()))
+
+        events = query.all()
+
+        assert [(event.start, event.stop) for event in sorted(events, key = lambda event: event.start)] == [
+            (datetime.datetime(2018, 6, 5, 1, 0, 0), datetime.datetime(2018, 6, 5, 1, 30, 0)),
+            (datetime.datetime(2018, 6, 5, 1, 30, 0), datetime.datetime(2018, 6, 5, 2, 30, 0))
+        ]
+
+        # Limits of the periods are not overlapping
+        events = self.query.get_events(start_filters = [{"date": "2018-06-05T03:00:00", "op": "<"}],
+                                       stop_filters = [{"date": "2018-06-05T02:30:00", "op": ">"}])
+
+        assert len(events) == 0
+
+        sources = self.query.get_sources(validity_start_filters = [{"date": "2018-06-05T02:00:00", "op": "<="}],
+                                         validity_stop_filters = [{"date": "2018-06-05T02:00:00", "op": ">="}])
+
+        assert set([source.name for source in sources]) == set(["source.xml", "source2.xml"])
+
+        # Filters not defining an intersection are not combined
+        sources = self.query.get_sources(validity_start_filters = [{"date": "2018-06-05T00:30:00", "op": ">"}],
+                                         validity_stop_filters = [{"date": "2018-06-05T03:00:00", "op": "<"}])
+
+        assert [source.name for source in sources] == ["source2.xml"]
+
+    def test_query_events_period_indexes_with_time_zone(self):
+
+        period_indexes = periods.config.get("PERIOD_INDEXES")
+        periods.config["PERIOD_INDEXES"] = True
+        self.addCleanup(periods.config.__setitem__, "PERIOD_INDEXES", period_indexes)
+
+        data = {"operations": [{
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-06-06T13:33:29Z",
+                           "generation_time": "2018-07-05T02:07:03Z",
+                           "validity_start": "2018-06-05T00:00:00Z",
+                           "validity_stop": "2018-06-06T00:00:00Z"},
+                "events": [{
+                    "gauge": {"name": "GAUGE_NAME",
+                              "system": "GAUGE_SYSTEM",
+                              "insertion_type": "INSERT_and_ERASE_per_EVENT"},
+                    "start": "2018-06-05T01:00:00Z",
+                    "stop": "2018-06-05T02:00:00Z"
+                }]
+            }]}
+        exit_status = self.engine_eboa.treat_data(data)
+
+        assert len([item for item in exit_status if item["status"] != eboa_engine.exit_codes["OK"]["status"]]) == 0
+
+        # Newer source removing the events of its periods through the overlap conditions with time zone
+        data["operations"][0]["source"] = {"name": "source2.xml",
+                                           "reception_time": "2018-06-06T13:33:29Z",
+                                           "generation_time": "2018-07-06T02:07:03Z",
+                                           "validity_start": "2018-06-05T01:30:00Z",
+                                           "validity_stop": "2018-06-05T02:30:00Z"}
+        data["operations"][0]["events"] = [{
+            "gauge": {"name": "GAUGE_NAME",
+                      "system": "GAUGE_SYSTEM",
+                      "insertion_type": "INSERT_and_ERASE_per_EVENT"},
+            "start": "2018-06-05T01:30:00Z",
+            "stop": "2018-06-05T02:30:00Z"
+        }]
+        exit_status = self.engine_eboa.treat_data(data)
+
+        assert len([item for item in exit_status if item["status"] != eboa_engine.exit_codes["OK"]["status"]]) == 0
+
+        query = self.query.get_events(start_filters = [{"date": "2018-06-05T02:00:00Z", "op": "<"}],
+                                      stop_filters = [{"date": "2018-06-05T01:00:00+00:00", "op": ">"}], return_query = True)
+
+        assert "&&" in str(query.statement.compile(dialect=postgresql.dialect()))
+
+        events = query.all()
+
+        assert [(event.start, event.stop) for event in sorted(events, key = lambda event: event.start)] == [
+            (datetime.datetime(2018, 6, 5, 1, 0, 0), datetime.datetime(2018, 6, 5, 1, 30, 0)),
+            (datetime.datetime(2018, 6, 5, 1, 30, 0), datetime.datetime(2018, 6, 5, 2, 30, 0))
+        ]
+
+        sources = self.query.get_sources(validity_start_filters = [{"date": "2018-06-05T02:00:00Z", "op": "<="}],
+                                         validity_stop_filters = [{"date": "2018-06-05T02:00:00Z", "op": ">="}])
+
+        assert set([source.name for source in sources]) == set(["source.xml", "source2.xml"])
+
+    def test_query_linked_events_graph(self):
+        data = {"operations": [{
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T00:00:00",
+                           "validity_stop": "2018-06-06T00:00:00"},
+                "events": [{
+                    "explicit_reference": "EXPLICIT_REFERENCE" + str(i),
+                    "link_ref": "EVENT_LINK" + str(i),
+                    "links": [{
+                        "link": "EVENT_LINK" + str(i + 1),
+                        "link_mode": "by_ref",
+                        "name": "NEXT"
+                    }] if i < 3 else [],
+                    "gauge": {
+                        "name": "GAUGE_NAME",
+                        "system": "GAUGE_SYSTEM",
+                        "insertion_type": "SIMPLE_UPDATE"
+                    },
+                    "start": "2018-06-05T0" + str(i) + ":00:00",
+                    "stop": "2018-06-05T0" + str(i) + ":30:00"
+                } for i in range(4)]
+            }]}
+        # Close the cycle from the third event to the first one
+        data["operations"][0]["events"][2]["links"].append({
+            "link": "EVENT_LINK0",
+            "link_mode": "by_ref",
+            "name": "BACK"
+        })
+        self.engine_eboa.treat_data(data)
+
+        events = {event.explicitRef.explicit_ref: event for event in self.query.get_events()}
+        event0 = events["EXPLICIT_REFERENCE0"]
+        event1 = events["EXPLICIT_REFERENCE1"]
+        event2 = events["EXPLICIT_REFERENCE2"]
+        event3 = events["EXPLICIT_REFERENCE3"]
+
+        graph = self.query.get_linked_events_graph(explicit_refs = {"filter": "EXPLICIT_REFERENCE0", "op": "=="})
+
+        assert list(graph["prime_events"].keys()) == [event0.event_uuid]
+        assert list(graph["linked_events"].keys()) == [event1.event_uuid]
+        assert graph["links"] == {event0.event_uuid: [{"link_name": "NEXT", "event_uuid": event1.event_uuid, "depth": 1}]}
+        assert "events_linking" not in graph
+
+        graph = self.query.get_linked_events_graph(explicit_refs = {"filter": "EXPLICIT_REFERENCE0", "op": "=="}, max_depth = 3)
+
+        assert set(graph["linked_events"].keys()) == set([event0.event_uuid, event1.event_uuid, event2.event_uuid, event3.event_uuid])
+        assert graph["links"][event1.event_uuid] == [{"link_name": "NEXT", "event_uuid": event2.event_uuid, "depth": 2}]
+        assert sorted([link["link_name"] for link in graph["links"][event2.event_uuid]]) == ["BACK", "NEXT"]
+
+        graph = self.query.get_linked_events_graph(explicit_refs = {"filter": "EXPLICIT_REFERENCE0", "op": "=="}, link_names = {"filter": "NEXT", "op": "=="}, max_depth = 3, back_ref = True)
+
+        assert set(graph["linked_events"].keys()) == set([event1.event_uuid, event2.event_uuid, event3.event_uuid])
+        assert list(graph["events_linking"].keys()) == [event2.event_uuid]
+        assert graph["back_links"] == {event0.event_uuid: [{"link_name": "BACK", "event_uuid_link": event2.event_uuid}]}
+
+    def test_query_linked_events_graph_diamond(self):
+
+        # Diamond A -> B -> D, A -> C -> D with D -> E and a shortcut A -> D
+        links = {"A": ["B", "C", "D"], "B": ["D"], "C": ["D"], "D": ["E"], "E": []}
+        data = {"operations": [{
+                "mode": "insert",
+                "dim_signature": {"name": "dim_signature",
+                                  "exec": "exec",
+                                  "version": "1.0"},
+                "source": {"name": "source.xml",
+                           "reception_time": "2018-06-06T13:33:29",
+                           "generation_time": "2018-07-05T02:07:03",
+                           "validity_start": "2018-06-05T00:00:00",
+                           "validity_stop": "2018-06-06T00:00:00"},
+                "events": [{
+                    "explicit_reference": "EXPLICIT_REFERENCE_" + name,
+                    "link_ref": "EVENT_LINK_" + name,
+                    "links": [{
+                        "link": "EVENT_LINK_" + link,
+                        "link_mode": "by_ref",
+                        "name": "NEXT"
+                    } for link in links[name]],
+                    "gauge": {
+                        "name": "GAUGE_NAME",
+                        "system": "GAUGE_SYSTEM",
+                        "insertion_type": "SIMPLE_UPDATE"
+                    },
+                    "start": "2018-06-05T01:00:00",
+                    "stop": "2018-06-05T02:00:00"
+                } for name in sorted(links)]
+            }]}
+        self.engine_eboa.treat_data(data)
+
+        events = {event.explicitRef.explicit_ref.replace("EXPLICIT_REFERENCE_", ""): event.event_uuid for event in self.query.get_events()}
+
+        graph = self.query.get_linked_events_graph(explicit_refs = {"filter": "EXPLICIT_REFERENCE_A", "op": "=="}, max_depth = 3)
+
+        assert set(graph["linked_events"].keys()) == set([events["B"], events["C"], events["D"], events["E"]])
+        assert sorted([link["event_uuid"] for link in graph["links"][events["A"]]]) == sorted([events["B"], events["C"], events["D"]])
+        assert graph["links"][events["B"]] == [{"link_name": "NEXT", "event_uuid": events["D"], "depth": 2}]
+        assert graph["links"][events["C"]] == [{"link_name": "NEXT", "event_uuid": events["D"], "depth": 2}]
+        # The link reached by several paths is returned once with the minimum depth
+        assert graph["links"][events["D"]] == [{"link_name": "NEXT", "event_uuid": events["E"], "depth": 2}]
+
+        # The traversal does not continue through the events which are not visible
+        self.query.session.query(Event).filter(Event.event_uuid.in_([events["C"], events["D"]])).update({"visible": False}, synchronize_session = False)
+        self.query.session.commit()
+
+        graph = self.query.get_linked_events_graph(explicit_refs = {"filter": "EXPLICIT_REFERENCE_A", "op": "=="}, max_depth = 3)
+
+        assert list(graph["linked_events"].keys()) == [events["B"]]
+        assert graph["links"] == {events["A"]: [{"link_name": "NEXT", "event_uuid": events["B"], "depth": 1}]}
+
+    def test_wrong_inputs_query_linked_events_graph(self):
+
+        result = False
+        try:
+            self.query.get_linked_events_graph(max_depth = 0)
+        except InputError:
+            result = True
+        # end try
+
+        assert result == True
+
+        result = False
+        try:
+            self.query.get_linked_events_graph(link_names = "not_a_dict")
+        except InputError:
+            result = True
+        # end try
+
+        assert result == True
+
     def test_query_linking_events(self):
         data = {"operations": [{
                 "mode": "insert",
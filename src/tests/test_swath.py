@@ -0,0 +1,246 @@
+"""
+Automated tests for the functions used by the generation of the satellite swaths
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import unittest
+import unittest.mock
+import datetime
+import os
+import time
+import tempfile
+
+# Import numpy
+import numpy as np
+
+# Import astropy utilities
+from astropy.utils import iers
+
+# Import eboa swath, orbit and vector
+import eboa.ingestion.swath as eboa_swath
+import eboa.ingestion.orbit as eboa_orbit
+import eboa.ingestion.vector as eboa_vector
+
+# Import cache of the positions of the satellites
+from eboa.ingestion.ephemeris_cache import EphemerisCache, get_orbit_key
+
+tle_string = """SENTINEL-2A
+1 40697U 15028A   21045.16776521  .00000059  00000-0  39042-4 0  9994
+2 40697  98.5692 121.0451 0001320  94.4733 265.6596 14.30816809293474"""
+
+class TestSwath(unittest.TestCase):
+
+    def test_get_ephemerides(self):
+
+        satellite_orbit = eboa_orbit.get_orbit(tle_string)
+
+        times = [datetime.datetime(2021, 2, 14, 10, 0, 0) + datetime.timedelta(seconds = j * 6.5) for j in range(100)]
+
+        errors, positions, velocities = eboa_orbit.get_ephemerides(satellite_orbit, times)
+
+        assert positions.shape == (100, 3)
+        assert velocities.shape == (100, 3)
+
+        # Same results as propagating epoch by epoch
+        for i, time in enumerate(times):
+            error, position, velocity = eboa_orbit.get_ephemeris(satellite_orbit, time.isoformat(timespec="microseconds"))
+            assert errors[i] == error
+            assert positions[i].tolist() == list(position)
+            assert velocities[i].tolist() == list(velocity)
+        # end for
+
+    def test_vector_norms(self):
+
+        vectors = np.random.default_rng(0).normal(size = (1000, 3)) * 7000
+
+        assert eboa_vector.vector_norms(vectors).tolist() == [np.linalg.norm(vector) for vector in vectors]
+
+    def test_define_rotation_axis_arrays(self):
+
+        axes = np.array([[0, 0, 1], [1, 0, 0]])
+        vectors = np.array([[1, 0, 0], [0, 1, 0]])
+
+        rotated_vectors = eboa_vector.define_rotation_axis(axes, 90).apply(vectors)
+
+        assert np.allclose(rotated_vectors, [[0, 1, 0], [0, 0, 1]])
+
+    def test_ephemeris_cache_slices(self):
+
+        satellite_orbit = eboa_orbit.get_orbit(tle_string)
+        ephemeris_cache = EphemerisCache()
+
+        epochs = np.arange(100, dtype=np.int64) * 30000000
+        positions = np.arange(300, dtype=float).reshape(100, 3)
+
+        cached_positions, found = ephemeris_cache.get(satellite_orbit, 30, epochs)
+        assert not found.any()
+
+        ephemeris_cache.put(satellite_orbit, 30, epochs[:60], positions[:60])
+        ephemeris_cache.put(satellite_orbit, 30, epochs[50:], positions[50:])
+
+        # Sub-window served from the block filled by both puts
+        cached_positions, found = ephemeris_cache.get(satellite_orbit, 30, epochs[40:70])
+        assert found.all()
+        assert cached_positions.tolist() == positions[40:70].tolist()
+
+        # Epochs not cached are not found
+        cached_positions, found = ephemeris_cache.get(satellite_orbit, 30, np.array([epochs[10], epochs[10] + 1, epochs[99] + 30000000]))
+        assert found.tolist() == [True, False, False]
+        assert cached_positions[0].tolist() == positions[10].tolist()
+
+        # Blocks are identified by the interval of the epoch grid and the orbit
+        cached_positions, found = ephemeris_cache.get(satellite_orbit, 60, epochs)
+        assert not found.any()
+
+        other_satellite_orbit = eboa_orbit.get_orbit(tle_string.replace("14.30816809293474", "14.30816819293474"))
+        assert get_orbit_key(other_satellite_orbit) != get_orbit_key(satellite_orbit)
+        cached_positions, found = ephemeris_cache.get(other_satellite_orbit, 30, epochs)
+        assert not found.any()
+
+        # Propagations do not change the key of the orbit
+        eboa_orbit.get_ephemeris(satellite_orbit, "2021-02-14T10:00:00")
+        cached_positions, found = ephemeris_cache.get(satellite_orbit, 30, epochs)
+        assert found.all()
+
+    def test_ephemeris_cache_disk(self):
+
+        satellite_orbit = eboa_orbit.get_orbit(tle_string)
+        epochs = np.arange(100, dtype=np.int64) * 30000000
+        positions = np.arange(300, dtype=float).reshape(100, 3)
+
+        with tempfile.TemporaryDirectory() as path:
+            ephemeris_cache = EphemerisCache(path = path)
+            ephemeris_cache.put(satellite_orbit, 30, epochs, positions)
+
+            # Another process reads the block from disk
+            other_ephemeris_cache = EphemerisCache(path = path)
+            cached_positions, found = other_ephemeris_cache.get(satellite_orbit, 30, epochs[20:30])
+            assert found.all()
+            assert cached_positions.tolist() == positions[20:30].tolist()
+
+            block_paths = [os.path.join(path, name) for name in os.listdir(path)]
+            assert len(block_paths) == 1
+
+            # Eviction by size
+            ephemeris_cache.max_size = 0
+            assert ephemeris_cache.evict() == block_paths
+            assert os.listdir(path) == []
+
+            # Eviction by age
+            ephemeris_cache.max_size = 104857600
+            ephemeris_cache.put(satellite_orbit, 30, epochs, positions)
+            os.utime(block_paths[0], (time.time() - 7200, time.time() - 7200))
+            assert EphemerisCache(path = path).get(satellite_orbit, 30, epochs)[1].any() == False
+            assert ephemeris_cache.evict() == block_paths
+        # end with
+
+    def test_ephemeris_cache_blocks(self):
+
+        satellite_orbit = eboa_orbit.get_orbit(tle_string)
+        epochs = np.arange(-25, 75, dtype=np.int64) * 30000000
+        positions = np.arange(300, dtype=float).reshape(100, 3)
+
+        with tempfile.TemporaryDirectory() as path:
+            ephemeris_cache = EphemerisCache(path = path, block_points = 10)
+            ephemeris_cache.put(satellite_orbit, 30, epochs[:50], positions[:50])
+
+            # Blocks cover a fixed number of intervals
+            assert sorted([len(np.load(os.path.join(path, name))) for name in os.listdir(path)]) == [5, 5, 10, 10, 10, 10]
+
+            # Only the blocks with new epochs are rewritten
+            inodes = {name: os.stat(os.path.join(path, name)).st_ino for name in os.listdir(path)}
+            ephemeris_cache.put(satellite_orbit, 30, epochs[50:], positions[50:])
+            assert len(os.listdir(path)) == 11
+            kept_blocks = [name for name in os.listdir(path) if os.stat(os.path.join(path, name)).st_ino == inodes.get(name)]
+            assert sorted([int(name[:-len(".npy")].split("_")[-1]) for name in kept_blocks]) == [-3, -2, -1, 0, 1]
+
+            # Windows spanning several blocks
+            cached_positions, found = EphemerisCache(path = path, block_points = 10).get(satellite_orbit, 30, epochs[15:85])
+            assert found.all()
+            assert cached_positions.tolist() == positions[15:85].tolist()
+
+            # Blocks exceeding the maximum number of positions are replaced by the new positions
+            ephemeris_cache.put(satellite_orbit, 30, epochs[30:40] + 1, positions[30:40])
+            assert len(ephemeris_cache._load((get_orbit_key(satellite_orbit), 30000000, 0))) == 5
+            cached_positions, found = ephemeris_cache.get(satellite_orbit, 30, np.concatenate((epochs[15:25], epochs[30:40], epochs[30:40] + 1)))
+            assert found.tolist() == [True] * 10 + [False] * 10 + [True] * 10
+        # end with
+
+    def test_get_grid_times(self):
+
+        start = datetime.datetime(2021, 2, 14, 10, 0, 10, 500)
+        stop = datetime.datetime(2021, 2, 14, 10, 2, 0)
+
+        assert eboa_swath.get_grid_times(start, stop, 30) == [start] + [datetime.datetime(2021, 2, 14, 10, 0, 30) + datetime.timedelta(seconds = j * 30) for j in range(3)] + [stop]
+        assert eboa_swath.get_grid_times(stop, stop, 30) == []
+
+        # Overlapping periods share the epochs of the grid
+        other_times = eboa_swath.get_grid_times(datetime.datetime(2021, 2, 14, 10, 1, 7), datetime.datetime(2021, 2, 14, 10, 3, 0), 30)
+        assert other_times[1:3] == eboa_swath.get_grid_times(start, stop, 30)[3:5]
+
+    def test_get_footprint_cache(self):
+
+        requests = [("2021-02-14T10:00:05", "2021-02-14T12:00:00", 10.3), ("2021-02-14T10:30:00", "2021-02-14T10:35:10", 20.6)]
+        ttl = eboa_swath.ephemeris_cache.ttl
+
+        # Avoid downloading the Earth orientation data
+        with iers.conf.set_temp("auto_download", False):
+            try:
+                eboa_swath.ephemeris_cache.ttl = 0
+                footprints = [eboa_swath.get_footprint(start, stop, alpha, tle_string = tle_string) for start, stop, alpha in requests]
+            finally:
+                eboa_swath.ephemeris_cache.ttl = ttl
+            # end try
+
+            # The cache does not change the footprints (computed and served from the cache)
+            eboa_swath.ephemeris_cache.invalidate()
+            for i in range(2):
+                assert [eboa_swath.get_footprint(start, stop, alpha, tle_string = tle_string) for start, stop, alpha in requests] == footprints
+            # end for
+        # end with
+
+    def test_get_footprint_aligned_epochs(self):
+
+        satellite_orbit = eboa_orbit.get_orbit(tle_string)
+        eboa_swath.ephemeris_cache.invalidate()
+
+        # Avoid downloading the Earth orientation data
+        with iers.conf.set_temp("auto_download", False), unittest.mock.patch.object(eboa_swath.ephemeris_cache, "aligned_epochs", True):
+            eboa_swath.get_footprint("2021-02-14T10:00:05", "2021-02-14T10:10:00", 10.3, tle_string = tle_string)
+
+            # An overlapping period with another start finds the positions of the shared epochs
+            times = eboa_swath.get_grid_times(datetime.datetime(2021, 2, 14, 10, 3, 17), datetime.datetime(2021, 2, 14, 10, 12, 0), 30)
+            cached_positions, found = eboa_swath.ephemeris_cache.get(satellite_orbit, 30, np.array([(time - datetime.datetime(1970, 1, 1)) // datetime.timedelta(microseconds = 1) for time in times], dtype=np.int64))
+            assert found.tolist() == [False] + [time <= datetime.datetime(2021, 2, 14, 10, 10, 0) for time in times[1:-1]] + [False]
+
+            # Long periods keep the epochs on the grid doubling the interval
+            eboa_swath.get_footprint("2021-02-14T10:00:05", "2021-02-14T12:00:00", 10.3, tle_string = tle_string)
+            times = eboa_swath.get_grid_times(datetime.datetime(2021, 2, 14, 10, 0, 5), datetime.datetime(2021, 2, 14, 12, 0, 0), 60)
+            assert len(times) == 121
+            cached_positions, found = eboa_swath.ephemeris_cache.get(satellite_orbit, 60, np.array([(time - datetime.datetime(1970, 1, 1)) // datetime.timedelta(microseconds = 1) for time in times[1:-1]], dtype=np.int64))
+            assert found.all()
+        # end with
+
+    def test_get_footprints(self):
+
+        requests = [("2021-02-14T10:00:00", "2021-02-14T10:05:00", 10.3, 0, 0, 0),
+                    ("2021-02-14T10:03:00", "2021-02-14T10:04:00", 20.6, 5, 0, 0),
+                    ("2021-02-14T11:00:00", "2021-02-14T11:02:30", 10.3, -4, 2, 0)]
+
+        # Avoid downloading the Earth orientation data
+        with iers.conf.set_temp("auto_download", False):
+            footprints = [eboa_swath.get_footprint(start, stop, alpha, tle_string = tle_string, roll = roll, pitch = pitch, yaw = yaw) for start, stop, alpha, roll, pitch, yaw in requests]
+
+            # Footprints are returned in the order of the requests with the same values
+            # (the cached positions of the serial calls are removed so that the workers propagate them)
+            eboa_swath.ephemeris_cache.invalidate()
+            assert eboa_swath.get_footprints(requests, tle_string = tle_string, processes = 2) == footprints
+
+            eboa_swath.ephemeris_cache.invalidate()
+            assert eboa_swath.get_footprints(requests, tle_string = tle_string, processes = 1) == footprints
+
+            assert eboa_swath.get_footprints([], tle_string = tle_string) == []
+        # end with
@@ -0,0 +1,56 @@
+"""
+Automated tests for the parsing of the timestamps used by the engine submodule
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import unittest
+import datetime
+from dateutil import parser
+
+# Import timestamps parsing
+from eboa.engine.timestamps import parse_timestamp
+
+class TestTimestamps(unittest.TestCase):
+
+    def test_parse_timestamp_as_dateutil(self):
+
+        timestamps = ["2018-06-05",
+                      "2018-06-05T02:07:03",
+                      "2018-06-05 02:07:03",
+                      "2018-06-05t02:07:03",
+                      "2018-06-05T02:07",
+                      "2018-06-05T02:07:03.5",
+                      "2018-06-05T02:07:03.123456",
+                      "2018-06-05T02:07:03.123456789",
+                      "2018-06-05T02:07:03Z",
+                      "2018-06-05T02:07:03+02:00",
+                      "2018-06-05T02:07:03.123-0130",
+                      "20180605T020703",
+                      "2018-06-05T02:07:03 UTC",
+                      "June 5 2018 02:07:03",
+                      "05/06/2018 02:07:03"]
+
+        for timestamp in timestamps:
+            assert parse_timestamp(timestamp) == parser.parse(timestamp), timestamp
+            assert parse_timestamp(timestamp).utcoffset() == parser.parse(timestamp).utcoffset(), timestamp
+        # end for
+
+    def test_parse_timestamp_fast_path(self):
+
+        assert parse_timestamp("2018-06-05T02:07:03.000001") == datetime.datetime(2018, 6, 5, 2, 7, 3, 1)
+
+        assert parse_timestamp("2018-06-05T02:07:03+00:00") == datetime.datetime(2018, 6, 5, 2, 7, 3, tzinfo=datetime.timezone.utc)
+
+        # The values are memoised
+        assert parse_timestamp("2018-06-05T02:07:03") is parse_timestamp("2018-06-05T02:07:03")
+
+    def test_parse_timestamp_wrong_value(self):
+
+        for timestamp in ["2018-06-05X02:07:03", "2018-13-05T02:07:03", "2018-06-05T24:00:00", "not a date"]:
+            with self.assertRaises(ValueError):
+                parse_timestamp(timestamp)
+            # end with
+        # end for
@@ -0,0 +1,77 @@
+"""
+Automated tests for the registry of compiled XML schemas and configuration files
+
+Written by Daniel Brosnan Blázquez
+
+module eboa
+"""
+# Import python utilities
+import os
+import unittest
+import shutil
+import tempfile
+
+# Import xml parser
+from lxml import etree
+
+# Import xml registry
+from eboa.engine.xml_registry import XmlRegistry
+
+schema_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + "/schemas/triggering_schema.xsd"
+xml_inputs_path = os.path.dirname(os.path.abspath(__file__)) + "/xml_inputs/"
+
+class TestXmlRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = XmlRegistry()
+        self.directory = tempfile.mkdtemp()
+        self.configuration_path = self.directory + "/triggering.xml"
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_get_schema_compiled_once(self):
+
+        schema = self.registry.get_schema(schema_path)
+
+        assert type(schema) == etree.XMLSchema
+        assert self.registry.get_schema(schema_path) is schema
+
+    def test_get_configuration_compiled_once(self):
+
+        shutil.copyfile(xml_inputs_path + "triggering_one_rule.xml", self.configuration_path)
+
+        configuration_xpath = self.registry.get_configuration(self.configuration_path, schema_path)
+
+        assert len(configuration_xpath("/triggering_rules/rule")) == 1
+        assert self.registry.get_configuration(self.configuration_path, schema_path) is configuration_xpath
+
+    def test_get_configuration_modified(self):
+
+        shutil.copyfile(xml_inputs_path + "triggering_one_rule.xml", self.configuration_path)
+
+        configuration_xpath = self.registry.get_configuration(self.configuration_path, schema_path)
+
+        assert len(configuration_xpath("/triggering_rules/rule")) == 1
+
+        os.remove(self.configuration_path)
+        shutil.copyfile(xml_inputs_path + "triggering_two_rules.xml", self.configuration_path)
+
+        configuration_xpath = self.registry.get_configuration(self.configuration_path, schema_path)
+
+        assert len(configuration_xpath("/triggering_rules/rule")) == 2
+
+    def test_get_configuration_not_xml(self):
+
+        shutil.copyfile(xml_inputs_path + "test_not_xml.xml", self.configuration_path)
+
+        with self.assertRaises(etree.XMLSyntaxError):
+            self.registry.get_configuration(self.configuration_path, schema_path)
+        # end with
+
+    def test_get_configuration_not_passing_schema(self):
+
+        shutil.copyfile(xml_inputs_path + "test_simple_update.xml", self.configuration_path)
+
+        with self.assertRaises(etree.DocumentInvalid):
+            self.registry.get_configuration(self.configuration_path, schema_path)
+        # end with
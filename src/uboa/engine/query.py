@@ -19,8 +19,8 @@ from uboa.datamodel.users import RoleUser, Role, User#, ConfigurationUser, Confi
 # Import auxiliary functions
 import eboa.engine.functions as functions
 
-# Import operators
-from eboa.engine.operators import arithmetic_operators, text_operators
+# Import filters
+import eboa.engine.filters as filters
 
 # Import logging
 from uboa.logging import Log
@@ -34,6 +34,21 @@ from sqlalchemy.orm.exc import StaleDataError
 logging = Log(name = __name__)
 logger = logging.logger
 
+# Tables (built once) associating the names of the text filters of the query methods to the columns they filter
+# (the filters requiring specific joins are built by the query methods)
+text_filter_columns = {
+    "get_users": {
+        "user_uuids": User.user_uuid,
+        "emails": User.email,
+        "usernames": User.username,
+        "groups": User.group
+    },
+    "get_roles": {
+        "role_uuids": Role.role_uuid,
+        "roles": Role.name
+    }
+}
+
 class Query():
 
     def __init__(self, session = None):
@@ -112,53 +127,8 @@ class Query():
         join_tables = False
         tables = {}
 
-        # User UUIDs
-        if user_uuids != None:
-            functions.is_valid_text_filter(user_uuids)
-            if user_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[user_uuids["op"]]
-                params.append(op(User.user_uuid, user_uuids["filter"]))
-            else:
-                filter = eval('User.user_uuid.' + text_operators[user_uuids["op"]])
-                params.append(filter(user_uuids["filter"]))
-            # end if
-        # end if
-
-        # Emails
-        if emails != None:
-            functions.is_valid_text_filter(emails)
-            if emails["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[emails["op"]]
-                params.append(op(User.email, emails["filter"]))
-            else:
-                filter = eval('User.email.' + text_operators[emails["op"]])
-                params.append(filter(emails["filter"]))
-            # end if
-        # end if
-        
-        # Usernames
-        if usernames != None:
-            functions.is_valid_text_filter(usernames)
-            if usernames["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[usernames["op"]]
-                params.append(op(User.username, usernames["filter"]))
-            else:
-                filter = eval('User.username.' + text_operators[usernames["op"]])
-                params.append(filter(usernames["filter"]))
-            # end if
-        # end if
-
-        # Groups
-        if groups != None:
-            functions.is_valid_text_filter(groups)
-            if groups["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[groups["op"]]
-                params.append(op(User.group, groups["filter"]))
-            else:
-                filter = eval('User.group.' + text_operators[groups["op"]])
-                params.append(filter(groups["filter"]))
-            # end if
-        # end if
+        # Text filters
+        params += filters.build_text_filters(User, text_filter_columns["get_users"], {"user_uuids": user_uuids, "emails": emails, "usernames": usernames, "groups": groups})
 
         # Active
         if active != None:
@@ -169,26 +139,14 @@ class Query():
         # Role UUIDs
         if role_uuids != None:
             functions.is_valid_text_filter(role_uuids)
-            if role_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[role_uuids["op"]]
-                params.append(op(RoleUser.role_uuid, role_uuids["filter"]))
-            else:
-                filter = eval('RoleUser.role_uuid.' + text_operators[role_uuids["op"]])
-                params.append(filter(role_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(RoleUser.role_uuid, role_uuids))
             join_tables = True
         # end if
 
         # Role names
         if roles != None:
             functions.is_valid_text_filter(roles)
-            if roles["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[roles["op"]]
-                params.append(op(Role.name, roles["filter"]))
-            else:
-                filter = eval('Role.name.' + text_operators[roles["op"]])
-                params.append(filter(roles["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Role.name, roles))
             join_tables = True
             tables[Role] = Role.role_uuid==RoleUser.role_uuid
         # end if
@@ -207,26 +165,14 @@ class Query():
         # Configuration UUIDs
         if configuration_uuids != None:
             functions.is_valid_text_filter(configuration_uuids)
-            if configuration_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[configuration_uuids["op"]]
-                params.append(op(ConfigurationUser.configuration_uuid, configuration_uuids["filter"]))
-            else:
-                filter = eval('ConfigurationUser.configuration_uuid.' + text_operators[configuration_uuids["op"]])
-                params.append(filter(configuration_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(ConfigurationUser.configuration_uuid, configuration_uuids))
             join_tables = True
         # end if
 
         # Configuration names
         if configuration_names != None:
             functions.is_valid_text_filter(configuration_names)
-            if configuration_names["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[configuration_names["op"]]
-                params.append(op(Configuration.name, configuration_names["filter"]))
-            else:
-                filter = eval('Configuration.name.' + text_operators[configuration_names["op"]])
-                params.append(filter(configuration_names["filter"]))
-            # end if
+            params.append(filters.build_text_filter(Configuration.name, configuration_names))
             join_tables = True
             tables[Configuration] = Configuration.configuration_uuid==ConfigurationUser.configuration_uuid
         # end if
@@ -243,12 +189,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("User." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("User." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(User, order_by))
         # end if
 
         # Limit
@@ -306,53 +247,20 @@ class Query():
         join_tables = False
         tables = {}
 
-        # Role UUIDs
-        if role_uuids != None:
-            functions.is_valid_text_filter(role_uuids)
-            if role_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[role_uuids["op"]]
-                params.append(op(Role.role_uuid, role_uuids["filter"]))
-            else:
-                filter = eval('Role.role_uuid.' + text_operators[role_uuids["op"]])
-                params.append(filter(role_uuids["filter"]))
-            # end if
-        # end if
+        # Text filters
+        params += filters.build_text_filters(Role, text_filter_columns["get_roles"], {"role_uuids": role_uuids, "roles": roles})
 
-        # Role names
-        if roles != None:
-            functions.is_valid_text_filter(roles)
-            if roles["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[roles["op"]]
-                params.append(op(Role.name, roles["filter"]))
-            else:
-                filter = eval('Role.name.' + text_operators[roles["op"]])
-                params.append(filter(roles["filter"]))
-            # end if
-        # end if
-        
         # User UUIDs
         if user_uuids != None:
             functions.is_valid_text_filter(user_uuids)
-            if user_uuids["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[user_uuids["op"]]
-                params.append(op(RoleUser.user_uuid, user_uuids["filter"]))
-            else:
-                filter = eval('RoleUser.user_uuid.' + text_operators[user_uuids["op"]])
-                params.append(filter(user_uuids["filter"]))
-            # end if
+            params.append(filters.build_text_filter(RoleUser.user_uuid, user_uuids))
             join_tables = True
         # end if
 
         # Emails
         if emails != None:
             functions.is_valid_text_filter(emails)
-            if emails["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[emails["op"]]
-                params.append(op(User.email, emails["filter"]))
-            else:
-                filter = eval('User.email.' + text_operators[emails["op"]])
-                params.append(filter(emails["filter"]))
-            # end if
+            params.append(filters.build_text_filter(User.email, emails))
             join_tables = True
             tables[User] = User.user_uuid==RoleUser.user_uuid
         # end if
@@ -360,13 +268,7 @@ class Query():
         # Usernames
         if usernames != None:
             functions.is_valid_text_filter(usernames)
-            if usernames["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[usernames["op"]]
-                params.append(op(User.username, usernames["filter"]))
-            else:
-                filter = eval('User.username.' + text_operators[usernames["op"]])
-                params.append(filter(usernames["filter"]))
-            # end if
+            params.append(filters.build_text_filter(User.username, usernames))
             join_tables = True
             tables[User] = User.user_uuid==RoleUser.user_uuid
         # end if
@@ -374,13 +276,7 @@ class Query():
         # Groups
         if groups != None:
             functions.is_valid_text_filter(groups)
-            if groups["op"] in arithmetic_operators.keys():
-                op = arithmetic_operators[groups["op"]]
-                params.append(op(User.group, groups["filter"]))
-            else:
-                filter = eval('User.group.' + text_operators[groups["op"]])
-                params.append(filter(groups["filter"]))
-            # end if
+            params.append(filters.build_text_filter(User.group, groups))
             join_tables = True
             tables[User] = User.user_uuid==RoleUser.user_uuid
         # end if
@@ -407,12 +303,7 @@ class Query():
         # Order by
         if order_by != None:
             functions.is_valid_order_by(order_by)
-            if order_by["descending"]:
-                order_by_statement = eval("Role." + order_by["field"] + ".desc()")
-            else:
-                order_by_statement = eval("Role." + order_by["field"])
-            # end if
-            query = query.order_by(order_by_statement)
+            query = query.order_by(filters.build_order_by(Role, order_by))
         # end if
 
         # Limit